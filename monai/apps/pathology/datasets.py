@@ -11,12 +11,13 @@
 
 import os
 import sys
+from multiprocessing.pool import ThreadPool
 from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from monai.data import Dataset, SmartCacheDataset
-from monai.data.image_reader import WSIReader
+from monai.data.image_reader import WSIReader, WSITileCache
 from monai.utils import ensure_tuple_rep
 
 __all__ = ["PatchWSIDataset", "SmartCachePatchWSIDataset", "MaskedInferenceWSIDataset"]
@@ -35,6 +36,9 @@ class PatchWSIDataset(Dataset):
         transform: transforms to be executed on input data.
         image_reader_name: the name of library to be used for loading whole slide imaging, either CuCIM or OpenSlide.
             Defaults to CuCIM.
+        tile_cache: the cache of the decoded tiles of the whole slide images, so the overlapping regions are
+            decoded only once. If True, use the cache shared in the process. Defaults to None, no cache.
+            See :py:class:`monai.data.WSITileCache` for more details.
 
     Note:
         The input data has the following form as an example:
@@ -56,6 +60,7 @@ class PatchWSIDataset(Dataset):
         patch_size: Union[int, Tuple[int, int]],
         transform: Optional[Callable] = None,
         image_reader_name: str = "cuCIM",
+        tile_cache: Optional[Union[bool, WSITileCache]] = None,
     ):
         super().__init__(data, transform)
 
@@ -65,7 +70,7 @@ class PatchWSIDataset(Dataset):
 
         self.image_path_list = list({x["image"] for x in self.data})
         self.image_reader_name = image_reader_name
-        self.image_reader = WSIReader(image_reader_name)
+        self.image_reader = WSIReader(image_reader_name, tile_cache=tile_cache)
         self.wsi_object_dict = None
         if self.image_reader_name != "openslide":
             # OpenSlide causes memory issue if we prefetch image objects
@@ -122,6 +127,9 @@ class SmartCachePatchWSIDataset(SmartCacheDataset):
         num_replace_workers: the number of worker threads to prepare the replacement cache for every epoch.
             If num_replace_workers is None then the number returned by os.cpu_count() is used.
         progress: whether to display a progress bar when caching for the first epoch.
+        tile_cache: the cache of the decoded tiles of the whole slide images, the tiles shared by the regions
+            of nearby locations or replaced in the next epochs are decoded only once.
+            If True, use the cache shared in the process. Defaults to None, no cache.
 
     """
 
@@ -139,6 +147,7 @@ class SmartCachePatchWSIDataset(SmartCacheDataset):
         num_init_workers: Optional[int] = None,
         num_replace_workers: Optional[int] = None,
         progress: bool = True,
+        tile_cache: Optional[Union[bool, WSITileCache]] = None,
     ):
         patch_wsi_dataset = PatchWSIDataset(
             data=data,
@@ -146,6 +155,7 @@ class SmartCachePatchWSIDataset(SmartCacheDataset):
             grid_shape=grid_shape,
             patch_size=patch_size,
             image_reader_name=image_reader_name,
+            tile_cache=tile_cache,
         )
         super().__init__(
             data=patch_wsi_dataset,  # type: ignore
@@ -172,6 +182,13 @@ class MaskedInferenceWSIDataset(Dataset):
         transform: transforms to be executed on extracted patches.
         image_reader_name: the name of library to be used for loading whole slide imaging, either CuCIM or OpenSlide.
         Defaults to CuCIM.
+        block_size: if not None, the foreground locations are grouped in blocks of `block_size` pixels of the mask
+            (an int or a tuple for the two dims), and every item of the dataset is the list of the patches of a
+            block, sliced from a single region covering them instead of reading every patch. It's efficient when
+            the neighbouring patches are close or overlapping (``patch_size`` not much smaller than the
+            downsampling ratio of the mask). Defaults to None, every item is a single patch.
+        num_workers: the number of threads to read the region of a block in parallel bands,
+            if None, use the number of CPUs. Only used when `block_size` is not None.
 
     Note:
         The resulting output (probability maps) after performing inference using this dataset is
@@ -184,10 +201,16 @@ class MaskedInferenceWSIDataset(Dataset):
         patch_size: Union[int, Tuple[int, int]],
         transform: Optional[Callable] = None,
         image_reader_name: str = "cuCIM",
+        block_size: Optional[Union[int, Tuple[int, int]]] = None,
+        num_workers: Optional[int] = None,
     ) -> None:
         super().__init__(data, transform)
 
         self.patch_size = ensure_tuple_rep(patch_size, 2)
+        self.block_size = None if block_size is None else np.asarray(ensure_tuple_rep(block_size, 2))
+        if self.block_size is not None and self.block_size.min() <= 0:
+            raise ValueError("block_size should be larger than 0.")
+        self.num_workers = max(int(num_workers or os.cpu_count() or 1), 1)
 
         # set up whole slide image reader
         self.image_reader_name = image_reader_name
@@ -201,6 +224,14 @@ class MaskedInferenceWSIDataset(Dataset):
         self.num_patches = sum(self.num_patches_per_sample)
         self.cum_num_patches = np.cumsum([0] + self.num_patches_per_sample[:-1])
 
+        # group the patches of every sample in blocks of the mask
+        if self.block_size is not None:
+            for sample in self.data:
+                sample["blocks"] = self._group_patches(sample["mask_locations"])
+            num_blocks_per_sample = [len(d["blocks"]) for d in self.data]
+            self.num_blocks = sum(num_blocks_per_sample)
+            self.cum_num_blocks = np.cumsum([0] + num_blocks_per_sample[:-1])
+
     def _prepare_data(self, input_data: List[Dict["str", "str"]]) -> List[Dict]:
         prepared_data = []
         for sample in input_data:
@@ -279,6 +310,64 @@ class MaskedInferenceWSIDataset(Dataset):
 
         return int(level), ratios[0]
 
+    def _group_patches(self, mask_locations: List[List[int]]) -> List[np.ndarray]:
+        """
+        Group the patch indices by the blocks of the mask containing their `mask_locations`,
+        keeping the order of the patches in every block.
+
+        """
+        if len(mask_locations) == 0:
+            return []
+        block_locations = np.asarray(mask_locations) // self.block_size
+        _, block_index, counts = np.unique(block_locations, axis=0, return_inverse=True, return_counts=True)
+        order = np.argsort(block_index.reshape(-1), kind="stable")
+        return np.split(order, np.cumsum(counts)[:-1])
+
+    def _read_region(self, image, location: np.ndarray, size: np.ndarray) -> np.ndarray:
+        """
+        Read the region of `size` at `location` from `image`, in bands along the first dim read by a thread pool.
+
+        """
+        num_bands = min(self.num_workers, int(size[0]))
+        if num_bands <= 1:
+            return self.image_reader.get_data(
+                img=image, location=tuple(int(i) for i in location), size=tuple(int(i) for i in size)
+            )[0]
+        bounds = np.linspace(0, size[0], num_bands + 1).astype(int)
+
+        def _read_band(band: int) -> np.ndarray:
+            band_location = (int(location[0] + bounds[band]), int(location[1]))
+            band_size = (int(bounds[band + 1] - bounds[band]), int(size[1]))
+            return self.image_reader.get_data(img=image, location=band_location, size=band_size)[0]
+
+        with ThreadPool(num_bands) as p:
+            bands = p.map(_read_band, range(num_bands))
+        return np.concatenate(bands, axis=1)
+
+    def _load_a_block(self, index):
+        """
+        Load the patches of a block given the index: read the region covering all the patches of the block
+        and slice the patches from it, providing every patch with its image name and mask location.
+
+        """
+        sample_num = np.searchsorted(self.cum_num_blocks, index, side="right") - 1
+        sample = self.data[sample_num]
+        patch_nums = sample["blocks"][index - self.cum_num_blocks[sample_num]]
+        locations = np.asarray([sample["image_locations"][i] for i in patch_nums])
+        region_location = locations.min(axis=0)
+        region_size = locations.max(axis=0) - region_location + self.patch_size
+        region = self._read_region(sample["image"], region_location, region_size)
+
+        patches = []
+        for patch_num, location in zip(patch_nums, locations - region_location):
+            patch = region[
+                :, location[0] : location[0] + self.patch_size[0], location[1] : location[1] + self.patch_size[1]
+            ]
+            patches.append(
+                {"image": patch, "name": sample["name"], "mask_location": sample["mask_locations"][patch_num]}
+            )
+        return patches
+
     def _load_a_patch(self, index):
         """
         Load sample given the index
@@ -287,7 +376,7 @@ class MaskedInferenceWSIDataset(Dataset):
         this method, first, finds the whole slide image and the patch that should be extracted,
         then it loads the patch and provide it with its image name and the corresponding mask location.
         """
-        sample_num = np.argmax(self.cum_num_patches > index) - 1
+        sample_num = np.searchsorted(self.cum_num_patches, index, side="right") - 1
         sample = self.data[sample_num]
         patch_num = index - self.cum_num_patches[sample_num]
         location_on_image = sample["image_locations"][patch_num]
@@ -302,10 +391,10 @@ class MaskedInferenceWSIDataset(Dataset):
         return processed_sample
 
     def __len__(self):
-        return self.num_patches
+        return self.num_patches if self.block_size is None else self.num_blocks
 
     def __getitem__(self, index):
-        patch = [self._load_a_patch(index)]
+        patch = [self._load_a_patch(index)] if self.block_size is None else self._load_a_block(index)
         if self.transform:
             patch = self.transform(patch)
         return patch
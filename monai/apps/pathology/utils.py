@@ -14,15 +14,17 @@ from typing import List, Union
 import numpy as np
 import torch
 
+from monai.transforms.utils import distance_transform
 from monai.utils import ProbNMS, optional_import
 
 measure, _ = optional_import("skimage.measure")
 ndimage, _ = optional_import("scipy.ndimage")
 
 
-def compute_multi_instance_mask(mask: np.ndarray, threshold: float):
+def compute_multi_instance_mask(mask: Union[np.ndarray, torch.Tensor], threshold: float):
     """
     This method computes the segmentation mask according to the binary tumor mask.
+    If `mask` is a tensor, the distance transform is computed on its device.
 
     Args:
         mask: the binary mask array
@@ -30,8 +32,11 @@ def compute_multi_instance_mask(mask: np.ndarray, threshold: float):
     """
 
     neg = 255 - mask * 255
-    distance = ndimage.morphology.distance_transform_edt(neg)
-    binary = distance < threshold
+    if isinstance(neg, torch.Tensor):
+        binary = (distance_transform(neg) < threshold).cpu().numpy()
+    else:
+        distance = ndimage.morphology.distance_transform_edt(neg)
+        binary = distance < threshold
 
     filled_image = ndimage.morphology.binary_fill_holes(binary)
     multi_instance_mask = measure.label(filled_image, connectivity=2)
@@ -9,6 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .buffered_collate import BufferedCollate
 from .csv_saver import CSVSaver
 from .dataloader import DataLoader
 from .dataset import (
@@ -16,6 +17,7 @@ from .dataset import (
     CacheDataset,
     CacheNTransDataset,
     Dataset,
+    DistributedCacheDataset,
     LMDBDataset,
     NPZDictItemDataset,
     PersistentDataset,
@@ -25,14 +27,14 @@ from .dataset import (
 from .decathlon_datalist import load_decathlon_datalist, load_decathlon_properties
 from .grid_dataset import GridPatchDataset, PatchDataset, PatchIter
 from .image_dataset import ImageDataset
-from .image_reader import ImageReader, ITKReader, NibabelReader, NumpyReader, PILReader, WSIReader
+from .image_reader import ImageReader, ITKReader, NibabelReader, NumpyReader, PILReader, WSIReader, WSITileCache
 from .inverse_batch_transform import BatchInverseTransform
 from .iterable_dataset import IterableDataset
 from .nifti_saver import NiftiSaver
 from .nifti_writer import write_nifti
 from .png_saver import PNGSaver
 from .png_writer import write_png
-from .samplers import DistributedSampler, DistributedWeightedRandomSampler
+from .samplers import BucketBatchSampler, DistributedSampler, DistributedWeightedRandomSampler, PartitionSampler
 from .synthetic import create_test_image_2d, create_test_image_3d
 from .test_time_augmentation import TestTimeAugmentation
 from .thread_buffer import ThreadBuffer, ThreadDataLoader
@@ -43,11 +45,15 @@ from .utils import (
     create_file_basename,
     decollate_batch,
     dense_patch_slices,
+    get_patch_grid,
+    get_patch_grid_coords,
     get_random_patch,
     get_valid_patch_size,
     is_supported_format,
     iter_patch,
+    iter_patch_at_coords,
     iter_patch_slices,
+    iter_patch_views,
     json_hashing,
     list_data_collate,
     pad_list_data_collate,
@@ -0,0 +1,173 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import weakref
+from collections import abc
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+from torch.utils.data._utils.collate import default_collate
+
+from monai.transforms.croppad.batch import PadListDataCollate
+from monai.utils.enums import Method, NumpyPadMode
+
+__all__ = ["BufferedCollate"]
+
+
+class BufferedCollate:
+    """
+    Same as MONAI's ``pad_list_data_collate`` with the ``"constant"`` padding mode, but the batch of every array
+    item is written in place into a preallocated (optionally pinned) buffer instead of allocating a new tensor for
+    every batch and a padded copy of every sample. The items are padded to the biggest shape in the batch, the
+    buffers are sized to the biggest batch seen so far and are reused across the iterations.
+
+    The collate function holds a ring of `num_buffers` sets of buffers, used in turn by the successive batches:
+    the tensors of a batch are valid until `num_buffers` more batches have been collated. If the tensors of a
+    batch are still referenced when its buffers come around again, new buffers are allocated instead of
+    overwriting them. Note that views created from a batch (e.g. `batch["image"][0]`) are not tracked, they must
+    be consumed or copied (for example by moving the batch to the GPU) before the buffers are reused.
+
+    With `pin_memory`, the copies of a batch to the GPU can be asynchronous (``non_blocking=True``): they may still
+    be queued after the batch is released. So when the next batch is collated, a CUDA event is recorded on the
+    current stream for the buffers of the previous batch, and the buffers wait for their event before being
+    overwritten. The copies must then be queued on the current CUDA stream before the next batch is requested.
+
+    For example, with a `DataLoader` collating in the main process:
+
+    .. code-block:: python
+
+        loader = DataLoader(dataset, batch_size=16, num_workers=0, collate_fn=BufferedCollate(pin_memory=True))
+        for batch in loader:
+            image = batch["image"].to(device, non_blocking=True)
+
+    When the collate function runs in the worker processes of a `DataLoader`, the batches are shared with the
+    main process so that the buffers can not be safely reused; the batches are then written to new shared
+    memory tensors, still without the intermediate padded copies.
+
+    This can be used on both list and dictionary data. In the case of the dictionary data, the padding is recorded
+    in the list of invertible transforms, it can be inverted with `PadListDataCollate.inverse`.
+
+    Args:
+        num_buffers: number of sets of buffers in the ring, default to 2.
+        pin_memory: whether to allocate the buffers in page-locked memory, ignored if CUDA is not available.
+        method: {``"symmetric"``, ``"end"``}
+            Pad the items symmetrically on all sides or at the end sides. Defaults to ``"symmetric"``.
+        value: the constant value to pad the items with, default to 0.
+
+    """
+
+    def __init__(
+        self,
+        num_buffers: int = 2,
+        pin_memory: bool = False,
+        method: Union[Method, str] = Method.SYMMETRIC,
+        value: float = 0,
+    ) -> None:
+        if num_buffers < 1:
+            raise ValueError("num_buffers must be a positive integer.")
+        self.num_buffers = num_buffers
+        self.pin_memory = pin_memory and torch.cuda.is_available()
+        self.method: Method = Method(method)
+        self.value = value
+        self.num_allocations = 0
+        self._buffers: List[Dict[Hashable, Tuple[torch.Tensor, Optional[weakref.ref]]]] = [
+            {} for _ in range(num_buffers)
+        ]
+        self._events: List[Optional[torch.cuda.Event]] = [None] * num_buffers
+        self._step = 0
+
+    def _sync_buffers(self, index: int) -> None:
+        """
+        Record a CUDA event after the copies of the previous batch, queued by the consumer, and wait for the
+        event of the buffers `index` so that they are not overwritten while an asynchronous copy reads them.
+
+        """
+        if self._step > 0:
+            event = torch.cuda.Event()
+            event.record()
+            self._events[(self._step - 1) % self.num_buffers] = event
+        event = self._events[index]
+        if event is not None:
+            event.synchronize()
+            self._events[index] = None
+
+    def _get_output(self, slot: Dict, key: Hashable, shape: Tuple[int, ...], dtype: torch.dtype) -> torch.Tensor:
+        """
+        Return a tensor of `shape` and `dtype` backed by the buffer of `key` in `slot`,
+        (re)allocating the buffer if it doesn't exist, is too small, or the previous output is still in use.
+
+        """
+        numel = int(np.prod(shape))
+        if torch.utils.data.get_worker_info() is not None:
+            # the outputs are sent to the main process, can't reuse the memory
+            self.num_allocations += 1
+            return torch.empty(numel, dtype=dtype).share_memory_().view(shape)
+        buffer, last_output = slot.get(key, (None, None))
+        in_use = last_output is not None and last_output() is not None
+        if buffer is None or buffer.numel() < numel or buffer.dtype != dtype or in_use:
+            size = max(numel, buffer.numel() if buffer is not None and buffer.dtype == dtype else 0)
+            buffer = torch.empty(size, dtype=dtype, pin_memory=self.pin_memory)
+            self.num_allocations += 1
+        output = buffer[:numel].view(shape)
+        slot[key] = (buffer, weakref.ref(output))
+        return output
+
+    def _collate_arrays(self, slot: Dict, key: Hashable, items: Sequence) -> torch.Tensor:
+        """
+        Write the arrays `items` into the rows of a batch buffer, padding them to the biggest spatial shape.
+
+        """
+        shapes = np.asarray([i.shape for i in items])
+        if shapes.ndim != 2 or (shapes.shape[1] > 0 and np.any(shapes[:, 0] != shapes[0, 0])):
+            raise RuntimeError(f"stack expects each item to have the same channel dimension, got {shapes.tolist()}.")
+        max_shape = tuple(int(s) for s in shapes.max(axis=0)) if shapes.shape[1] > 0 else ()
+        dtype = items[0].dtype if isinstance(items[0], torch.Tensor) else torch.from_numpy(items[0][None][:0]).dtype
+        out = self._get_output(slot, key, (len(items),) + max_shape, dtype)
+        if np.any(shapes != max_shape):
+            out.fill_(self.value)
+        for row, item, shape in zip(out, items, shapes):
+            if isinstance(item, np.ndarray):
+                item = torch.as_tensor(np.ascontiguousarray(item))
+            pad = [(m - s) // 2 if self.method == Method.SYMMETRIC else 0 for m, s in zip(max_shape, shape)]
+            row[tuple(slice(p, p + s) for p, s in zip(pad, shape))].copy_(item)
+        return out
+
+    def _collate(self, slot: Dict, key: Hashable, items: Sequence):
+        if isinstance(items[0], torch.Tensor) or (isinstance(items[0], np.ndarray) and items[0].dtype.kind in "biufc"):
+            return self._collate_arrays(slot, key, items)
+        return default_collate(items)
+
+    def __call__(self, batch: Sequence) -> Any:
+        elem = batch[0]
+        data = [i for k in batch for i in k] if isinstance(elem, list) else list(batch)
+        index = self._step % self.num_buffers
+        if self.pin_memory and torch.utils.data.get_worker_info() is None:
+            self._sync_buffers(index)
+        slot = self._buffers[index]
+        self._step += 1
+
+        elem = data[0]
+        if isinstance(elem, abc.Mapping):
+            padder = PadListDataCollate(method=self.method, mode=NumpyPadMode.CONSTANT)
+            for key in list(elem):
+                if not isinstance(elem[key], (np.ndarray, torch.Tensor)) or np.ndim(elem[key]) < 2:
+                    continue
+                spatial_shapes = np.asarray([d[key].shape[1:] for d in data])
+                if np.all(spatial_shapes == spatial_shapes.max(axis=0)):
+                    continue
+                # record the padding before collating the lists of applied transforms
+                for d in data:
+                    padder.push_transform(d, key, orig_size=d[key].shape[1:])
+            return {key: self._collate(slot, key, [d[key] for d in data]) for key in elem}
+        if isinstance(elem, tuple):
+            return [self._collate(slot, idx, [d[idx] for d in data]) for idx in range(len(elem))]
+        return self._collate(slot, None, data)
@@ -24,11 +24,12 @@ from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Seque
 
 import numpy as np
 import torch
+import torch.distributed as dist
 from torch.utils.data import Dataset as _TorchDataset
 from torch.utils.data import Subset
 
-from monai.data.utils import first, pickle_hashing
-from monai.transforms import Compose, Randomizable, Transform, apply_transform
+from monai.data.utils import first, partition_dataset, pickle_hashing
+from monai.transforms import Compose, Randomizable, apply_transform
 from monai.transforms.transform import RandomizableTransform
 from monai.utils import MAX_SEED, get_seed, min_version, optional_import
 
@@ -180,11 +181,10 @@ class PersistentDataset(Dataset):
         """
         if not isinstance(self.transform, Compose):
             raise ValueError("transform must be an instance of monai.transforms.Compose.")
-        for _transform in self.transform.transforms:
+        with self.transform.profile_stage("pre"):
             # execute all the deterministic transforms
-            if isinstance(_transform, RandomizableTransform) or not isinstance(_transform, Transform):
-                break
-            item_transformed = apply_transform(_transform, item_transformed)
+            for _transform in self.transform.cache_split()[0]:
+                item_transformed = apply_transform(_transform, item_transformed)
         return item_transformed
 
     def _post_transform(self, item_transformed):
@@ -200,14 +200,8 @@ class PersistentDataset(Dataset):
         """
         if not isinstance(self.transform, Compose):
             raise ValueError("transform must be an instance of monai.transforms.Compose.")
-        start_post_randomize_run = False
-        for _transform in self.transform.transforms:
-            if (
-                start_post_randomize_run
-                or isinstance(_transform, RandomizableTransform)
-                or not isinstance(_transform, Transform)
-            ):
-                start_post_randomize_run = True
+        with self.transform.profile_stage("post"):
+            for _transform in self.transform.cache_split()[1]:
                 item_transformed = apply_transform(_transform, item_transformed)
         return item_transformed
 
@@ -299,10 +293,11 @@ class CacheNTransDataset(PersistentDataset):
         """
         if not isinstance(self.transform, Compose):
             raise ValueError("transform must be an instance of monai.transforms.Compose.")
-        for i, _transform in enumerate(self.transform.transforms):
-            if i == self.cache_n_trans:
-                break
-            item_transformed = apply_transform(_transform, item_transformed)
+        with self.transform.profile_stage("pre"):
+            for i, _transform in enumerate(self.transform.transforms):
+                if i == self.cache_n_trans:
+                    break
+                item_transformed = apply_transform(_transform, item_transformed)
         return item_transformed
 
     def _post_transform(self, item_transformed):
@@ -317,9 +312,10 @@ class CacheNTransDataset(PersistentDataset):
         """
         if not isinstance(self.transform, Compose):
             raise ValueError("transform must be an instance of monai.transforms.Compose.")
-        for i, _transform in enumerate(self.transform.transforms):
-            if i >= self.cache_n_trans:
-                item_transformed = apply_transform(_transform, item_transformed)
+        with self.transform.profile_stage("post"):
+            for i, _transform in enumerate(self.transform.transforms):
+                if i >= self.cache_n_trans:
+                    item_transformed = apply_transform(_transform, item_transformed)
         return item_transformed
 
 
@@ -466,7 +462,9 @@ class CacheDataset(Dataset):
     It is recommended to experiment with different `cache_num` or `cache_rate` to identify the best training speed.
 
     To improve the caching efficiency, please always put as many as possible non-random transforms
-    before the randomized ones when composing the chain of transforms.
+    before the randomized ones when composing the chain of transforms, or use a `Compose` with
+    ``hoist_deterministic=True`` to also cache the deterministic transforms which commute with the random
+    ones before them, see :py:meth:`monai.transforms.Compose.cache_report`.
     If passing slicing indices, will return a PyTorch Subset, for example: `data: Subset = dataset[1:4]`,
     for more details, please check: https://pytorch.org/docs/stable/data.html#torch.utils.data.Subset
 
@@ -545,27 +543,24 @@ class CacheDataset(Dataset):
         item = self.data[idx]
         if not isinstance(self.transform, Compose):
             raise ValueError("transform must be an instance of monai.transforms.Compose.")
-        for _transform in self.transform.transforms:
+        with self.transform.profile_stage("pre"):
             # execute all the deterministic transforms
-            if isinstance(_transform, RandomizableTransform) or not isinstance(_transform, Transform):
-                break
-            item = apply_transform(_transform, item)
+            for _transform in self.transform.cache_split()[0]:
+                item = apply_transform(_transform, item)
         return item
 
     def _transform(self, index: int):
         if index % len(self) >= self.cache_num:  # support negative index
             # no cache for this index, execute all the transforms directly
             return super()._transform(index)
-        # load data from cache and execute from the first random transform
-        start_run = False
+        # load data from cache and execute the transforms which are not cached
         if self._cache is None:
             self._cache = self._fill_cache()
         data = self._cache[index]
         if not isinstance(self.transform, Compose):
             raise ValueError("transform must be an instance of monai.transforms.Compose.")
-        for _transform in self.transform.transforms:
-            if start_run or isinstance(_transform, RandomizableTransform) or not isinstance(_transform, Transform):
-                start_run = True
+        with self.transform.profile_stage("post"):
+            for _transform in self.transform.cache_split()[1]:
                 data = apply_transform(_transform, data)
         return data
 
@@ -829,6 +824,150 @@ class SmartCacheDataset(Randomizable, CacheDataset):
         return self.cache_num
 
 
+class DistributedCacheDataset(CacheDataset):
+    """
+    `CacheDataset` for distributed data parallel training, every rank only caches its own partition of `data`,
+    so that the memory usage of every node is divided by the number of ranks, instead of caching the whole
+    `data` in every rank. The dataset only contains the items of the partition of the current rank,
+    all the partitions have the same length (see also: :py:func:`monai.data.partition_dataset`),
+    it's typically used with :py:class:`monai.data.PartitionSampler` to shuffle the items of the partition
+    in every epoch.
+
+    As the ranks only see their own partition, the partitions can be rebalanced every `rebalance_interval` epochs:
+    every rank replaces `rebalance_rate` of its items with items of another rank, and loads and caches the
+    new items. All the ranks compute the same new partitions from `seed`, so no communication is needed.
+    `set_epoch()` must be called before every epoch to rebalance the partitions, `PartitionSampler` calls it.
+
+    For example:
+
+    .. code-block:: python
+
+        dataset = DistributedCacheDataset(data, transform, rebalance_interval=5, rebalance_rate=0.2)
+        sampler = PartitionSampler(dataset)
+        loader = DataLoader(dataset, batch_size=2, sampler=sampler, num_workers=4)
+        for epoch in range(num_epochs):
+            sampler.set_epoch(epoch)
+            for batch in loader:
+                ...
+
+    Note:
+        When the DataLoader uses `persistent_workers=True`, the worker processes keep the partitions of
+        their first epoch, so the rebalancing should be disabled.
+
+    Args:
+        data: input data to load and transform to generate dataset for model, the whole data of all the ranks.
+        transform: transforms to execute operations on input data.
+        num_replicas: number of processes participating in distributed training.
+            by default, `world_size` is retrieved from the current distributed group.
+        rank: rank of the current process within `num_replicas`. by default,
+            `rank` is retrieved from the current distributed group.
+        shuffle: whether to shuffle `data` before splitting it into partitions, default to `True`.
+        seed: random seed to shuffle `data` and rebalance the partitions, must be the same in all the ranks.
+        rebalance_interval: number of epochs between two rebalancing of the partitions,
+            default to 0, the partitions never change.
+        rebalance_rate: percentage of the items of every partition to exchange at every rebalancing.
+        cache_num: number of items to be cached in every rank. Default is `sys.maxsize`.
+            will take the minimum of (cache_num, partition_length x cache_rate, partition_length).
+        cache_rate: percentage of cached data in the partition, default is 1.0 (cache all).
+            will take the minimum of (cache_num, partition_length x cache_rate, partition_length).
+        num_workers: the number of worker threads to compute the cache.
+            If num_workers is None then the number returned by os.cpu_count() is used.
+        progress: whether to display a progress bar.
+
+    """
+
+    def __init__(
+        self,
+        data: Sequence,
+        transform: Union[Sequence[Callable], Callable],
+        num_replicas: Optional[int] = None,
+        rank: Optional[int] = None,
+        shuffle: bool = True,
+        seed: int = 0,
+        rebalance_interval: int = 0,
+        rebalance_rate: float = 0.25,
+        cache_num: int = sys.maxsize,
+        cache_rate: float = 1.0,
+        num_workers: Optional[int] = None,
+        progress: bool = True,
+    ) -> None:
+        if num_replicas is None:
+            num_replicas = dist.get_world_size() if dist.is_available() and dist.is_initialized() else 1
+        if rank is None:
+            rank = dist.get_rank() if dist.is_available() and dist.is_initialized() else 0
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"rank should be in the interval [0, {num_replicas - 1}], got {rank}.")
+        if not 0.0 <= rebalance_rate <= 1.0:
+            raise ValueError(f"rebalance_rate must be in [0, 1], got {rebalance_rate}.")
+        self.full_data = data
+        self.rank = rank
+        self.seed = seed
+        self.rebalance_interval = rebalance_interval
+        self.rebalance_rate = rebalance_rate
+        self.epoch = 0
+        self._round = 0
+        self._partitions: List[List[int]] = partition_dataset(
+            data=list(range(len(data))),
+            num_partitions=num_replicas,
+            shuffle=shuffle,
+            seed=seed,
+            even_divisible=True,
+        )
+        super().__init__(
+            data=[data[i] for i in self._partitions[rank]],
+            transform=transform,
+            cache_num=cache_num,
+            cache_rate=cache_rate,
+            num_workers=num_workers,
+            progress=progress,
+        )
+
+    @property
+    def partition(self) -> List[int]:
+        """
+        The indices in the whole `data` of the items of the current rank.
+
+        """
+        return list(self._partitions[self.rank])
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Set the epoch of the training, and rebalance the partitions if a rebalancing is due.
+
+        """
+        self.epoch = epoch
+        if self.rebalance_interval <= 0:
+            return
+        while self._round < epoch // self.rebalance_interval:
+            self._round += 1
+            self._rebalance()
+
+    def _rebalance(self) -> None:
+        """
+        Move `rebalance_rate` of the items of every rank to another rank, and cache the new items of the current rank.
+
+        """
+        num_replicas, part_len = len(self._partitions), len(self._partitions[0])
+        num_moves = int(part_len * self.rebalance_rate)
+        if num_replicas < 2 or num_moves == 0:
+            return
+        rand_state = np.random.RandomState((self.seed + self._round) % MAX_SEED)
+        shift = rand_state.randint(1, num_replicas)
+        positions = [rand_state.choice(part_len, num_moves, replace=False) for _ in range(num_replicas)]
+        previous = deepcopy(self._partitions)
+        for dst in range(num_replicas):
+            src = (dst - shift) % num_replicas
+            for dst_pos, src_pos in zip(positions[dst], positions[src]):
+                self._partitions[dst][dst_pos] = previous[src][src_pos]
+
+        for pos in positions[self.rank]:
+            self.data[pos] = self.full_data[self._partitions[self.rank][pos]]
+        to_load = [int(pos) for pos in positions[self.rank] if pos < self.cache_num]
+        with ThreadPool(self.num_workers) as p:
+            for pos, item in zip(to_load, p.map(self._load_cache_item, to_load)):
+                self._cache[pos] = item
+
+
 class ZipDataset(Dataset):
     """
     Zip several PyTorch datasets and output data(with the same index) together in a tuple.
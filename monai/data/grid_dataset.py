@@ -9,16 +9,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Dict, Optional, Sequence, Union
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
+import torch.distributed as dist
 from torch.utils.data import IterableDataset
 
 from monai.data.dataset import Dataset
-from monai.data.utils import iter_patch
+from monai.data.utils import (
+    get_patch_grid,
+    get_patch_grid_coords,
+    get_valid_patch_size,
+    iter_patch,
+    iter_patch_at_coords,
+    iter_patch_views,
+)
 from monai.transforms import apply_transform
-from monai.utils import NumpyPadMode, ensure_tuple
+from monai.utils import MAX_SEED, NumpyPadMode, ensure_tuple
 
 __all__ = ["PatchDataset", "GridPatchDataset", "PatchIter"]
 
@@ -34,6 +44,8 @@ class PatchIter:
         patch_size: Sequence[int],
         start_pos: Sequence[int] = (),
         mode: Union[NumpyPadMode, str] = NumpyPadMode.WRAP,
+        virtual_pad: bool = False,
+        batch_size: Optional[int] = None,
         **pad_opts: Dict,
     ):
         """
@@ -45,6 +57,12 @@ class PatchIter:
                 ``"median"``, ``"minimum"``, ``"reflect"``, ``"symmetric"``, ``"wrap"``, ``"empty"``}
                 One of the listed string values or a user supplied function. Defaults to ``"wrap"``.
                 See also: https://numpy.org/doc/1.18/reference/generated/numpy.pad.html
+            virtual_pad: if `True`, the input array is not padded, the patches inside the array are views
+                of the input (modifying them in place modifies the input), and only the patches crossing the
+                border are padded. see also: :py:func:`monai.data.utils.iter_patch_views`.
+            batch_size: if not None, extract all the patches of the grid at once and yield them in stacks of
+                `batch_size` patches, along with the stacked coordinates.
+                see also: :py:func:`monai.data.utils.get_patch_grid`.
             pad_opts: padding options, see numpy.pad
 
         Note:
@@ -58,13 +76,46 @@ class PatchIter:
         self.patch_size = (None,) + tuple(patch_size)
         self.start_pos = ensure_tuple(start_pos)
         self.mode: NumpyPadMode = NumpyPadMode(mode)
+        self.virtual_pad = virtual_pad
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+        self.batch_size = batch_size
         self.pad_opts = pad_opts
 
-    def __call__(self, array):
+    def num_patches(self, image_shape: Sequence[int]) -> int:
+        """
+        The number of items yielded for an image of shape `image_shape` (including the channel dim): the number
+        of patches of the grid, or of stacks of `batch_size` patches. It only depends on the shape of the image,
+        for example to compute the `num_patches` of :py:class:`monai.data.GridPatchDataset` without reading it.
+
+        Args:
+            image_shape: the shape of the image, channel first.
+        """
+        num_patches = len(get_patch_grid_coords(image_shape, self.patch_size, self.start_pos))
+        return num_patches if self.batch_size is None else -(-num_patches // self.batch_size)
+
+    def __call__(self, array, start: int = 0, stop: Optional[int] = None):
         """
         Args:
             array: the image to generate patches from.
+            start: index of the first item to yield, the patches before it are not extracted.
+            stop: index after the last item to yield, if None, yield the items until the end of the grid.
         """
+        if start != 0 or stop is not None:
+            yield from self._iter_range(array, start, stop)
+            return
+        if self.batch_size is not None:
+            patches, coords = get_patch_grid(
+                array, patch_size=self.patch_size, start_pos=self.start_pos, mode=self.mode, **self.pad_opts
+            )
+            for i in range(0, len(patches), self.batch_size):
+                yield patches[i : i + self.batch_size], coords[i : i + self.batch_size]
+            return
+        if self.virtual_pad:
+            yield from iter_patch_views(
+                array, patch_size=self.patch_size, start_pos=self.start_pos, mode=self.mode, **self.pad_opts
+            )
+            return
         yield from iter_patch(
             array,
             patch_size=self.patch_size,  # expand to have the channel dim
@@ -74,6 +125,24 @@ class PatchIter:
             **self.pad_opts,
         )
 
+    def _iter_range(self, array, start: int, stop: Optional[int]):
+        """
+        Yield the items `start` to `stop` of `__call__`, only extracting the patches at their grid coordinates.
+
+        """
+        patch_size = get_valid_patch_size(array.shape, self.patch_size)
+        coords = get_patch_grid_coords(array.shape, patch_size, self.start_pos)
+        batch_size = self.batch_size or 1
+        coords = coords[start * batch_size : None if stop is None else stop * batch_size]
+        patches = iter_patch_at_coords(array, coords, self.mode, **self.pad_opts)
+        if self.batch_size is None:
+            for patch, coord in patches:
+                # the patches are views of the input only with `virtual_pad`, as `__call__`
+                yield (patch if self.virtual_pad else np.array(patch)), coord
+            return
+        for i in range(0, len(coords), batch_size):
+            yield np.stack([patch for patch, _ in islice(patches, batch_size)]), coords[i : i + batch_size]
+
 
 class GridPatchDataset(IterableDataset):
     """
@@ -108,6 +177,11 @@ class GridPatchDataset(IterableDataset):
         #     coordinates: tensor([[[0, 1], [0, 2], [0, 2]],
         #                          [[0, 1], [2, 4], [0, 2]]])
 
+    By default, the images are split across the DataLoader workers. With a few large images,
+    `shard_patches=True` distributes the patches instead, across the workers and the distributed ranks,
+    every worker only reading the images of its own patches,
+    and `num_interleaved` together with `shuffle_buffer_size` mix patches from several images in a batch.
+
     """
 
     def __init__(
@@ -116,6 +190,15 @@ class GridPatchDataset(IterableDataset):
         patch_iter: Callable,
         transform: Optional[Callable] = None,
         with_coordinates: bool = True,
+        shard_patches: bool = False,
+        num_replicas: Optional[int] = None,
+        rank: Optional[int] = None,
+        num_interleaved: int = 1,
+        shuffle_buffer_size: int = 0,
+        cache_images: bool = False,
+        seed: int = 0,
+        num_patches: Optional[Union[int, Sequence[int]]] = None,
+        drop_last: bool = False,
     ) -> None:
         """
         Initializes this dataset in terms of the image dataset, patch generator, and an optional transform.
@@ -127,6 +210,38 @@ class GridPatchDataset(IterableDataset):
                 see also: :py:class:`monai.data.PatchIter`.
             transform: a callable data transform operates on the patches.
             with_coordinates: whether to yield the coordinates of each patch, default to `True`.
+            shard_patches: if `False` (default), the images are split across the DataLoader workers and
+                every worker yields all the patches of its own images. if `True`, the sequence of the patches of
+                all the images is split into contiguous ranges of the same length, one for every DataLoader worker
+                of every distributed rank, so that a few large images keep every worker busy. Every worker only
+                reads the images of its own range, and the ranges are padded with the first patches (or trimmed
+                if `drop_last`) so that all the ranks yield the same number of patches, as `DistributedSampler`.
+            num_replicas: number of processes participating in distributed training, only used when
+                `shard_patches=True`. by default, `world_size` is retrieved from the current distributed group.
+            rank: rank of the current process within `num_replicas`, only used when `shard_patches=True`.
+                by default, `rank` is retrieved from the current distributed group.
+            num_interleaved: number of images to read in parallel, their patches are interleaved
+                in a round-robin manner. default to 1, the images are visited one by one.
+            shuffle_buffer_size: size of a bounded buffer to randomly shuffle the patches before yielding,
+                used in combination with `num_interleaved` to mix patches from several images in a batch.
+                default to 0, no shuffling.
+            cache_images: whether to keep the images loaded from `dataset` in memory and reuse them in
+                the next iterations instead of re-reading them. Note that the cache is created in every
+                DataLoader worker, use it with `persistent_workers=True` to reuse it across the epochs.
+            seed: random seed to shuffle the patches if the dataset is not iterated in a DataLoader worker,
+                otherwise the seed of the worker is used.
+            num_patches: the number of items yielded by `patch_iter` for every image, or for all the images if
+                it's an int, required when `shard_patches=True` so that the images are not read to count their
+                patches. For a :py:class:`monai.data.PatchIter`, it can be computed from the image shapes
+                with :py:meth:`monai.data.PatchIter.num_patches`.
+            drop_last: if `True`, trim the patches of the last range instead of padding the ranges
+                to the same length, only used when `shard_patches=True`. default to `False`.
+
+        Raises:
+            ValueError: When ``rank`` is not in the interval [0, ``num_replicas`` - 1].
+            ValueError: When ``num_interleaved`` is not a positive integer.
+            ValueError: When ``shard_patches`` is True and ``num_patches`` is None.
+            ValueError: When ``num_patches`` is a sequence of a different length than ``dataset``.
 
         """
 
@@ -134,6 +249,107 @@ class GridPatchDataset(IterableDataset):
         self.patch_iter = patch_iter
         self.transform = transform
         self.with_coordinates = with_coordinates
+        self.shard_patches = shard_patches
+        if num_replicas is None:
+            num_replicas = dist.get_world_size() if dist.is_available() and dist.is_initialized() else 1
+        if rank is None:
+            rank = dist.get_rank() if dist.is_available() and dist.is_initialized() else 0
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"rank should be in the interval [0, {num_replicas - 1}], got {rank}.")
+        self.num_replicas = num_replicas
+        self.rank = rank
+        if num_interleaved < 1:
+            raise ValueError("num_interleaved must be a positive integer.")
+        self.num_interleaved = num_interleaved
+        self.shuffle_buffer_size = shuffle_buffer_size
+        self.cache_images = cache_images
+        self.seed = seed
+        self.drop_last = drop_last
+        self.num_patches: Optional[np.ndarray] = None
+        if shard_patches:
+            if num_patches is None:
+                raise ValueError("num_patches must be specified when shard_patches is True.")
+            self.num_patches = np.asarray(num_patches, dtype=np.int64)
+            if self.num_patches.ndim == 0:
+                self.num_patches = np.full(len(dataset), self.num_patches, dtype=np.int64)
+            if self.num_patches.shape != (len(dataset),):
+                raise ValueError(f"num_patches must be an int or a sequence of {len(dataset)} ints, got {num_patches}.")
+        self._num_iters = 0
+        self._image_cache: Dict[int, object] = {}
+
+    def _load_image(self, index: int):
+        if not self.cache_images:
+            return self.dataset[index]
+        if index not in self._image_cache:
+            self._image_cache[index] = self.dataset[index]
+        return self._image_cache[index]
+
+    def _shard_segments(self, num_shards: int, shard_id: int) -> List[Tuple[int, int, Optional[int]]]:
+        """
+        The `(image index, start, stop)` ranges of the patches of the shard `shard_id`: the sequence of the
+        patches of all the images is split into `num_shards` contiguous ranges of the same length,
+        padded by wrapping around to the first patches, or trimmed if `drop_last`.
+
+        """
+        offsets = np.concatenate([[0], np.cumsum(self.num_patches)])
+        total = int(offsets[-1])
+        if total == 0:
+            return []
+        length = total // num_shards if self.drop_last else -(-total // num_shards)
+        segments: List[Tuple[int, int, Optional[int]]] = []
+        start, stop = shard_id * length, (shard_id + 1) * length
+        while start < stop:
+            begin = start % total
+            # the image of the patch `begin`, skipping the images without patches
+            index = int(np.searchsorted(offsets, begin, side="right")) - 1
+            size = min(int(offsets[index + 1]) - begin, stop - start)
+            segments.append((index, begin - int(offsets[index]), begin - int(offsets[index]) + size))
+            start += size
+        return segments
+
+    def _iter_patches(self, segments: Iterable[Tuple[int, int, Optional[int]]]) -> Iterator:
+        """
+        Yield the outputs of `patch_iter` in the `(image index, start, stop)` ranges of `segments`,
+        reading `num_interleaved` images at a time and visiting their patches in a round-robin manner.
+
+        """
+        segments = iter(segments)
+
+        def _patches(index, start, stop):
+            if isinstance(self.patch_iter, PatchIter):
+                # only extract the patches of the range
+                return self.patch_iter(self._load_image(index), start, stop)
+            return islice(self.patch_iter(self._load_image(index)), start, stop)
+
+        active: deque = deque(_patches(*segment) for segment in islice(segments, self.num_interleaved))
+        while active:
+            patches = active.popleft()
+            try:
+                item = next(patches)
+            except StopIteration:
+                # replace the exhausted image with the next one
+                for segment in islice(segments, 1):
+                    active.append(_patches(*segment))
+                continue
+            yield item
+            active.append(patches)
+
+    @staticmethod
+    def _shuffle(items: Iterator, buffer_size: int, rand_state: np.random.RandomState) -> Iterator:
+        """
+        Randomly shuffle `items` with a bounded buffer of size `buffer_size`.
+
+        """
+        buffer: list = []
+        for item in items:
+            if len(buffer) < buffer_size:
+                buffer.append(item)
+                continue
+            idx = rand_state.randint(buffer_size)
+            yield buffer[idx]
+            buffer[idx] = item
+        rand_state.shuffle(buffer)
+        yield from buffer
 
     def __iter__(self):
         worker_info = torch.utils.data.get_worker_info()
@@ -143,26 +359,31 @@ class GridPatchDataset(IterableDataset):
         except TypeError:
             raise NotImplementedError("image dataset must implement `len()`.")
 
-        if worker_info is not None:
-            # split workload
-            per_worker = int(np.ceil((iter_end - iter_start) / float(worker_info.num_workers)))
-            iter_start = iter_start + worker_info.id * per_worker
-            iter_end = min(iter_start + per_worker, iter_end)
-
-        for index in range(iter_start, iter_end):
-            image = self.dataset[index]
-            if not self.with_coordinates:
-                for patch, *_ in self.patch_iter(image):  # patch_iter to yield at least 1 item: patch
-                    out_patch = (
-                        patch if self.transform is None else apply_transform(self.transform, patch, map_items=False)
-                    )
-                    yield out_patch
-            else:
-                for patch, slices, *_ in self.patch_iter(image):  # patch_iter to yield at least 2 items: patch, coords
-                    out_patch = (
-                        patch if self.transform is None else apply_transform(self.transform, patch, map_items=False)
-                    )
-                    yield out_patch, slices
+        if self.shard_patches:
+            num_workers, worker_id = (1, 0) if worker_info is None else (worker_info.num_workers, worker_info.id)
+            segments = self._shard_segments(self.num_replicas * num_workers, self.rank * num_workers + worker_id)
+        else:
+            if worker_info is not None:
+                # split workload
+                per_worker = int(np.ceil((iter_end - iter_start) / float(worker_info.num_workers)))
+                iter_start = iter_start + worker_info.id * per_worker
+                iter_end = min(iter_start + per_worker, iter_end)
+            segments = [(index, 0, None) for index in range(iter_start, iter_end)]
+
+        patches = self._iter_patches(segments)
+        if self.shuffle_buffer_size > 1:
+            seed = self.seed + self._num_iters if worker_info is None else worker_info.seed
+            patches = self._shuffle(patches, self.shuffle_buffer_size, np.random.RandomState(seed % MAX_SEED))
+        self._num_iters += 1
+
+        if not self.with_coordinates:
+            for patch, *_ in patches:  # patch_iter to yield at least 1 item: patch
+                out_patch = patch if self.transform is None else apply_transform(self.transform, patch, map_items=False)
+                yield out_patch
+        else:
+            for patch, slices, *_ in patches:  # patch_iter to yield at least 2 items: patch, coords
+                out_patch = patch if self.transform is None else apply_transform(self.transform, patch, map_items=False)
+                yield out_patch, slices
 
 
 class PatchDataset(Dataset):
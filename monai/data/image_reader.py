@@ -10,9 +10,11 @@
 # limitations under the License.
 
 import os
+import threading
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 from torch.utils.data._utils.collate import np_str_obj_array_pattern
@@ -43,7 +45,7 @@ else:
     cucim, has_cim = optional_import("cucim")
     openslide, has_osl = optional_import("openslide")
 
-__all__ = ["ImageReader", "ITKReader", "NibabelReader", "NumpyReader", "PILReader", "WSIReader"]
+__all__ = ["ImageReader", "ITKReader", "NibabelReader", "NumpyReader", "PILReader", "WSIReader", "WSITileCache"]
 
 
 class ImageReader(ABC):
@@ -633,18 +635,104 @@ class PILReader(ImageReader):
         return np.asarray((img.width, img.height))
 
 
+class WSITileCache:
+    """
+    Thread-safe LRU cache of the decoded tiles of whole slide images, with a budget in bytes.
+    The least recently used tiles are evicted when the total size of the cached tiles exceeds `max_bytes`.
+    The numbers of hits and misses of the lookups are counted in `hits` and `misses`.
+    The cache returned by :py:meth:`shared` is shared by all the `WSIReader` of the process using it.
+
+    Args:
+        max_bytes: the maximum total size in bytes of the cached tiles. Defaults to 1 GiB.
+
+    """
+
+    _shared: Optional["WSITileCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_bytes: int = 2 ** 30) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._tiles: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "WSITileCache":
+        """The tile cache shared in the process, created with the default budget on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, key) -> Optional[np.ndarray]:
+        """Return the tile of `key` and mark it as recently used, or None if it's not cached."""
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._tiles.move_to_end(key)
+            return tile
+
+    def put(self, key, tile: np.ndarray) -> None:
+        """Cache the `tile` of `key`, evicting the least recently used tiles to stay within the budget."""
+        if tile.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._tiles:
+                self.nbytes -= self._tiles.pop(key).nbytes
+            self._tiles[key] = tile
+            self.nbytes += tile.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._tiles.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Remove all the tiles and reset the counters."""
+        with self._lock:
+            self._tiles.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of the lookups found in the cache, 0.0 before any lookup."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+
 class WSIReader(ImageReader):
     """
     Read whole slide imaging and extract patches.
 
     Args:
         reader_lib: backend library to load the images, available options: "OpenSlide" or "cuCIM".
+        tile_cache: if not None, the regions at level 0 are assembled from the decoded tiles of the native tile
+            grid of the image, cached in this :py:class:`WSITileCache`, so the overlapping regions requested again
+            (for example the patches of nearby locations, or of the next epochs) are not decoded again.
+            If True, use the cache shared in the process (:py:meth:`WSITileCache.shared`). Defaults to None.
+        tile_size: (height, width) of the cached tiles. if None, use the native tile size of the image,
+            or 256 if the backend doesn't provide it.
 
     """
 
-    def __init__(self, reader_lib: str = "OpenSlide"):
+    def __init__(
+        self,
+        reader_lib: str = "OpenSlide",
+        tile_cache: Optional[Union[bool, WSITileCache]] = None,
+        tile_size: Optional[Union[int, Tuple[int, int]]] = None,
+    ):
         super().__init__()
         self.reader_lib = reader_lib.lower()
+        if isinstance(tile_cache, bool):
+            tile_cache = WSITileCache.shared() if tile_cache else None
+        self.tile_cache: Optional[WSITileCache] = tile_cache
+        self.tile_size = None if tile_size is None else ensure_tuple_rep(tile_size, 2)
         if self.reader_lib == "openslide":
             if has_osl:
                 self.wsi_reader = openslide.OpenSlide
@@ -750,6 +838,9 @@ class WSIReader(ImageReader):
     ):
         # reverse the order of dimensions for size and location to be compatible with image shape
         location = location[::-1]
+        if size is not None and level == 0 and self.tile_cache is not None:
+            region = self._extract_region_from_tiles(img_obj, size=size[::-1], location=location)
+            return region.astype(dtype, copy=False)
         if size is None:
             region = img_obj.read_region(location=location, level=level)
         else:
@@ -759,6 +850,54 @@ class WSIReader(ImageReader):
         region = self.convert_to_rgb_array(region, dtype)
         return region
 
+    def _native_tile_size(self, img_obj) -> Tuple[int, int]:
+        """The (width, height) of the tiles at level 0 of `img_obj`, or (256, 256) if not available."""
+        if self.tile_size is not None:
+            return self.tile_size[1], self.tile_size[0]
+        try:
+            if self.reader_lib == "openslide":
+                properties = img_obj.properties
+                return (
+                    int(properties["openslide.level[0].tile-width"]),
+                    int(properties["openslide.level[0].tile-height"]),
+                )
+            width, height = img_obj.resolutions["level_tile_sizes"][0]
+            return int(width), int(height)
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            return 256, 256
+
+    def _extract_region_from_tiles(self, img_obj, size: Tuple[int, int], location: Tuple[int, int]) -> np.ndarray:
+        """
+        Assemble the RGB region of (width, height) `size` at the (x, y) `location` of level 0
+        from the cached tiles, reading and caching the missing tiles.
+
+        """
+        tile_cache = cast(WSITileCache, self.tile_cache)
+        # the tiles of the same file are shared by the image objects of different readers
+        image_key = getattr(img_obj, "path", None) or getattr(img_obj, "_filename", None) or id(img_obj)
+        tile_width, tile_height = self._native_tile_size(img_obj)
+        x_min, y_min = (int(i) for i in location)
+        x_max, y_max = x_min + int(size[0]), y_min + int(size[1])
+        region = np.empty((y_max - y_min, x_max - x_min, 3), dtype=np.uint8)
+        for tile_y in range(y_min // tile_height, (y_max - 1) // tile_height + 1):
+            for tile_x in range(x_min // tile_width, (x_max - 1) // tile_width + 1):
+                key = (image_key, tile_width, tile_height, tile_x, tile_y)
+                tile = tile_cache.get(key)
+                if tile is None:
+                    raw_tile = img_obj.read_region(
+                        location=(tile_x * tile_width, tile_y * tile_height), size=(tile_width, tile_height), level=0
+                    )
+                    tile = self.convert_to_rgb_array(raw_tile, np.uint8)
+                    tile_cache.put(key, tile)
+                # copy the overlap of the tile and the region
+                x_start, y_start = max(x_min, tile_x * tile_width), max(y_min, tile_y * tile_height)
+                x_end, y_end = min(x_max, (tile_x + 1) * tile_width), min(y_max, (tile_y + 1) * tile_height)
+                region[y_start - y_min : y_end - y_min, x_start - x_min : x_end - x_min] = tile[
+                    y_start - tile_y * tile_height : y_end - tile_y * tile_height,
+                    x_start - tile_x * tile_width : x_end - tile_x * tile_width,
+                ]
+        return region
+
     def convert_to_rgb_array(
         self,
         raw_region,
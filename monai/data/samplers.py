@@ -9,13 +9,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence, Sized, Tuple
 
+import numpy as np
 import torch
+import torch.distributed as dist
 from torch.utils.data import Dataset
 from torch.utils.data import DistributedSampler as _TorchDistributedSampler
+from torch.utils.data import Sampler
 
-__all__ = ["DistributedSampler", "DistributedWeightedRandomSampler"]
+from monai.data.image_reader import ImageReader, NibabelReader
+
+__all__ = ["DistributedSampler", "DistributedWeightedRandomSampler", "BucketBatchSampler", "PartitionSampler"]
 
 
 class DistributedSampler(_TorchDistributedSampler):
@@ -117,3 +122,210 @@ class DistributedWeightedRandomSampler(DistributedSampler):
 
     def __len__(self):
         return self.num_samples_per_rank
+
+
+class BucketBatchSampler(Sampler):
+    """
+    Batch sampler grouping the items of similar spatial sizes, to reduce the padding needed to collate
+    variable-shape images (for example with `pad_list_data_collate`).
+
+    At every epoch, the items are split into `num_buckets` buckets of the same number of items, grouping the items
+    which need the least padding to a common spatial shape (so that, for example, items of shapes 100x10 and 10x100
+    are not grouped even if they have the same number of voxels, ties are broken randomly).
+    The items of every bucket are shuffled and grouped
+    into batches, then the order of all the batches is shuffled. Every rank of the distributed training yields
+    the same number of batches: the list of batches is extended by repeating the first batches to be evenly
+    divisible by `num_replicas`, and every rank selects one batch out of `num_replicas`.
+
+    For example:
+
+    .. code-block:: python
+
+        sizes = BucketBatchSampler.read_spatial_sizes([d["image"] for d in datalist])
+        sampler = BucketBatchSampler(sizes, batch_size=4, num_buckets=8)
+        loader = DataLoader(dataset, batch_sampler=sampler, collate_fn=pad_list_data_collate)
+        for epoch in range(num_epochs):
+            sampler.set_epoch(epoch)
+            ...
+        print(sampler.get_padding_stats())
+
+    Args:
+        sizes: the spatial size of every item of the dataset, known from the metadata
+            or from the headers of the image files, see also: :py:meth:`read_spatial_sizes`.
+        batch_size: number of items in a batch.
+        num_buckets: number of groups of items of similar sizes. 1 is equivalent to random batches,
+            `len(sizes) / batch_size` makes every batch a group of items of similar sizes.
+        shuffle: if `True`, sampler will shuffle the items of a bucket and the batches, default to True.
+        drop_last: if `True`, drop the last incomplete batch of every bucket, default to False.
+        num_replicas: number of processes participating in distributed training.
+            by default, `world_size` is retrieved from the current distributed group.
+        rank: rank of the current process within `num_replicas`. by default,
+            `rank` is retrieved from the current distributed group.
+        seed: random seed to shuffle the items, must be the same across all the ranks, default to 0.
+
+    """
+
+    def __init__(
+        self,
+        sizes: Sequence[Sequence[int]],
+        batch_size: int,
+        num_buckets: int = 10,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        num_replicas: Optional[int] = None,
+        rank: Optional[int] = None,
+        seed: int = 0,
+    ) -> None:
+        if batch_size <= 0 or num_buckets <= 0:
+            raise ValueError("batch_size and num_buckets must be positive integers.")
+        if num_replicas is None:
+            num_replicas = dist.get_world_size() if dist.is_available() and dist.is_initialized() else 1
+        if rank is None:
+            rank = dist.get_rank() if dist.is_available() and dist.is_initialized() else 0
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"rank should be in the interval [0, {num_replicas - 1}], got {rank}.")
+        self.sizes = np.asarray(sizes, dtype=np.int64)
+        if self.sizes.ndim != 2:
+            raise ValueError("all the items must have the same number of spatial dimensions.")
+        self.batch_size = batch_size
+        self.num_buckets = num_buckets
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.seed = seed
+        self.epoch = 0
+
+    @staticmethod
+    def read_spatial_sizes(filenames: Sequence[str], reader: Optional[ImageReader] = None) -> List[Tuple[int, ...]]:
+        """
+        Scan the spatial sizes of the image files, by default with the `NibabelReader`
+        which only reads the headers of the files.
+
+        Args:
+            filenames: the image files of the dataset.
+            reader: reader to load the image objects, the size is read from the `shape` attribute of the image
+                objects if available, otherwise from the `spatial_shape` of the meta data of `reader.get_data`.
+
+        """
+        reader = NibabelReader() if reader is None else reader
+        sizes = []
+        for filename in filenames:
+            img = reader.read(filename)
+            shape = getattr(img, "shape", None)
+            if shape is None:
+                shape = reader.get_data(img)[1]["spatial_shape"]
+            sizes.append(tuple(int(s) for s in shape))
+        return sizes
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Set the epoch for this sampler, the batches of every epoch are shuffled differently.
+
+        """
+        self.epoch = epoch
+
+    def _get_buckets(self, rand_state: np.random.RandomState) -> List[np.ndarray]:
+        """
+        Greedily split the items into `num_buckets` buckets of the same number of items: every bucket starts
+        from the biggest remaining item and takes the remaining items which need the least padding to the
+        bounding shape of this item and themselves, i.e. the smallest ``prod(max(shape, item shape)) - prod(shape)``.
+
+        """
+        num_items = len(self.sizes)
+        ties = rand_state.rand(num_items) if self.shuffle else np.arange(num_items)
+        volumes = np.prod(self.sizes, axis=1)
+        remaining = np.lexsort((ties, -volumes))
+        buckets: List[np.ndarray] = []
+        for bucket_size in map(len, np.array_split(remaining, min(self.num_buckets, max(num_items, 1)))):
+            sizes = self.sizes[remaining]
+            cost = np.prod(np.maximum(sizes, sizes[0]), axis=1) - volumes[remaining]
+            cost[0] = -1  # the biggest item starts the bucket
+            chosen = np.lexsort((ties[remaining], cost))[:bucket_size]
+            buckets.append(remaining[np.sort(chosen)])
+            remaining = np.delete(remaining, chosen)
+        return buckets
+
+    def _get_all_batches(self) -> List[List[int]]:
+        rand_state = np.random.RandomState(self.seed + self.epoch)
+        batches: List[List[int]] = []
+        for bucket in self._get_buckets(rand_state):
+            if self.shuffle:
+                rand_state.shuffle(bucket)
+            for i in range(0, len(bucket), self.batch_size):
+                batch = bucket[i : i + self.batch_size].tolist()
+                if len(batch) == self.batch_size or not self.drop_last:
+                    batches.append(batch)
+        if self.shuffle:
+            batches = [batches[i] for i in rand_state.permutation(len(batches))]
+        return batches
+
+    def _get_batches(self) -> List[List[int]]:
+        batches = self._get_all_batches()
+        if not batches:
+            return batches
+        # add extra batches to make it evenly divisible
+        num_batches = int(np.ceil(len(batches) / self.num_replicas)) * self.num_replicas
+        batches += (batches * int(np.ceil(num_batches / len(batches))))[: num_batches - len(batches)]
+        return batches[self.rank : num_batches : self.num_replicas]
+
+    def __iter__(self) -> Iterator[List[int]]:
+        yield from self._get_batches()
+
+    def __len__(self) -> int:
+        return len(self._get_batches())
+
+    def get_padding_stats(self) -> Dict[str, float]:
+        """
+        Compute the padding needed to collate the batches of the current epoch and rank,
+        returns a dictionary of the number of voxels of the items, the number of voxels of the padded batches,
+        and the ratio of padding voxels in the padded batches.
+
+        """
+        data_voxels, padded_voxels = 0, 0
+        for batch in self._get_batches():
+            sizes = self.sizes[batch]
+            data_voxels += int(np.prod(sizes, axis=1).sum())
+            padded_voxels += len(batch) * int(np.prod(sizes.max(axis=0)))
+        waste = 1.0 - data_voxels / padded_voxels if padded_voxels > 0 else 0.0
+        return {"data_voxels": data_voxels, "padded_voxels": padded_voxels, "waste_ratio": waste}
+
+
+class PartitionSampler(Sampler):
+    """
+    Sampler shuffling the items of a dataset that only contains the partition of the current rank,
+    typically :py:class:`monai.data.DistributedCacheDataset`, so that every rank keeps sampling the items it
+    has cached instead of reshuffling the indices across the ranks like `DistributedSampler`.
+    `set_epoch()` is forwarded to the dataset, so that the partitions can be rebalanced during the training.
+
+    Args:
+        dataset: the dataset of the partition of the current rank.
+        shuffle: if `True`, sampler will shuffle the indices in every epoch, default to True.
+        seed: random seed to shuffle the indices, default to 0.
+
+    """
+
+    def __init__(self, dataset: Sized, shuffle: bool = True, seed: int = 0) -> None:
+        self.dataset = dataset
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Set the epoch for this sampler and the dataset, the indices of every epoch are shuffled differently.
+
+        """
+        self.epoch = epoch
+        set_epoch = getattr(self.dataset, "set_epoch", None)
+        if callable(set_epoch):
+            set_epoch(epoch)
+
+    def __iter__(self) -> Iterator[int]:
+        if not self.shuffle:
+            return iter(range(len(self.dataset)))
+        rand_state = np.random.RandomState(self.seed + self.epoch)
+        return iter(rand_state.permutation(len(self.dataset)).tolist())
+
+    def __len__(self) -> int:
+        return len(self.dataset)
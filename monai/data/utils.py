@@ -45,6 +45,10 @@ __all__ = [
     "iter_patch_slices",
     "dense_patch_slices",
     "iter_patch",
+    "get_patch_grid_coords",
+    "get_patch_grid",
+    "iter_patch_views",
+    "iter_patch_at_coords",
     "get_valid_patch_size",
     "list_data_collate",
     "worker_init_fn",
@@ -227,6 +231,202 @@ def iter_patch(
         arr[...] = arrpad[slices]
 
 
+def get_patch_grid_coords(
+    image_size: Sequence[int], patch_size: Union[Sequence[int], int], start_pos: Sequence[int] = ()
+) -> np.ndarray:
+    """
+    Vectorized version of the grid visited by `iter_patch`: compute the coordinates of all the patches of size
+    `patch_size` in a contiguous grid starting from `start_pos` (can be negative) and covering `image_size`.
+    The patches are in the same order as `iter_patch`, using the first dimension as least significant.
+
+    Args:
+        image_size: dimensions of array to iterate over
+        patch_size: size of patches to generate slices for, 0 or None selects whole dimension
+        start_pos: starting position in the array, default is 0 for each dimension
+
+    Returns:
+        an integer array of shape (num_patches, len(image_size), 2), the last dimension is [start, end).
+
+    """
+    patch_size_ = get_valid_patch_size(image_size, patch_size)
+    start_pos = ensure_tuple_size(start_pos, len(image_size))
+    starts = [np.arange(s, d, p) for s, d, p in zip(start_pos, image_size, patch_size_)]
+    grid = np.meshgrid(*starts[::-1], indexing="ij")  # reverse the order to iterate in index order
+    coords_start = np.stack([g.ravel() for g in grid[::-1]], axis=1)
+    return np.stack([coords_start, coords_start + np.asarray(patch_size_)], axis=-1)
+
+
+_VIRTUAL_PAD_MODES = (
+    NumpyPadMode.CONSTANT,
+    NumpyPadMode.EDGE,
+    NumpyPadMode.REFLECT,
+    NumpyPadMode.SYMMETRIC,
+    NumpyPadMode.WRAP,
+)
+
+
+def _supports_virtual_pad(mode: NumpyPadMode, pad_opts: Dict) -> bool:
+    """Whether the padding defined by `mode` and `pad_opts` can be computed by `_virtual_pad_indices`."""
+    if mode not in _VIRTUAL_PAD_MODES or not set(pad_opts).issubset({"constant_values"}):
+        return False
+    return np.ndim(pad_opts.get("constant_values", 0)) == 0
+
+
+def _virtual_pad_indices(indices: np.ndarray, size: int, mode: NumpyPadMode) -> np.ndarray:
+    """
+    Map `indices` of a virtually padded axis to the indices of the unpadded axis of length `size`,
+    following the `numpy.pad` convention of `mode`. The out of bounds indices are clipped for the constant mode.
+    """
+    if mode == NumpyPadMode.WRAP:
+        return indices % size
+    if mode == NumpyPadMode.REFLECT and size > 1:
+        indices = indices % (2 * size - 2)
+        return np.where(indices < size, indices, 2 * size - 2 - indices)
+    if mode == NumpyPadMode.SYMMETRIC:
+        indices = indices % (2 * size)
+        return np.where(indices < size, indices, 2 * size - 1 - indices)
+    return np.clip(indices, 0, size - 1)
+
+
+def _gather_patch_grid(
+    arr: np.ndarray, starts: Sequence[np.ndarray], patch_size: Sequence[int], mode: NumpyPadMode, **pad_opts
+) -> np.ndarray:
+    """
+    Gather the patches of size `patch_size` at the grid of positions `starts` (one array of start indices per
+    dimension) into an array of shape (num_patches, *patch_size), with one indexing operation per dimension.
+    The regions out of the bounds of `arr` are computed on the fly so that the padded array is never created.
+    """
+    out = arr
+    for axis, (dim_starts, size) in enumerate(zip(starts, patch_size)):
+        indices = np.asarray(dim_starts)[:, None] + np.arange(size)
+        src_indices = _virtual_pad_indices(indices, arr.shape[axis], mode)
+        out = np.take(out, src_indices.ravel(), axis=2 * axis)
+        out = out.reshape(out.shape[: 2 * axis] + indices.shape + out.shape[2 * axis + 1 :])
+        if mode == NumpyPadMode.CONSTANT:
+            outside = (indices < 0) | (indices >= arr.shape[axis])
+            if outside.any():
+                out[(slice(None),) * (2 * axis) + (outside,)] = pad_opts.get("constant_values", 0)
+    # from (n_0, p_0, n_1, p_1, ...) to (..., n_1, n_0, p_0, p_1, ...), the first dimension is least significant
+    ndim = len(patch_size)
+    out = out.transpose(tuple(range(2 * ndim - 2, -1, -2)) + tuple(range(1, 2 * ndim, 2)))
+    return out.reshape((-1,) + tuple(patch_size))
+
+
+def get_patch_grid(
+    arr: np.ndarray,
+    patch_size: Union[Sequence[int], int] = 0,
+    start_pos: Sequence[int] = (),
+    mode: Union[NumpyPadMode, str] = NumpyPadMode.WRAP,
+    **pad_opts: Dict,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batched version of `iter_patch`: extract all the patches of the grid at once into a stacked array,
+    the patches and coordinates are the same as the ones yielded by `iter_patch`.
+    For the ``"constant"``, ``"edge"``, ``"reflect"``, ``"symmetric"`` and ``"wrap"`` modes, the padding is
+    computed for the border patches only and the padded copy of `arr` is never created.
+
+    Args:
+        arr: array to extract the patches from
+        patch_size: size of patches to generate slices for, 0 or None selects whole dimension
+        start_pos: starting position in the array, default is 0 for each dimension
+        mode: {``"constant"``, ``"edge"``, ``"linear_ramp"``, ``"maximum"``, ``"mean"``,
+            ``"median"``, ``"minimum"``, ``"reflect"``, ``"symmetric"``, ``"wrap"``, ``"empty"``}
+            One of the listed string values or a user supplied function. Defaults to ``"wrap"``.
+            See also: https://numpy.org/doc/1.18/reference/generated/numpy.pad.html
+        pad_opts: padding options, see `numpy.pad`
+
+    Returns:
+        a tuple of the patches, with shape (num_patches, *patch_size), and the coordinates of the patches,
+        with shape (num_patches, arr.ndim, 2).
+
+    """
+    patch_size_ = get_valid_patch_size(arr.shape, patch_size)
+    coords = get_patch_grid_coords(arr.shape, patch_size_, start_pos)
+    starts = [np.unique(coords[:, d, 0]) for d in range(arr.ndim)]
+    mode = NumpyPadMode(mode)
+    if not _supports_virtual_pad(mode, pad_opts):
+        # pad image by maximum values needed to ensure patches are taken from inside an image
+        arr = np.pad(arr, tuple((p, p) for p in patch_size_), mode.value, **pad_opts)
+        starts = [s + p for s, p in zip(starts, patch_size_)]
+    return _gather_patch_grid(arr, starts, patch_size_, mode, **pad_opts), coords
+
+
+def iter_patch_views(
+    arr: np.ndarray,
+    patch_size: Union[Sequence[int], int] = 0,
+    start_pos: Sequence[int] = (),
+    mode: Union[NumpyPadMode, str] = NumpyPadMode.WRAP,
+    **pad_opts: Dict,
+):
+    """
+    Yield the same patches and coordinates as `iter_patch` (with `copy_back=False`) without padding `arr`:
+    the patches inside `arr` are views of `arr` (so that modifying them modifies `arr`), and only the patches
+    crossing the border are padded on the fly.
+    For the modes other than ``"constant"``, ``"edge"``, ``"reflect"``, ``"symmetric"`` and ``"wrap"``,
+    this function falls back to `iter_patch`.
+
+    Args:
+        arr: array to iterate over
+        patch_size: size of patches to generate slices for, 0 or None selects whole dimension
+        start_pos: starting position in the array, default is 0 for each dimension
+        mode: {``"constant"``, ``"edge"``, ``"linear_ramp"``, ``"maximum"``, ``"mean"``,
+            ``"median"``, ``"minimum"``, ``"reflect"``, ``"symmetric"``, ``"wrap"``, ``"empty"``}
+            One of the listed string values or a user supplied function. Defaults to ``"wrap"``.
+            See also: https://numpy.org/doc/1.18/reference/generated/numpy.pad.html
+        pad_opts: padding options, see `numpy.pad`
+
+    Yields:
+        Patches of array data from `arr` and their coordinates.
+
+    """
+    mode = NumpyPadMode(mode)
+    if not _supports_virtual_pad(mode, pad_opts):
+        yield from iter_patch(arr, patch_size, start_pos, copy_back=False, mode=mode, **pad_opts)
+        return
+    patch_size_ = get_valid_patch_size(arr.shape, patch_size)
+    yield from iter_patch_at_coords(arr, get_patch_grid_coords(arr.shape, patch_size_, start_pos), mode, **pad_opts)
+
+
+def iter_patch_at_coords(
+    arr: np.ndarray, coords: np.ndarray, mode: Union[NumpyPadMode, str] = NumpyPadMode.WRAP, **pad_opts: Dict
+) -> Generator[Tuple[np.ndarray, np.ndarray], None, None]:
+    """
+    Yield the patches of `arr` at the coordinates `coords`, a subset of the grid given by `get_patch_grid_coords`,
+    along with their coordinates, without visiting the other patches of the grid.
+    The patches are the same as `iter_patch_views`: the patches inside `arr` are views of `arr`,
+    and only the patches crossing the border are padded.
+
+    Args:
+        arr: array to extract the patches from
+        coords: the coordinates of the patches, with shape (num_patches, arr.ndim, 2).
+        mode: {``"constant"``, ``"edge"``, ``"linear_ramp"``, ``"maximum"``, ``"mean"``,
+            ``"median"``, ``"minimum"``, ``"reflect"``, ``"symmetric"``, ``"wrap"``, ``"empty"``}
+            One of the listed string values or a user supplied function. Defaults to ``"wrap"``.
+            See also: https://numpy.org/doc/1.18/reference/generated/numpy.pad.html
+        pad_opts: padding options, see `numpy.pad`
+
+    Yields:
+        Patches of array data from `arr` and their coordinates.
+
+    """
+    if len(coords) == 0:
+        return
+    mode = NumpyPadMode(mode)
+    patch_size = tuple(int(p) for p in coords[0, :, 1] - coords[0, :, 0])
+    if not _supports_virtual_pad(mode, pad_opts):
+        # pad image by maximum values needed to ensure patches are taken from inside an image
+        arrpad = np.pad(arr, tuple((p, p) for p in patch_size), mode.value, **pad_opts)
+        for coord in coords:
+            yield arrpad[tuple(slice(s + p, e + p) for (s, e), p in zip(coord, patch_size))], coord
+        return
+    inside = np.all((coords[..., 0] >= 0) & (coords[..., 1] <= np.asarray(arr.shape)), axis=1)
+    for coord, is_inside in zip(coords, inside):
+        if is_inside:
+            yield arr[tuple(slice(s, e) for s, e in coord)], coord
+        else:
+            yield _gather_patch_grid(arr, coord[:, :1], patch_size, mode, **pad_opts)[0], coord
+
+
 def get_valid_patch_size(image_size: Sequence[int], patch_size: Union[Sequence[int], int]) -> Tuple[int, ...]:
     """
     Given an image of dimensions `image_size`, return a patch size tuple taking the dimension from `patch_size` if this is
@@ -9,7 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Union
 
 import torch
 
@@ -30,6 +30,7 @@ class ConfusionMatrix(IterationMetric):
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = "cpu",
         save_details: bool = True,
+        num_classes: Optional[int] = None,
     ) -> None:
         """
 
@@ -47,6 +48,9 @@ class ConfusionMatrix(IterationMetric):
             device: device specification in case of distributed computation usage.
             save_details: whether to save metric computation details per image, for example: TP/TN/FP/FN of every image.
                 default to True, will save to `engine.state.metric_details` dict with the metric name as key.
+                if False, only the running statistics of the metric are accumulated on every iteration.
+            num_classes: if not None, `y_pred` and `y` are label indices with values in [0, num_classes)
+                instead of the one-hot format. Defaults to None.
 
         See also:
             :py:meth:`monai.metrics.confusion_matrix`
@@ -56,6 +60,7 @@ class ConfusionMatrix(IterationMetric):
             metric_name=metric_name,
             compute_sample=False,
             reduction=MetricReduction.NONE,
+            num_classes=num_classes,
         )
         self.metric_name = metric_name
         super().__init__(
@@ -68,3 +73,10 @@ class ConfusionMatrix(IterationMetric):
     def _reduce(self, scores) -> Any:
         confusion_matrix, _ = do_metric_reduction(scores, MetricReduction.MEAN)
         return compute_confusion_matrix_metric(self.metric_name, confusion_matrix)
+
+    def _statistics(self, scores: torch.Tensor) -> Optional[torch.Tensor]:
+        return self._mean_statistics(scores)
+
+    def _reduce_statistics(self, statistics: torch.Tensor) -> Any:
+        confusion_matrix = super()._reduce_statistics(statistics)
+        return compute_confusion_matrix_metric(self.metric_name, confusion_matrix)
@@ -48,6 +48,7 @@ class HausdorffDistance(IterationMetric):
             device: device specification in case of distributed computation usage.
             save_details: whether to save metric computation details per image, for example: hausdorff distance
                 of every image. default to True, will save to `engine.state.metric_details` dict with the metric name as key.
+                if False, only the running statistics of the metric are accumulated on every iteration.
 
         """
         super().__init__(output_transform, device=device)
@@ -64,3 +65,6 @@ class HausdorffDistance(IterationMetric):
             device=device,
             save_details=save_details,
         )
+
+    def _statistics(self, scores: torch.Tensor) -> Optional[torch.Tensor]:
+        return self._mean_statistics(scores)
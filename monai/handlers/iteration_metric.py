@@ -19,6 +19,7 @@ from monai.utils import MetricReduction, exact_version, optional_import
 
 idist, _ = optional_import("ignite", "0.4.4", exact_version, "distributed")
 Metric, _ = optional_import("ignite.metrics", "0.4.4", exact_version, "Metric")
+NotComputableError, _ = optional_import("ignite.exceptions", "0.4.4", exact_version, "NotComputableError")
 reinit__is_reduced, _ = optional_import("ignite.metrics.metric", "0.4.4", exact_version, "reinit__is_reduced")
 if TYPE_CHECKING:
     from ignite.engine import Engine
@@ -40,6 +41,12 @@ class IterationMetric(Metric):  # type: ignore[valid-type, misc] # due to option
         save_details: whether to save metric computation details per image, for example: mean_dice of every image.
             default to True, will save to `engine.state.metric_details` dict with the metric name as key.
 
+    The metrics which can be reduced from sufficient statistics (for example the sums and the counts of the
+    scores) declare them by overriding `_statistics` and `_reduce_statistics`. If `save_details` is False,
+    these metrics only accumulate the running statistics on every iteration instead of the scores of every
+    image, so the memory is constant, the processes are synced by a single `all_reduce` and `compute` is cheap
+    enough to read the running value at any time of the epoch.
+
     """
 
     def __init__(
@@ -53,6 +60,7 @@ class IterationMetric(Metric):  # type: ignore[valid-type, misc] # due to option
         self.metric_fn = metric_fn
         self.save_details = save_details
         self._scores: List = []
+        self._statistics_sum: Optional[torch.Tensor] = None
         self._engine: Optional[Engine] = None
         self._name: Optional[str] = None
         super().__init__(output_transform, device=device)
@@ -60,6 +68,7 @@ class IterationMetric(Metric):  # type: ignore[valid-type, misc] # due to option
     @reinit__is_reduced
     def reset(self) -> None:
         self._scores = []
+        self._statistics_sum = None
 
     @reinit__is_reduced
     def update(self, output: Sequence[torch.Tensor]) -> None:
@@ -77,7 +86,12 @@ class IterationMetric(Metric):  # type: ignore[valid-type, misc] # due to option
         score = self.metric_fn(y_pred, y)
         if isinstance(score, (tuple, list)):
             score = score[0]
-        self._scores.append(score.to(self._device))
+        statistics = None if self.save_details else self._statistics(score)
+        if statistics is None:
+            self._scores.append(score.to(self._device))
+            return
+        statistics = statistics.to(self._device)
+        self._statistics_sum = statistics if self._statistics_sum is None else self._statistics_sum + statistics
 
     def compute(self) -> Any:
         """
@@ -85,6 +99,12 @@ class IterationMetric(Metric):  # type: ignore[valid-type, misc] # due to option
             NotComputableError: When ``compute`` is called before an ``update`` occurs.
 
         """
+        if self._statistics_sum is not None:
+            return self._compute_from_statistics(self._statistics_sum)
+        if not self._scores:
+            raise NotComputableError(
+                f"{self.__class__.__name__} must have at least one example before it can be computed."
+            )
         _scores = torch.cat(self._scores, dim=0)
 
         ws = idist.get_world_size()
@@ -110,9 +130,48 @@ class IterationMetric(Metric):  # type: ignore[valid-type, misc] # due to option
 
         return result.item() if isinstance(result, torch.Tensor) else result
 
+    def _compute_from_statistics(self, statistics: torch.Tensor) -> Any:
+        if idist.get_world_size() > 1:
+            # sum the statistics of all processes, the local sum keeps accumulating the next iterations
+            statistics = idist.all_reduce(statistics.clone())
+        result = self._reduce_statistics(statistics)
+        return result.item() if isinstance(result, torch.Tensor) and result.numel() == 1 else result
+
     def _reduce(self, scores) -> Any:
         return do_metric_reduction(scores, MetricReduction.MEAN)[0]
 
+    def _statistics(self, scores: torch.Tensor) -> Optional[torch.Tensor]:
+        """
+        Compute the sufficient statistics of the `scores` of an iteration, which are summed over the iterations
+        and the processes and then reduced by `_reduce_statistics`. None if the metric needs all the scores.
+
+        """
+        return None
+
+    def _reduce_statistics(self, statistics: torch.Tensor) -> Any:
+        """
+        Compute the metric from the sum of the statistics of `_mean_statistics`,
+        same as the `_reduce` of all the scores.
+
+        """
+        total, count = statistics
+        return torch.where(count > 0, total / count.clamp(min=1), torch.zeros_like(total))
+
+    @staticmethod
+    def _mean_statistics(scores: torch.Tensor) -> torch.Tensor:
+        """
+        The statistics of the "mean" reduction of :py:func:`monai.metrics.do_metric_reduction` for the scores of
+        shape (batch, channel, ...): the sum of the channel averages of the images and the number of the images
+        which have a channel average (not all the channels are NaN), stacked in a tensor of shape (2, ...).
+
+        """
+        nans = torch.isnan(scores)
+        not_nans = (~nans).sum(dim=1)
+        valid = not_nans > 0
+        scores = torch.where(nans, torch.zeros_like(scores), scores).double()
+        channel_mean = torch.where(valid, scores.sum(dim=1) / not_nans.clamp(min=1), torch.zeros_like(scores[:, 0]))
+        return torch.stack([channel_mean.sum(dim=0), valid.sum(dim=0).double()])
+
     def attach(self, engine: Engine, name: str) -> None:
         """
         Attaches current metric to provided engine. On the end of engine's run,
@@ -9,7 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Union
+from typing import Callable, Optional, Union
 
 import torch
 
@@ -29,6 +29,7 @@ class MeanDice(IterationMetric):
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = "cpu",
         save_details: bool = True,
+        num_classes: Optional[int] = None,
     ) -> None:
         """
 
@@ -39,6 +40,9 @@ class MeanDice(IterationMetric):
             device: device specification in case of distributed computation usage.
             save_details: whether to save metric computation details per image, for example: mean dice of every image.
                 default to True, will save to `engine.state.metric_details` dict with the metric name as key.
+                if False, only the running statistics of the metric are accumulated on every iteration.
+            num_classes: if not None, `y_pred` and `y` are label indices with values in [0, num_classes)
+                instead of the one-hot format. Defaults to None.
 
         See also:
             :py:meth:`monai.metrics.meandice.compute_meandice`
@@ -46,6 +50,7 @@ class MeanDice(IterationMetric):
         metric_fn = DiceMetric(
             include_background=include_background,
             reduction=MetricReduction.NONE,
+            num_classes=num_classes,
         )
         super().__init__(
             metric_fn=metric_fn,
@@ -53,3 +58,6 @@ class MeanDice(IterationMetric):
             device=device,
             save_details=save_details,
         )
+
+    def _statistics(self, scores: torch.Tensor) -> Optional[torch.Tensor]:
+        return self._mean_statistics(scores)
@@ -9,16 +9,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Sequence, Union
 
 import torch
 
 from monai.handlers.utils import evenly_divisible_all_gather
-from monai.metrics import compute_roc_auc
+from monai.metrics import compute_roc_auc, compute_roc_auc_from_histogram, compute_roc_auc_histogram
 from monai.utils import Average, exact_version, optional_import
 
 idist, _ = optional_import("ignite", "0.4.4", exact_version, "distributed")
 EpochMetric, _ = optional_import("ignite.metrics", "0.4.4", exact_version, "EpochMetric")
+NotComputableError, _ = optional_import("ignite.exceptions", "0.4.4", exact_version, "NotComputableError")
 
 
 class ROCAUC(EpochMetric):  # type: ignore[valid-type, misc]  # due to optional_import
@@ -43,6 +44,12 @@ class ROCAUC(EpochMetric):  # type: ignore[valid-type, misc]  # due to optional_
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
         device: device specification in case of distributed computation usage.
+        num_bins: if not None, accumulate the histograms of the predicted values in `num_bins` fixed bins
+            (see :py:func:`monai.metrics.compute_roc_auc_histogram`) instead of storing all the predictions,
+            so the memory is ``O(n_classes * num_bins)`` and the ranks only all-reduce the histograms.
+            The samples of a bin are treated as tied, which bounds the error of the ROC AUC.
+            Defaults to None, the exact ROC AUC.
+        value_range: the lower and upper bounds of the predicted values for the histograms.
 
     Note:
         ROCAUC expects y to be comprised of 0's and 1's.
@@ -55,6 +62,8 @@ class ROCAUC(EpochMetric):  # type: ignore[valid-type, misc]  # due to optional_
         average: Union[Average, str] = Average.MACRO,
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = "cpu",
+        num_bins: Optional[int] = None,
+        value_range: Sequence[float] = (0.0, 1.0),
     ) -> None:
         def _compute_fn(pred, label):
             return compute_roc_auc(
@@ -63,6 +72,10 @@ class ROCAUC(EpochMetric):  # type: ignore[valid-type, misc]  # due to optional_
                 average=Average(average),
             )
 
+        self.average = Average(average)
+        self.num_bins = num_bins
+        self.value_range = value_range
+        self._histogram: Optional[torch.Tensor] = None
         self._is_reduced: bool = False
         super().__init__(
             compute_fn=_compute_fn,
@@ -71,7 +84,33 @@ class ROCAUC(EpochMetric):  # type: ignore[valid-type, misc]  # due to optional_
             device=device,
         )
 
+    def reset(self) -> None:
+        if self.num_bins is None:
+            super().reset()
+            return
+        self._histogram = None
+        self._is_reduced = False
+
+    def update(self, output) -> None:
+        if self.num_bins is None:
+            super().update(output)
+            return
+        y_pred, y = output[0].detach(), output[1].detach()
+        histogram = compute_roc_auc_histogram(y_pred, y, self.num_bins, self.value_range).to(self._device)
+        self._histogram = histogram if self._histogram is None else self._histogram + histogram
+
+    def _compute_from_histogram(self) -> Any:
+        if self._histogram is None:
+            raise NotComputableError("ROCAUC must have at least one example before it can be computed.")
+        if idist.get_world_size() > 1 and not self._is_reduced:
+            # sum the histograms of all processes
+            self._histogram = idist.all_reduce(self._histogram)
+        self._is_reduced = True
+        return compute_roc_auc_from_histogram(self._histogram, self.average)
+
     def compute(self) -> Any:
+        if self.num_bins is not None:
+            return self._compute_from_histogram()
         _prediction_tensor = torch.cat(self._predictions, dim=0)
         _target_tensor = torch.cat(self._targets, dim=0)
 
@@ -9,7 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Union
+from typing import Callable, Optional, Union
 
 import torch
 
@@ -45,6 +45,7 @@ class SurfaceDistance(IterationMetric):
             device: device specification in case of distributed computation usage.
             save_details: whether to save metric computation details per image, for example: surface dice
                 of every image. default to True, will save to `engine.state.metric_details` dict with the metric name as key.
+                if False, only the running statistics of the metric are accumulated on every iteration.
 
         """
         metric_fn = SurfaceDistanceMetric(
@@ -59,3 +60,6 @@ class SurfaceDistance(IterationMetric):
             device=device,
             save_details=save_details,
         )
+
+    def _statistics(self, scores: torch.Tensor) -> Optional[torch.Tensor]:
+        return self._mean_statistics(scores)
@@ -10,7 +10,7 @@
 # limitations under the License.
 
 import warnings
-from typing import Callable, List, Optional, Sequence, Union
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
@@ -19,10 +19,34 @@ import torch.nn.functional as F
 from torch.nn.modules.loss import _Loss
 
 from monai.losses.focal_loss import FocalLoss
-from monai.networks import one_hot
 from monai.utils import LossReduction, Weight
 
 
+def _label_index_sums(
+    input: torch.Tensor, target: torch.Tensor, squared_pred: bool = False
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Compute the intersection, the ground truth and the prediction sums of every item and class of `input`
+    (BNH[WD]) with the label indices `target` (B1H[WD]), the same as with ``one_hot(target, N)`` but without
+    materializing the one-hot target: the intersection gathers `input` at the labels and scatters it back to
+    the classes, the ground truth sums are the counts of the labels.
+
+    Returns:
+        the intersection, ground truth and prediction sums of shape [B, N].
+
+    """
+    batch_size, n_pred_ch = input.shape[:2]
+    if target.shape[1] != 1 or target.shape[2:] != input.shape[2:]:
+        raise AssertionError(f"ground truth has different shape ({target.shape}) from input ({input.shape})")
+    input = input.reshape(batch_size, n_pred_ch, -1)
+    labels = target.reshape(batch_size, -1).long()
+    selected = input.gather(1, labels[:, None]).squeeze(1)
+    intersection = input.new_zeros(batch_size, n_pred_ch).scatter_add(1, labels, selected)
+    ground_o = input.new_zeros(batch_size, n_pred_ch).scatter_add(1, labels, torch.ones_like(selected))
+    pred_o = torch.sum(torch.pow(input, 2) if squared_pred else input, dim=2)
+    return intersection, ground_o, pred_o
+
+
 class DiceLoss(_Loss):
     """
     Compute average Dice loss between two tensors. It can support both multi-classes and multi-labels tasks.
@@ -124,37 +148,41 @@ class DiceLoss(_Loss):
         if self.other_act is not None:
             input = self.other_act(input)
 
-        if self.to_onehot_y:
-            if n_pred_ch == 1:
-                warnings.warn("single channel prediction, `to_onehot_y=True` ignored.")
-            else:
-                target = one_hot(target, num_classes=n_pred_ch)
-
-        if not self.include_background:
-            if n_pred_ch == 1:
-                warnings.warn("single channel prediction, `include_background=False` ignored.")
-            else:
+        if self.to_onehot_y and n_pred_ch == 1:
+            warnings.warn("single channel prediction, `to_onehot_y=True` ignored.")
+        if not self.include_background and n_pred_ch == 1:
+            warnings.warn("single channel prediction, `include_background=False` ignored.")
+
+        if self.to_onehot_y and n_pred_ch > 1:
+            # the sums are computed from the label indices, without the one-hot target
+            intersection, ground_o, pred_o = _label_index_sums(input, target, self.squared_pred)
+            if not self.include_background:
+                intersection, ground_o, pred_o = intersection[:, 1:], ground_o[:, 1:], pred_o[:, 1:]
+            if self.batch:
+                intersection, ground_o, pred_o = intersection.sum(0), ground_o.sum(0), pred_o.sum(0)
+        else:
+            if not self.include_background and n_pred_ch > 1:
                 # if skipping background, removing first channel
                 target = target[:, 1:]
                 input = input[:, 1:]
 
-        if target.shape != input.shape:
-            raise AssertionError(f"ground truth has different shape ({target.shape}) from input ({input.shape})")
+            if target.shape != input.shape:
+                raise AssertionError(f"ground truth has different shape ({target.shape}) from input ({input.shape})")
 
-        # reducing only spatial dimensions (not batch nor channels)
-        reduce_axis: List[int] = torch.arange(2, len(input.shape)).tolist()
-        if self.batch:
-            # reducing spatial dimensions and batch
-            reduce_axis = [0] + reduce_axis
+            # reducing only spatial dimensions (not batch nor channels)
+            reduce_axis: List[int] = torch.arange(2, len(input.shape)).tolist()
+            if self.batch:
+                # reducing spatial dimensions and batch
+                reduce_axis = [0] + reduce_axis
 
-        intersection = torch.sum(target * input, dim=reduce_axis)
+            intersection = torch.sum(target * input, dim=reduce_axis)
 
-        if self.squared_pred:
-            target = torch.pow(target, 2)
-            input = torch.pow(input, 2)
+            if self.squared_pred:
+                target = torch.pow(target, 2)
+                input = torch.pow(input, 2)
 
-        ground_o = torch.sum(target, dim=reduce_axis)
-        pred_o = torch.sum(input, dim=reduce_axis)
+            ground_o = torch.sum(target, dim=reduce_axis)
+            pred_o = torch.sum(input, dim=reduce_axis)
 
         denominator = ground_o + pred_o
 
@@ -313,31 +341,35 @@ class GeneralizedDiceLoss(_Loss):
         if self.other_act is not None:
             input = self.other_act(input)
 
-        if self.to_onehot_y:
-            if n_pred_ch == 1:
-                warnings.warn("single channel prediction, `to_onehot_y=True` ignored.")
-            else:
-                target = one_hot(target, num_classes=n_pred_ch)
-
-        if not self.include_background:
-            if n_pred_ch == 1:
-                warnings.warn("single channel prediction, `include_background=False` ignored.")
-            else:
+        if self.to_onehot_y and n_pred_ch == 1:
+            warnings.warn("single channel prediction, `to_onehot_y=True` ignored.")
+        if not self.include_background and n_pred_ch == 1:
+            warnings.warn("single channel prediction, `include_background=False` ignored.")
+
+        if self.to_onehot_y and n_pred_ch > 1:
+            # the sums are computed from the label indices, without the one-hot target
+            intersection, ground_o, pred_o = _label_index_sums(input, target)
+            if not self.include_background:
+                intersection, ground_o, pred_o = intersection[:, 1:], ground_o[:, 1:], pred_o[:, 1:]
+            if self.batch:
+                intersection, ground_o, pred_o = intersection.sum(0), ground_o.sum(0), pred_o.sum(0)
+        else:
+            if not self.include_background and n_pred_ch > 1:
                 # if skipping background, removing first channel
                 target = target[:, 1:]
                 input = input[:, 1:]
 
-        if target.shape != input.shape:
-            raise AssertionError(f"ground truth has differing shape ({target.shape}) from input ({input.shape})")
+            if target.shape != input.shape:
+                raise AssertionError(f"ground truth has differing shape ({target.shape}) from input ({input.shape})")
 
-        # reducing only spatial dimensions (not batch nor channels)
-        reduce_axis: List[int] = torch.arange(2, len(input.shape)).tolist()
-        if self.batch:
-            reduce_axis = [0] + reduce_axis
-        intersection = torch.sum(target * input, reduce_axis)
+            # reducing only spatial dimensions (not batch nor channels)
+            reduce_axis: List[int] = torch.arange(2, len(input.shape)).tolist()
+            if self.batch:
+                reduce_axis = [0] + reduce_axis
+            intersection = torch.sum(target * input, reduce_axis)
 
-        ground_o = torch.sum(target, reduce_axis)
-        pred_o = torch.sum(input, reduce_axis)
+            ground_o = torch.sum(target, reduce_axis)
+            pred_o = torch.sum(input, reduce_axis)
 
         denominator = ground_o + pred_o
 
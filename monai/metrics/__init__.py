@@ -11,8 +11,25 @@
 
 from .confusion_matrix import ConfusionMatrixMetric, compute_confusion_matrix_metric, get_confusion_matrix
 from .froc import compute_fp_tp_probs, compute_froc_curve_data, compute_froc_score
-from .hausdorff_distance import HausdorffDistanceMetric, compute_hausdorff_distance, compute_percent_hausdorff_distance
+from .hausdorff_distance import (
+    HausdorffDistanceMetric,
+    compute_hausdorff_distance,
+    compute_percent_hausdorff_distance,
+    hausdorff_distance_from_surface_distances,
+)
 from .meandice import DiceMetric, compute_meandice
-from .rocauc import compute_roc_auc
-from .surface_distance import SurfaceDistanceMetric, compute_average_surface_distance
-from .utils import do_metric_reduction, get_mask_edges, get_surface_distance, ignore_background
+from .rocauc import compute_roc_auc, compute_roc_auc_from_histogram, compute_roc_auc_histogram
+from .surface_distance import (
+    SurfaceDistanceMetric,
+    average_surface_distance_from_surface_distances,
+    compute_average_surface_distance,
+    compute_surface_distance_metrics,
+)
+from .utils import (
+    do_metric_reduction,
+    get_label_index_counts,
+    get_mask_edges,
+    get_surface_distance,
+    get_surface_distances_batch,
+    ignore_background,
+)
@@ -10,11 +10,11 @@
 # limitations under the License.
 
 import warnings
-from typing import Sequence, Union
+from typing import Optional, Sequence, Union
 
 import torch
 
-from monai.metrics.utils import do_metric_reduction, ignore_background
+from monai.metrics.utils import do_metric_reduction, get_label_index_counts, ignore_background
 from monai.utils import MetricReduction
 
 
@@ -51,6 +51,8 @@ class ConfusionMatrixMetric:
             ``"mean_channel"``, ``"sum_channel"``}
             Define the mode to reduce computation result of 1 batch data. Reduction will only be employed when
             ``compute_sample`` is ``True``. Defaults to ``"mean"``.
+        num_classes: if not None, `y_pred` and `y` are label indices of shape [B, 1, ...] with values in
+            [0, num_classes) instead of the one-hot format, see :py:func:`get_confusion_matrix`. Defaults to None.
 
     """
 
@@ -60,12 +62,14 @@ class ConfusionMatrixMetric:
         metric_name: Union[Sequence[str], str] = "hit_rate",
         compute_sample: bool = False,
         reduction: Union[MetricReduction, str] = MetricReduction.MEAN,
+        num_classes: Optional[int] = None,
     ) -> None:
         super().__init__()
         self.include_background = include_background
         self.metric_name = metric_name
         self.compute_sample = compute_sample
         self.reduction = reduction
+        self.num_classes = num_classes
 
     def __call__(self, y_pred: torch.Tensor, y: torch.Tensor):
         """
@@ -79,10 +83,11 @@ class ConfusionMatrixMetric:
             ValueError: when `y_pred` has less than two dimensions.
         """
         # check binarized input
-        if not torch.all(y_pred.byte() == y_pred):
-            warnings.warn("y_pred is not a binarized tensor here!")
-        if not torch.all(y.byte() == y):
-            raise ValueError("y should be a binarized tensor.")
+        if self.num_classes is None:
+            if not torch.all(y_pred.byte() == y_pred):
+                warnings.warn("y_pred is not a binarized tensor here!")
+            if not torch.all(y.byte() == y):
+                raise ValueError("y should be a binarized tensor.")
         # check dimension
         dims = y_pred.ndimension()
         if dims < 2:
@@ -96,6 +101,7 @@ class ConfusionMatrixMetric:
             y_pred=y_pred,
             y=y,
             include_background=self.include_background,
+            num_classes=self.num_classes,
         )
 
         if self.compute_sample:
@@ -119,6 +125,7 @@ def get_confusion_matrix(
     y_pred: torch.Tensor,
     y: torch.Tensor,
     include_background: bool = True,
+    num_classes: Optional[int] = None,
 ):
     """
     Compute confusion matrix. A tensor with the shape [BC4] will be returned. Where, the third dimension
@@ -133,10 +140,24 @@ def get_confusion_matrix(
             The values should be binarized.
         include_background: whether to skip metric computation on the first channel of
             the predicted output. Defaults to True.
+        num_classes: if not None, `y_pred` and `y` are label indices of shape [B, 1, ...] with values in
+            [0, num_classes) instead of the one-hot format, and the confusion matrices of the `num_classes` classes
+            are computed from :py:func:`monai.metrics.utils.get_label_index_counts`, without one-hot tensors.
+            Defaults to None.
 
     Raises:
         ValueError: when `y_pred` and `y` have different shapes.
     """
+    if num_classes is not None:
+        counts = get_label_index_counts(y_pred, y, num_classes).float()
+        tp = torch.diagonal(counts, dim1=1, dim2=2)
+        fp = counts.sum(dim=2) - tp
+        fn = counts.sum(dim=1) - tp
+        tn = counts.sum(dim=(1, 2))[:, None] - tp - fp - fn
+        confusion_matrix = torch.stack([tp, fp, tn, fn], dim=-1)
+        if not include_background and num_classes > 1:
+            confusion_matrix = confusion_matrix[:, 1:]
+        return confusion_matrix
 
     if not include_background:
         y_pred, y = ignore_background(
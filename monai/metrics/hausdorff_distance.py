@@ -10,15 +10,25 @@
 # limitations under the License.
 
 import warnings
-from typing import Optional, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
 
-from monai.metrics.utils import do_metric_reduction, get_mask_edges, get_surface_distance, ignore_background
+from monai.metrics.utils import (
+    do_metric_reduction,
+    get_surface_distance,
+    get_surface_distances_batch,
+    ignore_background,
+)
 from monai.utils import MetricReduction
 
-__all__ = ["HausdorffDistanceMetric", "compute_hausdorff_distance", "compute_percent_hausdorff_distance"]
+__all__ = [
+    "HausdorffDistanceMetric",
+    "compute_hausdorff_distance",
+    "compute_percent_hausdorff_distance",
+    "hausdorff_distance_from_surface_distances",
+]
 
 
 class HausdorffDistanceMetric:
@@ -42,6 +52,10 @@ class HausdorffDistanceMetric:
         reduction: {``"none"``, ``"mean"``, ``"sum"``, ``"mean_batch"``, ``"sum_batch"``,
             ``"mean_channel"``, ``"sum_channel"``}
             Define the mode to reduce computation result of 1 batch data. Defaults to ``"mean"``.
+        spacing: spacing of the voxels along every spatial dim (or the same for all the dims) for the
+            ``"euclidean"`` metric. if None, the spacing is 1.
+        num_workers: the number of threads to compute the distances of every class of every item,
+            if None, use the number of CPUs.
 
     """
 
@@ -52,6 +66,8 @@ class HausdorffDistanceMetric:
         percentile: Optional[float] = None,
         directed: bool = False,
         reduction: Union[MetricReduction, str] = MetricReduction.MEAN,
+        spacing: Optional[Union[float, Sequence[float]]] = None,
+        num_workers: Optional[int] = None,
     ) -> None:
         super().__init__()
         self.include_background = include_background
@@ -59,6 +75,8 @@ class HausdorffDistanceMetric:
         self.percentile = percentile
         self.directed = directed
         self.reduction = reduction
+        self.spacing = spacing
+        self.num_workers = num_workers
 
     def __call__(self, y_pred: torch.Tensor, y: torch.Tensor):
         """
@@ -88,6 +106,8 @@ class HausdorffDistanceMetric:
             distance_metric=self.distance_metric,
             percentile=self.percentile,
             directed=self.directed,
+            spacing=self.spacing,
+            num_workers=self.num_workers,
         )
 
         # do metric reduction
@@ -102,6 +122,8 @@ def compute_hausdorff_distance(
     distance_metric: str = "euclidean",
     percentile: Optional[float] = None,
     directed: bool = False,
+    spacing: Optional[Union[float, Sequence[float]]] = None,
+    num_workers: Optional[int] = None,
 ):
     """
     Compute the Hausdorff distance.
@@ -120,6 +142,10 @@ def compute_hausdorff_distance(
             percentile of the Hausdorff Distance rather than the maximum result will be achieved.
             Defaults to ``None``.
         directed: whether to calculate directed Hausdorff distance. Defaults to ``False``.
+        spacing: spacing of the voxels along every spatial dim (or the same for all the dims) for the
+            ``"euclidean"`` metric. if None, the spacing is 1.
+        num_workers: the number of threads to compute the distances of every class of every item,
+            if None, use the number of CPUs.
     """
 
     if not include_background:
@@ -135,15 +161,34 @@ def compute_hausdorff_distance(
     if y.shape != y_pred.shape:
         raise ValueError("y_pred and y should have same shapes.")
 
-    batch_size, n_class = y_pred.shape[:2]
-    hd = np.empty((batch_size, n_class))
-    for b, c in np.ndindex(batch_size, n_class):
-        (edges_pred, edges_gt) = get_mask_edges(y_pred[b, c], y[b, c])
-        distance_1 = compute_percent_hausdorff_distance(edges_pred, edges_gt, distance_metric, percentile)
+    distances = get_surface_distances_batch(y_pred, y, distance_metric, spacing, not directed, num_workers)
+    return hausdorff_distance_from_surface_distances(distances, percentile, directed)
+
+
+def hausdorff_distance_from_surface_distances(
+    distances: List[List[Tuple[np.ndarray, Optional[np.ndarray]]]],
+    percentile: Optional[float] = None,
+    directed: bool = False,
+) -> torch.Tensor:
+    """
+    Compute the Hausdorff distance from the surface distances of every class of every item given by
+    :py:func:`monai.metrics.utils.get_surface_distances_batch`.
+
+    Args:
+        distances: surface distances of every class of every item, they must be symmetric if not `directed`.
+        percentile: an optional float number between 0 and 100. If specified, the corresponding
+            percentile of the Hausdorff Distance rather than the maximum result will be achieved.
+            Defaults to ``None``.
+        directed: whether to calculate directed Hausdorff distance. Defaults to ``False``.
+    """
+    hd = np.empty((len(distances), len(distances[0]) if distances else 0))
+    for b, c in np.ndindex(*hd.shape):
+        distances_pred, distances_gt = distances[b][c]
+        distance_1 = _percent_hausdorff_distance(distances_pred, percentile)
         if directed:
             hd[b, c] = distance_1
         else:
-            distance_2 = compute_percent_hausdorff_distance(edges_gt, edges_pred, distance_metric, percentile)
+            distance_2 = _percent_hausdorff_distance(distances_gt, percentile)  # type: ignore
             hd[b, c] = max(distance_1, distance_2)
     return torch.from_numpy(hd)
 
@@ -153,13 +198,17 @@ def compute_percent_hausdorff_distance(
     edges_gt: np.ndarray,
     distance_metric: str = "euclidean",
     percentile: Optional[float] = None,
+    spacing: Optional[Union[float, Sequence[float]]] = None,
 ):
     """
     This function is used to compute the directed Hausdorff distance.
     """
 
-    surface_distance = get_surface_distance(edges_pred, edges_gt, distance_metric=distance_metric)
+    surface_distance = get_surface_distance(edges_pred, edges_gt, distance_metric=distance_metric, spacing=spacing)
+    return _percent_hausdorff_distance(surface_distance, percentile)
+
 
+def _percent_hausdorff_distance(surface_distance: np.ndarray, percentile: Optional[float] = None):
     # for both pred and gt do not have foreground
     if surface_distance.shape == (0,):
         return np.nan
@@ -10,11 +10,11 @@
 # limitations under the License.
 
 import warnings
-from typing import Union
+from typing import Optional, Union
 
 import torch
 
-from monai.metrics.utils import do_metric_reduction, ignore_background
+from monai.metrics.utils import do_metric_reduction, get_label_index_counts, ignore_background
 from monai.utils import MetricReduction
 
 
@@ -35,6 +35,8 @@ class DiceMetric:
         reduction: {``"none"``, ``"mean"``, ``"sum"``, ``"mean_batch"``, ``"sum_batch"``,
             ``"mean_channel"``, ``"sum_channel"``}
             Define the mode to reduce computation result of 1 batch data. Defaults to ``"mean"``.
+        num_classes: if not None, `y_pred` and `y` are label indices of shape [B, 1, H, W[, D]] with values in
+            [0, num_classes) instead of the one-hot format, see :py:func:`compute_meandice`. Defaults to None.
 
     """
 
@@ -42,10 +44,12 @@ class DiceMetric:
         self,
         include_background: bool = True,
         reduction: Union[MetricReduction, str] = MetricReduction.MEAN,
+        num_classes: Optional[int] = None,
     ) -> None:
         super().__init__()
         self.include_background = include_background
         self.reduction = reduction
+        self.num_classes = num_classes
 
     def __call__(self, y_pred: torch.Tensor, y: torch.Tensor):
         """
@@ -60,10 +64,11 @@ class DiceMetric:
             ValueError: when `y` is not a binarized tensor.
             ValueError: when `y_pred` has less than three dimensions.
         """
-        if not torch.all(y_pred.byte() == y_pred):
-            warnings.warn("y_pred is not a binarized tensor here!")
-        if not torch.all(y.byte() == y):
-            raise ValueError("y should be a binarized tensor.")
+        if self.num_classes is None:
+            if not torch.all(y_pred.byte() == y_pred):
+                warnings.warn("y_pred is not a binarized tensor here!")
+            if not torch.all(y.byte() == y):
+                raise ValueError("y should be a binarized tensor.")
         dims = y_pred.ndimension()
         if dims < 3:
             raise ValueError("y_pred should have at least three dimensions.")
@@ -72,6 +77,7 @@ class DiceMetric:
             y_pred=y_pred,
             y=y,
             include_background=self.include_background,
+            num_classes=self.num_classes,
         )
 
         # do metric reduction
@@ -83,6 +89,7 @@ def compute_meandice(
     y_pred: torch.Tensor,
     y: torch.Tensor,
     include_background: bool = True,
+    num_classes: Optional[int] = None,
 ) -> torch.Tensor:
     """Computes Dice score metric from full size Tensor and collects average.
 
@@ -94,6 +101,10 @@ def compute_meandice(
             The values should be binarized.
         include_background: whether to skip Dice computation on the first channel of
             the predicted output. Defaults to True.
+        num_classes: if not None, `y_pred` and `y` are label indices of shape [B, 1, H, W[, D]] with values in
+            [0, num_classes) instead of the one-hot format, and the Dice scores of the `num_classes` classes are
+            computed from :py:func:`monai.metrics.utils.get_label_index_counts`, without one-hot tensors.
+            Defaults to None.
 
     Returns:
         Dice scores per batch and per class, (shape [batch_size, n_classes]).
@@ -102,6 +113,13 @@ def compute_meandice(
         ValueError: when `y_pred` and `y` have different shapes.
 
     """
+    if num_classes is not None:
+        counts = get_label_index_counts(y_pred, y, num_classes).float()
+        intersection = torch.diagonal(counts, dim1=1, dim2=2)
+        y_pred_o, y_o = counts.sum(dim=2), counts.sum(dim=1)
+        if not include_background and num_classes > 1:
+            intersection, y_pred_o, y_o = intersection[:, 1:], y_pred_o[:, 1:], y_o[:, 1:]
+        return _dice(intersection, y_o, y_pred_o)
 
     if not include_background:
         y_pred, y = ignore_background(
@@ -122,6 +140,10 @@ def compute_meandice(
 
     y_o = torch.sum(y, reduce_axis)
     y_pred_o = torch.sum(y_pred, dim=reduce_axis)
+    return _dice(intersection, y_o, y_pred_o)
+
+
+def _dice(intersection: torch.Tensor, y_o: torch.Tensor, y_pred_o: torch.Tensor) -> torch.Tensor:
     denominator = y_o + y_pred_o
 
     f = torch.where(y_o > 0, (2.0 * intersection) / denominator, torch.tensor(float("nan"), device=y_o.device))
@@ -9,7 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Union, cast
+from typing import Sequence, Tuple, Union
 
 import numpy as np
 import torch
@@ -17,35 +17,78 @@ import torch
 from monai.utils import Average
 
 
+def _check_labels(y: torch.Tensor) -> None:
+    if not torch.all((y == 0) | (y == 1)):
+        raise AssertionError("y values must be 0 or 1, can not be all 0 or all 1.")
+    npos = y.sum(dim=-1)
+    if torch.any(npos == 0) or torch.any(npos == y.shape[-1]):
+        raise AssertionError("y values must be 0 or 1, can not be all 0 or all 1.")
+
+
+def _calculate_batch(y: torch.Tensor, y_pred: torch.Tensor) -> torch.Tensor:
+    """
+    Compute the ROC AUC of every row of `y_pred` (shape [n_classes, n_samples]) from the rank statistic
+    of the positive samples (Mann-Whitney U), the tied values sharing their average rank::
+
+        AUC = (sum of the ranks of the positives - npos * (npos + 1) / 2) / (npos * nneg)
+
+    All the operations are vectorized over the samples and the classes, on the device of the inputs.
+
+    """
+    if not (y.ndimension() == y_pred.ndimension() == 2 and y.shape == y_pred.shape):
+        raise AssertionError("y and y_pred must be 1 dimension data with same length.")
+    _check_labels(y)
+    n = y.shape[1]
+    y_pred, indices = y_pred.sort(dim=1)
+    y = y.gather(1, indices).double()
+    positions = torch.arange(n, device=y.device).expand_as(indices)
+    # the first and last positions of every group of tied values
+    changed = y_pred[:, 1:] != y_pred[:, :-1]
+    first = torch.cat([changed.new_ones(changed.shape[0], 1), changed], dim=1)
+    last = torch.cat([changed, changed.new_ones(changed.shape[0], 1)], dim=1)
+    start = torch.where(first, positions, torch.zeros_like(positions)).cummax(dim=1)[0]
+    end = torch.where(last, positions, torch.full_like(positions, n)).flip(1).cummin(dim=1)[0].flip(1)
+    ranks = (start + end).double() / 2 + 1
+    npos = y.sum(dim=1)
+    return ((ranks * y).sum(dim=1) - npos * (npos + 1) / 2) / (npos * (n - npos))
+
+
 def _calculate(y: torch.Tensor, y_pred: torch.Tensor) -> float:
     if not (y.ndimension() == y_pred.ndimension() == 1 and len(y) == len(y_pred)):
         raise AssertionError("y and y_pred must be 1 dimension data with same length.")
-    if not y.unique().equal(torch.tensor([0, 1], dtype=y.dtype, device=y.device)):
-        raise AssertionError("y values must be 0 or 1, can not be all 0 or all 1.")
-    n = len(y)
-    indices = y_pred.argsort()
-    y = y[indices].cpu().numpy()
-    y_pred = y_pred[indices].cpu().numpy()
-    nneg = auc = tmp_pos = tmp_neg = 0.0
-
-    for i in range(n):
-        y_i = cast(float, y[i])
-        if i + 1 < n and y_pred[i] == y_pred[i + 1]:
-            tmp_pos += y_i
-            tmp_neg += 1 - y_i
-            continue
-        if tmp_pos + tmp_neg > 0:
-            tmp_pos += y_i
-            tmp_neg += 1 - y_i
-            nneg += tmp_neg
-            auc += tmp_pos * (nneg - tmp_neg / 2)
-            tmp_pos = tmp_neg = 0
-            continue
-        if y_i == 1:
-            auc += nneg
-        else:
-            nneg += 1
-    return auc / (nneg * (n - nneg))
+    return _calculate_batch(y[None], y_pred[None]).item()
+
+
+def _prepare_inputs(y_pred: torch.Tensor, y: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Check the shapes of `y_pred` and `y` and squeeze the single class dim,
+    the outputs are of shape [batch_size] or [batch_size, n_classes].
+
+    """
+    y_pred_ndim = y_pred.ndimension()
+    y_ndim = y.ndimension()
+    if y_pred_ndim not in (1, 2):
+        raise ValueError("Predictions should be of shape (batch_size, n_classes) or (batch_size, ).")
+    if y_ndim not in (1, 2):
+        raise ValueError("Targets should be of shape (batch_size, n_classes) or (batch_size, ).")
+    if y_pred_ndim == 2 and y_pred.shape[1] == 1:
+        y_pred = y_pred.squeeze(dim=-1)
+    if y_ndim == 2 and y.shape[1] == 1:
+        y = y.squeeze(dim=-1)
+    if y_pred.ndimension() == 2 and y.shape != y_pred.shape:
+        raise AssertionError("data shapes of y_pred and y do not match.")
+    return y_pred, y
+
+
+def _average(auc_values: torch.Tensor, weights: torch.Tensor, average: Average):
+    auc_list = auc_values.tolist()
+    if average == Average.NONE:
+        return auc_list
+    if average == Average.MACRO:
+        return np.mean(auc_list)
+    if average == Average.WEIGHTED:
+        return np.average(auc_list, weights=weights.tolist())
+    raise ValueError(f'Unsupported average: {average}, available options are ["macro", "weighted", "micro", "none"].')
 
 
 def compute_roc_auc(
@@ -83,34 +126,86 @@ def compute_roc_auc(
         ROCAUC expects y to be comprised of 0's and 1's. `y_pred` must be either prob. estimates or confidence values.
 
     """
-    y_pred_ndim = y_pred.ndimension()
-    y_ndim = y.ndimension()
-    if y_pred_ndim not in (1, 2):
-        raise ValueError("Predictions should be of shape (batch_size, n_classes) or (batch_size, ).")
-    if y_ndim not in (1, 2):
-        raise ValueError("Targets should be of shape (batch_size, n_classes) or (batch_size, ).")
-    if y_pred_ndim == 2 and y_pred.shape[1] == 1:
-        y_pred = y_pred.squeeze(dim=-1)
-        y_pred_ndim = 1
-    if y_ndim == 2 and y.shape[1] == 1:
-        y = y.squeeze(dim=-1)
-
-    if y_pred_ndim == 1:
+    y_pred, y = _prepare_inputs(y_pred, y)
+    if y_pred.ndimension() == 1:
         return _calculate(y, y_pred)
 
-    if y.shape != y_pred.shape:
-        raise AssertionError("data shapes of y_pred and y do not match.")
-
     average = Average(average)
     if average == Average.MICRO:
         return _calculate(y.flatten(), y_pred.flatten())
     y, y_pred = y.transpose(0, 1), y_pred.transpose(0, 1)
-    auc_values = [_calculate(y_, y_pred_) for y_, y_pred_ in zip(y, y_pred)]
-    if average == Average.NONE:
-        return auc_values
-    if average == Average.MACRO:
-        return np.mean(auc_values)
-    if average == Average.WEIGHTED:
-        weights = [sum(y_) for y_ in y]
-        return np.average(auc_values, weights=weights)
-    raise ValueError(f'Unsupported average: {average}, available options are ["macro", "weighted", "micro", "none"].')
+    return _average(_calculate_batch(y, y_pred), y.sum(dim=1), average)
+
+
+def compute_roc_auc_histogram(
+    y_pred: torch.Tensor,
+    y: torch.Tensor,
+    num_bins: int = 1000,
+    value_range: Sequence[float] = (0.0, 1.0),
+) -> torch.Tensor:
+    """
+    Count the negative and positive samples of every class in `num_bins` fixed bins of the predicted values,
+    the sufficient statistics for :py:func:`compute_roc_auc_from_histogram`. The histograms of the batches
+    (or of the ranks in distributed training) can be summed, so the ROC AUC of an epoch is accumulated in
+    ``O(n_classes * num_bins)`` memory instead of storing all the predictions.
+
+    Args:
+        y_pred: input data to compute, typical classification model output, same as :py:func:`compute_roc_auc`.
+        y: ground truth of 0's and 1's, same as :py:func:`compute_roc_auc`.
+        num_bins: number of the bins of the predicted values.
+        value_range: the lower and upper bounds of the predicted values, the values outside are counted in the
+            first or last bin. Defaults to ``(0.0, 1.0)`` for the probability estimates.
+
+    Returns:
+        the counts of shape [n_classes, 2, num_bins], the negatives at index 0 and the positives at index 1
+        of the second dim. `n_classes` is 1 for the binary classification.
+
+    """
+    y_pred, y = _prepare_inputs(y_pred, y)
+    if y_pred.ndimension() == 1:
+        y_pred, y = y_pred[:, None], y[:, None]
+    if y.shape != y_pred.shape:
+        raise AssertionError("data shapes of y_pred and y do not match.")
+    if not torch.all((y == 0) | (y == 1)):
+        raise AssertionError("y values must be 0 or 1.")
+    low, high = value_range
+    bins = ((y_pred.double() - low) * (num_bins / (high - low))).floor().clamp(0, num_bins - 1).long()
+    n_classes = y_pred.shape[1]
+    classes = torch.arange(n_classes, device=bins.device)
+    index = (classes * 2 + y.long()) * num_bins + bins
+    counts = torch.bincount(index.flatten(), minlength=n_classes * 2 * num_bins)
+    return counts.reshape(n_classes, 2, num_bins)
+
+
+def compute_roc_auc_from_histogram(histogram: torch.Tensor, average: Union[Average, str] = Average.MACRO):
+    """
+    Computes the ROC AUC from the histograms of :py:func:`compute_roc_auc_histogram`. The ranking of the
+    samples of different bins is exact and the samples of a bin are treated as tied, so the absolute error
+    of every class is at most ``sum(neg_bin * pos_bin) / (2 * neg * pos)``, which is 0 when the negatives
+    and the positives of the same bin have the same values.
+
+    Args:
+        histogram: the counts of shape [n_classes, 2, num_bins].
+        average: {``"macro"``, ``"weighted"``, ``"micro"``, ``"none"``}
+            Type of averaging performed if not binary classification, same as :py:func:`compute_roc_auc`.
+
+    Raises:
+        ValueError: When ``histogram`` is not of shape [n_classes, 2, num_bins].
+        ValueError: When ``average`` is not one of ["macro", "weighted", "micro", "none"].
+
+    """
+    if histogram.ndimension() != 3 or histogram.shape[1] != 2:
+        raise ValueError(f"histogram should be of shape (n_classes, 2, num_bins), got {tuple(histogram.shape)}.")
+    average = Average(average)
+    histogram = histogram.double()
+    if average == Average.MICRO or histogram.shape[0] == 1:
+        histogram = histogram.sum(dim=0, keepdim=True)
+    neg, pos = histogram[:, 0], histogram[:, 1]
+    nneg, npos = neg.sum(dim=1), pos.sum(dim=1)
+    if torch.any(nneg == 0) or torch.any(npos == 0):
+        raise AssertionError("y values must be 0 or 1, can not be all 0 or all 1.")
+    neg_below = neg.cumsum(dim=1) - neg
+    auc_values = (pos * (neg_below + neg / 2)).sum(dim=1) / (npos * nneg)
+    if auc_values.shape[0] == 1:
+        return auc_values.item()
+    return _average(auc_values, npos, average)
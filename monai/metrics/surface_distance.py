@@ -10,12 +10,13 @@
 # limitations under the License.
 
 import warnings
-from typing import Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
 
-from monai.metrics.utils import do_metric_reduction, get_mask_edges, get_surface_distance, ignore_background
+from monai.metrics.hausdorff_distance import hausdorff_distance_from_surface_distances
+from monai.metrics.utils import do_metric_reduction, get_surface_distances_batch, ignore_background
 from monai.utils import MetricReduction
 
 
@@ -37,6 +38,10 @@ class SurfaceDistanceMetric:
         reduction: {``"none"``, ``"mean"``, ``"sum"``, ``"mean_batch"``, ``"sum_batch"``,
             ``"mean_channel"``, ``"sum_channel"``}
             Define the mode to reduce computation result of 1 batch data. Defaults to ``"mean"``.
+        spacing: spacing of the voxels along every spatial dim (or the same for all the dims) for the
+            ``"euclidean"`` metric. if None, the spacing is 1.
+        num_workers: the number of threads to compute the distances of every class of every item,
+            if None, use the number of CPUs.
 
     """
 
@@ -46,12 +51,16 @@ class SurfaceDistanceMetric:
         symmetric: bool = False,
         distance_metric: str = "euclidean",
         reduction: Union[MetricReduction, str] = MetricReduction.MEAN,
+        spacing: Optional[Union[float, Sequence[float]]] = None,
+        num_workers: Optional[int] = None,
     ) -> None:
         super().__init__()
         self.include_background = include_background
         self.distance_metric = distance_metric
         self.symmetric = symmetric
         self.reduction = reduction
+        self.spacing = spacing
+        self.num_workers = num_workers
 
     def __call__(self, y_pred: torch.Tensor, y: torch.Tensor):
         """
@@ -80,6 +89,8 @@ class SurfaceDistanceMetric:
             include_background=self.include_background,
             symmetric=self.symmetric,
             distance_metric=self.distance_metric,
+            spacing=self.spacing,
+            num_workers=self.num_workers,
         )
 
         # do metric reduction
@@ -93,6 +104,8 @@ def compute_average_surface_distance(
     include_background: bool = False,
     symmetric: bool = False,
     distance_metric: str = "euclidean",
+    spacing: Optional[Union[float, Sequence[float]]] = None,
+    num_workers: Optional[int] = None,
 ):
     """
     This function is used to compute the Average Surface Distance from `y_pred` to `y`
@@ -112,6 +125,10 @@ def compute_average_surface_distance(
             `seg_pred` and `seg_gt`. Defaults to ``False``.
         distance_metric: : [``"euclidean"``, ``"chessboard"``, ``"taxicab"``]
             the metric used to compute surface distance. Defaults to ``"euclidean"``.
+        spacing: spacing of the voxels along every spatial dim (or the same for all the dims) for the
+            ``"euclidean"`` metric. if None, the spacing is 1.
+        num_workers: the number of threads to compute the distances of every class of every item,
+            if None, use the number of CPUs.
     """
 
     if not include_background:
@@ -128,24 +145,81 @@ def compute_average_surface_distance(
     if y.shape != y_pred.shape:
         raise ValueError("y_pred and y should have same shapes.")
 
-    batch_size, n_class = y_pred.shape[:2]
-    asd = np.empty((batch_size, n_class))
+    distances = get_surface_distances_batch(y_pred, y, distance_metric, spacing, symmetric, num_workers)
+    return average_surface_distance_from_surface_distances(distances, symmetric)
 
-    for b, c in np.ndindex(batch_size, n_class):
-        (edges_pred, edges_gt) = get_mask_edges(y_pred[b, c], y[b, c])
-        surface_distance = get_surface_distance(edges_pred, edges_gt, distance_metric=distance_metric)
-        if surface_distance.shape == (0,):
-            avg_surface_distance = np.nan
-        else:
-            avg_surface_distance = surface_distance.mean()  # type: ignore
+
+def _mean_surface_distance(surface_distance: np.ndarray) -> float:
+    return np.nan if surface_distance.shape == (0,) else surface_distance.mean()
+
+
+def average_surface_distance_from_surface_distances(
+    distances: List[List[Tuple[np.ndarray, Optional[np.ndarray]]]],
+    symmetric: bool = False,
+) -> torch.Tensor:
+    """
+    Compute the Average Surface Distance from the surface distances of every class of every item given by
+    :py:func:`monai.metrics.utils.get_surface_distances_batch`.
+
+    Args:
+        distances: surface distances of every class of every item, they must be symmetric if `symmetric`.
+        symmetric: whether to calculate the symmetric average surface distance. Defaults to ``False``.
+    """
+    asd = np.empty((len(distances), len(distances[0]) if distances else 0))
+    for b, c in np.ndindex(*asd.shape):
+        distances_pred, distances_gt = distances[b][c]
+        avg_surface_distance = _mean_surface_distance(distances_pred)
         if not symmetric:
             asd[b, c] = avg_surface_distance
         else:
-            surface_distance_2 = get_surface_distance(edges_gt, edges_pred, distance_metric=distance_metric)
-            if surface_distance_2.shape == (0,):
-                avg_surface_distance_2 = np.nan
-            else:
-                avg_surface_distance_2 = surface_distance_2.mean()  # type: ignore
-            asd[b, c] = np.mean((avg_surface_distance, avg_surface_distance_2))
+            asd[b, c] = np.mean((avg_surface_distance, _mean_surface_distance(distances_gt)))  # type: ignore
 
     return torch.from_numpy(asd)
+
+
+def compute_surface_distance_metrics(
+    y_pred: Union[np.ndarray, torch.Tensor],
+    y: Union[np.ndarray, torch.Tensor],
+    include_background: bool = False,
+    distance_metric: str = "euclidean",
+    percentile: float = 95,
+    spacing: Optional[Union[float, Sequence[float]]] = None,
+    num_workers: Optional[int] = None,
+) -> Dict[str, torch.Tensor]:
+    """
+    Compute the (symmetric) Hausdorff distance, percentile Hausdorff distance and average surface distance
+    together, computing the edges and the distance transforms of every class of every item only once.
+
+    Args:
+        y_pred: input data to compute, typical segmentation model output.
+            It must be one-hot format and first dim is batch, example shape: [16, 3, 32, 32]. The values
+            should be binarized.
+        y: ground truth to compute the distances. It must be one-hot format and first dim is batch.
+            The values should be binarized.
+        include_background: whether to skip distance computation on the first channel of
+            the predicted output. Defaults to ``False``.
+        distance_metric: : [``"euclidean"``, ``"chessboard"``, ``"taxicab"``]
+            the metric used to compute surface distance. Defaults to ``"euclidean"``.
+        percentile: the percentile of the percentile Hausdorff distance. Defaults to 95.
+        spacing: spacing of the voxels along every spatial dim (or the same for all the dims) for the
+            ``"euclidean"`` metric. if None, the spacing is 1.
+        num_workers: the number of threads to compute the distances of every class of every item,
+            if None, use the number of CPUs.
+
+    Returns:
+        a dictionary of the metrics of every class of every item with the keys ``"hausdorff_distance"``,
+        ``"percentile_hausdorff_distance"`` and ``"average_surface_distance"``.
+    """
+    if not include_background:
+        y_pred, y = ignore_background(y_pred=y_pred, y=y)
+    if isinstance(y, torch.Tensor):
+        y = y.float()
+    if isinstance(y_pred, torch.Tensor):
+        y_pred = y_pred.float()
+
+    distances = get_surface_distances_batch(y_pred, y, distance_metric, spacing, True, num_workers)
+    return {
+        "hausdorff_distance": hausdorff_distance_from_surface_distances(distances),
+        "percentile_hausdorff_distance": hausdorff_distance_from_surface_distances(distances, percentile),
+        "average_surface_distance": average_surface_distance_from_surface_distances(distances, symmetric=True),
+    }
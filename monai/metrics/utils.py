@@ -9,20 +9,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple, Union
+import os
+from multiprocessing.pool import ThreadPool
+from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
 
 from monai.transforms.croppad.array import SpatialCrop
-from monai.transforms.utils import generate_spatial_bounding_box
+from monai.transforms.utils import distance_transform, generate_spatial_bounding_box
 from monai.utils import MetricReduction, optional_import
 
 binary_erosion, _ = optional_import("scipy.ndimage.morphology", name="binary_erosion")
 distance_transform_edt, _ = optional_import("scipy.ndimage.morphology", name="distance_transform_edt")
 distance_transform_cdt, _ = optional_import("scipy.ndimage.morphology", name="distance_transform_cdt")
 
-__all__ = ["ignore_background", "do_metric_reduction", "get_mask_edges", "get_surface_distance"]
+__all__ = [
+    "ignore_background",
+    "do_metric_reduction",
+    "get_mask_edges",
+    "get_surface_distance",
+    "get_surface_distances_batch",
+]
 
 
 def ignore_background(
@@ -43,6 +51,40 @@ def ignore_background(
     return y_pred, y
 
 
+def get_label_index_counts(y_pred: torch.Tensor, y: torch.Tensor, num_classes: int) -> torch.Tensor:
+    """
+    Count the elements of every pair of predicted and ground truth classes of every item of the batch, from the
+    label indices `y_pred` and `y` instead of their one-hot format, by a single ``bincount`` of
+    ``(batch_index * num_classes + y_pred) * num_classes + y``. So the memory and the time don't scale with
+    the number of classes. For the class `c`, ``counts[:, c, c]`` is the intersection, ``counts[:, c].sum(-1)``
+    the number of the predicted elements and ``counts[:, :, c].sum(-1)`` the number of the ground truth elements.
+
+    Args:
+        y_pred: the predicted label indices, the first dim is batch, example shape: [16, 1, 32, 32].
+        y: the ground truth label indices, of the same shape as `y_pred`.
+        num_classes: the number of classes, the label indices should be in [0, num_classes).
+
+    Returns:
+        the counts of shape [batch_size, num_classes (predicted), num_classes (ground truth)].
+
+    Raises:
+        ValueError: when `y_pred` and `y` have different shapes.
+        ValueError: when the label indices are not in [0, num_classes).
+
+    """
+    if y_pred.shape != y.shape:
+        raise ValueError("y_pred and y should have same shapes.")
+    batch_size = y_pred.shape[0]
+    y_pred, y = y_pred.reshape(batch_size, -1).long(), y.reshape(batch_size, -1).long()
+    for labels in (y_pred, y):
+        if labels.numel() > 0 and (labels.min() < 0 or labels.max() >= num_classes):
+            raise ValueError(f"the label indices should be in [0, {num_classes}).")
+    batch_index = torch.arange(batch_size, device=y.device)[:, None]
+    index = (batch_index * num_classes + y_pred) * num_classes + y
+    counts = torch.bincount(index.flatten(), minlength=batch_size * num_classes * num_classes)
+    return counts.reshape(batch_size, num_classes, num_classes)
+
+
 def do_metric_reduction(
     f: torch.Tensor,
     reduction: Union[MetricReduction, str] = MetricReduction.MEAN,
@@ -108,7 +150,8 @@ def get_mask_edges(
     seg_gt: Union[np.ndarray, torch.Tensor],
     label_idx: int = 1,
     crop: bool = True,
-) -> Tuple[np.ndarray, np.ndarray]:
+    always_return_as_numpy: bool = True,
+) -> Tuple[Union[np.ndarray, torch.Tensor], Union[np.ndarray, torch.Tensor]]:
     """
     Do binary erosion and use XOR for input to get the edges. This
     function is helpful to further calculate metrics such as Average Surface
@@ -135,7 +178,11 @@ def get_mask_edges(
             maintain two inputs' shapes, here the bounding box is achieved
             by ``(seg_pred | seg_gt)`` which represents the union set of two
             images. Defaults to ``True``.
+        always_return_as_numpy: whether to convert tensor inputs to numpy arrays. if False, the edges of
+            tensor inputs are computed and returned as tensors on the same device. Defaults to ``True``.
     """
+    if not always_return_as_numpy and isinstance(seg_pred, torch.Tensor) and isinstance(seg_gt, torch.Tensor):
+        return _get_mask_edges_torch(seg_pred, seg_gt, label_idx, crop)
 
     # Get both labelfields as np arrays
     if isinstance(seg_pred, torch.Tensor):
@@ -168,13 +215,56 @@ def get_mask_edges(
     return (edges_pred, edges_gt)
 
 
+def _binary_erosion_torch(mask: torch.Tensor) -> torch.Tensor:
+    """
+    Binary erosion of the boolean `mask` by the cross structuring element, with the border treated as
+    background, same as ``scipy.ndimage.binary_erosion(mask)``.
+
+    """
+    eroded = mask.clone()
+    for dim, length in enumerate(mask.shape):
+        if length > 1:
+            eroded.narrow(dim, 1, length - 1).logical_and_(mask.narrow(dim, 0, length - 1))
+            eroded.narrow(dim, 0, length - 1).logical_and_(mask.narrow(dim, 1, length - 1))
+        eroded.narrow(dim, 0, 1).fill_(False)
+        eroded.narrow(dim, length - 1, 1).fill_(False)
+    return eroded
+
+
+def _get_mask_edges_torch(
+    seg_pred: torch.Tensor, seg_gt: torch.Tensor, label_idx: int, crop: bool
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Tensor version of :py:func:`get_mask_edges` on the device of the inputs."""
+    if seg_pred.shape != seg_gt.shape:
+        raise ValueError("seg_pred and seg_gt should have same shapes.")
+    if seg_pred.dtype != torch.bool:
+        seg_pred = seg_pred == label_idx
+    if seg_gt.dtype != torch.bool:
+        seg_gt = seg_gt == label_idx
+
+    if crop:
+        coords = torch.nonzero(seg_pred | seg_gt)
+        if coords.shape[0] == 0:
+            return torch.zeros_like(seg_pred), torch.zeros_like(seg_gt)
+        box = torch.stack([coords.min(dim=0)[0], coords.max(dim=0)[0] + 1]).tolist()
+        slices = tuple(slice(start, end) for start, end in zip(*box))
+        # squeeze the dims of size 1 the same way as the numpy version
+        seg_pred, seg_gt = seg_pred[slices].squeeze(), seg_gt[slices].squeeze()
+
+    return _binary_erosion_torch(seg_pred) ^ seg_pred, _binary_erosion_torch(seg_gt) ^ seg_gt
+
+
 def get_surface_distance(
-    seg_pred: np.ndarray,
-    seg_gt: np.ndarray,
+    seg_pred: Union[np.ndarray, torch.Tensor],
+    seg_gt: Union[np.ndarray, torch.Tensor],
     distance_metric: str = "euclidean",
-) -> np.ndarray:
+    spacing: Optional[Union[float, Sequence[float]]] = None,
+) -> Union[np.ndarray, torch.Tensor]:
     """
     This function is used to compute the surface distances from `seg_pred` to `seg_gt`.
+    If both the inputs are tensors on a GPU, the distance transform is computed on their device by
+    :py:func:`monai.transforms.utils.distance_transform` and the distances are returned as a tensor,
+    otherwise `scipy` is used.
 
     Args:
         seg_pred: the edge of the predictions.
@@ -185,8 +275,25 @@ def get_surface_distance(
             - ``"euclidean"``, uses Exact Euclidean distance transform.
             - ``"chessboard"``, uses `chessboard` metric in chamfer type of transform.
             - ``"taxicab"``, uses `taxicab` metric in chamfer type of transform.
+        spacing: spacing of the voxels along every spatial dim (or the same for all the dims) for the
+            ``"euclidean"`` metric. if None, the spacing is 1.
+
+    Raises:
+        ValueError: When ``spacing`` is specified for the ``"chessboard"`` or ``"taxicab"`` metrics.
     """
+    if spacing is not None and distance_metric != "euclidean":
+        raise ValueError(f"spacing is only supported by the euclidean distance, got {distance_metric}.")
+    if _on_device(seg_pred, seg_gt):
+        if not torch.any(seg_gt):
+            return torch.full((int(seg_pred.sum()),), float("inf"), device=seg_pred.device)
+        if not torch.any(seg_pred):
+            return torch.full((int(seg_gt.sum()),), float("inf"), device=seg_gt.device)
+        return distance_transform(~seg_gt, distance_metric, spacing)[seg_pred]  # type: ignore
 
+    if isinstance(seg_pred, torch.Tensor):
+        seg_pred = seg_pred.detach().cpu().numpy()
+    if isinstance(seg_gt, torch.Tensor):
+        seg_gt = seg_gt.detach().cpu().numpy()
     if not np.any(seg_gt):
         dis = np.inf * np.ones_like(seg_gt)
     else:
@@ -194,10 +301,176 @@ def get_surface_distance(
             dis = np.inf * np.ones_like(seg_gt)
             return np.asarray(dis[seg_gt])
         if distance_metric == "euclidean":
-            dis = distance_transform_edt(~seg_gt)
+            dis = distance_transform_edt(~seg_gt, sampling=spacing)
         elif distance_metric in ["chessboard", "taxicab"]:
             dis = distance_transform_cdt(~seg_gt, metric=distance_metric)
         else:
             raise ValueError(f"distance_metric {distance_metric} is not implemented.")
 
     return np.asarray(dis[seg_pred])
+
+
+def _on_device(*tensors) -> bool:
+    """Whether all the inputs are tensors on a GPU, for which the distances are computed with PyTorch."""
+    return all(isinstance(t, torch.Tensor) and t.device.type != "cpu" for t in tensors)
+
+
+def _cropped_spacing(
+    seg_pred: np.ndarray, seg_gt: np.ndarray, spacing: Optional[Union[float, Sequence[float]]]
+) -> Optional[Union[float, Sequence[float]]]:
+    """
+    Drop the `spacing` of the spatial dims that are squeezed when :py:func:`get_mask_edges` crops the masks.
+
+    """
+    if spacing is None or isinstance(spacing, (int, float)):
+        return spacing
+    coords = np.argwhere(seg_pred.astype(bool) | seg_gt.astype(bool))
+    if coords.shape[0] == 0:
+        return spacing
+    extent = coords.max(axis=0) - coords.min(axis=0)
+    return [s for s, e in zip(spacing, extent) if e > 0]
+
+
+def _surface_distances(
+    seg_pred: np.ndarray,
+    seg_gt: np.ndarray,
+    distance_metric: str,
+    spacing: Optional[Union[float, Sequence[float]]],
+    symmetric: bool,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    spacing = _cropped_spacing(seg_pred, seg_gt, spacing)
+    edges_pred, edges_gt = get_mask_edges(seg_pred, seg_gt)
+    dis_pred = get_surface_distance(edges_pred, edges_gt, distance_metric, spacing)
+    if not symmetric:
+        return dis_pred, None  # type: ignore
+    return dis_pred, get_surface_distance(edges_gt, edges_pred, distance_metric, spacing)  # type: ignore
+
+
+def _batch_mask_edges_torch(y_pred: torch.Tensor, y: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Edges of all the (B, C) masks at once, equal to the edges given by :py:func:`get_mask_edges` (with `crop`)
+    placed back in the uncropped images: the crop only matters for the spatial dims squeezed because the
+    union of the masks spans a single voxel along them, and these dims are left out of the erosion.
+
+    """
+    spatial_dims = y_pred.ndim - 2
+    union = y_pred | y
+    edges = []
+    for mask in (y_pred, y):
+        eroded = mask.clone()
+        for i in range(spatial_dims):
+            dim = 2 + i
+            length = mask.shape[dim]
+            along = mask.clone()
+            if length > 1:
+                along.narrow(dim, 1, length - 1).logical_and_(mask.narrow(dim, 0, length - 1))
+                along.narrow(dim, 0, length - 1).logical_and_(mask.narrow(dim, 1, length - 1))
+            along.narrow(dim, 0, 1).fill_(False)
+            along.narrow(dim, length - 1, 1).fill_(False)
+            occupied = union.movedim(dim, -1).reshape(*mask.shape[:2], -1, length).any(dim=2)
+            squeezed = (occupied.sum(dim=-1) <= 1).view(*mask.shape[:2], *([1] * spatial_dims))
+            eroded &= along | squeezed
+        edges.append(eroded ^ mask)
+    return edges[0], edges[1]
+
+
+def _get_surface_distances_torch(
+    y_pred: torch.Tensor,
+    y: torch.Tensor,
+    distance_metric: str,
+    spacing: Optional[Union[float, Sequence[float]]],
+    symmetric: bool,
+) -> List[List[Tuple[np.ndarray, Optional[np.ndarray]]]]:
+    """
+    Tensor version of :py:func:`get_surface_distances_batch`: the edges and the distance transforms of all
+    the (B, C) masks are computed at once on the device of the inputs.
+
+    """
+    if spacing is not None and distance_metric != "euclidean":
+        raise ValueError(f"spacing is only supported by the euclidean distance, got {distance_metric}.")
+    spatial_dims = y_pred.ndim - 2
+    edges_pred, edges_gt = _batch_mask_edges_torch(y_pred, y)
+    dis_gt = distance_transform(~edges_gt, distance_metric, spacing, spatial_dims).cpu().numpy()
+    dis_pred = None
+    if symmetric:
+        dis_pred = distance_transform(~edges_pred, distance_metric, spacing, spatial_dims).cpu().numpy()
+    edges_pred, edges_gt = edges_pred.cpu().numpy(), edges_gt.cpu().numpy()
+
+    def _distances(edges_from: np.ndarray, edges_to: np.ndarray, dis_to: np.ndarray) -> np.ndarray:
+        # same as get_surface_distance, which returns inf for the edge of the ground truth if there is no edge
+        # in the prediction, and the distance transform is inf if there is no edge in the ground truth
+        if not np.any(edges_from):
+            return np.full(int(edges_to.sum()), np.inf, dtype=dis_to.dtype)
+        return dis_to[edges_from]
+
+    batch_size, n_class = y_pred.shape[:2]
+    results: List[List[Tuple[np.ndarray, Optional[np.ndarray]]]] = []
+    for b in range(batch_size):
+        results.append([])
+        for c in range(n_class):
+            index = (b, c)
+            result_gt = None
+            if dis_pred is not None:
+                result_gt = _distances(edges_gt[index], edges_pred[index], dis_pred[index])
+            results[b].append((_distances(edges_pred[index], edges_gt[index], dis_gt[index]), result_gt))
+    return results
+
+
+def get_surface_distances_batch(
+    y_pred: Union[np.ndarray, torch.Tensor],
+    y: Union[np.ndarray, torch.Tensor],
+    distance_metric: str = "euclidean",
+    spacing: Optional[Union[float, Sequence[float]]] = None,
+    symmetric: bool = True,
+    num_workers: Optional[int] = None,
+) -> List[List[Tuple[np.ndarray, Optional[np.ndarray]]]]:
+    """
+    Compute the surface distances of every class of every item of a batch, with the edges and the distance
+    transforms of every mask computed only once, so that all the surface distance metrics (Hausdorff distance,
+    percentile Hausdorff distance, average surface distance, ...) can be computed from them. The items are
+    processed with `scipy` in a thread pool, except if the inputs are tensors on a GPU: then the edges and the
+    distance transforms of the whole batch are computed at once on the GPU by
+    :py:func:`monai.transforms.utils.distance_transform`.
+
+    Args:
+        y_pred: the binarized predictions in shape (batch_size, n_class, spatial_dim1[, spatial_dim2, ...]).
+        y: the binarized ground truth, of the same shape as `y_pred`.
+        distance_metric: : [``"euclidean"``, ``"chessboard"``, ``"taxicab"``]
+            the metric used to compute surface distance. Defaults to ``"euclidean"``.
+        spacing: spacing of the voxels along every spatial dim (or the same for all the dims) for the
+            ``"euclidean"`` metric. if None, the spacing is 1.
+        symmetric: whether to also compute the surface distances from `y` to `y_pred`.
+        num_workers: the number of threads, if None, use the number of CPUs (up to the number of items).
+
+    Returns:
+        the nested list ``distances[b][c] = (distances_pred, distances_gt)`` where `distances_pred` are the
+        distances from the edge of ``y_pred[b, c]`` to the edge of ``y[b, c]`` given by
+        :py:func:`get_surface_distance`, and `distances_gt` the other way round (None if not `symmetric`).
+
+    Raises:
+        ValueError: When ``y_pred`` and ``y`` have different shapes.
+    """
+    if y.shape != y_pred.shape:
+        raise ValueError("y_pred and y should have same shapes.")
+    if _on_device(y_pred, y):
+        y_pred, y = y_pred.detach().bool(), y.detach().bool()  # type: ignore
+        return _get_surface_distances_torch(y_pred, y, distance_metric, spacing, symmetric)  # type: ignore
+
+    if isinstance(y_pred, torch.Tensor):
+        y_pred = y_pred.detach().cpu().numpy()
+    if isinstance(y, torch.Tensor):
+        y = y.detach().cpu().numpy()
+
+    batch_size, n_class = y_pred.shape[:2]
+    indices = list(np.ndindex(batch_size, n_class))
+
+    def _compute(index: Tuple[int, int]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        return _surface_distances(y_pred[index], y[index], distance_metric, spacing, symmetric)  # type: ignore
+
+    num_workers = min(len(indices), num_workers or os.cpu_count() or 1)
+    if num_workers > 1:
+        with ThreadPool(num_workers) as p:
+            results = p.map(_compute, indices)
+    else:
+        results = [_compute(i) for i in indices]
+    return [results[b * n_class : (b + 1) * n_class] for b in range(batch_size)]
@@ -89,6 +89,7 @@ from .intensity.array import (
     StdShiftIntensity,
     ThresholdIntensity,
 )
+from .intensity.batch import BatchRandAdjustContrast, BatchRandGaussianNoise, BatchRandScaleIntensity
 from .intensity.dictionary import (
     AdjustContrastd,
     AdjustContrastD,
@@ -154,6 +155,7 @@ from .intensity.dictionary import (
 from .inverse import InvertibleTransform
 from .io.array import LoadImage, SaveImage
 from .io.dictionary import LoadImaged, LoadImageD, LoadImageDict, SaveImaged, SaveImageD, SaveImageDict
+from .lazy import LazyTransform, PendingResample
 from .post.array import (
     Activations,
     AsDiscrete,
@@ -208,6 +210,7 @@ from .spatial.array import (
     Spacing,
     Zoom,
 )
+from .spatial.batch import BatchRandAffine, BatchRandFlip, BatchRandRotate, BatchRandZoom
 from .spatial.dictionary import (
     Affined,
     AffineD,
@@ -258,7 +261,16 @@ from .spatial.dictionary import (
     ZoomD,
     ZoomDict,
 )
-from .transform import MapTransform, Randomizable, RandomizableTransform, Transform, apply_transform
+from .transform import (
+    KeyLocalTransform,
+    MapTransform,
+    OrderInvariantTransform,
+    Randomizable,
+    RandomizableTransform,
+    ReorderTransform,
+    Transform,
+    apply_transform,
+)
 from .utility.array import (
     AddChannel,
     AddExtremePointsChannel,
@@ -374,11 +386,13 @@ from .utils import (
     create_scale,
     create_shear,
     create_translate,
+    distance_transform,
     extreme_points_to_image,
     generate_pos_neg_label_crop_centers,
     generate_spatial_bounding_box,
     get_extreme_points,
     get_largest_connected_component_mask,
+    get_largest_connected_component_mask_per_label,
     img_bounds,
     in_bounds,
     is_empty,
@@ -13,25 +13,60 @@ A collection of generic interfaces for MONAI transforms.
 """
 
 import warnings
-from typing import Any, Callable, Optional, Sequence, Union
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from monai.transforms.inverse import InvertibleTransform
+from monai.transforms.lazy import LazyTransform, PendingResample
 
 # For backwards compatiblity (so this still works: from monai.transforms.compose import MapTransform)
 from monai.transforms.transform import (  # noqa: F401
     MapTransform,
+    OrderInvariantTransform,
     Randomizable,
     RandomizableTransform,
+    ReorderTransform,
     Transform,
     apply_transform,
 )
-from monai.utils import MAX_SEED, ensure_tuple, get_seed
+from monai.utils import MAX_SEED, TransformProfiler, ensure_tuple, get_seed
 
 __all__ = ["Compose"]
 
 
+def _is_random(transform: Callable) -> bool:
+    """Whether the result of `transform` can't be cached: random transforms and callables which are not `Transform`."""
+    return isinstance(transform, RandomizableTransform) or not isinstance(transform, Transform)
+
+
+def _name(transform: Callable) -> str:
+    return getattr(transform, "__qualname__", type(transform).__name__)
+
+
+def _commutes(first: Callable, second: Callable) -> bool:
+    """
+    Whether the deterministic transform `second` can be applied before `first` with the same results:
+    the items written by each one are not read or written by the other one, except the arrays of
+    the `ReorderTransform` `first`, which are also mapped by the `OrderInvariantTransform` `second`
+    if its :py:meth:`~monai.transforms.OrderInvariantTransform.order_invariant` is True.
+
+    """
+    if not isinstance(first, Transform) or not isinstance(second, Transform):
+        return False
+    reordered: set = set()
+    if isinstance(first, ReorderTransform) and isinstance(second, OrderInvariantTransform) and second.order_invariant():
+        if not isinstance(first, MapTransform) and not isinstance(second, MapTransform):
+            return True  # array transforms
+        reordered = set(getattr(first, "keys", ()))
+    read_1, write_1, read_2, write_2 = first.read_keys(), first.write_keys(), second.read_keys(), second.write_keys()
+    if read_1 is None or write_1 is None or read_2 is None or write_2 is None:
+        return False
+    return not ((write_1 & (read_2 | write_2)) | (write_2 & read_1)) - reordered
+
+
 class Compose(RandomizableTransform, InvertibleTransform):
     """
     ``Compose`` provides the ability to chain a series of calls together in a
@@ -91,12 +126,67 @@ class Compose(RandomizableTransform, InvertibleTransform):
         Alternatively, one can create a class with a `__call__` function that
         calls your pre-processing functions taking into account that not all of
         them are called on the labels.
+
+    Lazy execution:
+
+        With ``lazy=True``, the consecutive spatial transforms implementing
+        :py:class:`monai.transforms.LazyTransform` (such as `Spacingd`, `Orientationd`,
+        `Rotated`, `Zoomd`, `Affined` and their random versions) only compute their affine
+        matrices and output shapes. The matrices of every key are composed and the arrays are
+        resampled once, with a single `grid_sample`, before the first transform that is not
+        lazy or at the end of the chain. This saves the intermediate arrays and the blur of
+        the repeated interpolations. The meta data and the applied transforms are recorded as
+        in the eager execution, so that :py:meth:`inverse` is unchanged.
+
+        The fused resampling uses the interpolation options of the most recent transform of
+        each key (``"nearest"`` is kept once requested), and `Zoomd`/`RandZoomd` are computed
+        by this affine resampling instead of `torch.nn.functional.interpolate`, so the lazy
+        results are close to, but not exactly, the eager ones.
+
+    Profiling:
+
+        With a :py:class:`monai.utils.TransformProfiler` as ``profiler``, the wall time, the shapes and
+        the allocated bytes of every transform applied by the `Compose`, including the nested `Compose`
+        and their transforms, are recorded at every call. The `PersistentDataset` and `CacheDataset`
+        tag the records with the ``"pre"`` (cached) and ``"post"`` stages, and the records of the
+        `DataLoader` workers are merged by the profiler, see :py:meth:`monai.utils.TransformProfiler.table`
+        and :py:meth:`monai.utils.TransformProfiler.export_chrome_trace`.
+
+    Caching:
+
+        The datasets caching the results of the deterministic transforms, such as `CacheDataset` and
+        `PersistentDataset`, split the transforms with :py:meth:`cache_split`: by default the cached transforms
+        are the ones before the first random transform. With ``hoist_deterministic=True``, the following
+        deterministic transforms are also cached when they commute with all the transforms before them which
+        are not cached, according to the items read and written by the transforms
+        (:py:meth:`monai.transforms.Transform.read_keys`, :py:meth:`monai.transforms.Transform.write_keys`)
+        and to the :py:class:`monai.transforms.OrderInvariantTransform` and
+        :py:class:`monai.transforms.ReorderTransform` markers. The items of the dictionary transforms are
+        only known for the :py:class:`monai.transforms.KeyLocalTransform`. For example, `ToTensord` and `NormalizeIntensityd`
+        after a `RandFlipd` are cached, and :py:meth:`cache_report` shows the split before running the pipeline.
+
+    Args:
+        transforms: sequence of callables.
+        lazy: whether to fuse the resampling of the consecutive lazy transforms, default to False.
+        profiler: the profiler recording the transforms, default to None (no profiling).
+        hoist_deterministic: whether to cache the deterministic transforms which commute with the random
+            transforms before them, default to False.
     """
 
-    def __init__(self, transforms: Optional[Union[Sequence[Callable], Callable]] = None) -> None:
+    def __init__(
+        self,
+        transforms: Optional[Union[Sequence[Callable], Callable]] = None,
+        lazy: bool = False,
+        profiler: Optional[TransformProfiler] = None,
+        hoist_deterministic: bool = False,
+    ) -> None:
         if transforms is None:
             transforms = []
         self.transforms = ensure_tuple(transforms)
+        self.lazy = lazy
+        self.profiler = profiler
+        self.hoist_deterministic = hoist_deterministic
+        self._cache_split: Optional[Tuple[Tuple, Tuple[List[Callable], List[Callable]]]] = None
         self.set_random_state(seed=get_seed())
 
     def set_random_state(self, seed: Optional[int] = None, state: Optional[np.random.RandomState] = None) -> "Compose":
@@ -133,15 +223,107 @@ class Compose(RandomizableTransform, InvertibleTransform):
             else:
                 new_transforms.append(t)
 
-        return Compose(new_transforms)
+        return Compose(
+            new_transforms, lazy=self.lazy, profiler=self.profiler, hoist_deterministic=self.hoist_deterministic
+        )
+
+    def _cache_plan(self) -> List[Tuple[Callable, bool, str]]:
+        """
+        The transforms, whether they are cached, and the reason of the decision, in order.
+
+        """
+        plan: List[Tuple[Callable, bool, str]] = []
+        not_cached: List[Callable] = []
+        for t in self.transforms:
+            if _is_random(t):
+                plan.append((t, False, "random" if isinstance(t, Transform) else "not a Transform"))
+                not_cached.append(t)
+            elif not not_cached:
+                plan.append((t, True, ""))
+            elif not self.hoist_deterministic:
+                plan.append((t, False, "after a random transform"))
+                not_cached.append(t)
+            else:
+                blocking = [p for p in not_cached if not _commutes(p, t)]
+                if blocking:
+                    plan.append((t, False, f"doesn't commute with {_name(blocking[0])}"))
+                    not_cached.append(t)
+                else:
+                    plan.append((t, True, f"hoisted before {_name(not_cached[0])}"))
+        return plan
+
+    def cache_split(self) -> Tuple[List[Callable], List[Callable]]:
+        """
+        Split the transforms into the transforms whose results can be cached and the transforms to apply
+        to the cached results, in order. See the caching section of the class documentation.
+        The split is computed once, and again only if `transforms` or `hoist_deterministic` are changed.
+
+        """
+        key = (tuple(id(t) for t in self.transforms), self.hoist_deterministic)
+        if self._cache_split is None or self._cache_split[0] != key:
+            plan = self._cache_plan()
+            self._cache_split = key, ([t for t, c, _ in plan if c], [t for t, c, _ in plan if not c])
+        return self._cache_split[1]
+
+    def cache_report(self) -> str:
+        """
+        A dry run report of :py:meth:`cache_split`, e.g.::
+
+            cached:
+              0 LoadImaged
+              1 ScaleIntensityd
+              3 ToTensord (hoisted before RandFlipd)
+            not cached:
+              2 RandFlipd (random)
+              4 RandGaussianNoised (random)
+
+        """
+        plan = list(enumerate(self._cache_plan()))
+        lines = []
+        for title, cached in (("cached:", True), ("not cached:", False)):
+            lines.append(title)
+            for i, (t, c, reason) in plan:
+                if c == cached:
+                    lines.append(f"  {i} {_name(t)}" + (f" ({reason})" if reason else ""))
+        return "\n".join(lines)
 
     def __len__(self):
         """Return number of transformations."""
         return len(self.flatten().transforms)
 
+    @contextmanager
+    def profile_stage(self, stage: str):
+        """
+        Tag the transforms applied within the context block with `stage` if the `Compose` has a profiler.
+        It's used by the datasets which apply the transforms of the `Compose` one by one, e.g. ``"pre"``
+        for the transforms computed before caching.
+
+        """
+        if self.profiler is None:
+            yield
+            return
+        with self.profiler.activate(stage):
+            yield
+
     def __call__(self, input_):
+        if self.profiler is not None and TransformProfiler.active() is None:
+            with self.profiler.activate():
+                return self.profiler.call(self, input_)
+        if not self.lazy:
+            for _transform in self.transforms:
+                input_ = apply_transform(_transform, input_)
+            return input_
+
+        pending = PendingResample()
         for _transform in self.transforms:
+            if isinstance(_transform, LazyTransform) and isinstance(input_, Mapping):
+                input_ = apply_transform(partial(_transform.lazy_call, pending=pending), input_)
+                continue
+            if len(pending) > 0:
+                input_ = pending.apply(input_)
             input_ = apply_transform(_transform, input_)
+        if len(pending) > 0:
+            input_ = pending.apply(input_)
         return input_
 
     def inverse(self, data):
@@ -150,6 +332,7 @@ class Compose(RandomizableTransform, InvertibleTransform):
             warnings.warn("inverse has been called but no invertible transforms have been supplied")
 
         # loop backwards over transforms
-        for t in reversed(invertible_transforms):
-            data = apply_transform(t.inverse, data)
+        with self.profile_stage("inverse"):
+            for t in reversed(invertible_transforms):
+                data = apply_transform(t.inverse, data)
         return data
@@ -16,15 +16,16 @@ https://github.com/Project-MONAI/MONAI/wiki/MONAI_Design
 from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-import torch
 
-from monai.config import IndexSelection
+from monai.config import IndexSelection, NdarrayTensor
 from monai.data.utils import get_random_patch, get_valid_patch_size
 from monai.transforms.transform import Randomizable, RandomizableTransform, Transform
 from monai.transforms.utils import (
+    batch_spatial_crop,
     generate_pos_neg_label_crop_centers,
     generate_spatial_bounding_box,
     map_binary_to_indices,
+    pad_nd,
     weighted_patch_samples,
 )
 from monai.utils import Method, NumpyPadMode, ensure_tuple, fall_back_tuple
@@ -49,7 +50,7 @@ class SpatialPad(Transform):
     """
     Performs padding to the data, symmetric for all sides or all on one side for each dimension.
     Uses np.pad so in practice, a mode needs to be provided. See numpy.lib.arraypad.pad
-    for additional details.
+    for additional details. Tensors are padded on their device, see :py:func:`monai.transforms.utils.pad_nd`.
 
     Args:
         spatial_size: the spatial size of output data after padding.
@@ -82,7 +83,7 @@ class SpatialPad(Transform):
             return pad_width
         return [(0, max(self.spatial_size[i] - data_shape[i], 0)) for i in range(len(self.spatial_size))]
 
-    def __call__(self, img: np.ndarray, mode: Optional[Union[NumpyPadMode, str]] = None) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor, mode: Optional[Union[NumpyPadMode, str]] = None) -> NdarrayTensor:
         """
         Args:
             img: data to be transformed, assuming `img` is channel-first and
@@ -97,8 +98,7 @@ class SpatialPad(Transform):
         if not np.asarray(all_pad_width).any():
             # all zeros, skip padding
             return img
-        img = np.pad(img, all_pad_width, mode=self.mode.value if mode is None else NumpyPadMode(mode).value)
-        return img
+        return pad_nd(img, all_pad_width, mode=self.mode if mode is None else mode)
 
 
 class BorderPad(Transform):
@@ -129,7 +129,7 @@ class BorderPad(Transform):
         self.spatial_border = spatial_border
         self.mode: NumpyPadMode = NumpyPadMode(mode)
 
-    def __call__(self, img: np.ndarray, mode: Optional[Union[NumpyPadMode, str]] = None):
+    def __call__(self, img: NdarrayTensor, mode: Optional[Union[NumpyPadMode, str]] = None) -> NdarrayTensor:
         """
         Args:
             img: data to be transformed, assuming `img` is channel-first and
@@ -163,9 +163,7 @@ class BorderPad(Transform):
                 f"[1, len(spatial_shape)={len(spatial_shape)}, 2*len(spatial_shape)={2*len(spatial_shape)}]."
             )
 
-        return np.pad(
-            img, [(0, 0)] + data_pad_width, mode=self.mode.value if mode is None else NumpyPadMode(mode).value
-        )
+        return pad_nd(img, [(0, 0)] + data_pad_width, mode=self.mode if mode is None else mode)
 
 
 class DivisiblePad(Transform):
@@ -189,7 +187,7 @@ class DivisiblePad(Transform):
         self.k = k
         self.mode: NumpyPadMode = NumpyPadMode(mode)
 
-    def __call__(self, img: np.ndarray, mode: Optional[Union[NumpyPadMode, str]] = None) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor, mode: Optional[Union[NumpyPadMode, str]] = None) -> NdarrayTensor:
         """
         Args:
             img: data to be transformed, assuming `img` is channel-first
@@ -246,7 +244,7 @@ class SpatialCrop(Transform):
         self.roi_start = self.roi_start if isinstance(self.roi_start, np.ndarray) else np.array([self.roi_start])
         self.roi_end = self.roi_end if isinstance(self.roi_end, np.ndarray) else np.array([self.roi_end])
 
-    def __call__(self, img: Union[np.ndarray, torch.Tensor]):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`, assuming `img` is channel-first and
         slicing doesn't apply to the channel dim.
@@ -268,7 +266,7 @@ class CenterSpatialCrop(Transform):
     def __init__(self, roi_size: Union[Sequence[int], int]) -> None:
         self.roi_size = roi_size
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`, assuming `img` is channel-first and
         slicing doesn't apply to the channel dim.
@@ -310,7 +308,7 @@ class RandSpatialCrop(RandomizableTransform):
             valid_size = get_valid_patch_size(img_size, self._size)
             self._slices = (slice(None),) + get_random_patch(img_size, valid_size, self.R)
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`, assuming `img` is channel-first and
         slicing doesn't apply to the channel dim.
@@ -338,9 +336,13 @@ class RandSpatialCropSamples(RandomizableTransform):
         random_center: crop at random position as center or the image center.
         random_size: crop with random size or specific size ROI.
             The actual size is sampled from `randint(roi_size, img_size)`.
+        stack: whether to gather all the samples at once into an array (or tensor) of shape
+            (num_samples, C, *roi_size) instead of returning a list of the samples, the ROI must be
+            inside the image. it requires ``random_size=False``.
 
     Raises:
         ValueError: When ``num_samples`` is nonpositive.
+        ValueError: When ``stack=True`` and ``random_size=True``.
 
     """
 
@@ -350,10 +352,14 @@ class RandSpatialCropSamples(RandomizableTransform):
         num_samples: int,
         random_center: bool = True,
         random_size: bool = True,
+        stack: bool = False,
     ) -> None:
         if num_samples < 1:
             raise ValueError(f"num_samples must be positive, got {num_samples}.")
+        if stack and random_size:
+            raise ValueError("the samples of random size can't be stacked.")
         self.num_samples = num_samples
+        self.stack = stack
         self.cropper = RandSpatialCrop(roi_size, random_center, random_size)
 
     def set_random_state(
@@ -366,12 +372,23 @@ class RandSpatialCropSamples(RandomizableTransform):
     def randomize(self, data: Optional[Any] = None) -> None:
         pass
 
-    def __call__(self, img: np.ndarray) -> List[np.ndarray]:
+    def __call__(self, img: NdarrayTensor) -> Union[List[NdarrayTensor], NdarrayTensor]:
         """
         Apply the transform to `img`, assuming `img` is channel-first and
         cropping doesn't change the channel dim.
         """
-        return [self.cropper(img) for _ in range(self.num_samples)]
+        if not self.stack:
+            return [self.cropper(img) for _ in range(self.num_samples)]
+        img_size = np.asarray(img.shape[1:])
+        starts = []
+        for _ in range(self.num_samples):
+            # draws the same random numbers as `self.cropper(img)`
+            self.cropper.randomize(img.shape[1:])
+            if self.cropper.random_center:
+                starts.append([s.start for s in self.cropper._slices[1:]])  # type: ignore
+            else:
+                starts.append(img_size // 2 - np.asarray(self.cropper._size) // 2)
+        return batch_spatial_crop(img, starts, self.cropper._size)  # type: ignore
 
 
 class CropForeground(Transform):
@@ -514,12 +531,17 @@ class RandCropByPosNegLabel(RandomizableTransform):
             the valid image content areas.
         fg_indices: if provided pre-computed foreground indices of `label`, will ignore above `image` and
             `image_threshold`, and randomly select crop centers based on them, need to provide `fg_indices`
-            and `bg_indices` together, expect to be 1 dim array of spatial indices after flattening.
-            a typical usage is to call `FgBgToIndices` transform first and cache the results.
+            and `bg_indices` together, expect to be 1 dim array of spatial indices after flattening, or
+            :py:class:`monai.transforms.utils.RunLengthIndices`. a typical usage is to call `FgBgToIndices`
+            transform first and cache the results, ``FgBgToIndices(compact=True)`` makes the cache much smaller.
         bg_indices: if provided pre-computed background indices of `label`, will ignore above `image` and
             `image_threshold`, and randomly select crop centers based on them, need to provide `fg_indices`
-            and `bg_indices` together, expect to be 1 dim array of spatial indices after flattening.
-            a typical usage is to call `FgBgToIndices` transform first and cache the results.
+            and `bg_indices` together, expect to be 1 dim array of spatial indices after flattening, or
+            :py:class:`monai.transforms.utils.RunLengthIndices`. a typical usage is to call `FgBgToIndices`
+            transform first and cache the results, ``FgBgToIndices(compact=True)`` makes the cache much smaller.
+        stack: whether to gather all the samples at once into an array (or tensor) of shape
+            (num_samples, C, *spatial_size) instead of returning a list of the samples,
+            `spatial_size` must not be larger than the image.
 
     Raises:
         ValueError: When ``pos`` or ``neg`` are negative.
@@ -538,6 +560,7 @@ class RandCropByPosNegLabel(RandomizableTransform):
         image_threshold: float = 0.0,
         fg_indices: Optional[np.ndarray] = None,
         bg_indices: Optional[np.ndarray] = None,
+        stack: bool = False,
     ) -> None:
         self.spatial_size = ensure_tuple(spatial_size)
         self.label = label
@@ -552,6 +575,7 @@ class RandCropByPosNegLabel(RandomizableTransform):
         self.centers: Optional[List[List[np.ndarray]]] = None
         self.fg_indices = fg_indices
         self.bg_indices = bg_indices
+        self.stack = stack
 
     def randomize(
         self,
@@ -562,7 +586,7 @@ class RandCropByPosNegLabel(RandomizableTransform):
     ) -> None:
         self.spatial_size = fall_back_tuple(self.spatial_size, default=label.shape[1:])
         if fg_indices is None or bg_indices is None:
-            fg_indices_, bg_indices_ = map_binary_to_indices(label, image, self.image_threshold)
+            fg_indices_, bg_indices_ = map_binary_to_indices(label, image, self.image_threshold, compact=True)
         else:
             fg_indices_ = fg_indices
             bg_indices_ = bg_indices
@@ -577,7 +601,7 @@ class RandCropByPosNegLabel(RandomizableTransform):
         image: Optional[np.ndarray] = None,
         fg_indices: Optional[np.ndarray] = None,
         bg_indices: Optional[np.ndarray] = None,
-    ) -> List[np.ndarray]:
+    ) -> Union[List[np.ndarray], np.ndarray]:
         """
         Args:
             img: input data to crop samples from based on the pos/neg ratio of `label` and `image`.
@@ -603,13 +627,18 @@ class RandCropByPosNegLabel(RandomizableTransform):
                 fg_indices = self.fg_indices
                 bg_indices = self.bg_indices
             else:
-                fg_indices, bg_indices = map_binary_to_indices(label, image, self.image_threshold)
+                fg_indices, bg_indices = map_binary_to_indices(label, image, self.image_threshold, compact=True)
         self.randomize(label, fg_indices, bg_indices, image)
+        if self.centers is None:
+            raise AssertionError
+        if self.stack:
+            size = np.asarray(self.spatial_size)
+            starts = np.maximum(np.asarray(self.centers, dtype=np.int64) - size // 2, 0)
+            return batch_spatial_crop(img, starts, self.spatial_size)
         results: List[np.ndarray] = []
-        if self.centers is not None:
-            for center in self.centers:
-                cropper = SpatialCrop(roi_center=tuple(center), roi_size=self.spatial_size)  # type: ignore
-                results.append(cropper(img))
+        for center in self.centers:
+            cropper = SpatialCrop(roi_center=tuple(center), roi_size=self.spatial_size)  # type: ignore
+            results.append(cropper(img))
 
         return results
 
@@ -639,7 +668,7 @@ class ResizeWithPadOrCrop(Transform):
         self.padder = SpatialPad(spatial_size=spatial_size, mode=mode)
         self.cropper = CenterSpatialCrop(roi_size=spatial_size)
 
-    def __call__(self, img: np.ndarray, mode: Optional[Union[NumpyPadMode, str]] = None) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor, mode: Optional[Union[NumpyPadMode, str]] = None) -> NdarrayTensor:
         """
         Args:
             img: data to pad or crop, assuming `img` is channel-first and
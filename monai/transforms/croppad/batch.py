@@ -13,7 +13,6 @@ A collection of "vanilla" transforms for crop and pad operations acting on batch
 https://github.com/Project-MONAI/MONAI/wiki/MONAI_Design
 """
 
-from copy import deepcopy
 from typing import Any, Dict, Hashable, Union
 
 import numpy as np
@@ -75,7 +74,7 @@ class PadListDataCollate(InvertibleTransform):
         # data is either list of dicts or list of lists
         is_list_of_dicts = isinstance(batch[0], dict)
         # loop over items inside of each element in a batch
-        for key_or_idx in batch[0].keys() if is_list_of_dicts else range(len(batch[0])):
+        for key_or_idx in list(batch[0].keys()) if is_list_of_dicts else range(len(batch[0])):
             # calculate max size of each dimension
             max_shapes = []
             for elem in batch:
@@ -117,13 +116,13 @@ class PadListDataCollate(InvertibleTransform):
         if not isinstance(data, dict):
             raise RuntimeError("Inverse can only currently be applied on dictionaries.")
 
-        d = deepcopy(data)
-        for key in d.keys():
+        d = dict(data)
+        for key in data.keys():
             transform_key = str(key) + InverseKeys.KEY_SUFFIX
             if transform_key in d.keys():
                 transform = d[transform_key][-1]
                 if transform[InverseKeys.CLASS_NAME] == PadListDataCollate.__name__:
                     d[key] = CenterSpatialCrop(transform["orig_size"])(d[key])
                     # remove transform
-                    d[transform_key].pop()
+                    d[transform_key] = d[transform_key][:-1]
         return d
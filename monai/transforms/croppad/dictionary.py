@@ -15,10 +15,9 @@ defined in :py:class:`monai.transforms.croppad.array`.
 Class names are ended with 'd' to denote dictionary-based transforms.
 """
 
-from copy import deepcopy
 from itertools import chain
 from math import floor
-from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 
@@ -34,7 +33,7 @@ from monai.transforms.croppad.array import (
     SpatialPad,
 )
 from monai.transforms.inverse import InvertibleTransform
-from monai.transforms.transform import MapTransform, Randomizable, RandomizableTransform
+from monai.transforms.transform import KeyLocalTransform, MapTransform, Randomizable, RandomizableTransform
 from monai.transforms.utils import (
     generate_pos_neg_label_crop_centers,
     generate_spatial_bounding_box,
@@ -87,7 +86,7 @@ __all__ = [
 NumpyPadModeSequence = Union[Sequence[Union[NumpyPadMode, str]], NumpyPadMode, str]
 
 
-class SpatialPadd(MapTransform, InvertibleTransform):
+class SpatialPadd(MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.SpatialPad`.
     Performs padding to the data, symmetric for all sides or all on one side for each dimension.
@@ -129,7 +128,7 @@ class SpatialPadd(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
             # Create inverse transform
@@ -149,7 +148,7 @@ class SpatialPadd(MapTransform, InvertibleTransform):
         return d
 
 
-class BorderPadd(MapTransform, InvertibleTransform):
+class BorderPadd(MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Pad the input data by adding specified borders to every dimension.
     Dictionary-based wrapper of :py:class:`monai.transforms.BorderPad`.
@@ -197,7 +196,7 @@ class BorderPadd(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
 
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
@@ -221,7 +220,7 @@ class BorderPadd(MapTransform, InvertibleTransform):
         return d
 
 
-class DivisiblePadd(MapTransform, InvertibleTransform):
+class DivisiblePadd(MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Pad the input data, so that the spatial sizes are divisible by `k`.
     Dictionary-based wrapper of :py:class:`monai.transforms.DivisiblePad`.
@@ -263,7 +262,7 @@ class DivisiblePadd(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
 
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
@@ -281,7 +280,7 @@ class DivisiblePadd(MapTransform, InvertibleTransform):
         return d
 
 
-class SpatialCropd(MapTransform, InvertibleTransform):
+class SpatialCropd(MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.SpatialCrop`.
     Either a spatial center and size must be provided, or alternatively if center and size
@@ -318,7 +317,7 @@ class SpatialCropd(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
 
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
@@ -337,7 +336,7 @@ class SpatialCropd(MapTransform, InvertibleTransform):
         return d
 
 
-class CenterSpatialCropd(MapTransform, InvertibleTransform):
+class CenterSpatialCropd(MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.CenterSpatialCrop`.
 
@@ -364,7 +363,7 @@ class CenterSpatialCropd(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
 
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
@@ -385,7 +384,7 @@ class CenterSpatialCropd(MapTransform, InvertibleTransform):
         return d
 
 
-class RandSpatialCropd(RandomizableTransform, MapTransform, InvertibleTransform):
+class RandSpatialCropd(RandomizableTransform, MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandSpatialCrop`.
     Crop image with random size or specific size ROI. It can crop at a random position as
@@ -444,7 +443,7 @@ class RandSpatialCropd(RandomizableTransform, MapTransform, InvertibleTransform)
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
 
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
@@ -528,10 +527,19 @@ class RandSpatialCropSamplesd(RandomizableTransform, MapTransform):
         pass
 
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> List[Dict[Hashable, np.ndarray]]:
-        return [self.cropper(data) for _ in range(self.num_samples)]
+        trace_keys = [str(key) + InverseKeys.KEY_SUFFIX for key in self.key_iterator(data)]
+        results = []
+        for _ in range(self.num_samples):
+            # the samples share the other items, only the lists of applied transforms are copied for every sample
+            d = dict(data)
+            for trace_key in trace_keys:
+                if trace_key in d:
+                    d[trace_key] = list(d[trace_key])
+            results.append(self.cropper(d))
+        return results
 
 
-class CropForegroundd(MapTransform, InvertibleTransform):
+class CropForegroundd(MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.CropForeground`.
     Crop only the foreground object of the expected images.
@@ -576,6 +584,12 @@ class CropForegroundd(MapTransform, InvertibleTransform):
         self.start_coord_key = start_coord_key
         self.end_coord_key = end_coord_key
 
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        return super().read_keys() | {self.source_key}  # type: ignore
+
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        return super().write_keys() | {self.start_coord_key, self.end_coord_key}  # type: ignore
+
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
         d = dict(data)
         box_start, box_end = generate_spatial_bounding_box(
@@ -590,7 +604,7 @@ class CropForegroundd(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
             # Create inverse transform
@@ -609,7 +623,7 @@ class CropForegroundd(MapTransform, InvertibleTransform):
         return d
 
 
-class RandWeightedCropd(RandomizableTransform, MapTransform):
+class RandWeightedCropd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Samples a list of `num_samples` image patches according to the provided `weight_map`.
 
@@ -650,6 +664,14 @@ class RandWeightedCropd(RandomizableTransform, MapTransform):
             spatial_size=self.spatial_size, w=weight_map[0], n_samples=self.num_samples, r_state=self.R
         )
 
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        return super().read_keys() | {self.w_key}  # type: ignore
+
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        if self.center_coord_key is None:
+            return super().write_keys()
+        return super().write_keys() | {self.center_coord_key}  # type: ignore
+
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> List[Dict[Hashable, np.ndarray]]:
         d = dict(data)
         self.randomize(d[self.w_key])
@@ -676,7 +698,7 @@ class RandWeightedCropd(RandomizableTransform, MapTransform):
         return results
 
 
-class RandCropByPosNegLabeld(RandomizableTransform, MapTransform):
+class RandCropByPosNegLabeld(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandCropByPosNegLabel`.
     Crop random fixed sized regions with the center being a foreground or background voxel
@@ -700,12 +722,14 @@ class RandCropByPosNegLabeld(RandomizableTransform, MapTransform):
             the valid image content area.
         fg_indices_key: if provided pre-computed foreground indices of `label`, will ignore above `image_key` and
             `image_threshold`, and randomly select crop centers based on them, need to provide `fg_indices_key`
-            and `bg_indices_key` together, expect to be 1 dim array of spatial indices after flattening.
-            a typical usage is to call `FgBgToIndicesd` transform first and cache the results.
+            and `bg_indices_key` together, expect to be 1 dim array of spatial indices after flattening, or
+            :py:class:`monai.transforms.utils.RunLengthIndices`. a typical usage is to call `FgBgToIndicesd`
+            transform first and cache the results, ``FgBgToIndicesd(compact=True)`` makes the cache much smaller.
         bg_indices_key: if provided pre-computed background indices of `label`, will ignore above `image_key` and
             `image_threshold`, and randomly select crop centers based on them, need to provide `fg_indices_key`
-            and `bg_indices_key` together, expect to be 1 dim array of spatial indices after flattening.
-            a typical usage is to call `FgBgToIndicesd` transform first and cache the results.
+            and `bg_indices_key` together, expect to be 1 dim array of spatial indices after flattening, or
+            :py:class:`monai.transforms.utils.RunLengthIndices`. a typical usage is to call `FgBgToIndicesd`
+            transform first and cache the results, ``FgBgToIndicesd(compact=True)`` makes the cache much smaller.
         allow_missing_keys: don't raise exception if key is missing.
 
     Raises:
@@ -753,7 +777,7 @@ class RandCropByPosNegLabeld(RandomizableTransform, MapTransform):
     ) -> None:
         self.spatial_size = fall_back_tuple(self.spatial_size, default=label.shape[1:])
         if fg_indices is None or bg_indices is None:
-            fg_indices_, bg_indices_ = map_binary_to_indices(label, image, self.image_threshold)
+            fg_indices_, bg_indices_ = map_binary_to_indices(label, image, self.image_threshold, compact=True)
         else:
             fg_indices_ = fg_indices
             bg_indices_ = bg_indices
@@ -761,6 +785,10 @@ class RandCropByPosNegLabeld(RandomizableTransform, MapTransform):
             self.spatial_size, self.num_samples, self.pos_ratio, label.shape[1:], fg_indices_, bg_indices_, self.R
         )
 
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        extra_keys = (self.label_key, self.image_key, self.fg_indices_key, self.bg_indices_key)
+        return super().read_keys() | {k for k in extra_keys if k is not None}  # type: ignore
+
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> List[Dict[Hashable, np.ndarray]]:
         d = dict(data)
         label = d[self.label_key]
@@ -773,21 +801,20 @@ class RandCropByPosNegLabeld(RandomizableTransform, MapTransform):
             raise AssertionError
         if self.centers is None:
             raise AssertionError
-        results: List[Dict[Hashable, np.ndarray]] = [{} for _ in range(self.num_samples)]
-
+        # the samples share the extra keys with unmodified data
+        results: List[Dict[Hashable, np.ndarray]] = [
+            {key: data[key] for key in set(data.keys()).difference(set(self.keys))} for _ in range(self.num_samples)
+        ]
+        keys = list(self.key_iterator(d))
         for i, center in enumerate(self.centers):
-            for key in self.key_iterator(d):
-                img = d[key]
-                cropper = SpatialCrop(roi_center=tuple(center), roi_size=self.spatial_size)  # type: ignore
-                results[i][key] = cropper(img)
-            # fill in the extra keys with unmodified data
-            for key in set(data.keys()).difference(set(self.keys)):
-                results[i][key] = data[key]
+            cropper = SpatialCrop(roi_center=tuple(center), roi_size=self.spatial_size)  # type: ignore
+            for key in keys:
+                results[i][key] = cropper(d[key])
 
         return results
 
 
-class ResizeWithPadOrCropd(MapTransform, InvertibleTransform):
+class ResizeWithPadOrCropd(MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ResizeWithPadOrCrop`.
 
@@ -823,7 +850,7 @@ class ResizeWithPadOrCropd(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
             # Create inverse transform
@@ -882,6 +909,12 @@ class BoundingRectd(MapTransform):
         self.bbox = BoundingRect(select_fn=select_fn)
         self.bbox_key_postfix = bbox_key_postfix
 
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        return set(self.keys)
+
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        return {f"{key}_{self.bbox_key_postfix}" for key in self.keys}
+
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
         """
         See also: :py:class:`monai.transforms.utils.generate_spatial_bounding_box`.
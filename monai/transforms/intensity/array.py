@@ -20,11 +20,11 @@ from warnings import warn
 import numpy as np
 import torch
 
-from monai.config import DtypeLike
+from monai.config import DtypeLike, NdarrayTensor
 from monai.networks.layers import GaussianFilter, HilbertTransform, SavitzkyGolayFilter
-from monai.transforms.transform import RandomizableTransform, Transform
-from monai.transforms.utils import rescale_array
-from monai.utils import PT_BEFORE_1_7, InvalidPyTorchVersionError, dtype_torch_to_numpy, ensure_tuple_size
+from monai.transforms.transform import OrderInvariantTransform, RandomizableTransform, Transform
+from monai.transforms.utils import compute_percentiles, rescale_array
+from monai.utils import PT_BEFORE_1_7, InvalidPyTorchVersionError, dtype_numpy_to_torch, ensure_tuple_size
 
 __all__ = [
     "RandGaussianNoise",
@@ -55,6 +55,7 @@ __all__ = [
 class RandGaussianNoise(RandomizableTransform):
     """
     Add Gaussian noise to image.
+    The noise is drawn from the numpy random state of the transform, and copied to the device of tensor inputs.
 
     Args:
         prob: Probability to add Gaussian noise.
@@ -72,7 +73,7 @@ class RandGaussianNoise(RandomizableTransform):
         super().randomize(None)
         self._noise = self.R.normal(self.mean, self.R.uniform(0, self.std), size=im_shape)
 
-    def __call__(self, img: Union[torch.Tensor, np.ndarray]) -> Union[torch.Tensor, np.ndarray]:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
@@ -81,11 +82,12 @@ class RandGaussianNoise(RandomizableTransform):
             raise AssertionError
         if not self._do_transform:
             return img
-        dtype = dtype_torch_to_numpy(img.dtype) if isinstance(img, torch.Tensor) else img.dtype
-        return img + self._noise.astype(dtype)
+        if isinstance(img, torch.Tensor):
+            return img + torch.as_tensor(self._noise, dtype=img.dtype, device=img.device)
+        return img + self._noise.astype(img.dtype)
 
 
-class ShiftIntensity(Transform):
+class ShiftIntensity(OrderInvariantTransform):
     """
     Shift intensity uniformly for the entire image with specified `offset`.
 
@@ -96,10 +98,12 @@ class ShiftIntensity(Transform):
     def __init__(self, offset: float) -> None:
         self.offset = offset
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
+        if isinstance(img, torch.Tensor):
+            return (img + self.offset).to(img.dtype)
         return np.asarray((img + self.offset), dtype=img.dtype)
 
 
@@ -127,7 +131,7 @@ class RandShiftIntensity(RandomizableTransform):
         self._offset = self.R.uniform(low=self.offsets[0], high=self.offsets[1])
         super().randomize(None)
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
@@ -165,7 +169,15 @@ class StdShiftIntensity(Transform):
         self.channel_wise = channel_wise
         self.dtype = dtype
 
-    def _stdshift(self, img: np.ndarray) -> np.ndarray:
+    def _stdshift(self, img: NdarrayTensor) -> NdarrayTensor:
+        if isinstance(img, torch.Tensor):
+            if self.nonzero:
+                slices = img != 0
+                if not torch.any(slices):
+                    return img
+                img[slices] = img[slices] + self.factor * torch.std(img[slices], unbiased=False)
+                return img
+            return img + self.factor * torch.std(img, unbiased=False)
         slices = (img != 0) if self.nonzero else np.ones(img.shape, dtype=bool)
         if not np.any(slices):
             return img
@@ -173,11 +185,14 @@ class StdShiftIntensity(Transform):
         img[slices] = img[slices] + offset
         return img
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
-        img = img.astype(self.dtype)
+        if isinstance(img, torch.Tensor):
+            img = img.to(dtype_numpy_to_torch(self.dtype), copy=True)
+        else:
+            img = img.astype(self.dtype)
         if self.channel_wise:
             for i, d in enumerate(img):
                 img[i] = self._stdshift(d)
@@ -225,7 +240,7 @@ class RandStdShiftIntensity(RandomizableTransform):
         self.factor = self.R.uniform(low=self.factors[0], high=self.factors[1])
         super().randomize(None)
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
@@ -238,7 +253,7 @@ class RandStdShiftIntensity(RandomizableTransform):
         return shifter(img)
 
 
-class ScaleIntensity(Transform):
+class ScaleIntensity(OrderInvariantTransform):
     """
     Scale the intensity of input image to the given value range (minv, maxv).
     If `minv` and `maxv` not provided, use `factor` to scale image by ``v = v * (1 + factor)``.
@@ -258,7 +273,7 @@ class ScaleIntensity(Transform):
         self.maxv = maxv
         self.factor = factor
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
 
@@ -267,8 +282,12 @@ class ScaleIntensity(Transform):
 
         """
         if self.minv is not None and self.maxv is not None:
+            if isinstance(img, torch.Tensor):
+                return rescale_array(img, self.minv, self.maxv, img.dtype)
             return np.asarray(rescale_array(img, self.minv, self.maxv, img.dtype))
         if self.factor is not None:
+            if isinstance(img, torch.Tensor):
+                return (img * (1 + self.factor)).to(img.dtype)
             return np.asarray(img * (1 + self.factor), dtype=img.dtype)
         raise ValueError("Incompatible values: minv=None or maxv=None and factor=None.")
 
@@ -299,7 +318,7 @@ class RandScaleIntensity(RandomizableTransform):
         self.factor = self.R.uniform(low=self.factors[0], high=self.factors[1])
         super().randomize(None)
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
@@ -401,7 +420,7 @@ class RandBiasField(RandomizableTransform):
         return (img * _bias_fields).astype(self.dtype)
 
 
-class NormalizeIntensity(Transform):
+class NormalizeIntensity(OrderInvariantTransform):
     """
     Normalize input based on provided args, using calculated mean and std if not provided.
     This transform can normalize only non-zero values or entire image, and can also calculate
@@ -432,7 +451,25 @@ class NormalizeIntensity(Transform):
         self.channel_wise = channel_wise
         self.dtype = dtype
 
-    def _normalize(self, img: np.ndarray, sub=None, div=None) -> np.ndarray:
+    def order_invariant(self) -> bool:
+        """
+        Whether `subtrahend` and `divisor` are None, scalars or (if `channel_wise`) per-channel scalars,
+        not arrays of the voxels.
+
+        """
+        for value in (self.subtrahend, self.divisor):
+            if value is None:
+                continue
+            if self.channel_wise and np.ndim(value) > 0:
+                if any(np.ndim(v) > 0 for v in value):
+                    return False
+            elif np.ndim(value) > 0:
+                return False
+        return True
+
+    def _normalize(self, img: NdarrayTensor, sub=None, div=None) -> NdarrayTensor:
+        if isinstance(img, torch.Tensor):
+            return self._normalize_tensor(img, sub, div)
         slices = (img != 0) if self.nonzero else np.ones(img.shape, dtype=bool)
         if not np.any(slices):
             return img
@@ -451,10 +488,32 @@ class NormalizeIntensity(Transform):
         img[slices] = (img[slices] - _sub) / _div
         return img
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def _normalize_tensor(self, img: torch.Tensor, sub=None, div=None) -> torch.Tensor:
+        slices = (img != 0) if self.nonzero else torch.ones_like(img, dtype=torch.bool)
+        if not torch.any(slices):
+            return img
+        values = img[slices].to(torch.float64)
+
+        _sub = sub if sub is not None else torch.mean(values)
+        if isinstance(_sub, (np.ndarray, torch.Tensor)) and np.ndim(_sub) > 0:
+            _sub = torch.as_tensor(_sub, device=img.device)[slices]
+
+        _div = div if div is not None else torch.std(values, unbiased=False)
+        if isinstance(_div, (np.ndarray, torch.Tensor)) and np.ndim(_div) > 0:
+            _div = torch.as_tensor(_div, dtype=torch.float64, device=img.device)[slices]
+            _div[_div == 0.0] = 1.0
+        elif _div == 0.0:
+            _div = 1.0
+        img[slices] = ((values - _sub) / _div).to(img.dtype)
+        return img
+
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`, assuming `img` is a channel-first array if `self.channel_wise` is True,
         """
+        if isinstance(img, torch.Tensor):
+            # the values are normalized in place, don't modify the input tensor
+            img = img.clone()
         if self.channel_wise:
             if self.subtrahend is not None and len(self.subtrahend) != len(img):
                 raise ValueError(f"img has {len(img)} channels, but subtrahend has {len(self.subtrahend)} components.")
@@ -470,10 +529,12 @@ class NormalizeIntensity(Transform):
         else:
             img = self._normalize(img, self.subtrahend, self.divisor)
 
+        if isinstance(img, torch.Tensor):
+            return img.to(dtype_numpy_to_torch(self.dtype))
         return img.astype(self.dtype)
 
 
-class ThresholdIntensity(Transform):
+class ThresholdIntensity(OrderInvariantTransform):
     """
     Filter the intensity values of whole image to below threshold or above threshold.
     And fill the remaining parts of the image to the `cval` value.
@@ -491,16 +552,19 @@ class ThresholdIntensity(Transform):
         self.above = above
         self.cval = cval
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
+        if isinstance(img, torch.Tensor):
+            mask = img > self.threshold if self.above else img < self.threshold
+            return torch.where(mask, img, torch.as_tensor(self.cval, dtype=img.dtype, device=img.device))
         return np.asarray(
             np.where(img > self.threshold if self.above else img < self.threshold, img, self.cval), dtype=img.dtype
         )
 
 
-class ScaleIntensityRange(Transform):
+class ScaleIntensityRange(OrderInvariantTransform):
     """
     Apply specific intensity scaling to the whole numpy array.
     Scaling from [a_min, a_max] to [b_min, b_max] with clip option.
@@ -520,7 +584,7 @@ class ScaleIntensityRange(Transform):
         self.b_max = b_max
         self.clip = clip
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
@@ -531,11 +595,13 @@ class ScaleIntensityRange(Transform):
         img = (img - self.a_min) / (self.a_max - self.a_min)
         img = img * (self.b_max - self.b_min) + self.b_min
         if self.clip:
+            if isinstance(img, torch.Tensor):
+                return torch.clamp(img, self.b_min, self.b_max)
             img = np.asarray(np.clip(img, self.b_min, self.b_max))
         return img
 
 
-class AdjustContrast(Transform):
+class AdjustContrast(OrderInvariantTransform):
     """
     Changes image intensity by gamma. Each pixel/voxel intensity is updated as::
 
@@ -550,13 +616,15 @@ class AdjustContrast(Transform):
             raise AssertionError("gamma must be a float or int number.")
         self.gamma = gamma
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
         epsilon = 1e-7
         img_min = img.min()
         img_range = img.max() - img_min
+        if isinstance(img, torch.Tensor):
+            return ((img - img_min) / float(img_range + epsilon)) ** self.gamma * img_range + img_min
         return np.power(((img - img_min) / float(img_range + epsilon)), self.gamma) * img_range + img_min
 
 
@@ -592,7 +660,7 @@ class RandAdjustContrast(RandomizableTransform):
         super().randomize(None)
         self.gamma_value = self.R.uniform(low=self.gamma[0], high=self.gamma[1])
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Apply the transform to `img`.
         """
@@ -605,7 +673,7 @@ class RandAdjustContrast(RandomizableTransform):
         return adjuster(img)
 
 
-class ScaleIntensityRangePercentiles(Transform):
+class ScaleIntensityRangePercentiles(OrderInvariantTransform):
     """
     Apply range scaling to a numpy array based on the intensity distribution of the input.
 
@@ -658,10 +726,22 @@ class ScaleIntensityRangePercentiles(Transform):
         b_max: intensity target range max.
         clip: whether to perform clip after scaling.
         relative: whether to scale to the corresponding percentiles of [b_min, b_max].
+        method: {``"exact"``, ``"histogram"``}
+            the method computing both percentiles in one pass, the values of ``np.percentile`` or their
+            approximation from a histogram, see :py:func:`monai.transforms.utils.compute_percentiles`.
+        num_bins: the number of bins of the ``"histogram"`` method.
     """
 
     def __init__(
-        self, lower: float, upper: float, b_min: float, b_max: float, clip: bool = False, relative: bool = False
+        self,
+        lower: float,
+        upper: float,
+        b_min: float,
+        b_max: float,
+        clip: bool = False,
+        relative: bool = False,
+        method: str = "exact",
+        num_bins: int = 4096,
     ) -> None:
         if lower < 0.0 or lower > 100.0:
             raise AssertionError("Percentiles must be in the range [0, 100]")
@@ -673,13 +753,23 @@ class ScaleIntensityRangePercentiles(Transform):
         self.b_max = b_max
         self.clip = clip
         self.relative = relative
+        self.method = method
+        self.num_bins = num_bins
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor, percentiles: Optional[Sequence[float]] = None) -> NdarrayTensor:
         """
         Apply the transform to `img`.
+
+        Args:
+            img: the image to scale.
+            percentiles: the precomputed intensities at the `lower` and `upper` percentiles of `img`,
+                computed from `img` if None.
+
         """
-        a_min = np.percentile(img, self.lower)
-        a_max = np.percentile(img, self.upper)
+        if percentiles is None:
+            a_min, a_max = compute_percentiles(img, (self.lower, self.upper), self.method, self.num_bins)
+        else:
+            a_min, a_max = percentiles
         b_min = self.b_min
         b_max = self.b_max
 
@@ -691,6 +781,8 @@ class ScaleIntensityRangePercentiles(Transform):
         img = scalar(img)
 
         if self.clip:
+            if isinstance(img, torch.Tensor):
+                return torch.clamp(img, self.b_min, self.b_max)
             img = np.asarray(np.clip(img, self.b_min, self.b_max))
 
         return img
@@ -734,13 +826,18 @@ class MaskIntensity(Transform):
             mask_data_ = self.mask_data > 0
         if mask_data is not None:
             mask_data_ = mask_data > 0
-        mask_data_ = np.asarray(mask_data_)
+        if isinstance(img, torch.Tensor):
+            mask_data_ = torch.as_tensor(mask_data_, device=img.device)
+        else:
+            mask_data_ = np.asarray(mask_data_)
         if mask_data_.shape[0] != 1 and mask_data_.shape[0] != img.shape[0]:
             raise ValueError(
                 "When mask_data is not single channel, mask_data channels must match img, "
                 f"got img={img.shape[0]} mask_data={mask_data_.shape[0]}."
             )
 
+        if isinstance(img, torch.Tensor):
+            return img * mask_data_
         return np.asarray(img * mask_data_)
 
 
@@ -766,7 +863,7 @@ class SavitzkyGolaySmooth(Transform):
         self.axis = axis
         self.mode = mode
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Args:
             img: numpy.ndarray containing input data. Must be real and in shape [channels, spatial1, spatial2, ...].
@@ -777,6 +874,8 @@ class SavitzkyGolaySmooth(Transform):
         """
         # add one to transform axis because a batch axis will be added at dimension 0
         savgol_filter = SavitzkyGolayFilter(self.window_length, self.order, self.axis + 1, self.mode)
+        if isinstance(img, torch.Tensor):
+            return savgol_filter(img.unsqueeze(0)).squeeze(0)
         # convert to Tensor and add Batch axis expected by HilbertTransform
         input_data = torch.as_tensor(np.ascontiguousarray(img)).unsqueeze(0)
         return savgol_filter(input_data).squeeze(0).numpy()
@@ -805,7 +904,7 @@ class DetectEnvelope(Transform):
         self.axis = axis
         self.n = n
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
 
         Args:
@@ -817,6 +916,8 @@ class DetectEnvelope(Transform):
         """
         # add one to transform axis because a batch axis will be added at dimension 0
         hilbert_transform = HilbertTransform(self.axis + 1, self.n)
+        if isinstance(img, torch.Tensor):
+            return torch.abs(hilbert_transform(img.unsqueeze(0)).squeeze(0))
         # convert to Tensor and add Batch axis expected by HilbertTransform
         input_data = torch.as_tensor(np.ascontiguousarray(img)).unsqueeze(0)
         return np.abs(hilbert_transform(input_data).squeeze(0).numpy())
@@ -840,8 +941,11 @@ class GaussianSmooth(Transform):
         self.sigma = sigma
         self.approx = approx
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         gaussian_filter = GaussianFilter(img.ndim - 1, self.sigma, approx=self.approx)
+        if isinstance(img, torch.Tensor):
+            gaussian_filter = gaussian_filter.to(img.device)
+            return gaussian_filter(img.to(torch.float).unsqueeze(0)).squeeze(0).detach()
         input_data = torch.as_tensor(np.ascontiguousarray(img), dtype=torch.float).unsqueeze(0)
         return gaussian_filter(input_data).squeeze(0).detach().numpy()
 
@@ -880,7 +984,7 @@ class RandGaussianSmooth(RandomizableTransform):
         self.y = self.R.uniform(low=self.sigma_y[0], high=self.sigma_y[1])
         self.z = self.R.uniform(low=self.sigma_z[0], high=self.sigma_z[1])
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         self.randomize()
         if not self._do_transform:
             return img
@@ -927,13 +1031,18 @@ class GaussianSharpen(Transform):
         self.alpha = alpha
         self.approx = approx
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         gaussian_filter1 = GaussianFilter(img.ndim - 1, self.sigma1, approx=self.approx)
         gaussian_filter2 = GaussianFilter(img.ndim - 1, self.sigma2, approx=self.approx)
-        input_data = torch.as_tensor(np.ascontiguousarray(img), dtype=torch.float).unsqueeze(0)
+        if isinstance(img, torch.Tensor):
+            gaussian_filter1, gaussian_filter2 = gaussian_filter1.to(img.device), gaussian_filter2.to(img.device)
+            input_data = img.to(torch.float).unsqueeze(0)
+        else:
+            input_data = torch.as_tensor(np.ascontiguousarray(img), dtype=torch.float).unsqueeze(0)
         blurred_f = gaussian_filter1(input_data)
         filter_blurred_f = gaussian_filter2(blurred_f)
-        return (blurred_f + self.alpha * (blurred_f - filter_blurred_f)).squeeze(0).detach().numpy()
+        out = (blurred_f + self.alpha * (blurred_f - filter_blurred_f)).squeeze(0).detach()
+        return out if isinstance(img, torch.Tensor) else out.numpy()
 
 
 class RandGaussianSharpen(RandomizableTransform):
@@ -993,7 +1102,7 @@ class RandGaussianSharpen(RandomizableTransform):
         self.z2 = self.R.uniform(low=sigma2_z[0], high=sigma2_z[1])
         self.a = self.R.uniform(low=self.alpha[0], high=self.alpha[1])
 
-    def __call__(self, img: np.ndarray):
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         self.randomize()
         if not self._do_transform:
             return img
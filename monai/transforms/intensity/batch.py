@@ -0,0 +1,207 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A collection of "vanilla" transforms for random intensity augmentations acting on batches of data
+https://github.com/Project-MONAI/MONAI/wiki/MONAI_Design
+"""
+
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+import torch
+
+from monai.transforms.transform import RandomizableTransform
+from monai.utils import MAX_SEED
+
+__all__ = [
+    "BatchRandGaussianNoise",
+    "BatchRandScaleIntensity",
+    "BatchRandAdjustContrast",
+]
+
+
+def _as_batch(img: Union[np.ndarray, torch.Tensor]) -> torch.Tensor:
+    """
+    Convert `img` to a floating point tensor of shape (B, C, ...), keeping its device.
+
+    """
+    img = torch.as_tensor(img)
+    if img.ndim < 2:
+        raise ValueError(f"img must have shape (B, C, ...), got {tuple(img.shape)}.")
+    return img if torch.is_floating_point(img) else img.float()
+
+
+def _per_sample(values: np.ndarray, img: torch.Tensor) -> torch.Tensor:
+    """
+    Convert the per sample `values` to a tensor broadcastable to the batch `img`.
+
+    """
+    return torch.as_tensor(values, dtype=img.dtype, device=img.device).reshape((-1,) + (1,) * (img.ndim - 1))
+
+
+class BatchRandGaussianNoise(RandomizableTransform):
+    """
+    Batched version of :py:class:`monai.transforms.RandGaussianNoise`: the standard deviation of the noise
+    is drawn independently for every sample of a collated batch, and the noise is generated directly on the
+    device of the input tensor, by a ``torch.Generator`` seeded from the random state of the transform.
+
+    Args:
+        prob: Probability to add Gaussian noise to every sample.
+        mean: Mean or “centre” of the distribution.
+        std: Standard deviation (spread) of distribution, the standard deviation of every sample is
+            picked from (0, std).
+
+    """
+
+    def __init__(self, prob: float = 0.1, mean: float = 0.0, std: float = 0.1) -> None:
+        RandomizableTransform.__init__(self, prob)
+        self.mean = mean
+        self.std = std
+        self.sample_std = np.zeros(0)
+        self._seed = 0
+        self._do_transform = np.zeros(0, dtype=bool)
+
+    def randomize(self, batch_size: int) -> None:  # type: ignore # pytype: disable=signature-mismatch
+        self._do_transform = self.R.rand(batch_size) < self.prob
+        self.sample_std = self.R.uniform(0, self.std, size=batch_size)
+        self._seed = self.R.randint(MAX_SEED, dtype="uint32")
+
+    def __call__(self, img: Union[np.ndarray, torch.Tensor], randomize: bool = True) -> torch.Tensor:
+        """
+        Apply the transform to the batch `img` of shape (B, C, ...).
+        If `randomize` is False, the parameters and the noise of the previous call are used.
+
+        Raises:
+            ValueError: When ``randomize`` is False and the batch size differs from the previous call.
+
+        """
+        img = _as_batch(img)
+        if randomize:
+            self.randomize(img.shape[0])
+        elif len(self._do_transform) != img.shape[0]:
+            raise ValueError(f"batch size {img.shape[0]} differs from the drawn parameters {len(self._do_transform)}.")
+        if not np.any(self._do_transform):
+            return img
+        generator = torch.Generator(device=img.device).manual_seed(int(self._seed))
+        noise = torch.randn(img.shape, generator=generator, dtype=img.dtype, device=img.device)
+        std = _per_sample(self.sample_std * self._do_transform, img)
+        mean = _per_sample(self.mean * self._do_transform, img)
+        return torch.addcmul(img + mean, noise, std)
+
+
+class BatchRandScaleIntensity(RandomizableTransform):
+    """
+    Batched version of :py:class:`monai.transforms.RandScaleIntensity`: the intensity of every sample of a
+    collated batch is scaled by ``v = v * (1 + factor)``, where the `factor` is drawn independently for
+    every sample.
+
+    Args:
+        factors: factor range to randomly scale by ``v = v * (1 + factor)``.
+            if single number, factor value is picked from (-factors, factors).
+        prob: probability of scale of every sample.
+
+    """
+
+    def __init__(self, factors: Union[Tuple[float, float], float], prob: float = 0.1) -> None:
+        RandomizableTransform.__init__(self, prob)
+        if isinstance(factors, (int, float)):
+            self.factors = (min(-factors, factors), max(-factors, factors))
+        else:
+            if len(factors) != 2:
+                raise AssertionError("factors should be a number or pair of numbers.")
+            self.factors = (min(factors), max(factors))
+        self.factor = np.zeros(0)
+        self._do_transform = np.zeros(0, dtype=bool)
+
+    def randomize(self, batch_size: int) -> None:  # type: ignore # pytype: disable=signature-mismatch
+        self._do_transform = self.R.rand(batch_size) < self.prob
+        self.factor = self.R.uniform(low=self.factors[0], high=self.factors[1], size=batch_size)
+
+    def __call__(self, img: Union[np.ndarray, torch.Tensor], randomize: bool = True) -> torch.Tensor:
+        """
+        Apply the transform to the batch `img` of shape (B, C, ...).
+        If `randomize` is False, the factors of the previous call are used.
+
+        Raises:
+            ValueError: When ``randomize`` is False and the batch size differs from the previous call.
+
+        """
+        img = _as_batch(img)
+        if randomize:
+            self.randomize(img.shape[0])
+        elif len(self._do_transform) != img.shape[0]:
+            raise ValueError(f"batch size {img.shape[0]} differs from the drawn parameters {len(self._do_transform)}.")
+        if not np.any(self._do_transform):
+            return img
+        return img * _per_sample(1 + self.factor * self._do_transform, img)
+
+
+class BatchRandAdjustContrast(RandomizableTransform):
+    """
+    Batched version of :py:class:`monai.transforms.RandAdjustContrast`: the intensity of every sample of a
+    collated batch is changed by a gamma drawn independently for every sample::
+
+        x = ((x - min) / intensity_range) ^ gamma * intensity_range + min
+
+    where `min` and `intensity_range` are computed over all the channels of the sample.
+
+    Args:
+        prob: Probability of adjustment of every sample.
+        gamma: Range of gamma values.
+            If single number, value is picked from (0.5, gamma), default is (0.5, 4.5).
+
+    """
+
+    def __init__(self, prob: float = 0.1, gamma: Union[Sequence[float], float] = (0.5, 4.5)) -> None:
+        RandomizableTransform.__init__(self, prob)
+        if isinstance(gamma, (int, float)):
+            if gamma <= 0.5:
+                raise AssertionError(
+                    "if gamma is single number, must greater than 0.5 and value is picked from (0.5, gamma)"
+                )
+            self.gamma = (0.5, gamma)
+        else:
+            if len(gamma) != 2:
+                raise AssertionError("gamma should be a number or pair of numbers.")
+            self.gamma = (min(gamma), max(gamma))
+        self.gamma_value = np.zeros(0)
+        self._do_transform = np.zeros(0, dtype=bool)
+
+    def randomize(self, batch_size: int) -> None:  # type: ignore # pytype: disable=signature-mismatch
+        self._do_transform = self.R.rand(batch_size) < self.prob
+        self.gamma_value = self.R.uniform(low=self.gamma[0], high=self.gamma[1], size=batch_size)
+
+    def __call__(self, img: Union[np.ndarray, torch.Tensor], randomize: bool = True) -> torch.Tensor:
+        """
+        Apply the transform to the batch `img` of shape (B, C, ...).
+        If `randomize` is False, the gamma values of the previous call are used.
+
+        Raises:
+            ValueError: When ``randomize`` is False and the batch size differs from the previous call.
+
+        """
+        img = _as_batch(img)
+        if randomize:
+            self.randomize(img.shape[0])
+        elif len(self._do_transform) != img.shape[0]:
+            raise ValueError(f"batch size {img.shape[0]} differs from the drawn parameters {len(self._do_transform)}.")
+        if not np.any(self._do_transform):
+            return img
+        epsilon = 1e-7
+        index = torch.as_tensor(np.nonzero(self._do_transform)[0], device=img.device)
+        selected = img[index]
+        flat = selected.reshape(selected.shape[0], -1)
+        img_min = _per_sample(flat.min(dim=1)[0], selected)
+        img_range = _per_sample(flat.max(dim=1)[0], selected) - img_min
+        gamma = _per_sample(self.gamma_value[self._do_transform], selected)
+        out = img.clone()
+        out[index] = torch.pow((selected - img_min) / (img_range + epsilon), gamma) * img_range + img_min
+        return out
@@ -16,7 +16,7 @@ Class names are ended with 'd' to denote dictionary-based transforms.
 """
 
 from collections.abc import Iterable
-from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 import torch
@@ -36,7 +36,7 @@ from monai.transforms.intensity.array import (
     StdShiftIntensity,
     ThresholdIntensity,
 )
-from monai.transforms.transform import MapTransform, RandomizableTransform
+from monai.transforms.transform import KeyLocalTransform, MapTransform, OrderInvariantTransform, RandomizableTransform
 from monai.utils import dtype_torch_to_numpy, ensure_tuple_rep, ensure_tuple_size
 
 __all__ = [
@@ -103,7 +103,7 @@ __all__ = [
 ]
 
 
-class RandGaussianNoised(RandomizableTransform, MapTransform):
+class RandGaussianNoised(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandGaussianNoise`.
     Add Gaussian noise to image. This transform assumes all the expected fields have same shape.
@@ -152,7 +152,7 @@ class RandGaussianNoised(RandomizableTransform, MapTransform):
         return d
 
 
-class ShiftIntensityd(MapTransform):
+class ShiftIntensityd(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ShiftIntensity`.
     """
@@ -175,7 +175,7 @@ class ShiftIntensityd(MapTransform):
         return d
 
 
-class RandShiftIntensityd(RandomizableTransform, MapTransform):
+class RandShiftIntensityd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandShiftIntensity`.
     """
@@ -222,7 +222,7 @@ class RandShiftIntensityd(RandomizableTransform, MapTransform):
         return d
 
 
-class StdShiftIntensityd(MapTransform):
+class StdShiftIntensityd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.StdShiftIntensity`.
     """
@@ -257,7 +257,7 @@ class StdShiftIntensityd(MapTransform):
         return d
 
 
-class RandStdShiftIntensityd(RandomizableTransform, MapTransform):
+class RandStdShiftIntensityd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandStdShiftIntensity`.
     """
@@ -312,7 +312,7 @@ class RandStdShiftIntensityd(RandomizableTransform, MapTransform):
         return d
 
 
-class ScaleIntensityd(MapTransform):
+class ScaleIntensityd(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ScaleIntensity`.
     Scale the intensity of input image to the given value range (minv, maxv).
@@ -348,7 +348,7 @@ class ScaleIntensityd(MapTransform):
         return d
 
 
-class RandScaleIntensityd(RandomizableTransform, MapTransform):
+class RandScaleIntensityd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandScaleIntensity`.
     """
@@ -396,7 +396,7 @@ class RandScaleIntensityd(RandomizableTransform, MapTransform):
         return d
 
 
-class RandBiasFieldd(RandomizableTransform, MapTransform):
+class RandBiasFieldd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandBiasField`.
     """
@@ -440,7 +440,7 @@ class RandBiasFieldd(RandomizableTransform, MapTransform):
         return d
 
 
-class NormalizeIntensityd(MapTransform):
+class NormalizeIntensityd(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.NormalizeIntensity`.
     This transform can normalize only non-zero values or entire image, and can also calculate
@@ -471,6 +471,9 @@ class NormalizeIntensityd(MapTransform):
         super().__init__(keys, allow_missing_keys)
         self.normalizer = NormalizeIntensity(subtrahend, divisor, nonzero, channel_wise, dtype)
 
+    def order_invariant(self) -> bool:
+        return self.normalizer.order_invariant()
+
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
         d = dict(data)
         for key in self.key_iterator(d):
@@ -478,7 +481,7 @@ class NormalizeIntensityd(MapTransform):
         return d
 
 
-class ThresholdIntensityd(MapTransform):
+class ThresholdIntensityd(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ThresholdIntensity`.
 
@@ -509,7 +512,7 @@ class ThresholdIntensityd(MapTransform):
         return d
 
 
-class ScaleIntensityRanged(MapTransform):
+class ScaleIntensityRanged(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ScaleIntensityRange`.
 
@@ -544,7 +547,7 @@ class ScaleIntensityRanged(MapTransform):
         return d
 
 
-class AdjustContrastd(MapTransform):
+class AdjustContrastd(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.AdjustContrast`.
     Changes image intensity by gamma. Each pixel/voxel intensity is updated as:
@@ -569,7 +572,7 @@ class AdjustContrastd(MapTransform):
         return d
 
 
-class RandAdjustContrastd(RandomizableTransform, MapTransform):
+class RandAdjustContrastd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandAdjustContrast`.
     Randomly changes image intensity by gamma. Each pixel/voxel intensity is updated as:
@@ -625,10 +628,15 @@ class RandAdjustContrastd(RandomizableTransform, MapTransform):
         return d
 
 
-class ScaleIntensityRangePercentilesd(MapTransform):
+class ScaleIntensityRangePercentilesd(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ScaleIntensityRangePercentiles`.
 
+    The percentiles can be precomputed, for example when the dataset is indexed, and stored in the
+    meta data or in the data dictionary as a mapping from the percentiles to the intensities, e.g.
+    ``{"image": "ct.nii.gz", "image_percentiles": {0.5: -1000.0, 99.5: 1450.0}}`` with
+    ``percentiles_key="percentiles"``. They are computed if they are not found.
+
     Args:
         keys: keys of the corresponding items to be transformed.
             See also: monai.transforms.MapTransform
@@ -638,6 +646,14 @@ class ScaleIntensityRangePercentilesd(MapTransform):
         b_max: intensity target range max.
         clip: whether to perform clip after scaling.
         relative: whether to scale to the corresponding percentiles of [b_min, b_max]
+        method: {``"exact"``, ``"histogram"``}
+            the method computing the percentiles, see :py:class:`monai.transforms.ScaleIntensityRangePercentiles`.
+        num_bins: the number of bins of the ``"histogram"`` method.
+        percentiles_key: if not None, the precomputed percentiles of each key are read from the item
+            `percentiles_key` of the meta data dictionary `{key}_{meta_key_postfix}`, or else from the item
+            `{key}_{percentiles_key}` of the data dictionary.
+        meta_key_postfix: use `{key}_{meta_key_postfix}` to fetch the meta data of the key data,
+            default is `meta_dict`.
         allow_missing_keys: don't raise exception if key is missing.
     """
 
@@ -650,19 +666,49 @@ class ScaleIntensityRangePercentilesd(MapTransform):
         b_max: float,
         clip: bool = False,
         relative: bool = False,
+        method: str = "exact",
+        num_bins: int = 4096,
+        percentiles_key: Optional[str] = None,
+        meta_key_postfix: str = "meta_dict",
         allow_missing_keys: bool = False,
     ) -> None:
         super().__init__(keys, allow_missing_keys)
-        self.scaler = ScaleIntensityRangePercentiles(lower, upper, b_min, b_max, clip, relative)
+        self.scaler = ScaleIntensityRangePercentiles(lower, upper, b_min, b_max, clip, relative, method, num_bins)
+        self.percentiles_key = percentiles_key
+        self.meta_key_postfix = meta_key_postfix
+
+    def _precomputed(self, data: Mapping[Hashable, Any], key: Hashable) -> Optional[Tuple[float, float]]:
+        """
+        The intensities at the lower and upper percentiles of the `key` data stored in `data`, None if not found.
+
+        """
+        if self.percentiles_key is None:
+            return None
+        meta_data = data.get(f"{key}_{self.meta_key_postfix}")
+        if isinstance(meta_data, Mapping) and self.percentiles_key in meta_data:
+            stored = meta_data[self.percentiles_key]
+        else:
+            stored = data.get(f"{key}_{self.percentiles_key}")
+        if not isinstance(stored, Mapping):
+            return None
+        stored = {float(k): v for k, v in stored.items()}
+        if self.scaler.lower not in stored or self.scaler.upper not in stored:
+            return None
+        return float(stored[self.scaler.lower]), float(stored[self.scaler.upper])
+
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        if self.percentiles_key is None:
+            return super().read_keys()
+        return super().read_keys() | {f"{key}_{self.percentiles_key}" for key in self.keys}  # type: ignore
 
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
         d = dict(data)
         for key in self.key_iterator(d):
-            d[key] = self.scaler(d[key])
+            d[key] = self.scaler(d[key], percentiles=self._precomputed(d, key))
         return d
 
 
-class MaskIntensityd(MapTransform):
+class MaskIntensityd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.MaskIntensity`.
 
@@ -691,6 +737,11 @@ class MaskIntensityd(MapTransform):
         self.converter = MaskIntensity(mask_data)
         self.mask_key = mask_key if mask_data is None else None
 
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        if self.mask_key is None:
+            return super().read_keys()
+        return super().read_keys() | {self.mask_key}  # type: ignore
+
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
         d = dict(data)
         for key in self.key_iterator(d):
@@ -698,7 +749,7 @@ class MaskIntensityd(MapTransform):
         return d
 
 
-class GaussianSmoothd(MapTransform):
+class GaussianSmoothd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.GaussianSmooth`.
 
@@ -731,7 +782,7 @@ class GaussianSmoothd(MapTransform):
         return d
 
 
-class RandGaussianSmoothd(RandomizableTransform, MapTransform):
+class RandGaussianSmoothd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.GaussianSmooth`.
 
@@ -782,7 +833,7 @@ class RandGaussianSmoothd(RandomizableTransform, MapTransform):
         return d
 
 
-class GaussianSharpend(MapTransform):
+class GaussianSharpend(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.GaussianSharpen`.
 
@@ -821,7 +872,7 @@ class GaussianSharpend(MapTransform):
         return d
 
 
-class RandGaussianSharpend(RandomizableTransform, MapTransform):
+class RandGaussianSharpend(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.GaussianSharpen`.
 
@@ -895,7 +946,7 @@ class RandGaussianSharpend(RandomizableTransform, MapTransform):
         return d
 
 
-class RandHistogramShiftd(RandomizableTransform, MapTransform):
+class RandHistogramShiftd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandHistogramShift`.
     Apply random nonlinear transform the the image's intensity histogram.
@@ -61,6 +61,10 @@ class InvertibleTransform(Transform):
            accepted in pytorch data loader's collate function (e.g., `None` is not allowed).
         #. Implement an ``inverse`` method. Make sure that after performing the inverse,
            ``pop_transform`` is called.
+        #. ``inverse`` must not modify its input: start from a shallow copy ``d = dict(data)`` and
+           replace the items that are inverted instead of changing them in place (including the meta
+           data dictionaries). ``pop_transform`` replaces the list of applied transforms with a copy,
+           so the lists of the input are kept.
 
     """
 
@@ -107,8 +111,9 @@ class InvertibleTransform(Transform):
         return transform
 
     def pop_transform(self, data: dict, key: Hashable) -> None:
-        """Remove most recent transform."""
-        data[str(key) + InverseKeys.KEY_SUFFIX].pop()
+        """Remove most recent transform, the list of applied transforms is replaced by a shorter copy."""
+        key_transform = str(key) + InverseKeys.KEY_SUFFIX
+        data[key_transform] = data[key_transform][:-1]
 
     def inverse(self, data: dict) -> Dict[Hashable, np.ndarray]:
         """
@@ -0,0 +1,171 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A collection of generic interfaces for the lazy execution of spatial transforms.
+"""
+
+from typing import Any, Dict, Hashable, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+
+from monai.config import DtypeLike
+from monai.networks.layers import AffineTransform
+from monai.transforms.transform import Transform
+from monai.utils import GridSampleMode, GridSamplePadMode
+
+__all__ = ["LazyTransform", "PendingResample"]
+
+
+class PendingResample:
+    """
+    The spatial resampling accumulated for the keys of a dictionary data, not yet applied to the arrays.
+
+    For every key, the resampling is described by an (N+1)x(N+1) matrix mapping the voxel indices of the
+    output array to the voxel indices of the (unchanged) array in the data, and the output spatial shape.
+    Pushing a new resampling composes its matrix with the pending one, so that a chain of spatial transforms
+    can be applied with a single interpolation of the original array by :py:meth:`apply`.
+
+    The interpolation options of the fused resampling are the ones of the most recent transform, except that
+    ``"nearest"`` interpolation is kept once requested for a key, so that label maps stay discrete.
+
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[Hashable, Tuple[np.ndarray, Tuple[int, ...], Dict[str, Any]]] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def spatial_shape(self, data: Mapping[Hashable, Any], key: Hashable) -> Tuple[int, ...]:
+        """
+        Spatial shape of `data[key]` once the pending resampling is applied.
+
+        """
+        if key in self._pending:
+            return self._pending[key][1]
+        return tuple(int(s) for s in data[key].shape[1:])
+
+    def push(
+        self,
+        key: Hashable,
+        matrix: Union[np.ndarray, torch.Tensor],
+        spatial_shape: Sequence[int],
+        mode: Optional[Union[GridSampleMode, str]] = None,
+        padding_mode: Optional[Union[GridSamplePadMode, str]] = None,
+        align_corners: Optional[bool] = None,
+        dtype: DtypeLike = None,
+        as_tensor_output: bool = False,
+        device: Optional[torch.device] = None,
+    ) -> None:
+        """
+        Add a resampling of `key` after the pending ones.
+
+        Args:
+            key: key of the array to resample.
+            matrix: (N+1)x(N+1) matrix mapping the output voxel indices of this resampling to
+                the voxel indices of its input.
+            spatial_shape: output spatial shape of this resampling.
+            mode: {``"bilinear"``, ``"nearest"``}
+                Interpolation mode to calculate output values. Defaults to ``"bilinear"``.
+            padding_mode: {``"zeros"``, ``"border"``, ``"reflection"``}
+                Padding mode for outside grid values. Defaults to ``"border"``.
+            align_corners: whether the reflection padding is about the centers of the border voxels,
+                instead of the image edges. Defaults to False.
+            dtype: data type for resampling computation. Defaults to ``np.float32``.
+            as_tensor_output: whether to output a torch tensor instead of a numpy array.
+            device: device on which the resampling is computed.
+
+        """
+        matrix = np.asarray(matrix.cpu() if isinstance(matrix, torch.Tensor) else matrix, dtype=np.float64)
+        options: Dict[str, Any] = {}
+        if key in self._pending:
+            pending_matrix, _, options = self._pending[key]
+            matrix = pending_matrix @ matrix
+        if mode is not None and options.get("mode") != GridSampleMode.NEAREST:
+            options["mode"] = GridSampleMode(mode)
+        if padding_mode is not None:
+            options["padding_mode"] = GridSamplePadMode(padding_mode)
+        if align_corners is not None:
+            options["align_corners"] = align_corners
+        if dtype is not None:
+            options["dtype"] = dtype
+        options["as_tensor_output"] = as_tensor_output
+        options["device"] = device
+        self._pending[key] = (matrix, tuple(int(s) for s in spatial_shape), options)
+
+    def apply(self, data: Mapping[Hashable, Any], keys: Optional[Sequence[Hashable]] = None) -> Dict[Hashable, Any]:
+        """
+        Resample the arrays of `keys` (default to all the pending keys) with a single interpolation each.
+
+        Identity resamplings are skipped, the arrays are then only converted to ``np.float32``
+        (or to a tensor if requested), as with the corresponding transforms. The resamplings mapping
+        the output voxels exactly onto input voxels (such as reorientations) use the nearest interpolation.
+
+        """
+        d = dict(data)
+        for key in list(self._pending) if keys is None else keys:
+            if key not in self._pending:
+                continue
+            matrix, spatial_shape, options = self._pending.pop(key)
+            img = d[key]
+            device = options.get("device")
+            if isinstance(img, np.ndarray):
+                img = torch.as_tensor(np.ascontiguousarray(img))
+            if tuple(img.shape[1:]) == spatial_shape and np.allclose(matrix, np.eye(len(matrix)), atol=1e-6):
+                out = img.to(device=device, dtype=torch.float32)
+            else:
+                dtype = torch.as_tensor(np.empty(0, dtype=options.get("dtype", np.float32))).dtype
+                mode = options.get("mode", GridSampleMode.BILINEAR)
+                if np.allclose(matrix, np.round(matrix), atol=1e-6):
+                    # the output voxels are exactly on the input voxels (e.g., flips, permutations)
+                    mode = GridSampleMode.NEAREST
+                xform = AffineTransform(
+                    normalized=False,
+                    mode=mode,
+                    padding_mode=options.get("padding_mode", GridSamplePadMode.BORDER),
+                    align_corners=options.get("align_corners", False),
+                    reverse_indexing=True,
+                )
+                out = xform(
+                    img.to(device=device, dtype=dtype).unsqueeze(0),
+                    torch.as_tensor(matrix, dtype=dtype, device=device),
+                    spatial_size=spatial_shape,
+                )
+                out = out.squeeze(0).float()
+            d[key] = out if options["as_tensor_output"] else np.asarray(out.detach().cpu().numpy(), dtype=np.float32)
+        return d
+
+
+class LazyTransform(Transform):
+    """
+    An interface for the dictionary-based spatial transforms that can defer their resampling.
+
+    In the lazy mode of :py:class:`monai.transforms.Compose`, :py:meth:`lazy_call` is called instead of
+    ``__call__``: the transform computes its parameters from the spatial shapes returned by
+    `pending.spatial_shape`, updates the meta data and the list of applied transforms as ``__call__`` would,
+    but only pushes its resampling matrix to `pending` instead of resampling the arrays.
+    The random parameters must be drawn in the same order as ``__call__``.
+
+    """
+
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
+        """
+        Push the resampling of ``data`` to `pending` and return the updated ``data``.
+
+        Raises:
+            NotImplementedError: When the subclass does not override this method.
+
+        """
+        raise NotImplementedError(f"Subclass {self.__class__.__name__} must implement this method.")
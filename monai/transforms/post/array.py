@@ -22,7 +22,10 @@ import torch.nn.functional as F
 
 from monai.networks import one_hot
 from monai.transforms.transform import Transform
-from monai.transforms.utils import get_largest_connected_component_mask
+from monai.transforms.utils import (
+    get_largest_connected_component_mask,
+    get_largest_connected_component_mask_per_label,
+)
 from monai.utils import ensure_tuple
 
 __all__ = [
@@ -225,7 +228,11 @@ class KeepLargestConnectedComponent(Transform):
     """
 
     def __init__(
-        self, applied_labels: Union[Sequence[int], int], independent: bool = True, connectivity: Optional[int] = None
+        self,
+        applied_labels: Union[Sequence[int], int],
+        independent: bool = True,
+        connectivity: Optional[int] = None,
+        num_workers: Optional[int] = None,
     ) -> None:
         """
         Args:
@@ -238,11 +245,14 @@ class KeepLargestConnectedComponent(Transform):
             connectivity: Maximum number of orthogonal hops to consider a pixel/voxel as a neighbor.
                 Accepted values are ranging from  1 to input.ndim. If ``None``, a full
                 connectivity of ``input.ndim`` is used.
+            num_workers: the number of threads to process the items of the batch when `independent` is True,
+                if None, use the number of CPUs (up to the batch size).
         """
         super().__init__()
         self.applied_labels = ensure_tuple(applied_labels)
         self.independent = independent
         self.connectivity = connectivity
+        self.num_workers = num_workers
 
     def __call__(self, img: torch.Tensor) -> torch.Tensor:
         """
@@ -258,10 +268,14 @@ class KeepLargestConnectedComponent(Transform):
             img = torch.squeeze(img, dim=channel_dim)
 
             if self.independent:
+                # all the labels are processed with one labeling, as connected components never mix labels
+                foreground = torch.zeros_like(img, dtype=torch.bool)
                 for i in self.applied_labels:
-                    foreground = (img == i).type(torch.uint8)
-                    mask = get_largest_connected_component_mask(foreground, self.connectivity)
-                    img[foreground != mask] = 0
+                    foreground |= img == i
+                mask = get_largest_connected_component_mask_per_label(
+                    img, self.applied_labels, self.connectivity, self.num_workers
+                )
+                img[foreground & ~mask] = 0
             else:
                 foreground = torch.zeros_like(img)
                 for i in self.applied_labels:
@@ -271,13 +285,23 @@ class KeepLargestConnectedComponent(Transform):
             output = torch.unsqueeze(img, dim=channel_dim)
         else:
             # one-hot data is assumed to have binary value in each channel
-            if self.independent:
+            applied_img = img[:, self.applied_labels, ...].type(torch.uint8)
+            if self.independent and len(set(self.applied_labels)) > 1 and applied_img.sum(channel_dim).max() <= 1:
+                # the channels don't overlap, process them with one labeling of the channel indices
+                label_map = torch.zeros_like(applied_img[:, 0], dtype=torch.long)
+                for c in range(len(self.applied_labels)):
+                    label_map[applied_img[:, c] > 0] = c + 1
+                mask = get_largest_connected_component_mask_per_label(
+                    label_map, range(1, len(self.applied_labels) + 1), self.connectivity, self.num_workers
+                )
+                for c, i in enumerate(self.applied_labels):
+                    img[:, i, ...][(label_map == c + 1) & ~mask] = 0
+            elif self.independent:
                 for i in self.applied_labels:
                     foreground = img[:, i, ...].type(torch.uint8)
                     mask = get_largest_connected_component_mask(foreground, self.connectivity)
                     img[:, i, ...][foreground != mask] = 0
             else:
-                applied_img = img[:, self.applied_labels, ...].type(torch.uint8)
                 foreground = torch.any(applied_img, dim=channel_dim)
                 mask = get_largest_connected_component_mask(foreground, self.connectivity)
                 background_mask = torch.unsqueeze(foreground != mask, dim=channel_dim)
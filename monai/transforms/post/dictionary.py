@@ -15,7 +15,7 @@ defined in :py:class:`monai.transforms.utility.array`.
 Class names are ended with 'd' to denote dictionary-based transforms.
 """
 
-from typing import Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Union
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Set, Union
 
 import numpy as np
 import torch
@@ -30,7 +30,7 @@ from monai.transforms.post.array import (
     MeanEnsemble,
     VoteEnsemble,
 )
-from monai.transforms.transform import MapTransform
+from monai.transforms.transform import KeyLocalTransform, MapTransform
 from monai.utils import ensure_tuple_rep
 
 __all__ = [
@@ -59,7 +59,7 @@ __all__ = [
 ]
 
 
-class Activationsd(MapTransform):
+class Activationsd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.AddActivations`.
     Add activation layers to the input data specified by `keys`.
@@ -100,7 +100,7 @@ class Activationsd(MapTransform):
         return d
 
 
-class AsDiscreted(MapTransform):
+class AsDiscreted(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.AsDiscrete`.
     """
@@ -156,7 +156,7 @@ class AsDiscreted(MapTransform):
         return d
 
 
-class KeepLargestConnectedComponentd(MapTransform):
+class KeepLargestConnectedComponentd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.KeepLargestConnectedComponent`.
     """
@@ -167,6 +167,7 @@ class KeepLargestConnectedComponentd(MapTransform):
         applied_labels: Union[Sequence[int], int],
         independent: bool = True,
         connectivity: Optional[int] = None,
+        num_workers: Optional[int] = None,
         allow_missing_keys: bool = False,
     ) -> None:
         """
@@ -182,11 +183,13 @@ class KeepLargestConnectedComponentd(MapTransform):
             connectivity: Maximum number of orthogonal hops to consider a pixel/voxel as a neighbor.
                 Accepted values are ranging from  1 to input.ndim. If ``None``, a full
                 connectivity of ``input.ndim`` is used.
+            num_workers: the number of threads to process the items of the batch when `independent` is True,
+                if None, use the number of CPUs (up to the batch size).
             allow_missing_keys: don't raise exception if key is missing.
 
         """
         super().__init__(keys, allow_missing_keys)
-        self.converter = KeepLargestConnectedComponent(applied_labels, independent, connectivity)
+        self.converter = KeepLargestConnectedComponent(applied_labels, independent, connectivity, num_workers)
 
     def __call__(self, data: Mapping[Hashable, torch.Tensor]) -> Dict[Hashable, torch.Tensor]:
         d = dict(data)
@@ -195,7 +198,7 @@ class KeepLargestConnectedComponentd(MapTransform):
         return d
 
 
-class LabelToContourd(MapTransform):
+class LabelToContourd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.LabelToContour`.
     """
@@ -219,7 +222,7 @@ class LabelToContourd(MapTransform):
         return d
 
 
-class Ensembled(MapTransform):
+class Ensembled(MapTransform, KeyLocalTransform):
     """
     Base class of dictionary-based ensemble transforms.
 
@@ -254,6 +257,9 @@ class Ensembled(MapTransform):
             raise ValueError("Incompatible values: len(self.keys) > 1 and output_key=None.")
         self.output_key = output_key if output_key is not None else self.keys[0]
 
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        return {self.output_key}
+
     def __call__(self, data: Mapping[Hashable, torch.Tensor]) -> Dict[Hashable, torch.Tensor]:
         d = dict(data)
         items: Union[List[torch.Tensor], torch.Tensor]
@@ -19,11 +19,11 @@ from typing import Any, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import torch
 
-from monai.config import USE_COMPILED, DtypeLike
+from monai.config import USE_COMPILED, DtypeLike, NdarrayTensor
 from monai.data.utils import compute_shape_offset, to_affine_nd, zoom_affine
-from monai.networks.layers import AffineTransform, GaussianFilter, grid_pull
+from monai.networks.layers import AffineTransform, GaussianFilter, gaussian_1d, grid_pull
 from monai.transforms.croppad.array import CenterSpatialCrop
-from monai.transforms.transform import RandomizableTransform, Transform
+from monai.transforms.transform import RandomizableTransform, ReorderTransform, Transform
 from monai.transforms.utils import (
     create_control_grid,
     create_grid,
@@ -32,12 +32,14 @@ from monai.transforms.utils import (
     create_shear,
     create_translate,
     map_spatial_axes,
+    pad_nd,
 )
 from monai.utils import (
     GridSampleMode,
     GridSamplePadMode,
     InterpolateMode,
     NumpyPadMode,
+    dtype_numpy_to_torch,
     ensure_tuple,
     ensure_tuple_rep,
     ensure_tuple_size,
@@ -48,6 +50,29 @@ from monai.utils import (
 
 nib, _ = optional_import("nibabel")
 
+
+def _as_tensor(img: NdarrayTensor, dtype: DtypeLike = None) -> torch.Tensor:
+    """
+    Convert `img` to a tensor of `dtype` (default to the dtype of `img`), tensors are kept on their device.
+
+    """
+    if isinstance(img, torch.Tensor):
+        return img if dtype is None else img.to(dtype_numpy_to_torch(dtype))
+    img = np.ascontiguousarray(img)
+    return torch.as_tensor(img if dtype is None else img.astype(dtype))
+
+
+def _as_output(out: torch.Tensor, img: NdarrayTensor) -> NdarrayTensor:
+    """
+    Convert the output `out` to a ``float32`` tensor if the input `img` is a tensor, to a ``np.float32`` array otherwise.
+
+    """
+    out = out.detach()
+    if isinstance(img, torch.Tensor):
+        return out.to(torch.float32)
+    return np.asarray(out.cpu().numpy(), dtype=np.float32)
+
+
 __all__ = [
     "Spacing",
     "Orientation",
@@ -123,16 +148,17 @@ class Spacing(Transform):
 
     def __call__(
         self,
-        data_array: np.ndarray,
+        data_array: NdarrayTensor,
         affine: Optional[np.ndarray] = None,
         mode: Optional[Union[GridSampleMode, str]] = None,
         padding_mode: Optional[Union[GridSamplePadMode, str]] = None,
         align_corners: Optional[bool] = None,
         dtype: DtypeLike = None,
-    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    ) -> Tuple[NdarrayTensor, np.ndarray, np.ndarray]:
         """
         Args:
-            data_array: in shape (num_channels, H[, W, ...]).
+            data_array: in shape (num_channels, H[, W, ...]). If it is a tensor, the resampling is computed on
+                its device and the output is a ``torch.float32`` tensor on the same device.
             affine (matrix): (N+1)x(N+1) original affine matrix for spatially ND `data_array`. Defaults to identity.
             mode: {``"bilinear"``, ``"nearest"``}
                 Interpolation mode to calculate output values. Defaults to ``self.mode``.
@@ -155,7 +181,52 @@ class Spacing(Transform):
 
         """
         _dtype = dtype or self.dtype or data_array.dtype
-        sr = data_array.ndim - 1
+        transform, output_shape, affine, new_affine = self.compute_matrix(data_array.shape[1:], affine)
+
+        # no resampling if it's identity transform
+        if np.allclose(transform, np.diag(np.ones(len(transform))), atol=1e-3):
+            if isinstance(data_array, torch.Tensor):
+                return data_array.to(torch.float32, copy=True), affine, new_affine
+            output_data = data_array.copy().astype(np.float32)
+            return output_data, affine, new_affine
+
+        # resample
+        affine_xform = AffineTransform(
+            normalized=False,
+            mode=mode or self.mode,
+            padding_mode=padding_mode or self.padding_mode,
+            align_corners=self.align_corners if align_corners is None else align_corners,
+            reverse_indexing=True,
+        )
+        img_t = _as_tensor(data_array, _dtype)
+        output_data = affine_xform(
+            # AffineTransform requires a batch dim
+            img_t.unsqueeze(0),
+            torch.as_tensor(np.ascontiguousarray(transform), dtype=img_t.dtype, device=img_t.device),
+            spatial_size=output_shape,
+        )
+        return _as_output(output_data.squeeze(0), data_array), affine, new_affine
+
+    def compute_matrix(
+        self, spatial_shape: Sequence[int], affine: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the resampling of an image of `spatial_shape` into `self.pixdim`, without resampling it.
+
+        Args:
+            spatial_shape: spatial shape of the input image.
+            affine (matrix): (N+1)x(N+1) original affine matrix of the input image. Defaults to identity.
+
+        Raises:
+            ValueError: When ``spatial_shape`` has no spatial dimensions.
+            ValueError: When ``pixdim`` is nonpositive.
+
+        Returns:
+            matrix mapping the output voxel indices to the input voxel indices, output spatial shape,
+            original affine, current affine.
+
+        """
+        sr = len(spatial_shape)
         if sr <= 0:
             raise ValueError("data_array must have at least one spatial dimension.")
         if affine is None:
@@ -171,35 +242,13 @@ class Spacing(Transform):
             raise ValueError(f"pixdim must be positive, got {out_d}.")
         # compute output affine, shape and offset
         new_affine = zoom_affine(affine_, out_d, diagonal=self.diagonal)
-        output_shape, offset = compute_shape_offset(data_array.shape[1:], affine_, new_affine)
+        output_shape, offset = compute_shape_offset(spatial_shape, affine_, new_affine)
         new_affine[:sr, -1] = offset[:sr]
         transform = np.linalg.inv(affine_) @ new_affine
         # adapt to the actual rank
         transform = to_affine_nd(sr, transform)
-
-        # no resampling if it's identity transform
-        if np.allclose(transform, np.diag(np.ones(len(transform))), atol=1e-3):
-            output_data = data_array.copy().astype(np.float32)
-            new_affine = to_affine_nd(affine, new_affine)
-            return output_data, affine, new_affine
-
-        # resample
-        affine_xform = AffineTransform(
-            normalized=False,
-            mode=mode or self.mode,
-            padding_mode=padding_mode or self.padding_mode,
-            align_corners=self.align_corners if align_corners is None else align_corners,
-            reverse_indexing=True,
-        )
-        output_data = affine_xform(
-            # AffineTransform requires a batch dim
-            torch.as_tensor(np.ascontiguousarray(data_array).astype(_dtype)).unsqueeze(0),
-            torch.as_tensor(np.ascontiguousarray(transform).astype(_dtype)),
-            spatial_size=output_shape,
-        )
-        output_data = np.asarray(output_data.squeeze(0).detach().cpu().numpy(), dtype=np.float32)  # type: ignore
         new_affine = to_affine_nd(affine, new_affine)
-        return output_data, affine, new_affine
+        return transform, output_shape, affine, new_affine
 
 
 class Orientation(Transform):
@@ -257,7 +306,37 @@ class Orientation(Transform):
             data_array (reoriented in `self.axcodes`), original axcodes, current axcodes.
 
         """
-        sr = data_array.ndim - 1
+        spatial_ornt, affine, new_affine = self._compute_ornt(data_array.shape[1:], affine)
+        ornt = spatial_ornt.copy()
+        ornt[:, 0] += 1  # skip channel dim
+        ornt = np.concatenate([np.array([[0, 1]]), ornt])
+        data_array = np.ascontiguousarray(nib.orientations.apply_orientation(data_array, ornt))
+        return data_array, affine, new_affine
+
+    def compute_matrix(
+        self, spatial_shape: Sequence[int], affine: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the reorientation of an image of `spatial_shape` into `self.axcodes`, without reorienting it.
+
+        Args:
+            spatial_shape: spatial shape of the input image.
+            affine (matrix): (N+1)x(N+1) original affine matrix of the input image. Defaults to identity.
+
+        Returns:
+            matrix mapping the output voxel indices to the input voxel indices, output spatial shape,
+            original affine, current affine.
+
+        """
+        spatial_ornt, affine, new_affine = self._compute_ornt(spatial_shape, affine)
+        matrix = nib.orientations.inv_ornt_aff(spatial_ornt, spatial_shape)
+        output_shape = np.asarray(spatial_shape)[spatial_ornt[:, 0].astype(int).argsort()]
+        return matrix, output_shape, affine, new_affine
+
+    def _compute_ornt(
+        self, spatial_shape: Sequence[int], affine: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        sr = len(spatial_shape)
         if sr <= 0:
             raise ValueError("data_array must have at least one spatial dimension.")
         if affine is None:
@@ -277,17 +356,12 @@ class Orientation(Transform):
                     f"axcodes must match data_array spatially, got axcodes={len(self.axcodes)}D data_array={sr}D"
                 )
             spatial_ornt = nib.orientations.ornt_transform(src, dst)
-        ornt = spatial_ornt.copy()
-        ornt[:, 0] += 1  # skip channel dim
-        ornt = np.concatenate([np.array([[0, 1]]), ornt])
-        shape = data_array.shape[1:]
-        data_array = np.ascontiguousarray(nib.orientations.apply_orientation(data_array, ornt))
-        new_affine = affine_ @ nib.orientations.inv_ornt_aff(spatial_ornt, shape)
+        new_affine = affine_ @ nib.orientations.inv_ornt_aff(spatial_ornt, spatial_shape)
         new_affine = to_affine_nd(affine, new_affine)
-        return data_array, affine, new_affine
+        return spatial_ornt, affine, new_affine
 
 
-class Flip(Transform):
+class Flip(ReorderTransform):
     """
     Reverses the order of elements along the given spatial axis. Preserves shape.
     Uses ``np.flip`` in practice. See numpy.flip for additional details:
@@ -305,12 +379,13 @@ class Flip(Transform):
     def __init__(self, spatial_axis: Optional[Union[Sequence[int], int]] = None) -> None:
         self.spatial_axis = spatial_axis
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Args:
             img: channel first array, must have shape: (num_channels, H[, W, ..., ]),
         """
-
+        if isinstance(img, torch.Tensor):
+            return torch.flip(img, ensure_tuple(map_spatial_axes(img.ndim, self.spatial_axis)))
         result: np.ndarray = np.flip(img, map_spatial_axes(img.ndim, self.spatial_axis))
         return result.astype(img.dtype)
 
@@ -345,10 +420,10 @@ class Resize(Transform):
 
     def __call__(
         self,
-        img: np.ndarray,
+        img: NdarrayTensor,
         mode: Optional[Union[InterpolateMode, str]] = None,
         align_corners: Optional[bool] = None,
-    ) -> np.ndarray:
+    ) -> NdarrayTensor:
         """
         Args:
             img: channel first array, must have shape: (num_channels, H[, W, ..., ]).
@@ -375,13 +450,12 @@ class Resize(Transform):
             )
         spatial_size = fall_back_tuple(self.spatial_size, img.shape[1:])
         resized = torch.nn.functional.interpolate(  # type: ignore
-            input=torch.as_tensor(np.ascontiguousarray(img), dtype=torch.float).unsqueeze(0),
+            input=_as_tensor(img, np.float32).unsqueeze(0),
             size=spatial_size,
             mode=self.mode.value if mode is None else InterpolateMode(mode).value,
             align_corners=self.align_corners if align_corners is None else align_corners,
         )
-        resized = resized.squeeze(0).detach().cpu().numpy()
-        return np.asarray(resized)
+        return _as_output(resized.squeeze(0), img)
 
 
 class Rotate(Transform):
@@ -425,12 +499,12 @@ class Rotate(Transform):
 
     def __call__(
         self,
-        img: np.ndarray,
+        img: NdarrayTensor,
         mode: Optional[Union[GridSampleMode, str]] = None,
         padding_mode: Optional[Union[GridSamplePadMode, str]] = None,
         align_corners: Optional[bool] = None,
         dtype: DtypeLike = None,
-    ) -> np.ndarray:
+    ) -> NdarrayTensor:
         """
         Args:
             img: channel first array, must have shape: [chns, H, W] or [chns, H, W, D].
@@ -453,7 +527,39 @@ class Rotate(Transform):
 
         """
         _dtype = dtype or self.dtype or img.dtype
-        im_shape = np.asarray(img.shape[1:])  # spatial dimensions
+        transform, output_shape = self.compute_matrix(img.shape[1:])
+
+        xform = AffineTransform(
+            normalized=False,
+            mode=mode or self.mode,
+            padding_mode=padding_mode or self.padding_mode,
+            align_corners=self.align_corners if align_corners is None else align_corners,
+            reverse_indexing=True,
+        )
+        img_t = _as_tensor(img, _dtype)
+        output = xform(
+            img_t.unsqueeze(0),
+            torch.as_tensor(np.ascontiguousarray(transform), dtype=img_t.dtype, device=img_t.device),
+            spatial_size=output_shape,
+        )
+        return _as_output(output.squeeze(0), img)
+
+    def compute_matrix(self, spatial_shape: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the rotation of an image of `spatial_shape`, without resampling it.
+        The matrix is also stored as the most recently applied rotation matrix.
+
+        Args:
+            spatial_shape: spatial shape of the input image, must be 2D or 3D.
+
+        Raises:
+            ValueError: When ``spatial_shape`` is not one of [2D, 3D].
+
+        Returns:
+            matrix mapping the output voxel indices to the input voxel indices, output spatial shape.
+
+        """
+        im_shape = np.asarray(spatial_shape)  # spatial dimensions
         input_ndim = len(im_shape)
         if input_ndim not in (2, 3):
             raise ValueError(f"Unsupported img dimension: {input_ndim}, available options are [2, 3].")
@@ -470,21 +576,8 @@ class Rotate(Transform):
             output_shape = np.asarray(corners.ptp(axis=1) + 0.5, dtype=int)
         shift_1 = create_translate(input_ndim, -(output_shape - 1) / 2)
         transform = shift @ transform @ shift_1
-
-        xform = AffineTransform(
-            normalized=False,
-            mode=mode or self.mode,
-            padding_mode=padding_mode or self.padding_mode,
-            align_corners=self.align_corners if align_corners is None else align_corners,
-            reverse_indexing=True,
-        )
-        output = xform(
-            torch.as_tensor(np.ascontiguousarray(img).astype(_dtype)).unsqueeze(0),
-            torch.as_tensor(np.ascontiguousarray(transform).astype(_dtype)),
-            spatial_size=output_shape,
-        )
         self.rotation_matrix = transform
-        return np.asarray(output.squeeze(0).detach().cpu().numpy(), dtype=np.float32)
+        return transform, output_shape
 
     def get_rotation_matrix(self) -> Optional[np.ndarray]:
         """Get the most recently applied rotation matrix"""
@@ -532,11 +625,11 @@ class Zoom(Transform):
 
     def __call__(
         self,
-        img: np.ndarray,
+        img: NdarrayTensor,
         mode: Optional[Union[InterpolateMode, str]] = None,
         padding_mode: Optional[Union[NumpyPadMode, str]] = None,
         align_corners: Optional[bool] = None,
-    ):
+    ) -> NdarrayTensor:
         """
         Args:
             img: channel first array, must have shape: (num_channels, H[, W, ..., ]).
@@ -555,12 +648,12 @@ class Zoom(Transform):
         _zoom = ensure_tuple_rep(self.zoom, img.ndim - 1)  # match the spatial image dim
         zoomed = torch.nn.functional.interpolate(  # type: ignore
             recompute_scale_factor=True,
-            input=torch.as_tensor(np.ascontiguousarray(img), dtype=torch.float).unsqueeze(0),
+            input=_as_tensor(img, np.float32).unsqueeze(0),
             scale_factor=list(_zoom),
             mode=self.mode.value if mode is None else InterpolateMode(mode).value,
             align_corners=self.align_corners if align_corners is None else align_corners,
         )
-        zoomed = zoomed.squeeze(0).detach().cpu().numpy()
+        zoomed = _as_output(zoomed.squeeze(0), img)
         if not self.keep_size or np.allclose(img.shape, zoomed.shape):
             return zoomed
 
@@ -575,11 +668,47 @@ class Zoom(Transform):
                 slice_vec[idx] = slice(half, half + od)
 
         padding_mode = self.padding_mode if padding_mode is None else NumpyPadMode(padding_mode)
-        zoomed = np.pad(zoomed, pad_vec, mode=padding_mode.value)
+        zoomed = pad_nd(zoomed, pad_vec, mode=padding_mode)
         return zoomed[tuple(slice_vec)]
 
+    def compute_matrix(
+        self, spatial_shape: Sequence[int], align_corners: Optional[bool] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the zooming of an image of `spatial_shape` as an affine resampling, without resampling it.
+        The output voxels are mapped to the input voxels as in a linear interpolation, and then
+        shifted by the padding or the slicing of `keep_size`.
+
+        Args:
+            spatial_shape: spatial shape of the input image.
+            align_corners: whether the corner voxels of the input and output are aligned.
+                Defaults to ``self.align_corners``.
+
+        Returns:
+            matrix mapping the output voxel indices to the input voxel indices, output spatial shape.
 
-class Rotate90(Transform):
+        """
+        in_shape = np.asarray(spatial_shape, dtype=int)
+        _zoom = np.asarray(ensure_tuple_rep(self.zoom, len(in_shape)), dtype=np.float64)
+        zoomed_shape = np.floor(in_shape * _zoom).astype(int)
+        align_corners = self.align_corners if align_corners is None else align_corners
+        if align_corners:
+            scale = (in_shape - 1) / np.maximum(zoomed_shape - 1, 1)
+            offset = np.zeros(len(in_shape))
+        else:
+            scale = in_shape / zoomed_shape
+            offset = 0.5 * scale - 0.5
+        matrix = np.diag(np.append(scale, 1.0))
+        matrix[:-1, -1] = offset
+        if not self.keep_size or np.allclose(in_shape, zoomed_shape):
+            return matrix, zoomed_shape
+        # index shift of the symmetric padding (negative) or slicing (positive)
+        diff = zoomed_shape - in_shape
+        matrix = matrix @ create_translate(len(in_shape), np.sign(diff) * (np.abs(diff) // 2))
+        return matrix, in_shape
+
+
+class Rotate90(ReorderTransform):
     """
     Rotate an array by 90 degrees in the plane specified by `axes`.
     See np.rot90 for additional details:
@@ -601,17 +730,18 @@ class Rotate90(Transform):
             raise ValueError("spatial_axes must be 2 int numbers to indicate the axes to rotate 90 degrees.")
         self.spatial_axes = spatial_axes_
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: NdarrayTensor) -> NdarrayTensor:
         """
         Args:
             img: channel first array, must have shape: (num_channels, H[, W, ..., ]),
         """
-
+        if isinstance(img, torch.Tensor):
+            return torch.rot90(img, self.k, map_spatial_axes(img.ndim, self.spatial_axes))
         result: np.ndarray = np.rot90(img, self.k, map_spatial_axes(img.ndim, self.spatial_axes))
         return result.astype(img.dtype)
 
 
-class RandRotate90(RandomizableTransform):
+class RandRotate90(RandomizableTransform, ReorderTransform):
     """
     With probability `prob`, input arrays are rotated by 90 degrees
     in the plane specified by `spatial_axes`.
@@ -749,10 +879,11 @@ class RandRotate(RandomizableTransform):
             align_corners=self.align_corners if align_corners is None else align_corners,
             dtype=dtype or self.dtype or img.dtype,
         )
-        return np.array(rotator(img))
+        rotated = rotator(img)
+        return rotated if isinstance(rotated, torch.Tensor) else np.array(rotated)
 
 
-class RandFlip(RandomizableTransform):
+class RandFlip(RandomizableTransform, ReorderTransform):
     """
     Randomly flips the image along axes. Preserves shape.
     See numpy.flip for additional details.
@@ -778,7 +909,7 @@ class RandFlip(RandomizableTransform):
         return self.flipper(img)
 
 
-class RandAxisFlip(RandomizableTransform):
+class RandAxisFlip(RandomizableTransform, ReorderTransform):
     """
     Randomly select a spatial axis and flip along it.
     See numpy.flip for additional details.
@@ -889,7 +1020,7 @@ class RandZoom(RandomizableTransform):
         self.randomize()
         _dtype = np.float32
         if not self._do_transform:
-            return img.astype(_dtype)
+            return img.to(torch.float32) if isinstance(img, torch.Tensor) else img.astype(_dtype)
         if len(self._zoom) == 1:
             # to keep the spatial shape ratio, use same random zoom factor for all dims
             self._zoom = ensure_tuple_rep(self._zoom[0], img.ndim - 1)
@@ -897,15 +1028,13 @@ class RandZoom(RandomizableTransform):
             # if 2 zoom factors provided for 3D data, use the first factor for H and W dims, second factor for D dim
             self._zoom = ensure_tuple_rep(self._zoom[0], img.ndim - 2) + ensure_tuple(self._zoom[-1])
         zoomer = Zoom(self._zoom, keep_size=self.keep_size)
-        return np.asarray(
-            zoomer(
-                img,
-                mode=mode or self.mode,
-                padding_mode=padding_mode or self.padding_mode,
-                align_corners=self.align_corners if align_corners is None else align_corners,
-            ),
-            dtype=_dtype,
+        zoomed = zoomer(
+            img,
+            mode=mode or self.mode,
+            padding_mode=padding_mode or self.padding_mode,
+            align_corners=self.align_corners if align_corners is None else align_corners,
         )
+        return zoomed if isinstance(zoomed, torch.Tensor) else np.asarray(zoomed, dtype=_dtype)
 
 
 class AffineGrid(Transform):
@@ -977,20 +1106,7 @@ class AffineGrid(Transform):
             else:
                 raise ValueError("Incompatible values: grid=None and spatial_size=None.")
 
-        if self.affine is None:
-            spatial_dims = len(grid.shape) - 1
-            affine = np.eye(spatial_dims + 1)
-            if self.rotate_params:
-                affine = affine @ create_rotate(spatial_dims, self.rotate_params)
-            if self.shear_params:
-                affine = affine @ create_shear(spatial_dims, self.shear_params)
-            if self.translate_params:
-                affine = affine @ create_translate(spatial_dims, self.translate_params)
-            if self.scale_params:
-                affine = affine @ create_scale(spatial_dims, self.scale_params)
-        else:
-            affine = self.affine
-
+        affine = self.compute_affine(len(grid.shape) - 1)
         if isinstance(affine, np.ndarray):
             affine = torch.as_tensor(np.ascontiguousarray(affine))
 
@@ -1003,6 +1119,27 @@ class AffineGrid(Transform):
             raise ValueError("Unknown grid.")
         return grid if self.as_tensor_output else np.asarray(grid.cpu().numpy()), affine
 
+    def compute_affine(self, spatial_dims: int) -> Union[np.ndarray, torch.Tensor]:
+        """
+        Compute the (N+1)x(N+1) affine matrix applied to the coordinates, without generating the grid.
+
+        Args:
+            spatial_dims: number of spatial dimensions N.
+
+        """
+        if self.affine is not None:
+            return self.affine
+        affine = np.eye(spatial_dims + 1)
+        if self.rotate_params:
+            affine = affine @ create_rotate(spatial_dims, self.rotate_params)
+        if self.shear_params:
+            affine = affine @ create_shear(spatial_dims, self.shear_params)
+        if self.translate_params:
+            affine = affine @ create_translate(spatial_dims, self.translate_params)
+        if self.scale_params:
+            affine = affine @ create_scale(spatial_dims, self.scale_params)
+        return affine
+
 
 class RandAffineGrid(RandomizableTransform):
     """
@@ -1096,6 +1233,27 @@ class RandAffineGrid(RandomizableTransform):
         grid, self.affine = affine_grid(spatial_size, grid)
         return grid
 
+    def compute_affine(self, spatial_dims: int) -> torch.Tensor:
+        """
+        Randomize the parameters and compute the (N+1)x(N+1) affine matrix as ``__call__``,
+        without generating the grid.
+
+        Args:
+            spatial_dims: number of spatial dimensions N.
+
+        """
+        self.randomize()
+        affine_grid = AffineGrid(
+            rotate_params=self.rotate_params,
+            shear_params=self.shear_params,
+            translate_params=self.translate_params,
+            scale_params=self.scale_params,
+        )
+        self.affine = torch.as_tensor(np.ascontiguousarray(affine_grid.compute_affine(spatial_dims)))
+        if self.device:
+            self.affine = self.affine.to(self.device)
+        return self.affine
+
     def get_transformation_matrix(self) -> Optional[Union[np.ndarray, torch.Tensor]]:
         """Get the most recently applied transformation matrix"""
         return self.affine
@@ -1204,7 +1362,7 @@ class Resample(Transform):
         grid = torch.tensor(grid) if not isinstance(grid, torch.Tensor) else grid.detach().clone()
         if self.device:
             img = img.to(self.device)
-            grid = grid.to(self.device)
+        grid = grid.to(img.device)
 
         if USE_COMPILED:
             for i, dim in enumerate(img.shape[1:]):
@@ -1569,6 +1727,23 @@ class Rand2DElastic(RandomizableTransform):
         return self.resampler(img, grid, mode=mode or self.mode, padding_mode=padding_mode or self.padding_mode)
 
 
+def _smoothed_noise_variance(kernel: torch.Tensor, num_points: int, size: int) -> float:
+    """
+    Average variance, relative to the variance of the noise, of a 1D white noise of `num_points` samples
+    smoothed by `kernel` (with zero padding) and linearly interpolated to `size` points.
+
+    """
+    radius = (len(kernel) - 1) // 2
+    smooth = torch.zeros(num_points, num_points)
+    for i in range(-radius, radius + 1):
+        if abs(i) < num_points:
+            smooth += torch.diag(torch.full((num_points - abs(i),), float(kernel[i + radius])), i)
+    weights = smooth[None]
+    if num_points != size:
+        weights = torch.nn.functional.interpolate(weights, size=size, mode="linear", align_corners=True)
+    return float(torch.mean(torch.sum(weights[0] ** 2, 0)))
+
+
 class Rand3DElastic(RandomizableTransform):
     """
     Random elastic deformation and affine in 3D
@@ -1588,6 +1763,7 @@ class Rand3DElastic(RandomizableTransform):
         padding_mode: Union[GridSamplePadMode, str] = GridSamplePadMode.REFLECTION,
         as_tensor_output: bool = False,
         device: Optional[torch.device] = None,
+        control_spacing: Optional[Union[Sequence[int], int]] = None,
     ) -> None:
         """
         Args:
@@ -1623,6 +1799,12 @@ class Rand3DElastic(RandomizableTransform):
             as_tensor_output: the computation is implemented using pytorch tensors, this option specifies
                 whether to convert it back to numpy arrays.
             device: device on which the tensor will be allocated.
+            control_spacing: if not None, the random offsets are drawn on a coarse grid of control points
+                spaced by about `control_spacing` voxels (one value for all the axes, or one value per axis),
+                smoothed at the coarse resolution and upsampled to `spatial_size` with a trilinear interpolation.
+                The smoothing and the magnitude of the offsets are scaled to approximately match the full
+                resolution field, the cost of the deformation is then close to an affine transform.
+                Defaults to None, drawing and smoothing the offsets at the full resolution.
 
         See also:
             - :py:class:`RandAffineGrid` for the random affine parameters configurations.
@@ -1638,6 +1820,7 @@ class Rand3DElastic(RandomizableTransform):
         self.mode: GridSampleMode = GridSampleMode(mode)
         self.padding_mode: GridSamplePadMode = GridSamplePadMode(padding_mode)
         self.device = device
+        self.control_spacing = None if control_spacing is None else ensure_tuple_rep(control_spacing, 3)
 
         self.rand_offset = None
         self.magnitude = 1.0
@@ -1653,6 +1836,8 @@ class Rand3DElastic(RandomizableTransform):
     def randomize(self, grid_size: Sequence[int]) -> None:
         super().randomize(None)
         if self._do_transform:
+            if self.control_spacing is not None:
+                grid_size = [int(np.ceil((s - 1) / c)) + 1 for s, c in zip(grid_size, self.control_spacing)]
             self.rand_offset = self.R.uniform(-1.0, 1.0, [3] + list(grid_size)).astype(np.float32)
         self.magnitude = self.R.uniform(self.magnitude_range[0], self.magnitude_range[1])
         self.sigma = self.R.uniform(self.sigma_range[0], self.sigma_range[1])
@@ -1682,11 +1867,38 @@ class Rand3DElastic(RandomizableTransform):
         self.randomize(grid_size=sp_size)
         grid = create_grid(spatial_size=sp_size)
         if self._do_transform:
-            if self.rand_offset is None:
-                raise AssertionError
             grid = torch.as_tensor(np.ascontiguousarray(grid), device=self.device)
-            gaussian = GaussianFilter(3, self.sigma, 3.0).to(device=self.device)
-            offset = torch.as_tensor(self.rand_offset, device=self.device).unsqueeze(0)
-            grid[:3] += gaussian(offset)[0] * self.magnitude
+            grid[:3] += self.compute_offset(sp_size)
             grid = self.rand_affine_grid(grid=grid)
         return self.resampler(img, grid, mode=mode or self.mode, padding_mode=padding_mode or self.padding_mode)
+
+    def compute_offset(self, spatial_size: Sequence[int]) -> torch.Tensor:
+        """
+        Smooth the most recent random offsets into a 3x`spatial_size` displacement field.
+
+        With `control_spacing`, the offsets are smoothed on the control grid with a Gaussian of standard deviation
+        `sigma / spacing` (the actual spacing of the control points spanning `spatial_size`), then rescaled so that
+        their variance matches the one of the full resolution smoothing, and upsampled to `spatial_size`.
+
+        Raises:
+            RuntimeError: When the offsets have not been randomized.
+
+        """
+        if self.rand_offset is None:
+            raise RuntimeError("rand_offset is not initialized, please call randomize first.")
+        offset = torch.as_tensor(self.rand_offset, device=self.device).unsqueeze(0)
+        if self.control_spacing is None:
+            gaussian = GaussianFilter(3, self.sigma, 3.0).to(device=self.device)
+            return gaussian(offset)[0] * self.magnitude
+
+        spacing = [max((s - 1) / max(c - 1, 1), 1.0) for s, c in zip(spatial_size, offset.shape[2:])]
+        sigma = [self.sigma / sp for sp in spacing]
+        gaussian = GaussianFilter(3, sigma, 3.0).to(device=self.device)
+        # the smoothed coarse noise has a larger variance, and the interpolation reduces it between the control
+        # points: rescale to the average variance of the full resolution field, separately along each axis
+        scale = 1.0
+        for s, n, sig in zip(spatial_size, offset.shape[2:], sigma):
+            var_full = _smoothed_noise_variance(gaussian_1d(torch.tensor(float(self.sigma)), 3.0), s, s)
+            scale *= np.sqrt(var_full / _smoothed_noise_variance(gaussian_1d(torch.tensor(float(sig)), 3.0), n, s))
+        offset = gaussian(offset) * float(self.magnitude * scale)
+        return torch.nn.functional.interpolate(offset, size=list(spatial_size), mode="trilinear", align_corners=True)[0]
@@ -0,0 +1,564 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A collection of "vanilla" transforms for random spatial augmentations acting on batches of data
+https://github.com/Project-MONAI/MONAI/wiki/MONAI_Design
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+
+from monai.networks.layers import AffineTransform
+from monai.transforms.spatial.array import RandRange
+from monai.transforms.transform import RandomizableTransform
+from monai.transforms.utils import map_spatial_axes
+from monai.utils import (
+    GridSampleMode,
+    GridSamplePadMode,
+    ensure_tuple,
+    fall_back_tuple,
+    issequenceiterable,
+)
+
+__all__ = [
+    "BatchRandAffine",
+    "BatchRandRotate",
+    "BatchRandZoom",
+    "BatchRandFlip",
+]
+
+
+def _as_batch(img: Union[np.ndarray, torch.Tensor]) -> torch.Tensor:
+    """
+    Convert `img` to a floating point tensor of shape (B, C, H, W[, D]), keeping its device.
+
+    """
+    img = torch.as_tensor(img)
+    if img.ndim not in (4, 5):
+        raise ValueError(f"img must have shape (B, C, H, W[, D]), got {tuple(img.shape)}.")
+    return img if torch.is_floating_point(img) else img.float()
+
+
+def _rand_params(R: np.random.RandomState, param_range: Tuple, batch_size: int, add_scalar: float = 0.0):
+    """
+    Draw the parameters of `batch_size` samples, same as ``RandAffineGrid._get_rand_param`` for every sample.
+
+    Returns:
+        an array of shape (batch_size, number of parameters).
+
+    """
+    out_param = []
+    for f in param_range:
+        if issequenceiterable(f):
+            if len(f) != 2:
+                raise ValueError("If giving range as [min,max], should only have two elements per dim.")
+            out_param.append(R.uniform(f[0], f[1], size=batch_size) + add_scalar)
+        elif f is not None:
+            out_param.append(R.uniform(-f, f, size=batch_size) + add_scalar)
+    return np.stack(out_param, axis=1) if out_param else np.zeros((batch_size, 0))
+
+
+def _batch_eye(batch_size: int, spatial_dims: int) -> torch.Tensor:
+    return torch.eye(spatial_dims + 1, dtype=torch.float64).repeat(batch_size, 1, 1)
+
+
+def _batch_rotate(spatial_dims: int, radians: Union[np.ndarray, torch.Tensor]) -> torch.Tensor:
+    """
+    Batched version of :py:func:`monai.transforms.utils.create_rotate`.
+
+    Args:
+        spatial_dims: {``2``, ``3``} spatial rank
+        radians: rotation radians of shape (B, K), the K angles of every sample follow the convention
+            of ``create_rotate`` (K >= 1 in 2D, 1 <= K <= 3 in 3D).
+
+    Raises:
+        ValueError: When ``radians`` is empty.
+        ValueError: When ``spatial_dims`` is not one of [2, 3].
+
+    """
+    radians = torch.as_tensor(radians, dtype=torch.float64)
+    if radians.ndim != 2 or radians.shape[1] < 1:
+        raise ValueError("radians must be non empty.")
+    if spatial_dims == 2:
+        # (row, column, sign of the sine at (row, column)) of the rotation planes
+        planes = [(0, 1, -1.0)]
+    elif spatial_dims == 3:
+        planes = [(1, 2, -1.0), (0, 2, 1.0), (0, 1, -1.0)]
+    else:
+        raise ValueError(f"Unsupported spatial_dims: {spatial_dims}, available options are [2, 3].")
+    affine = _batch_eye(radians.shape[0], spatial_dims)
+    for (i, j, sign), angle in zip(planes, radians.T):
+        rot = _batch_eye(radians.shape[0], spatial_dims)
+        sin_, cos_ = torch.sin(angle), torch.cos(angle)
+        rot[:, i, i], rot[:, j, j] = cos_, cos_
+        rot[:, i, j], rot[:, j, i] = sign * sin_, -sign * sin_
+        affine = affine @ rot
+    return affine
+
+
+def _batch_shear(spatial_dims: int, coefs: Union[np.ndarray, torch.Tensor]) -> torch.Tensor:
+    """
+    Batched version of :py:func:`monai.transforms.utils.create_shear`.
+
+    Args:
+        spatial_dims: {``2``, ``3``} spatial rank
+        coefs: shearing factors of shape (B, K), padded with 0 to the 2 (2D) or 6 (3D) factors of every sample.
+
+    Raises:
+        NotImplementedError: When ``spatial_dims`` is not one of [2, 3].
+
+    """
+    if spatial_dims not in (2, 3):
+        raise NotImplementedError("Currently only spatial_dims in [2, 3] are supported.")
+    coefs = torch.as_tensor(coefs, dtype=torch.float64)
+    affine = _batch_eye(coefs.shape[0], spatial_dims)
+    off_diagonal = [(i, j) for i in range(spatial_dims) for j in range(spatial_dims) if i != j]
+    for (i, j), coef in zip(off_diagonal, coefs.T):
+        affine[:, i, j] = coef
+    return affine
+
+
+def _batch_scale(spatial_dims: int, scaling_factor: Union[np.ndarray, torch.Tensor]) -> torch.Tensor:
+    """
+    Batched version of :py:func:`monai.transforms.utils.create_scale`.
+
+    Args:
+        spatial_dims: spatial rank
+        scaling_factor: scaling factors of shape (B, K), padded with 1 to the `spatial_dims` factors of every sample.
+
+    """
+    scaling_factor = torch.as_tensor(scaling_factor, dtype=torch.float64)
+    affine = _batch_eye(scaling_factor.shape[0], spatial_dims)
+    for i, factor in enumerate(scaling_factor.T[:spatial_dims]):
+        affine[:, i, i] = factor
+    return affine
+
+
+def _batch_translate(spatial_dims: int, shift: Union[np.ndarray, torch.Tensor]) -> torch.Tensor:
+    """
+    Batched version of :py:func:`monai.transforms.utils.create_translate`.
+
+    Args:
+        spatial_dims: spatial rank
+        shift: translate factors of shape (B, K), padded with 0 to the `spatial_dims` factors of every sample.
+
+    """
+    shift = torch.as_tensor(shift, dtype=torch.float64)
+    affine = _batch_eye(shift.shape[0], spatial_dims)
+    affine[:, : min(shift.shape[1], spatial_dims), spatial_dims] = shift[:, :spatial_dims]
+    return affine
+
+
+def _affine_resample(
+    img: torch.Tensor,
+    affine: torch.Tensor,
+    spatial_size: Sequence[int],
+    mode: Union[GridSampleMode, str],
+    padding_mode: Union[GridSamplePadMode, str],
+    align_corners: bool,
+) -> torch.Tensor:
+    """
+    Resample the batch `img` with a single ``grid_sample`` call.
+
+    Args:
+        img: batch of images of shape (B, C, H, W[, D]).
+        affine: (B, N+1, N+1) matrices mapping the coordinates of the output voxels to the coordinates
+            in the input images, the coordinates are relative to the centers of the images.
+        spatial_size: output spatial shape.
+
+    """
+    spatial_dims = img.ndim - 2
+    in_center = (torch.as_tensor(img.shape[2:], dtype=torch.float64) - 1) / 2
+    out_center = (torch.as_tensor(spatial_size, dtype=torch.float64) - 1) / 2
+    ones = torch.ones(1, 1)
+    theta = _batch_translate(spatial_dims, in_center * ones) @ affine
+    theta = theta @ _batch_translate(spatial_dims, -out_center * ones)
+    xform = AffineTransform(
+        normalized=False, mode=mode, padding_mode=padding_mode, align_corners=align_corners, reverse_indexing=True
+    )
+    return xform(img, theta.to(img), spatial_size=spatial_size)
+
+
+class BatchRandAffine(RandomizableTransform):
+    """
+    Batched version of :py:class:`monai.transforms.RandAffine`: the random affine parameters are drawn
+    independently for every sample of a collated batch, and the whole batch is resampled by a single
+    ``affine_grid`` + ``grid_sample`` call, on the device of the input tensor.
+    The affine transformations are applied in rotate, shear, translate, scale order.
+
+    For example, to augment the batches on the GPU after the ``DataLoader``:
+
+    .. code-block:: python
+
+        augment = BatchRandAffine(prob=0.5, rotate_range=0.3, scale_range=0.1)
+        for batch in loader:
+            image = augment(batch["image"].to(device))
+            # the same parameters for the labels
+            label = augment(batch["label"].to(device), mode="nearest", randomize=False)
+
+    Args:
+        prob: probability of transforming every sample of the batch, defaults to 0.1.
+        rotate_range: angle range in radians, see :py:class:`monai.transforms.RandAffineGrid`.
+        shear_range: shear_range with format matching `rotate_range`.
+        translate_range: translate_range with format matching `rotate_range`.
+        scale_range: scaling_range with format matching `rotate_range`. A value of 1.0 is added to the result.
+            This allows 0 to correspond to no change (i.e., a scaling of 1).
+        spatial_size: output image spatial size.
+            if `spatial_size` and `self.spatial_size` are not defined, or smaller than 1,
+            the transform will use the spatial size of `img`.
+        mode: {``"bilinear"``, ``"nearest"``}
+            Interpolation mode to calculate output values. Defaults to ``"bilinear"``.
+            See also: https://pytorch.org/docs/stable/nn.functional.html#grid-sample
+        padding_mode: {``"zeros"``, ``"border"``, ``"reflection"``}
+            Padding mode for outside grid values. Defaults to ``"reflection"``.
+            See also: https://pytorch.org/docs/stable/nn.functional.html#grid-sample
+
+    """
+
+    def __init__(
+        self,
+        prob: float = 0.1,
+        rotate_range: RandRange = None,
+        shear_range: RandRange = None,
+        translate_range: RandRange = None,
+        scale_range: RandRange = None,
+        spatial_size: Optional[Union[Sequence[int], int]] = None,
+        mode: Union[GridSampleMode, str] = GridSampleMode.BILINEAR,
+        padding_mode: Union[GridSamplePadMode, str] = GridSamplePadMode.REFLECTION,
+    ) -> None:
+        RandomizableTransform.__init__(self, prob)
+        self.rotate_range = ensure_tuple(rotate_range)
+        self.shear_range = ensure_tuple(shear_range)
+        self.translate_range = ensure_tuple(translate_range)
+        self.scale_range = ensure_tuple(scale_range)
+        self.spatial_size = spatial_size
+        self.mode: GridSampleMode = GridSampleMode(mode)
+        self.padding_mode: GridSamplePadMode = GridSamplePadMode(padding_mode)
+
+        self.rotate_params = np.zeros((0, 0))
+        self.shear_params = np.zeros((0, 0))
+        self.translate_params = np.zeros((0, 0))
+        self.scale_params = np.zeros((0, 0))
+        self._do_transform = np.zeros(0, dtype=bool)
+
+    def randomize(self, batch_size: int) -> None:  # type: ignore # pytype: disable=signature-mismatch
+        self._do_transform = self.R.rand(batch_size) < self.prob
+        self.rotate_params = _rand_params(self.R, self.rotate_range, batch_size)
+        self.shear_params = _rand_params(self.R, self.shear_range, batch_size)
+        self.translate_params = _rand_params(self.R, self.translate_range, batch_size)
+        self.scale_params = _rand_params(self.R, self.scale_range, batch_size, 1.0)
+
+    def compute_affine(self, spatial_dims: int) -> torch.Tensor:
+        """
+        Compute the (B, N+1, N+1) affine matrices of the most recently drawn parameters,
+        the matrices of the samples which are not transformed are identities.
+
+        Args:
+            spatial_dims: number of spatial dimensions N.
+
+        """
+        affine = _batch_eye(len(self._do_transform), spatial_dims)
+        if self.rotate_params.shape[1] > 0:
+            affine = affine @ _batch_rotate(spatial_dims, self.rotate_params)
+        if self.shear_params.shape[1] > 0:
+            affine = affine @ _batch_shear(spatial_dims, self.shear_params)
+        if self.translate_params.shape[1] > 0:
+            affine = affine @ _batch_translate(spatial_dims, self.translate_params)
+        if self.scale_params.shape[1] > 0:
+            affine = affine @ _batch_scale(spatial_dims, self.scale_params)
+        affine[~torch.as_tensor(self._do_transform)] = _batch_eye(1, spatial_dims)
+        return affine
+
+    def __call__(
+        self,
+        img: Union[np.ndarray, torch.Tensor],
+        spatial_size: Optional[Union[Sequence[int], int]] = None,
+        mode: Optional[Union[GridSampleMode, str]] = None,
+        padding_mode: Optional[Union[GridSamplePadMode, str]] = None,
+        randomize: bool = True,
+    ) -> torch.Tensor:
+        """
+        Args:
+            img: batch of channel first images, shape must be (B, C, H, W[, D]).
+            spatial_size: output image spatial size, defaults to ``self.spatial_size``.
+            mode: {``"bilinear"``, ``"nearest"``}
+                Interpolation mode to calculate output values. Defaults to ``self.mode``.
+            padding_mode: {``"zeros"``, ``"border"``, ``"reflection"``}
+                Padding mode for outside grid values. Defaults to ``self.padding_mode``.
+            randomize: whether to draw new parameters, if False, the parameters of the previous call are used,
+                for example to apply the same transforms to the images and to the labels of a batch.
+
+        Raises:
+            ValueError: When ``randomize`` is False and the batch size differs from the previous call.
+
+        """
+        img = _as_batch(img)
+        if randomize:
+            self.randomize(img.shape[0])
+        elif len(self._do_transform) != img.shape[0]:
+            raise ValueError(f"batch size {img.shape[0]} differs from the drawn parameters {len(self._do_transform)}.")
+        sp_size = fall_back_tuple(spatial_size or self.spatial_size, img.shape[2:])
+        return _affine_resample(
+            img,
+            self.compute_affine(img.ndim - 2),
+            sp_size,
+            mode=mode or self.mode,
+            padding_mode=padding_mode or self.padding_mode,
+            align_corners=True,
+        )
+
+
+class BatchRandRotate(RandomizableTransform):
+    """
+    Batched version of :py:class:`monai.transforms.RandRotate`: the angles are drawn independently for every
+    sample of a collated batch, and the whole batch is rotated by a single ``affine_grid`` + ``grid_sample``
+    call, on the device of the input tensor. The output has the same spatial shape as the input.
+
+    Args:
+        range_x: Range of rotation angle in radians in the plane defined by the first and second axes.
+            If single number, angle is uniformly sampled from (-range_x, range_x).
+        range_y: Range of rotation angle in radians in the plane defined by the first and third axes.
+            If single number, angle is uniformly sampled from (-range_y, range_y).
+        range_z: Range of rotation angle in radians in the plane defined by the second and third axes.
+            If single number, angle is uniformly sampled from (-range_z, range_z).
+        prob: Probability of rotation of every sample.
+        mode: {``"bilinear"``, ``"nearest"``}
+            Interpolation mode to calculate output values. Defaults to ``"bilinear"``.
+            See also: https://pytorch.org/docs/stable/nn.functional.html#grid-sample
+        padding_mode: {``"zeros"``, ``"border"``, ``"reflection"``}
+            Padding mode for outside grid values. Defaults to ``"border"``.
+            See also: https://pytorch.org/docs/stable/nn.functional.html#grid-sample
+        align_corners: Defaults to False.
+            See also: https://pytorch.org/docs/stable/nn.functional.html#grid-sample
+
+    """
+
+    def __init__(
+        self,
+        range_x: Union[Tuple[float, float], float] = 0.0,
+        range_y: Union[Tuple[float, float], float] = 0.0,
+        range_z: Union[Tuple[float, float], float] = 0.0,
+        prob: float = 0.1,
+        mode: Union[GridSampleMode, str] = GridSampleMode.BILINEAR,
+        padding_mode: Union[GridSamplePadMode, str] = GridSamplePadMode.BORDER,
+        align_corners: bool = False,
+    ) -> None:
+        RandomizableTransform.__init__(self, prob)
+        self.range_x = ensure_tuple(range_x)
+        if len(self.range_x) == 1:
+            self.range_x = tuple(sorted([-self.range_x[0], self.range_x[0]]))
+        self.range_y = ensure_tuple(range_y)
+        if len(self.range_y) == 1:
+            self.range_y = tuple(sorted([-self.range_y[0], self.range_y[0]]))
+        self.range_z = ensure_tuple(range_z)
+        if len(self.range_z) == 1:
+            self.range_z = tuple(sorted([-self.range_z[0], self.range_z[0]]))
+
+        self.mode: GridSampleMode = GridSampleMode(mode)
+        self.padding_mode: GridSamplePadMode = GridSamplePadMode(padding_mode)
+        self.align_corners = align_corners
+
+        self.angles = np.zeros((0, 3))
+        self._do_transform = np.zeros(0, dtype=bool)
+
+    def randomize(self, batch_size: int) -> None:  # type: ignore # pytype: disable=signature-mismatch
+        self._do_transform = self.R.rand(batch_size) < self.prob
+        x = self.R.uniform(low=self.range_x[0], high=self.range_x[1], size=batch_size)
+        y = self.R.uniform(low=self.range_y[0], high=self.range_y[1], size=batch_size)
+        z = self.R.uniform(low=self.range_z[0], high=self.range_z[1], size=batch_size)
+        self.angles = np.stack([x, y, z], axis=1)
+
+    def __call__(
+        self,
+        img: Union[np.ndarray, torch.Tensor],
+        mode: Optional[Union[GridSampleMode, str]] = None,
+        padding_mode: Optional[Union[GridSamplePadMode, str]] = None,
+        align_corners: Optional[bool] = None,
+        randomize: bool = True,
+    ) -> torch.Tensor:
+        """
+        Args:
+            img: batch of channel first images, shape must be (B, C, H, W[, D]).
+            mode: {``"bilinear"``, ``"nearest"``}
+                Interpolation mode to calculate output values. Defaults to ``self.mode``.
+            padding_mode: {``"zeros"``, ``"border"``, ``"reflection"``}
+                Padding mode for outside grid values. Defaults to ``self.padding_mode``.
+            align_corners: Defaults to ``self.align_corners``.
+            randomize: whether to draw new angles, if False, the angles of the previous call are used.
+
+        Raises:
+            ValueError: When ``randomize`` is False and the batch size differs from the previous call.
+
+        """
+        img = _as_batch(img)
+        if randomize:
+            self.randomize(img.shape[0])
+        elif len(self._do_transform) != img.shape[0]:
+            raise ValueError(f"batch size {img.shape[0]} differs from the drawn parameters {len(self._do_transform)}.")
+        if not np.any(self._do_transform):
+            return img
+        spatial_dims = img.ndim - 2
+        angles = self.angles * self._do_transform[:, None]
+        return _affine_resample(
+            img,
+            _batch_rotate(spatial_dims, angles[:, :1] if spatial_dims == 2 else angles),
+            img.shape[2:],
+            mode=mode or self.mode,
+            padding_mode=padding_mode or self.padding_mode,
+            align_corners=self.align_corners if align_corners is None else align_corners,
+        )
+
+
+class BatchRandZoom(RandomizableTransform):
+    """
+    Batched version of :py:class:`monai.transforms.RandZoom`: the zoom factors are drawn independently for every
+    sample of a collated batch, and the whole batch is zoomed about the image centers by a single ``affine_grid``
+    + ``grid_sample`` call, on the device of the input tensor. The output has the same spatial shape as the input.
+
+    Different from ``RandZoom``, the images are resampled instead of being interpolated to the zoomed shape then
+    padded or cropped, so that the interpolation and padding modes are the ones of ``grid_sample``.
+
+    Args:
+        prob: Probability of zooming every sample.
+        min_zoom: Min zoom factor. Can be float or sequence same size as image.
+            If a float, select a random factor from `[min_zoom, max_zoom]` then apply to all spatial dims
+            to keep the original spatial shape ratio.
+            If a sequence, min_zoom should contain one value for each spatial axis.
+            If 2 values provided for 3D data, use the first value for both H & W dims to keep the same zoom ratio.
+        max_zoom: Max zoom factor. Can be float or sequence same size as image, same format as `min_zoom`.
+        mode: {``"bilinear"``, ``"nearest"``}
+            Interpolation mode to calculate output values. Defaults to ``"bilinear"``.
+            See also: https://pytorch.org/docs/stable/nn.functional.html#grid-sample
+        padding_mode: {``"zeros"``, ``"border"``, ``"reflection"``}
+            Padding mode for outside grid values. Defaults to ``"border"``.
+            See also: https://pytorch.org/docs/stable/nn.functional.html#grid-sample
+        align_corners: Defaults to False.
+            See also: https://pytorch.org/docs/stable/nn.functional.html#grid-sample
+
+    """
+
+    def __init__(
+        self,
+        prob: float = 0.1,
+        min_zoom: Union[Sequence[float], float] = 0.9,
+        max_zoom: Union[Sequence[float], float] = 1.1,
+        mode: Union[GridSampleMode, str] = GridSampleMode.BILINEAR,
+        padding_mode: Union[GridSamplePadMode, str] = GridSamplePadMode.BORDER,
+        align_corners: bool = False,
+    ) -> None:
+        RandomizableTransform.__init__(self, prob)
+        self.min_zoom = ensure_tuple(min_zoom)
+        self.max_zoom = ensure_tuple(max_zoom)
+        if len(self.min_zoom) != len(self.max_zoom):
+            raise AssertionError("min_zoom and max_zoom must have same length.")
+        self.mode: GridSampleMode = GridSampleMode(mode)
+        self.padding_mode: GridSamplePadMode = GridSamplePadMode(padding_mode)
+        self.align_corners = align_corners
+
+        self.zoom = np.ones((0, len(self.min_zoom)))
+        self._do_transform = np.zeros(0, dtype=bool)
+
+    def randomize(self, batch_size: int) -> None:  # type: ignore # pytype: disable=signature-mismatch
+        self._do_transform = self.R.rand(batch_size) < self.prob
+        self.zoom = np.stack([self.R.uniform(l, h, size=batch_size) for l, h in zip(self.min_zoom, self.max_zoom)], 1)
+
+    def __call__(
+        self,
+        img: Union[np.ndarray, torch.Tensor],
+        mode: Optional[Union[GridSampleMode, str]] = None,
+        padding_mode: Optional[Union[GridSamplePadMode, str]] = None,
+        align_corners: Optional[bool] = None,
+        randomize: bool = True,
+    ) -> torch.Tensor:
+        """
+        Args:
+            img: batch of channel first images, shape must be (B, C, H, W[, D]).
+            mode: {``"bilinear"``, ``"nearest"``}
+                Interpolation mode to calculate output values. Defaults to ``self.mode``.
+            padding_mode: {``"zeros"``, ``"border"``, ``"reflection"``}
+                Padding mode for outside grid values. Defaults to ``self.padding_mode``.
+            align_corners: Defaults to ``self.align_corners``.
+            randomize: whether to draw new zoom factors, if False, the factors of the previous call are used.
+
+        Raises:
+            ValueError: When ``randomize`` is False and the batch size differs from the previous call.
+
+        """
+        img = _as_batch(img)
+        if randomize:
+            self.randomize(img.shape[0])
+        elif len(self._do_transform) != img.shape[0]:
+            raise ValueError(f"batch size {img.shape[0]} differs from the drawn parameters {len(self._do_transform)}.")
+        if not np.any(self._do_transform):
+            return img
+        spatial_dims = img.ndim - 2
+        zoom = np.where(self._do_transform[:, None], self.zoom, 1.0)
+        if zoom.shape[1] == 1:
+            # to keep the spatial shape ratio, use same random zoom factor for all dims
+            zoom = np.repeat(zoom, spatial_dims, axis=1)
+        elif zoom.shape[1] == 2 and spatial_dims == 3:
+            # if 2 zoom factors provided for 3D data, use the first factor for H and W dims, second factor for D dim
+            zoom = zoom[:, [0, 0, 1]]
+        return _affine_resample(
+            img,
+            _batch_scale(spatial_dims, 1.0 / zoom),
+            img.shape[2:],
+            mode=mode or self.mode,
+            padding_mode=padding_mode or self.padding_mode,
+            align_corners=self.align_corners if align_corners is None else align_corners,
+        )
+
+
+class BatchRandFlip(RandomizableTransform):
+    """
+    Batched version of :py:class:`monai.transforms.RandFlip`: every sample of a collated batch is flipped
+    with probability `prob`, the selected samples are flipped by a single indexing operation on the device
+    of the input tensor.
+
+    Args:
+        prob: Probability of flipping every sample.
+        spatial_axis: Spatial axes along which to flip over. Default is None, to flip over all the spatial axes.
+
+    """
+
+    def __init__(self, prob: float = 0.1, spatial_axis: Optional[Union[Sequence[int], int]] = None) -> None:
+        RandomizableTransform.__init__(self, prob)
+        self.spatial_axis = spatial_axis
+        self._do_transform = np.zeros(0, dtype=bool)
+
+    def randomize(self, batch_size: int) -> None:  # type: ignore # pytype: disable=signature-mismatch
+        self._do_transform = self.R.rand(batch_size) < self.prob
+
+    def __call__(self, img: Union[np.ndarray, torch.Tensor], randomize: bool = True) -> torch.Tensor:
+        """
+        Args:
+            img: batch of channel first images, shape must be (B, C, H[, W, ..., ]).
+            randomize: whether to draw which samples are flipped, if False, the samples of the previous call
+                are flipped.
+
+        Raises:
+            ValueError: When ``randomize`` is False and the batch size differs from the previous call.
+
+        """
+        img = torch.as_tensor(img)
+        if randomize:
+            self.randomize(img.shape[0])
+        elif len(self._do_transform) != img.shape[0]:
+            raise ValueError(f"batch size {img.shape[0]} differs from the drawn parameters {len(self._do_transform)}.")
+        if not np.any(self._do_transform):
+            return img
+        axes = [a + 1 for a in ensure_tuple(map_spatial_axes(img.ndim - 1, self.spatial_axis))]
+        index = torch.as_tensor(np.nonzero(self._do_transform)[0], device=img.device)
+        out = img.clone()
+        out[index] = torch.flip(img[index], dims=axes)
+        return out
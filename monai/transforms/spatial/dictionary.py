@@ -16,16 +16,16 @@ Class names are ended with 'd' to denote dictionary-based transforms.
 """
 
 from copy import deepcopy
-from typing import Any, Dict, Hashable, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
 
 from monai.config import DtypeLike, KeysCollection
 from monai.networks.layers import AffineTransform
-from monai.networks.layers.simplelayers import GaussianFilter
 from monai.transforms.croppad.array import CenterSpatialCrop, SpatialPad
 from monai.transforms.inverse import InvertibleTransform
+from monai.transforms.lazy import LazyTransform, PendingResample
 from monai.transforms.spatial.array import (
     Affine,
     AffineGrid,
@@ -34,14 +34,15 @@ from monai.transforms.spatial.array import (
     Rand2DElastic,
     Rand3DElastic,
     RandAffine,
+    Resample,
     Resize,
     Rotate,
     Rotate90,
     Spacing,
     Zoom,
 )
-from monai.transforms.transform import MapTransform, RandomizableTransform
-from monai.transforms.utils import create_grid
+from monai.transforms.transform import KeyLocalTransform, MapTransform, RandomizableTransform, ReorderTransform
+from monai.transforms.utils import create_grid, create_translate
 from monai.utils import (
     GridSampleMode,
     GridSamplePadMode,
@@ -113,7 +114,85 @@ InterpolateModeSequence = Union[Sequence[Union[InterpolateMode, str]], Interpola
 NumpyPadModeSequence = Union[Sequence[Union[NumpyPadMode, str]], NumpyPadMode, str]
 
 
-class Spacingd(MapTransform, InvertibleTransform):
+def _centered_to_index(affine, in_shape: Sequence[int], out_shape: Sequence[int]) -> np.ndarray:
+    """
+    Convert an affine on the image-centered coordinates, as used by `Resample`, to voxel indices.
+
+    """
+    affine = np.asarray(affine.cpu() if isinstance(affine, torch.Tensor) else affine, dtype=np.float64)
+    shift = create_translate(len(in_shape), (np.asarray(in_shape) - 1) / 2)
+    shift_1 = create_translate(len(out_shape), -(np.asarray(out_shape) - 1) / 2)
+    return shift @ affine @ shift_1
+
+
+def _group_keys(d: Mapping[Hashable, Any], items: Iterable[Tuple]) -> Dict[Tuple, List[Hashable]]:
+    """
+    Group the keys of the `(key, *options)` items that can be resampled together: the arrays must have
+    the same spatial shape, data type and device, and the keys the same resampling options.
+
+    """
+    groups: Dict[Tuple, List[Hashable]] = {}
+    for key, *options in items:
+        img = d[key]
+        device = img.device if isinstance(img, torch.Tensor) else None
+        group = (tuple(img.shape[1:]), str(img.dtype), str(device), *options)
+        groups.setdefault(group, []).append(key)
+    return groups
+
+
+def _stack_apply(imgs: Sequence[Union[np.ndarray, torch.Tensor]], func: Callable) -> List:
+    """
+    Apply `func` once to the channel-wise concatenation of `imgs` and split its output back into the
+    outputs of every array. `func` must process the channels independently. If `func` returns a tuple,
+    its first item is split and the other items are copied for every array.
+
+    """
+    if len(imgs) == 1:
+        return [func(imgs[0])]
+    if all(isinstance(i, np.ndarray) for i in imgs):
+        out = func(np.concatenate(imgs))
+    else:
+        out = func(torch.cat([torch.as_tensor(i) for i in imgs]))
+    out, others = (out[0], out[1:]) if isinstance(out, tuple) else (out, None)
+    if isinstance(out, torch.Tensor):
+        outputs = list(torch.split(out, [len(i) for i in imgs]))
+    else:
+        outputs = np.split(out, np.cumsum([len(i) for i in imgs])[:-1])
+    if others is None:
+        return outputs
+    return [(o,) + deepcopy(others) for o in outputs]
+
+
+def _resample_keys(d: Dict[Hashable, Any], items: Iterable[Tuple], resampler: Resample, grid) -> None:
+    """
+    Resample the arrays of the `(key, mode, padding_mode)` items of `d` with `grid`, calling `resampler`
+    once for every group of keys that can be resampled together.
+
+    """
+    for (_, _, _, mode, padding_mode), keys in _group_keys(d, items).items():
+        outputs = _stack_apply(
+            [d[key] for key in keys], lambda img: resampler(img, grid, mode=mode, padding_mode=padding_mode)
+        )
+        d.update(zip(keys, outputs))
+
+
+def _zoom_grid_modes(
+    mode: Union[InterpolateMode, str], padding_mode: Union[NumpyPadMode, str]
+) -> Tuple[GridSampleMode, GridSamplePadMode]:
+    """
+    Closest `grid_sample` options of the interpolation and padding modes of `Zoom`.
+
+    """
+    mode = GridSampleMode.NEAREST if InterpolateMode(mode) == InterpolateMode.NEAREST else GridSampleMode.BILINEAR
+    padding_mode = NumpyPadMode(padding_mode)
+    if padding_mode == NumpyPadMode.CONSTANT:
+        return mode, GridSamplePadMode.ZEROS
+    if padding_mode in (NumpyPadMode.REFLECT, NumpyPadMode.SYMMETRIC):
+        return mode, GridSamplePadMode.REFLECTION
+    return mode, GridSamplePadMode.BORDER
+
+
+class Spacingd(MapTransform, InvertibleTransform, LazyTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Spacing`.
 
@@ -192,29 +271,69 @@ class Spacingd(MapTransform, InvertibleTransform):
     def __call__(
         self, data: Mapping[Union[Hashable, str], Dict[str, np.ndarray]]
     ) -> Dict[Union[Hashable, str], Union[np.ndarray, Dict[str, np.ndarray]]]:
+        d: Dict = dict(data)
+        items = []
+        for key, mode, padding_mode, align_corners, dtype in self.key_iterator(
+            d, self.mode, self.padding_mode, self.align_corners, self.dtype
+        ):
+            if not isinstance(d[key], torch.Tensor):
+                d[key] = np.asarray(d[key])
+            affine = d[f"{key}_{self.meta_key_postfix}"]["affine"]
+            affine = None if affine is None else np.asarray(affine)
+            items.append((key, None if affine is None else affine.tobytes(), mode, padding_mode, align_corners, dtype))
+        # the keys with the same affine, spatial shape and options are resampled together
+        for (_, _, _, _, mode, padding_mode, align_corners, dtype), keys in _group_keys(d, items).items():
+            affine = d[f"{keys[0]}_{self.meta_key_postfix}"]["affine"]
+            orig_size = d[keys[0]].shape[1:]
+            outputs = _stack_apply(
+                [d[key] for key in keys],
+                # resample the arrays using affine fetched from the meta data
+                lambda img: self.spacing_transform(
+                    data_array=img,
+                    affine=affine,
+                    mode=mode,
+                    padding_mode=padding_mode,
+                    align_corners=align_corners,
+                    dtype=dtype,
+                ),
+            )
+            for key, (d[key], old_affine, new_affine) in zip(keys, outputs):
+                meta_data_key = f"{key}_{self.meta_key_postfix}"
+                self.push_transform(
+                    d, key, extra_info={"meta_data_key": meta_data_key, "old_affine": old_affine}, orig_size=orig_size
+                )
+                # set the 'affine' key
+                d[meta_data_key]["affine"] = new_affine
+        return d
+
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
         d: Dict = dict(data)
         for key, mode, padding_mode, align_corners, dtype in self.key_iterator(
             d, self.mode, self.padding_mode, self.align_corners, self.dtype
         ):
             meta_data_key = f"{key}_{self.meta_key_postfix}"
             meta_data = d[meta_data_key]
-            # resample array of each corresponding key
-            # using affine fetched from d[affine_key]
-            d[key], old_affine, new_affine = self.spacing_transform(
-                data_array=np.asarray(d[key]),
-                affine=meta_data["affine"],
+            orig_size = pending.spatial_shape(d, key)
+            matrix, output_shape, old_affine, new_affine = self.spacing_transform.compute_matrix(
+                orig_size, affine=meta_data["affine"]
+            )
+            pending.push(
+                key,
+                matrix,
+                output_shape,
                 mode=mode,
                 padding_mode=padding_mode,
                 align_corners=align_corners,
                 dtype=dtype,
             )
-            self.push_transform(d, key, extra_info={"meta_data_key": meta_data_key, "old_affine": old_affine})
-            # set the 'affine' key
+            self.push_transform(
+                d, key, extra_info={"meta_data_key": meta_data_key, "old_affine": old_affine}, orig_size=orig_size
+            )
             meta_data["affine"] = new_affine
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key, mode, padding_mode, align_corners, dtype in self.key_iterator(
             d, self.mode, self.padding_mode, self.align_corners, self.dtype
         ):
@@ -225,13 +344,14 @@ class Spacingd(MapTransform, InvertibleTransform):
                     + "Please raise a github issue if you need this feature"
                 )
             # Create inverse transform
-            meta_data = d[transform[InverseKeys.EXTRA_INFO]["meta_data_key"]]
+            meta_data_key = transform[InverseKeys.EXTRA_INFO]["meta_data_key"]
+            meta_data = d[meta_data_key] = dict(d[meta_data_key])
             old_affine = np.array(transform[InverseKeys.EXTRA_INFO]["old_affine"])
             orig_pixdim = np.sqrt(np.sum(np.square(old_affine), 0))[:-1]
             inverse_transform = Spacing(orig_pixdim, diagonal=self.spacing_transform.diagonal)
             # Apply inverse
             d[key], _, new_affine = inverse_transform(
-                data_array=np.asarray(d[key]),
+                data_array=d[key] if isinstance(d[key], torch.Tensor) else np.asarray(d[key]),
                 affine=meta_data["affine"],
                 mode=mode,
                 padding_mode=padding_mode,
@@ -245,7 +365,7 @@ class Spacingd(MapTransform, InvertibleTransform):
         return d
 
 
-class Orientationd(MapTransform, InvertibleTransform):
+class Orientationd(MapTransform, InvertibleTransform, LazyTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Orientation`.
 
@@ -302,17 +422,38 @@ class Orientationd(MapTransform, InvertibleTransform):
         for key in self.key_iterator(d):
             meta_data_key = f"{key}_{self.meta_key_postfix}"
             meta_data = d[meta_data_key]
+            orig_size = d[key].shape[1:]
             d[key], old_affine, new_affine = self.ornt_transform(d[key], affine=meta_data["affine"])
-            self.push_transform(d, key, extra_info={"meta_data_key": meta_data_key, "old_affine": old_affine})
+            self.push_transform(
+                d, key, extra_info={"meta_data_key": meta_data_key, "old_affine": old_affine}, orig_size=orig_size
+            )
             d[meta_data_key]["affine"] = new_affine
         return d
 
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
+        d: Dict = dict(data)
+        for key in self.key_iterator(d):
+            meta_data_key = f"{key}_{self.meta_key_postfix}"
+            meta_data = d[meta_data_key]
+            orig_size = pending.spatial_shape(d, key)
+            matrix, output_shape, old_affine, new_affine = self.ornt_transform.compute_matrix(
+                orig_size, affine=meta_data["affine"]
+            )
+            # reorienting only permutes the voxels, the most recent interpolation mode is kept
+            pending.push(key, matrix, output_shape)
+            self.push_transform(
+                d, key, extra_info={"meta_data_key": meta_data_key, "old_affine": old_affine}, orig_size=orig_size
+            )
+            meta_data["affine"] = new_affine
+        return d
+
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
             # Create inverse transform
-            meta_data = d[transform[InverseKeys.EXTRA_INFO]["meta_data_key"]]
+            meta_data_key = transform[InverseKeys.EXTRA_INFO]["meta_data_key"]
+            meta_data = d[meta_data_key] = dict(d[meta_data_key])
             orig_affine = transform[InverseKeys.EXTRA_INFO]["old_affine"]
             orig_axcodes = nib.orientations.aff2axcodes(orig_affine)
             inverse_transform = Orientation(
@@ -329,7 +470,7 @@ class Orientationd(MapTransform, InvertibleTransform):
         return d
 
 
-class Rotate90d(MapTransform, InvertibleTransform):
+class Rotate90d(MapTransform, InvertibleTransform, ReorderTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Rotate90`.
     """
@@ -355,7 +496,7 @@ class Rotate90d(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             _ = self.get_most_recent_transform(d, key)
             # Create inverse transform
@@ -374,7 +515,7 @@ class Rotate90d(MapTransform, InvertibleTransform):
         return d
 
 
-class RandRotate90d(RandomizableTransform, MapTransform, InvertibleTransform):
+class RandRotate90d(RandomizableTransform, MapTransform, InvertibleTransform, ReorderTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandRotate90`.
     With probability `prob`, input arrays are rotated by 90 degrees
@@ -425,7 +566,7 @@ class RandRotate90d(RandomizableTransform, MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
             # Check if random transform was actually performed (based on `prob`)
@@ -445,7 +586,7 @@ class RandRotate90d(RandomizableTransform, MapTransform, InvertibleTransform):
         return d
 
 
-class Resized(MapTransform, InvertibleTransform):
+class Resized(MapTransform, InvertibleTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Resize`.
 
@@ -488,7 +629,7 @@ class Resized(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key, mode, align_corners in self.key_iterator(d, self.mode, self.align_corners):
             transform = self.get_most_recent_transform(d, key)
             orig_size = transform[InverseKeys.ORIG_SIZE]
@@ -502,7 +643,7 @@ class Resized(MapTransform, InvertibleTransform):
         return d
 
 
-class Affined(MapTransform, InvertibleTransform):
+class Affined(MapTransform, InvertibleTransform, LazyTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Affine`.
     """
@@ -576,8 +717,28 @@ class Affined(MapTransform, InvertibleTransform):
             self.push_transform(d, key, orig_size=orig_size, extra_info={"affine": affine})
         return d
 
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
+        d = dict(data)
+        for key, mode, padding_mode in self.key_iterator(d, self.mode, self.padding_mode):
+            orig_size = pending.spatial_shape(d, key)
+            sp_size = fall_back_tuple(self.affine.spatial_size, orig_size)
+            affine = self.affine.affine_grid.compute_affine(len(orig_size))
+            affine = torch.as_tensor(np.ascontiguousarray(affine), device=self.affine.affine_grid.device)
+            pending.push(
+                key,
+                _centered_to_index(affine, orig_size, sp_size),
+                sp_size,
+                mode=mode,
+                padding_mode=padding_mode,
+                align_corners=True,
+                as_tensor_output=self.affine.resampler.as_tensor_output,
+                device=self.affine.resampler.device,
+            )
+            self.push_transform(d, key, orig_size=orig_size, extra_info={"affine": affine})
+        return d
+
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
 
         for key, mode, padding_mode in self.key_iterator(d, self.mode, self.padding_mode):
             transform = self.get_most_recent_transform(d, key)
@@ -601,7 +762,7 @@ class Affined(MapTransform, InvertibleTransform):
         return d
 
 
-class RandAffined(RandomizableTransform, MapTransform, InvertibleTransform):
+class RandAffined(RandomizableTransform, MapTransform, InvertibleTransform, LazyTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.RandAffine`.
     """
@@ -700,13 +861,39 @@ class RandAffined(RandomizableTransform, MapTransform, InvertibleTransform):
             # to be consistent with the self._do_transform case (dtype and device)
             affine = torch.as_tensor(np.eye(len(sp_size) + 1), device=self.rand_affine.rand_affine_grid.device)
 
-        for key, mode, padding_mode in self.key_iterator(d, self.mode, self.padding_mode):
+        items = list(self.key_iterator(d, self.mode, self.padding_mode))
+        for key, *_ in items:
             self.push_transform(d, key, extra_info={"affine": affine})
-            d[key] = self.rand_affine.resampler(d[key], grid, mode=mode, padding_mode=padding_mode)
+        _resample_keys(d, items, self.rand_affine.resampler, grid)
+        return d
+
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
+        d = dict(data)
+        self.randomize()
+
+        sp_size = fall_back_tuple(self.rand_affine.spatial_size, pending.spatial_shape(d, self.keys[0]))
+        if self._do_transform:
+            affine = self.rand_affine.rand_affine_grid.compute_affine(len(sp_size))
+        else:
+            affine = torch.as_tensor(np.eye(len(sp_size) + 1), device=self.rand_affine.rand_affine_grid.device)
+
+        for key, mode, padding_mode in self.key_iterator(d, self.mode, self.padding_mode):
+            orig_size = pending.spatial_shape(d, key)
+            pending.push(
+                key,
+                _centered_to_index(affine, orig_size, sp_size),
+                sp_size,
+                mode=mode,
+                padding_mode=padding_mode,
+                align_corners=True,
+                as_tensor_output=self.rand_affine.resampler.as_tensor_output,
+                device=self.rand_affine.resampler.device,
+            )
+            self.push_transform(d, key, extra_info={"affine": affine}, orig_size=orig_size)
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
 
         for key, mode, padding_mode in self.key_iterator(d, self.mode, self.padding_mode):
             transform = self.get_most_recent_transform(d, key)
@@ -730,7 +917,7 @@ class RandAffined(RandomizableTransform, MapTransform, InvertibleTransform):
         return d
 
 
-class Rand2DElasticd(RandomizableTransform, MapTransform):
+class Rand2DElasticd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Rand2DElastic`.
     """
@@ -844,12 +1031,11 @@ class Rand2DElasticd(RandomizableTransform, MapTransform):
         else:
             grid = create_grid(spatial_size=sp_size)
 
-        for key, mode, padding_mode in self.key_iterator(d, self.mode, self.padding_mode):
-            d[key] = self.rand_2d_elastic.resampler(d[key], grid, mode=mode, padding_mode=padding_mode)
+        _resample_keys(d, self.key_iterator(d, self.mode, self.padding_mode), self.rand_2d_elastic.resampler, grid)
         return d
 
 
-class Rand3DElasticd(RandomizableTransform, MapTransform):
+class Rand3DElasticd(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Rand3DElastic`.
     """
@@ -870,6 +1056,7 @@ class Rand3DElasticd(RandomizableTransform, MapTransform):
         as_tensor_output: bool = False,
         device: Optional[torch.device] = None,
         allow_missing_keys: bool = False,
+        control_spacing: Optional[Union[Sequence[int], int]] = None,
     ) -> None:
         """
         Args:
@@ -909,6 +1096,9 @@ class Rand3DElasticd(RandomizableTransform, MapTransform):
                 whether to convert it back to numpy arrays.
             device: device on which the tensor will be allocated.
             allow_missing_keys: don't raise exception if key is missing.
+            control_spacing: if not None, the random offsets are drawn on a coarse grid of control points
+                spaced by about `control_spacing` voxels, smoothed and upsampled to `spatial_size`.
+                See also: :py:class:`monai.transforms.Rand3DElastic`.
 
         See also:
             - :py:class:`RandAffineGrid` for the random affine parameters configurations.
@@ -927,6 +1117,7 @@ class Rand3DElasticd(RandomizableTransform, MapTransform):
             spatial_size=spatial_size,
             as_tensor_output=as_tensor_output,
             device=device,
+            control_spacing=control_spacing,
         )
         self.mode = ensure_tuple_rep(mode, len(self.keys))
         self.padding_mode = ensure_tuple_rep(padding_mode, len(self.keys))
@@ -951,19 +1142,15 @@ class Rand3DElasticd(RandomizableTransform, MapTransform):
         self.randomize(grid_size=sp_size)
         grid = create_grid(spatial_size=sp_size)
         if self._do_transform:
-            device = self.rand_3d_elastic.device
-            grid = torch.tensor(grid).to(device)
-            gaussian = GaussianFilter(spatial_dims=3, sigma=self.rand_3d_elastic.sigma, truncated=3.0).to(device)
-            offset = torch.tensor(self.rand_3d_elastic.rand_offset, device=device).unsqueeze(0)
-            grid[:3] += gaussian(offset)[0] * self.rand_3d_elastic.magnitude
+            grid = torch.tensor(grid).to(self.rand_3d_elastic.device)
+            grid[:3] += self.rand_3d_elastic.compute_offset(sp_size)
             grid = self.rand_3d_elastic.rand_affine_grid(grid=grid)
 
-        for key, mode, padding_mode in self.key_iterator(d, self.mode, self.padding_mode):
-            d[key] = self.rand_3d_elastic.resampler(d[key], grid, mode=mode, padding_mode=padding_mode)
+        _resample_keys(d, self.key_iterator(d, self.mode, self.padding_mode), self.rand_3d_elastic.resampler, grid)
         return d
 
 
-class Flipd(MapTransform, InvertibleTransform):
+class Flipd(MapTransform, InvertibleTransform, ReorderTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Flip`.
 
@@ -993,7 +1180,7 @@ class Flipd(MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             _ = self.get_most_recent_transform(d, key)
             # Might need to convert to numpy
@@ -1007,7 +1194,7 @@ class Flipd(MapTransform, InvertibleTransform):
         return d
 
 
-class RandFlipd(RandomizableTransform, MapTransform, InvertibleTransform):
+class RandFlipd(RandomizableTransform, MapTransform, InvertibleTransform, ReorderTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandFlip`.
 
@@ -1044,7 +1231,7 @@ class RandFlipd(RandomizableTransform, MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
             # Check if random transform was actually performed (based on `prob`)
@@ -1059,7 +1246,7 @@ class RandFlipd(RandomizableTransform, MapTransform, InvertibleTransform):
         return d
 
 
-class RandAxisFlipd(RandomizableTransform, MapTransform, InvertibleTransform):
+class RandAxisFlipd(RandomizableTransform, MapTransform, InvertibleTransform, ReorderTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandAxisFlip`.
 
@@ -1094,7 +1281,7 @@ class RandAxisFlipd(RandomizableTransform, MapTransform, InvertibleTransform):
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key in self.key_iterator(d):
             transform = self.get_most_recent_transform(d, key)
             # Check if random transform was actually performed (based on `prob`)
@@ -1110,7 +1297,7 @@ class RandAxisFlipd(RandomizableTransform, MapTransform, InvertibleTransform):
         return d
 
 
-class Rotated(MapTransform, InvertibleTransform):
+class Rotated(MapTransform, InvertibleTransform, LazyTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Rotate`.
 
@@ -1158,24 +1345,47 @@ class Rotated(MapTransform, InvertibleTransform):
         self.dtype = ensure_tuple_rep(dtype, len(self.keys))
 
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
+        d = dict(data)
+        items = self.key_iterator(d, self.mode, self.padding_mode, self.align_corners, self.dtype)
+        # the keys with the same spatial shape and options are rotated together
+        for (orig_size, _, _, mode, padding_mode, align_corners, dtype), keys in _group_keys(d, items).items():
+            outputs = _stack_apply(
+                [d[key] for key in keys],
+                lambda img: self.rotator(
+                    img,
+                    mode=mode,
+                    padding_mode=padding_mode,
+                    align_corners=align_corners,
+                    dtype=dtype,
+                ),
+            )
+            rot_mat = self.rotator.get_rotation_matrix()
+            for key, out in zip(keys, outputs):
+                d[key] = out
+                self.push_transform(d, key, orig_size=orig_size, extra_info={"rot_mat": rot_mat})
+        return d
+
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
         d = dict(data)
         for key, mode, padding_mode, align_corners, dtype in self.key_iterator(
             d, self.mode, self.padding_mode, self.align_corners, self.dtype
         ):
-            orig_size = d[key].shape[1:]
-            d[key] = self.rotator(
-                d[key],
+            orig_size = pending.spatial_shape(d, key)
+            rot_mat, output_shape = self.rotator.compute_matrix(orig_size)
+            pending.push(
+                key,
+                rot_mat,
+                output_shape,
                 mode=mode,
                 padding_mode=padding_mode,
                 align_corners=align_corners,
                 dtype=dtype,
             )
-            rot_mat = self.rotator.get_rotation_matrix()
             self.push_transform(d, key, orig_size=orig_size, extra_info={"rot_mat": rot_mat})
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key, mode, padding_mode, align_corners, dtype in self.key_iterator(
             d, self.mode, self.padding_mode, self.align_corners, self.dtype
         ):
@@ -1203,7 +1413,7 @@ class Rotated(MapTransform, InvertibleTransform):
         return d
 
 
-class RandRotated(RandomizableTransform, MapTransform, InvertibleTransform):
+class RandRotated(RandomizableTransform, MapTransform, InvertibleTransform, LazyTransform, KeyLocalTransform):
     """
     Dictionary-based version :py:class:`monai.transforms.RandRotate`
     Randomly rotates the input arrays.
@@ -1292,23 +1502,55 @@ class RandRotated(RandomizableTransform, MapTransform, InvertibleTransform):
             angle=angle,
             keep_size=self.keep_size,
         )
+        items = self.key_iterator(d, self.mode, self.padding_mode, self.align_corners, self.dtype)
+        # the keys with the same spatial shape and options are rotated together
+        for (orig_size, _, _, mode, padding_mode, align_corners, dtype), keys in _group_keys(d, items).items():
+            outputs = _stack_apply(
+                [d[key] for key in keys],
+                lambda img: rotator(
+                    img,
+                    mode=mode,
+                    padding_mode=padding_mode,
+                    align_corners=align_corners,
+                    dtype=dtype,
+                ),
+            )
+            rot_mat = rotator.get_rotation_matrix()
+            for key, out in zip(keys, outputs):
+                d[key] = out
+                self.push_transform(d, key, orig_size=orig_size, extra_info={"rot_mat": rot_mat})
+        return d
+
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
+        self.randomize()
+        d = dict(data)
+        if not self._do_transform:
+            for key in self.keys:
+                orig_size = pending.spatial_shape(d, key)
+                self.push_transform(d, key, extra_info={"rot_mat": np.eye(len(orig_size) + 1)}, orig_size=orig_size)
+            return d
+        ndim = len(pending.spatial_shape(d, self.keys[0]))
+        angle: Union[Sequence[float], float] = self.x if ndim == 2 else (self.x, self.y, self.z)
+        rotator = Rotate(angle=angle, keep_size=self.keep_size)
         for key, mode, padding_mode, align_corners, dtype in self.key_iterator(
             d, self.mode, self.padding_mode, self.align_corners, self.dtype
         ):
-            orig_size = d[key].shape[1:]
-            d[key] = rotator(
-                d[key],
+            orig_size = pending.spatial_shape(d, key)
+            rot_mat, output_shape = rotator.compute_matrix(orig_size)
+            pending.push(
+                key,
+                rot_mat,
+                output_shape,
                 mode=mode,
                 padding_mode=padding_mode,
                 align_corners=align_corners,
                 dtype=dtype,
             )
-            rot_mat = rotator.get_rotation_matrix()
             self.push_transform(d, key, orig_size=orig_size, extra_info={"rot_mat": rot_mat})
         return d
 
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key, mode, padding_mode, align_corners, dtype in self.key_iterator(
             d, self.mode, self.padding_mode, self.align_corners, self.dtype
         ):
@@ -1338,7 +1580,7 @@ class RandRotated(RandomizableTransform, MapTransform, InvertibleTransform):
         return d
 
 
-class Zoomd(MapTransform, InvertibleTransform):
+class Zoomd(MapTransform, InvertibleTransform, LazyTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Zoom`.
 
@@ -1393,8 +1635,20 @@ class Zoomd(MapTransform, InvertibleTransform):
             )
         return d
 
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
+        d = dict(data)
+        for key, mode, padding_mode, align_corners in self.key_iterator(
+            d, self.mode, self.padding_mode, self.align_corners
+        ):
+            orig_size = pending.spatial_shape(d, key)
+            self.push_transform(d, key, orig_size=orig_size)
+            matrix, output_shape = self.zoomer.compute_matrix(orig_size, align_corners=align_corners)
+            grid_mode, grid_padding_mode = _zoom_grid_modes(mode, padding_mode)
+            pending.push(key, matrix, output_shape, mode=grid_mode, padding_mode=grid_padding_mode)
+        return d
+
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key, mode, padding_mode, align_corners in self.key_iterator(
             d, self.mode, self.padding_mode, self.align_corners
         ):
@@ -1417,7 +1671,7 @@ class Zoomd(MapTransform, InvertibleTransform):
         return d
 
 
-class RandZoomd(RandomizableTransform, MapTransform, InvertibleTransform):
+class RandZoomd(RandomizableTransform, MapTransform, InvertibleTransform, LazyTransform, KeyLocalTransform):
     """
     Dict-based version :py:class:`monai.transforms.RandZoom`.
 
@@ -1506,8 +1760,29 @@ class RandZoomd(RandomizableTransform, MapTransform, InvertibleTransform):
                 )
         return d
 
+    def lazy_call(self, data: Mapping[Hashable, Any], pending: PendingResample) -> Dict[Hashable, Any]:
+        self.randomize()
+        d = dict(data)
+
+        img_dims = len(pending.spatial_shape(d, self.keys[0])) + 1
+        if len(self._zoom) == 1:
+            self._zoom = ensure_tuple_rep(self._zoom[0], img_dims - 1)
+        elif len(self._zoom) == 2 and img_dims > 3:
+            self._zoom = ensure_tuple_rep(self._zoom[0], img_dims - 2) + ensure_tuple(self._zoom[-1])
+        zoomer = Zoom(self._zoom, keep_size=self.keep_size)
+        for key, mode, padding_mode, align_corners in self.key_iterator(
+            d, self.mode, self.padding_mode, self.align_corners
+        ):
+            orig_size = pending.spatial_shape(d, key)
+            self.push_transform(d, key, extra_info={"zoom": self._zoom}, orig_size=orig_size)
+            if self._do_transform:
+                matrix, output_shape = zoomer.compute_matrix(orig_size, align_corners=align_corners)
+                grid_mode, grid_padding_mode = _zoom_grid_modes(mode, padding_mode)
+                pending.push(key, matrix, output_shape, mode=grid_mode, padding_mode=grid_padding_mode)
+        return d
+
     def inverse(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
-        d = deepcopy(dict(data))
+        d = dict(data)
         for key, mode, padding_mode, align_corners in self.key_iterator(
             d, self.mode, self.padding_mode, self.align_corners
         ):
@@ -13,16 +13,27 @@ A collection of generic interfaces for MONAI transforms.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Generator, Hashable, Iterable, List, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, Generator, Hashable, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 import torch
 
 from monai import transforms
 from monai.config import KeysCollection
-from monai.utils import MAX_SEED, ensure_tuple
+from monai.utils import MAX_SEED, TransformProfiler, ensure_tuple
+from monai.utils.enums import InverseKeys
 
-__all__ = ["apply_transform", "Randomizable", "RandomizableTransform", "Transform", "MapTransform"]
+__all__ = [
+    "apply_transform",
+    "Randomizable",
+    "RandomizableTransform",
+    "Transform",
+    "MapTransform",
+    "KeyLocalTransform",
+    "OrderInvariantTransform",
+    "ReorderTransform",
+]
 
 
 def apply_transform(transform: Callable, data, map_items: bool = True):
@@ -38,14 +49,18 @@ def apply_transform(transform: Callable, data, map_items: bool = True):
         map_items: whether to apply transform to each item in `data`,
             if `data` is a list or tuple. Defaults to True.
 
+    If a :py:class:`monai.utils.TransformProfiler` is active in the current thread, the call is recorded.
+
     Raises:
         Exception: When ``transform`` raises an exception.
 
     """
+    profiler = TransformProfiler.active()
+    _transform = transform if profiler is None else partial(profiler.call, transform)
     try:
         if isinstance(data, (list, tuple)) and map_items:
-            return [transform(item) for item in data]
-        return transform(data)
+            return [_transform(item) for item in data]
+        return _transform(data)
     except Exception as e:
 
         if not isinstance(transform, transforms.compose.Compose):
@@ -175,6 +190,22 @@ class Transform(ABC):
         """
         raise NotImplementedError(f"Subclass {self.__class__.__name__} must implement this method.")
 
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        """
+        The keys of the input dictionary read by the transform, None if unknown (the transform may read any item).
+        It's used by :py:meth:`monai.transforms.Compose.cache_split` to find the transforms which commute.
+
+        """
+        return None
+
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        """
+        The keys of the output dictionary added, changed or removed by the transform,
+        None if unknown (the transform may change any item).
+
+        """
+        return None
+
 
 class RandomizableTransform(Randomizable, Transform):
     """
@@ -299,3 +330,71 @@ class MapTransform(Transform):
             # if missing keys not allowed, raise
             elif not self.allow_missing_keys:
                 raise KeyError(f"Key was missing ({key}) and allow_missing_keys==False")
+
+    def _item_keys(self) -> Set[Hashable]:
+        """
+        The `keys`, the keys of their meta data if the transform has a `meta_key_postfix`,
+        and the keys of their applied transforms if the transform is invertible.
+
+        """
+        item_keys = set(self.keys)
+        meta_key_postfix = getattr(self, "meta_key_postfix", None)
+        for key in self.keys:
+            if meta_key_postfix is not None:
+                item_keys.add(f"{key}_{meta_key_postfix}")
+            if isinstance(self, transforms.inverse.InvertibleTransform):
+                item_keys.add(str(key) + InverseKeys.KEY_SUFFIX)
+        return item_keys
+
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        """
+        The keys read by the transform. For a :py:class:`KeyLocalTransform`, the `keys`, with their meta data
+        and applied transforms keys, otherwise None (unknown). The transforms which read other items must extend it.
+
+        """
+        return self._item_keys() if isinstance(self, KeyLocalTransform) else None
+
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        """
+        The keys written by the transform. For a :py:class:`KeyLocalTransform`, the `keys`, with their meta data
+        and applied transforms keys, otherwise None (unknown). The transforms which write other items must extend it.
+
+        """
+        return self._item_keys() if isinstance(self, KeyLocalTransform) else None
+
+
+class KeyLocalTransform(Transform):
+    """
+    Marker of the dictionary transforms which only read and write the items of their `keys`, with their meta data
+    and applied transforms items, see :py:meth:`MapTransform.read_keys`. The other dictionary transforms,
+    for example `Lambdad` whose function may read any item, are never reordered by
+    :py:meth:`monai.transforms.Compose.cache_split`.
+
+    """
+
+
+class OrderInvariantTransform(Transform):
+    """
+    Marker of the transforms which map the values of the arrays independently of the order of their voxels,
+    i.e. reordering the voxels of the input reorders the voxels of the output the same way, for example
+    casting, thresholding or scaling the intensity with global statistics.
+    They commute with the :py:class:`ReorderTransform` on the same keys.
+
+    """
+
+    def order_invariant(self) -> bool:
+        """
+        Whether the instance is order invariant. The transforms whose parameters can depend on the position
+        of the voxels, for example a voxelwise subtrahend, must override it.
+
+        """
+        return True
+
+
+class ReorderTransform(Transform):
+    """
+    Marker of the transforms which only reorder the voxels of the spatial dimensions of the arrays,
+    for example flips and rotations by 90 degrees.
+    They commute with the :py:class:`OrderInvariantTransform` on the same keys.
+
+    """
@@ -22,8 +22,13 @@ import numpy as np
 import torch
 
 from monai.config import DtypeLike, NdarrayTensor
-from monai.transforms.transform import RandomizableTransform, Transform
-from monai.transforms.utils import extreme_points_to_image, get_extreme_points, map_binary_to_indices
+from monai.transforms.transform import OrderInvariantTransform, RandomizableTransform, Transform
+from monai.transforms.utils import (
+    RunLengthIndices,
+    extreme_points_to_image,
+    get_extreme_points,
+    map_binary_to_indices,
+)
 from monai.utils import ensure_tuple, min_version, optional_import
 
 if TYPE_CHECKING:
@@ -264,7 +269,7 @@ class SplitChannel(Transform):
         return outputs
 
 
-class CastToType(Transform):
+class CastToType(OrderInvariantTransform):
     """
     Cast the Numpy data to specified numpy data type, or cast the PyTorch Tensor to
     specified PyTorch data type.
@@ -297,7 +302,7 @@ class CastToType(Transform):
         raise TypeError(f"img must be one of (numpy.ndarray, torch.Tensor) but is {type(img).__name__}.")
 
 
-class ToTensor(Transform):
+class ToTensor(OrderInvariantTransform):
     """
     Converts the input image to a tensor without applying any other transformations.
     """
@@ -311,7 +316,7 @@ class ToTensor(Transform):
         return torch.as_tensor(np.ascontiguousarray(img))
 
 
-class ToNumpy(Transform):
+class ToNumpy(OrderInvariantTransform):
     """
     Converts the input data to numpy array, can support list or tuple of numbers and PyTorch Tensor.
     """
@@ -607,7 +612,9 @@ class LabelToMask(Transform):
 
 
 class FgBgToIndices(Transform):
-    def __init__(self, image_threshold: float = 0.0, output_shape: Optional[Sequence[int]] = None) -> None:
+    def __init__(
+        self, image_threshold: float = 0.0, output_shape: Optional[Sequence[int]] = None, compact: bool = False
+    ) -> None:
         """
         Compute foreground and background of the input label data, return the indices.
         If no output_shape specified, output data will be 1 dim indices after flattening.
@@ -619,17 +626,26 @@ class FgBgToIndices(Transform):
             image_threshold: if enabled `image` at runtime, use ``image > image_threshold`` to
                 determine the valid image content area and select background only in this area.
             output_shape: expected shape of output indices. if not None, unravel indices to specified shape.
+            compact: whether to output the indices as :py:class:`monai.transforms.utils.RunLengthIndices`,
+                which are much smaller for the masks of connected regions, to cache them. can't be used
+                together with `output_shape`.
+
+        Raises:
+            ValueError: When ``compact=True`` and ``output_shape`` is not None.
 
         """
+        if compact and output_shape is not None:
+            raise ValueError("compact indices can't be unraveled to output_shape.")
         self.image_threshold = image_threshold
         self.output_shape = output_shape
+        self.compact = compact
 
     def __call__(
         self,
         label: np.ndarray,
         image: Optional[np.ndarray] = None,
         output_shape: Optional[Sequence[int]] = None,
-    ) -> Tuple[np.ndarray, np.ndarray]:
+    ) -> Tuple[Union[np.ndarray, RunLengthIndices], Union[np.ndarray, RunLengthIndices]]:
         """
         Args:
             label: input data to compute foreground and background indices.
@@ -637,10 +653,15 @@ class FgBgToIndices(Transform):
                 to define background. so the output items will not map to all the voxels in the label.
             output_shape: expected shape of output indices. if None, use `self.output_shape` instead.
 
+        Raises:
+            ValueError: When ``self.compact=True`` and ``output_shape`` is not None.
+
         """
         if output_shape is None:
             output_shape = self.output_shape
-        fg_indices, bg_indices = map_binary_to_indices(label, image, self.image_threshold)
+        if self.compact and output_shape is not None:
+            raise ValueError("compact indices can't be unraveled to output_shape.")
+        fg_indices, bg_indices = map_binary_to_indices(label, image, self.image_threshold, self.compact)
         if output_shape is not None:
             fg_indices = np.stack([np.unravel_index(i, output_shape) for i in fg_indices])
             bg_indices = np.stack([np.unravel_index(i, output_shape) for i in bg_indices])
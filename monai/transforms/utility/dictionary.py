@@ -17,13 +17,13 @@ Class names are ended with 'd' to denote dictionary-based transforms.
 
 import copy
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 import torch
 
 from monai.config import DtypeLike, KeysCollection, NdarrayTensor
-from monai.transforms.transform import MapTransform, RandomizableTransform
+from monai.transforms.transform import KeyLocalTransform, MapTransform, OrderInvariantTransform, RandomizableTransform
 from monai.transforms.utility.array import (
     AddChannel,
     AsChannelFirst,
@@ -136,7 +136,7 @@ __all__ = [
 ]
 
 
-class Identityd(MapTransform):
+class Identityd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Identity`.
     """
@@ -161,7 +161,7 @@ class Identityd(MapTransform):
         return d
 
 
-class AsChannelFirstd(MapTransform):
+class AsChannelFirstd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.AsChannelFirst`.
     """
@@ -184,7 +184,7 @@ class AsChannelFirstd(MapTransform):
         return d
 
 
-class AsChannelLastd(MapTransform):
+class AsChannelLastd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.AsChannelLast`.
     """
@@ -207,7 +207,7 @@ class AsChannelLastd(MapTransform):
         return d
 
 
-class AddChanneld(MapTransform):
+class AddChanneld(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.AddChannel`.
     """
@@ -229,7 +229,7 @@ class AddChanneld(MapTransform):
         return d
 
 
-class EnsureChannelFirstd(MapTransform):
+class EnsureChannelFirstd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.EnsureChannelFirst`.
     """
@@ -255,7 +255,7 @@ class EnsureChannelFirstd(MapTransform):
         return d
 
 
-class RepeatChanneld(MapTransform):
+class RepeatChanneld(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.RepeatChannel`.
     """
@@ -278,7 +278,7 @@ class RepeatChanneld(MapTransform):
         return d
 
 
-class RemoveRepeatedChanneld(MapTransform):
+class RemoveRepeatedChanneld(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.RemoveRepeatedChannel`.
     """
@@ -301,7 +301,7 @@ class RemoveRepeatedChanneld(MapTransform):
         return d
 
 
-class SplitChanneld(MapTransform):
+class SplitChanneld(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.SplitChannel`.
     All the input specified by `keys` should be split into same count of data.
@@ -334,6 +334,9 @@ class SplitChanneld(MapTransform):
         self.output_postfixes = output_postfixes
         self.splitter = SplitChannel(channel_dim=channel_dim)
 
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        return None  # the keys of the outputs depend on the number of channels
+
     def __call__(
         self, data: Mapping[Hashable, Union[np.ndarray, torch.Tensor]]
     ) -> Dict[Hashable, Union[np.ndarray, torch.Tensor]]:
@@ -351,7 +354,7 @@ class SplitChanneld(MapTransform):
         return d
 
 
-class CastToTyped(MapTransform):
+class CastToTyped(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.CastToType`.
     """
@@ -386,7 +389,7 @@ class CastToTyped(MapTransform):
         return d
 
 
-class ToTensord(MapTransform):
+class ToTensord(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ToTensor`.
     """
@@ -410,7 +413,7 @@ class ToTensord(MapTransform):
         return d
 
 
-class ToNumpyd(MapTransform):
+class ToNumpyd(MapTransform, OrderInvariantTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ToNumpy`.
     """
@@ -434,7 +437,7 @@ class ToNumpyd(MapTransform):
         return d
 
 
-class ToPILd(MapTransform):
+class ToPILd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ToNumpy`.
     """
@@ -458,7 +461,7 @@ class ToPILd(MapTransform):
         return d
 
 
-class DeleteItemsd(MapTransform):
+class DeleteItemsd(MapTransform, KeyLocalTransform):
     """
     Delete specified items from data dictionary to release memory.
     It will remove the key-values and copy the others to construct a new dictionary.
@@ -468,18 +471,21 @@ class DeleteItemsd(MapTransform):
         return {key: val for key, val in data.items() if key not in self.key_iterator(data)}
 
 
-class SelectItemsd(MapTransform):
+class SelectItemsd(MapTransform, KeyLocalTransform):
     """
     Select only specified items from data dictionary to release memory.
     It will copy the selected key-values and construct and new dictionary.
     """
 
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        return None  # all the other items are removed
+
     def __call__(self, data):
         result = {key: data[key] for key in self.key_iterator(data)}
         return result
 
 
-class SqueezeDimd(MapTransform):
+class SqueezeDimd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.SqueezeDim`.
     """
@@ -502,7 +508,7 @@ class SqueezeDimd(MapTransform):
         return d
 
 
-class DataStatsd(MapTransform):
+class DataStatsd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.DataStats`.
     """
@@ -570,7 +576,7 @@ class DataStatsd(MapTransform):
         return d
 
 
-class SimulateDelayd(MapTransform):
+class SimulateDelayd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.SimulateDelay`.
     """
@@ -598,7 +604,7 @@ class SimulateDelayd(MapTransform):
         return d
 
 
-class CopyItemsd(MapTransform):
+class CopyItemsd(MapTransform, KeyLocalTransform):
     """
     Copy specified items from data dictionary and save with different key names.
     It can copy several items together and copy several times.
@@ -636,6 +642,9 @@ class CopyItemsd(MapTransform):
             )
         self.names = names
 
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        return set(self.names)
+
     def __call__(self, data):
         """
         Raises:
@@ -654,7 +663,7 @@ class CopyItemsd(MapTransform):
         return d
 
 
-class ConcatItemsd(MapTransform):
+class ConcatItemsd(MapTransform, KeyLocalTransform):
     """
     Concatenate specified items from data dictionary together on the first dim to construct a big array.
     Expect all the items are numpy array or PyTorch Tensor.
@@ -678,6 +687,9 @@ class ConcatItemsd(MapTransform):
         self.name = name
         self.dim = dim
 
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        return {self.name}
+
     def __call__(self, data):
         """
         Raises:
@@ -769,7 +781,7 @@ class RandLambdad(Lambdad, RandomizableTransform):
         pass
 
 
-class LabelToMaskd(MapTransform):
+class LabelToMaskd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.LabelToMask`.
 
@@ -819,6 +831,8 @@ class FgBgToIndicesd(MapTransform):
         image_threshold: if enabled image_key, use ``image > image_threshold`` to determine
             the valid image content area and select background only in this area.
         output_shape: expected shape of output indices. if not None, unravel indices to specified shape.
+        compact: whether to save the indices as :py:class:`monai.transforms.utils.RunLengthIndices`,
+            which are much smaller for the masks of connected regions, for example in ``CacheDataset``.
         allow_missing_keys: don't raise exception if key is missing.
 
     """
@@ -831,13 +845,20 @@ class FgBgToIndicesd(MapTransform):
         image_key: Optional[str] = None,
         image_threshold: float = 0.0,
         output_shape: Optional[Sequence[int]] = None,
+        compact: bool = False,
         allow_missing_keys: bool = False,
     ) -> None:
         super().__init__(keys, allow_missing_keys)
         self.fg_postfix = fg_postfix
         self.bg_postfix = bg_postfix
         self.image_key = image_key
-        self.converter = FgBgToIndices(image_threshold, output_shape)
+        self.converter = FgBgToIndices(image_threshold, output_shape, compact)
+
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        return set(self.keys) if self.image_key is None else set(self.keys) | {self.image_key}
+
+    def write_keys(self) -> Optional[Set[Hashable]]:
+        return {str(key) + postfix for key in self.keys for postfix in (self.fg_postfix, self.bg_postfix)}
 
     def __call__(self, data: Mapping[Hashable, np.ndarray]) -> Dict[Hashable, np.ndarray]:
         d = dict(data)
@@ -848,7 +869,7 @@ class FgBgToIndicesd(MapTransform):
         return d
 
 
-class ConvertToMultiChannelBasedOnBratsClassesd(MapTransform):
+class ConvertToMultiChannelBasedOnBratsClassesd(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.ConvertToMultiChannelBasedOnBratsClasses`.
     Convert labels to multi channels based on brats18 classes:
@@ -870,7 +891,7 @@ class ConvertToMultiChannelBasedOnBratsClassesd(MapTransform):
         return d
 
 
-class AddExtremePointsChanneld(RandomizableTransform, MapTransform):
+class AddExtremePointsChanneld(RandomizableTransform, MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.AddExtremePointsChannel`.
 
@@ -912,6 +933,9 @@ class AddExtremePointsChanneld(RandomizableTransform, MapTransform):
     def randomize(self, label: np.ndarray) -> None:
         self.points = get_extreme_points(label, rand_state=self.R, background=self.background, pert=self.pert)
 
+    def read_keys(self) -> Optional[Set[Hashable]]:
+        return super().read_keys() | {self.label_key}  # type: ignore
+
     def __call__(self, data):
         d = dict(data)
         label = d[self.label_key]
@@ -934,7 +958,7 @@ class AddExtremePointsChanneld(RandomizableTransform, MapTransform):
         return d
 
 
-class TorchVisiond(MapTransform):
+class TorchVisiond(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.TorchVision`.
     As most of the TorchVision transforms only work for PIL image and PyTorch Tensor, this transform expects input
@@ -962,7 +986,7 @@ class TorchVisiond(MapTransform):
         return d
 
 
-class MapLabelValued(MapTransform):
+class MapLabelValued(MapTransform, KeyLocalTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.MapLabelValue`.
     """
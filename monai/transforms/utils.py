@@ -10,19 +10,30 @@
 # limitations under the License.
 
 import itertools
+import os
 import random
 import warnings
 from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
 
-from monai.config import DtypeLike, IndexSelection
+from monai.config import DtypeLike, IndexSelection, NdarrayTensor
 from monai.networks.layers import GaussianFilter
 from monai.transforms.compose import Compose
 from monai.transforms.transform import MapTransform
-from monai.utils import ensure_tuple, ensure_tuple_rep, ensure_tuple_size, fall_back_tuple, min_version, optional_import
+from monai.utils import (
+    NumpyPadMode,
+    dtype_numpy_to_torch,
+    ensure_tuple,
+    ensure_tuple_rep,
+    ensure_tuple_size,
+    fall_back_tuple,
+    min_version,
+    optional_import,
+)
 from monai.utils.misc import issequenceiterable
 
 measure, _ = optional_import("skimage.measure", "0.14.2", min_version)
@@ -36,8 +47,12 @@ __all__ = [
     "rescale_array",
     "rescale_instance_array",
     "rescale_array_int_max",
+    "pad_nd",
+    "compute_percentiles",
     "copypaste_arrays",
     "resize_center",
+    "batch_spatial_crop",
+    "RunLengthIndices",
     "map_binary_to_indices",
     "weighted_patch_samples",
     "generate_pos_neg_label_crop_centers",
@@ -49,6 +64,8 @@ __all__ = [
     "create_translate",
     "generate_spatial_bounding_box",
     "get_largest_connected_component_mask",
+    "get_largest_connected_component_mask_per_label",
+    "distance_transform",
     "get_extreme_points",
     "extreme_points_to_image",
     "map_spatial_axes",
@@ -96,15 +113,15 @@ def zero_margins(img: np.ndarray, margin: int) -> bool:
     return not np.any(img[:, :margin, :]) and not np.any(img[:, -margin:, :])
 
 
-def rescale_array(arr: np.ndarray, minv: float = 0.0, maxv: float = 1.0, dtype: DtypeLike = np.float32):
+def rescale_array(arr: NdarrayTensor, minv: float = 0.0, maxv: float = 1.0, dtype: DtypeLike = np.float32):
     """
-    Rescale the values of numpy array `arr` to be from `minv` to `maxv`.
+    Rescale the values of numpy array or tensor `arr` to be from `minv` to `maxv`.
     """
     if dtype is not None:
-        arr = arr.astype(dtype)
+        arr = arr.to(dtype_numpy_to_torch(dtype)) if isinstance(arr, torch.Tensor) else arr.astype(dtype)
 
-    mina = np.min(arr)
-    maxa = np.max(arr)
+    mina = arr.min()
+    maxa = arr.max()
 
     if mina == maxa:
         return arr * minv
@@ -134,6 +151,142 @@ def rescale_array_int_max(arr: np.ndarray, dtype: DtypeLike = np.uint16) -> np.n
     return np.asarray(rescale_array(arr, info.min, info.max), dtype=dtype)
 
 
+_TORCH_PAD_MODES = {
+    NumpyPadMode.CONSTANT: "constant",
+    NumpyPadMode.EDGE: "replicate",
+    NumpyPadMode.REFLECT: "reflect",
+    NumpyPadMode.WRAP: "circular",
+}
+
+
+def pad_nd(
+    img: NdarrayTensor, to_pad: Sequence[Tuple[int, int]], mode: Union[NumpyPadMode, str] = NumpyPadMode.CONSTANT
+) -> NdarrayTensor:
+    """
+    Pad `img` by the `(before, after)` widths `to_pad` of every dimension, with ``np.pad`` for numpy arrays.
+    Tensors are padded with ``torch.nn.functional.pad``, so that the output keeps the device and the dtype
+    of the input, only the numpy padding modes without torch equivalent (or not supported for the shape of
+    `img`) go through a numpy copy of the tensor.
+
+    Args:
+        img: data to be padded, the first dimension (channel) is not padded if the padding modes
+            of ``torch.nn.functional.pad`` are used.
+        to_pad: the `(before, after)` padding widths of every dimension of `img`.
+        mode: {``"constant"``, ``"edge"``, ``"linear_ramp"``, ``"maximum"``, ``"mean"``,
+            ``"median"``, ``"minimum"``, ``"reflect"``, ``"symmetric"``, ``"wrap"``, ``"empty"``}
+            See also: https://numpy.org/doc/1.18/reference/generated/numpy.pad.html
+
+    """
+    mode = NumpyPadMode(mode)
+    if not isinstance(img, torch.Tensor):
+        return np.pad(img, to_pad, mode=mode.value)  # type: ignore
+    spatial_pad = [tuple(int(w) for w in p) for p in to_pad[1:]]
+    sizes = img.shape[1:]
+    supported = mode in _TORCH_PAD_MODES and not any(to_pad[0])
+    if supported and mode != NumpyPadMode.CONSTANT:
+        supported = 1 <= len(spatial_pad) <= 3
+        if mode == NumpyPadMode.REFLECT:
+            supported = supported and all(max(p) < s for p, s in zip(spatial_pad, sizes))
+        elif mode == NumpyPadMode.WRAP:
+            supported = supported and all(max(p) <= s for p, s in zip(spatial_pad, sizes))
+    if not supported:
+        return torch.as_tensor(np.pad(img.cpu().numpy(), to_pad, mode=mode.value), device=img.device)
+    pad = [w for p in reversed(spatial_pad) for w in p]
+    if mode == NumpyPadMode.CONSTANT:
+        return torch.nn.functional.pad(img, pad, mode="constant")
+    # the non constant modes expect a batch dimension and are only implemented for floating point inputs
+    out = img.unsqueeze(0) if torch.is_floating_point(img) else img.unsqueeze(0).to(torch.float64)
+    return torch.nn.functional.pad(out, pad, mode=_TORCH_PAD_MODES[mode]).squeeze(0).to(img.dtype)
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """The linear interpolation of ``np.percentile``, which is exact at both ends."""
+    diff_b_a = b - a
+    return np.where(t >= 0.5, b - diff_b_a * (1 - t), a + diff_b_a * t)
+
+
+def compute_percentiles(
+    img: NdarrayTensor, q: Union[Sequence[float], float], method: str = "exact", num_bins: int = 4096
+) -> np.ndarray:
+    """
+    Compute the percentiles `q` of all the elements of `img` in a single pass, with the linear interpolation
+    between the closest ranks of ``np.percentile``. Tensors are processed on their device.
+
+    Args:
+        img: the array or tensor to compute the percentiles of.
+        q: percentile or sequence of percentiles, in the range [0, 100].
+        method: {``"exact"``, ``"histogram"``}
+            ``"exact"`` computes the values of ``np.percentile``, with a single partial sort of the ranks of all
+            the percentiles (``np.partition``, ``torch.kthvalue``). ``"histogram"`` approximates the percentiles
+            from a histogram of `num_bins` bins between the minimum and the maximum of `img`, the error is at
+            most the width of a bin, ``(max - min) / num_bins``. The percentiles of integer inputs whose range
+            is smaller than ``2 ** 20`` are computed exactly from the counts of the values by both methods.
+        num_bins: the number of bins of the ``"histogram"`` method.
+
+    Returns:
+        the percentiles as a float64 array of the same length as `q`.
+
+    Raises:
+        ValueError: When ``q`` is not in the range [0, 100].
+        ValueError: When ``img`` is empty.
+        ValueError: When ``method`` is not one of ["exact", "histogram"].
+
+    """
+    q_arr = np.asarray(ensure_tuple(q), dtype=np.float64)
+    if np.any((q_arr < 0) | (q_arr > 100)):
+        raise ValueError(f"percentiles must be in the range [0, 100], got {q}.")
+    if method not in ("exact", "histogram"):
+        raise ValueError(f"method must be one of ['exact', 'histogram'], got {method}.")
+    is_tensor = isinstance(img, torch.Tensor)
+    flat = img.reshape(-1) if is_tensor else np.ravel(img)  # type: ignore
+    n = flat.shape[0]
+    if n == 0:
+        raise ValueError("img must not be empty.")
+    # the dtype of the interpolation, to match np.percentile
+    if is_tensor:
+        is_int = not torch.is_floating_point(flat) and flat.dtype != torch.bool  # type: ignore
+        out_dtype = {torch.float16: np.float16, torch.float32: np.float32}.get(flat.dtype, np.float64)  # type: ignore
+    else:
+        is_int = np.issubdtype(flat.dtype, np.integer)
+        out_dtype = np.float64 if not np.issubdtype(flat.dtype, np.floating) else flat.dtype
+    ranks = q_arr / 100.0 * (n - 1)
+    lower, upper = np.floor(ranks).astype(np.int64), np.ceil(ranks).astype(np.int64)
+    kth = np.unique(np.concatenate([lower, upper]))
+
+    values: np.ndarray
+    vmin, vmax = (float(flat.min()), float(flat.max())) if is_int or method == "histogram" else (0.0, 0.0)
+    if is_int and vmax - vmin < 2 ** 20:
+        # counts of the integer values
+        if is_tensor:
+            counts = torch.bincount(flat.long() - int(vmin), minlength=int(vmax - vmin) + 1).cpu().numpy()
+        else:
+            counts = np.bincount(flat.astype(np.int64, copy=False) - int(vmin), minlength=int(vmax - vmin) + 1)
+        values = vmin + np.searchsorted(np.cumsum(counts), kth, side="right").astype(np.float64)
+    elif method == "histogram" and vmax > vmin:
+        # values spread uniformly within their bins
+        scale = num_bins / (vmax - vmin)
+        if is_tensor:
+            bins = ((flat.to(torch.float64) - vmin) * scale).long().clamp_(max=num_bins - 1)  # type: ignore
+            counts = torch.bincount(bins, minlength=num_bins).cpu().numpy()
+        else:
+            bins = np.minimum(((flat.astype(np.float64) - vmin) * scale).astype(np.int64), num_bins - 1)
+            counts = np.bincount(bins, minlength=num_bins)
+        cum_counts = np.cumsum(counts)
+        bin_index = np.searchsorted(cum_counts, kth, side="right")
+        rank_in_bin = kth - (cum_counts[bin_index] - counts[bin_index])
+        values = vmin + (bin_index + (rank_in_bin + 0.5) / counts[bin_index]) / scale
+    elif method == "histogram":
+        values = np.full(len(kth), vmin)
+    elif is_tensor:
+        values = np.asarray([float(torch.kthvalue(flat, int(k) + 1).values) for k in kth])  # type: ignore
+    else:
+        values = np.partition(flat, kth)[kth].astype(np.float64)
+
+    values = values.astype(out_dtype)
+    a, b = values[np.searchsorted(kth, lower)], values[np.searchsorted(kth, upper)]
+    return _lerp(a, b, ranks - lower).astype(np.float64)
+
+
 def copypaste_arrays(
     src_shape,
     dest_shape,
@@ -215,11 +368,101 @@ def resize_center(img: np.ndarray, *resize_dims: Optional[int], fill_value: floa
     return img[srcslices]
 
 
+def batch_spatial_crop(
+    img: NdarrayTensor, roi_starts: Union[Sequence[Sequence[int]], np.ndarray], roi_size: Sequence[int]
+) -> NdarrayTensor:
+    """
+    Crop the regions of the same `roi_size` starting at `roi_starts` from the channel-first `img` and return
+    them stacked in shape (N, C, *roi_size). The regions are gathered with one indexing operation on a strided
+    view of all the possible regions of `img`, instead of cropping and stacking them one by one.
+
+    Args:
+        img: channel-first numpy array or tensor to crop.
+        roi_starts: voxel coordinates for start of every region, in shape (N, spatial dims).
+        roi_size: size of the regions.
+
+    Raises:
+        ValueError: When a region is not inside the spatial shape of `img`.
+
+    """
+    spatial_shape = np.asarray(img.shape[1:])
+    roi_size_ = np.asarray(roi_size, dtype=np.int64)
+    starts = np.asarray(roi_starts, dtype=np.int64).reshape(-1, len(spatial_shape))
+    if np.any(starts < 0) or np.any(starts + roi_size_ > spatial_shape):
+        raise ValueError(f"regions of size {tuple(roi_size)} must be inside the spatial shape {img.shape[1:]}.")
+    # view of shape (*valid starts, C, *roi_size) where the first dims index the start of the region
+    shape = tuple(spatial_shape - roi_size_ + 1) + (img.shape[0],) + tuple(roi_size_)
+    if isinstance(img, torch.Tensor):
+        strides = tuple(img.stride())
+        windows = img.as_strided(shape, strides[1:] + strides, img.storage_offset())
+        return windows[tuple(torch.as_tensor(starts.T, device=img.device))]
+    windows = np.lib.stride_tricks.as_strided(img, shape, img.strides[1:] + img.strides, writeable=False)
+    return windows[tuple(starts.T)]
+
+
+class RunLengthIndices:
+    """
+    Compact representation of the sorted flat indices of the nonzero elements of a mask, as the runs of
+    consecutive indices, which is much smaller than the indices for the masks of connected regions. It behaves
+    as the 1 dim array of the indices for ``len()`` and indexing (``indices[i]`` takes O(log(number of runs))),
+    and ``np.asarray(indices)`` builds the array of indices. It can be cached and pickled.
+
+    Args:
+        starts: the first index of every run, in increasing order.
+        lengths: the length of every run.
+
+    """
+
+    def __init__(self, starts: np.ndarray, lengths: np.ndarray) -> None:
+        dtype = np.int32 if len(starts) == 0 or starts[-1] + lengths[-1] < np.iinfo(np.int32).max else np.int64
+        self.starts = np.asarray(starts, dtype=dtype)
+        # number of indices before every run
+        self.offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]).astype(dtype)
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "RunLengthIndices":
+        """Encode the flat indices of the nonzero elements of `mask`."""
+        flat = np.asarray(mask, dtype=bool).ravel()
+        if flat.size == 0:
+            return cls(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+        bounds = np.concatenate([[0], np.flatnonzero(flat[1:] != flat[:-1]) + 1, [flat.size]])
+        selected = flat[bounds[:-1]]
+        return cls(bounds[:-1][selected], (bounds[1:] - bounds[:-1])[selected])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.starts.nbytes + self.offsets.nbytes)
+
+    @property
+    def size(self) -> int:
+        return int(self.offsets[-1])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index):
+        index_arr = np.asarray(index, dtype=np.int64)
+        index_arr = np.where(index_arr < 0, index_arr + self.size, index_arr)
+        if np.any((index_arr < 0) | (index_arr >= self.size)):
+            raise IndexError(f"index {index} is out of bounds for size {self.size}.")
+        run = np.searchsorted(self.offsets, index_arr, side="right") - 1
+        result = self.starts[run].astype(np.int64) + index_arr - self.offsets[run]
+        return int(result) if result.ndim == 0 else result
+
+    def __array__(self, dtype=None):
+        indices = np.arange(self.size, dtype=np.int64)
+        return self[indices].astype(dtype) if dtype is not None else self[indices]
+
+    def __repr__(self) -> str:
+        return f"RunLengthIndices(size={self.size}, runs={len(self.starts)})"
+
+
 def map_binary_to_indices(
     label: np.ndarray,
     image: Optional[np.ndarray] = None,
     image_threshold: float = 0.0,
-) -> Tuple[np.ndarray, np.ndarray]:
+    compact: bool = False,
+) -> Tuple[Union[np.ndarray, RunLengthIndices], Union[np.ndarray, RunLengthIndices]]:
     """
     Compute the foreground and background of input label data, return the indices after fattening.
     For example:
@@ -232,19 +475,21 @@ def map_binary_to_indices(
             to define background. so the output items will not map to all the voxels in the label.
         image_threshold: if enabled `image`, use ``image > image_threshold`` to
             determine the valid image content area and select background only in this area.
+        compact: whether to return the indices as :py:class:`RunLengthIndices` instead of int64 arrays.
 
     """
     # Prepare fg/bg indices
     if label.shape[0] > 1:
         label = label[1:]  # for One-Hot format data, remove the background channel
     label_flat = np.any(label, axis=0).ravel()  # in case label has multiple dimensions
-    fg_indices = np.nonzero(label_flat)[0]
     if image is not None:
         img_flat = np.any(image > image_threshold, axis=0).ravel()
-        bg_indices = np.nonzero(np.logical_and(img_flat, ~label_flat))[0]
+        bg_flat = np.logical_and(img_flat, ~label_flat)
     else:
-        bg_indices = np.nonzero(~label_flat)[0]
-    return fg_indices, bg_indices
+        bg_flat = ~label_flat
+    if compact:
+        return RunLengthIndices.from_mask(label_flat), RunLengthIndices.from_mask(bg_flat)
+    return np.nonzero(label_flat)[0], np.nonzero(bg_flat)[0]
 
 
 def weighted_patch_samples(
@@ -296,8 +541,8 @@ def generate_pos_neg_label_crop_centers(
     num_samples: int,
     pos_ratio: float,
     label_spatial_shape: Sequence[int],
-    fg_indices: np.ndarray,
-    bg_indices: np.ndarray,
+    fg_indices: Union[np.ndarray, RunLengthIndices],
+    bg_indices: Union[np.ndarray, RunLengthIndices],
     rand_state: np.random.RandomState = np.random,
 ) -> List[List[np.ndarray]]:
     """
@@ -309,8 +554,8 @@ def generate_pos_neg_label_crop_centers(
         num_samples: total sample centers to be generated.
         pos_ratio: ratio of total locations generated that have center being foreground.
         label_spatial_shape: spatial shape of the original label data to unravel selected centers.
-        fg_indices: pre-computed foreground indices in 1 dimension.
-        bg_indices: pre-computed background indices in 1 dimension.
+        fg_indices: pre-computed foreground indices in 1 dimension, or :py:class:`RunLengthIndices`.
+        bg_indices: pre-computed background indices in 1 dimension, or :py:class:`RunLengthIndices`.
         rand_state: numpy randomState object to align with other modules.
 
     Raises:
@@ -345,7 +590,10 @@ def generate_pos_neg_label_crop_centers(
         return center_ori
 
     centers = []
-    fg_indices, bg_indices = np.asarray(fg_indices), np.asarray(bg_indices)
+    if not isinstance(fg_indices, RunLengthIndices):
+        fg_indices = np.asarray(fg_indices)
+    if not isinstance(bg_indices, RunLengthIndices):
+        bg_indices = np.asarray(bg_indices)
     if fg_indices.size == 0 and bg_indices.size == 0:
         raise ValueError("No sampling location available.")
 
@@ -578,6 +826,210 @@ def get_largest_connected_component_mask(img: torch.Tensor, connectivity: Option
     return torch.as_tensor(largest_cc, device=img.device)
 
 
+def _largest_component_per_label(label_map: np.ndarray, labels: np.ndarray, connectivity: Optional[int]) -> np.ndarray:
+    """
+    Mask of the largest connected component of every value of `labels` in the integer `label_map`, computed with
+    one labeling of `label_map`: the components never join neighbors of different values.
+
+    """
+    components = measure.label(label_map, background=0, connectivity=connectivity)
+    flat = components.ravel()
+    sizes = np.bincount(flat)
+    # the label of every component, the components are numbered in the same order as the labeling of every label
+    component_label = np.zeros_like(sizes)
+    component_label[flat] = label_map.ravel()
+    keep = np.zeros(len(sizes), dtype=bool)
+    for label in labels:
+        ids = np.flatnonzero(component_label[1:] == label) + 1
+        if ids.size > 0:
+            keep[ids[np.argmax(sizes[ids])]] = True
+    return keep[components]
+
+
+def get_largest_connected_component_mask_per_label(
+    img: torch.Tensor, labels: Sequence[int], connectivity: Optional[int] = None, num_workers: Optional[int] = None
+) -> torch.Tensor:
+    """
+    Gets the mask of the largest connected component of every label of `labels` in a label image, it's the union
+    of ``get_largest_connected_component_mask(img == label)`` for every label, but labels every image only once.
+
+    Args:
+        img: label image. Shape is (batch_size, spatial_dim1 [, spatial_dim2, ...]).
+        labels: labels to get the largest connected component of, the other values are ignored.
+        connectivity: Maximum number of orthogonal hops to consider a pixel/voxel as a neighbor.
+            Accepted values are ranging from  1 to input.ndim. If ``None``, a full
+            connectivity of ``input.ndim`` is used.
+        num_workers: the number of threads to process the images of the batch, if None, use the number of
+            CPUs (up to the batch size).
+    """
+    labels_arr = np.asarray(labels, dtype=np.int64)
+    applied = torch.zeros_like(img, dtype=torch.bool)
+    for label in labels:
+        applied |= img == label
+    label_map = torch.where(applied, img, torch.zeros_like(img)).detach().cpu().numpy().astype(np.int64)
+
+    def _process(item: np.ndarray) -> np.ndarray:
+        return _largest_component_per_label(item, labels_arr, connectivity)
+
+    if len(label_map) == 0:
+        return applied
+    num_workers = min(len(label_map), num_workers or os.cpu_count() or 1)
+    if num_workers > 1:
+        with ThreadPool(num_workers) as p:
+            masks = p.map(_process, label_map)
+    else:
+        masks = [_process(item) for item in label_map]
+    return torch.as_tensor(np.stack(masks), device=img.device)
+
+
+def _nearest_zero_distance_1d(mask: torch.Tensor, dim: int, spacing: float) -> torch.Tensor:
+    """
+    Distance along `dim` of every element of the boolean `mask` to the nearest False element of its line,
+    computed with cumulative scans. It's inf for the lines without False element.
+
+    """
+    x = mask.movedim(dim, -1)
+    pos = torch.arange(x.shape[-1], device=mask.device).to(torch.float64).expand(x.shape)
+    inf = torch.full_like(pos, float("inf"))
+    previous_zero = torch.cummax(torch.where(x, -inf, pos), dim=-1)[0]
+    next_zero = torch.cummin(torch.where(x, inf, pos).flip(-1), dim=-1)[0].flip(-1)
+    return (torch.min(pos - previous_zero, next_zero - pos) * spacing).movedim(-1, dim)
+
+
+def _envelope_value(x: torch.Tensor, i: torch.Tensor, g_i: torch.Tensor, spacing: float, metric: str) -> torch.Tensor:
+    """Distance at the positions `x` from the element `i` of the line of value `g_i` (squared if euclidean)."""
+    if metric == "euclidean":
+        return ((x - i) * spacing) ** 2 + g_i
+    if metric == "taxicab":
+        return (x - i).abs() + g_i
+    return torch.max((x - i).abs(), g_i)
+
+
+def _envelope_separation(
+    i: torch.Tensor, u: int, g_i: torch.Tensor, g_u: torch.Tensor, spacing: float, metric: str
+) -> torch.Tensor:
+    """
+    The last position where the element `i` of the line is not farther than the element `u > i`,
+    ``Sep(i, u)`` of Meijster et al., inf if `i` is nearer everywhere after `i`.
+
+    """
+    if metric == "euclidean":
+        sep = ((u * u - i * i) * spacing ** 2 + g_u - g_i) / (2 * (u - i) * spacing ** 2)
+    elif metric == "taxicab":
+        sep = torch.where(g_u >= g_i + u - i, torch.full_like(g_u, float("inf")), (g_u - g_i + u + i) / 2)
+    else:
+        middle = torch.floor((i + u) / 2)
+        sep = torch.where(g_i <= g_u, torch.max(i + g_u, middle), torch.min(u - g_i, middle))
+    return torch.floor(sep)
+
+
+def _lower_envelope_1d(values: torch.Tensor, dim: int, spacing: float, metric: str) -> torch.Tensor:
+    """
+    Lower envelope along `dim` of the distances `values` (squared for the euclidean metric) combined with the
+    offsets to every other element of the line, ``out[x] = min_i f(x, i)`` for the distance ``f`` of the metric.
+
+    It's the linear-time algorithm of Meijster et al. (the lower envelope of parabolas of Felzenszwalb and
+    Huttenlocher for the euclidean metric): a forward scan keeps a stack of the elements of the envelope with
+    the positions where they start to be the nearest, and a backward scan reads the envelope. The scans loop
+    over the length of the lines and process all the lines at once.
+
+    """
+    x = values.movedim(dim, -1)
+    length = x.shape[-1]
+    # one row for every position, the lines are contiguous
+    g = x.reshape(-1, length).t().contiguous()
+    num_lines = g.shape[1]
+    # stacks of the elements of the envelope, their values and the positions where they start to be the nearest,
+    # the top elements are also kept in `top_values` to only index the stacks for the lines pushing or popping
+    stacks = torch.zeros((3, num_lines * length), dtype=g.dtype, device=g.device)
+    top_values = torch.zeros((3, num_lines), dtype=g.dtype, device=g.device)
+    top = torch.full((num_lines,), -1, dtype=torch.long, device=g.device)
+
+    def _pop(mask):
+        popped = torch.nonzero(mask, as_tuple=False).squeeze(1)
+        if popped.numel() == 0:
+            return False
+        top[popped] -= 1
+        previous = top[popped].clamp(min=0)
+        top_values[:, popped] = stacks[:, popped * length + previous]
+        return True
+
+    for u in range(length):
+        g_u = g[u]
+        # the elements without zero element in their line are never the nearest
+        valid = torch.isfinite(g_u)
+        while True:
+            s_q, g_q, t_q = top_values
+            # remove the elements farther than `u` where they start to be the nearest
+            pop = valid & (top >= 0)
+            pop &= _envelope_value(t_q, s_q, g_q, spacing, metric) > _envelope_value(t_q, u, g_u, spacing, metric)
+            if not _pop(pop):
+                break
+        # after the start of the top element, which may be rounded down by ties
+        start = torch.max(1 + _envelope_separation(s_q, u, g_q, g_u, spacing, metric), t_q + 1)
+        start = torch.where(top >= 0, start, torch.zeros_like(start))
+        pushed = torch.nonzero(valid & (start < length), as_tuple=False).squeeze(1)
+        top[pushed] += 1
+        new_values = torch.stack([torch.full_like(start[pushed], u), g_u[pushed], start[pushed]])
+        top_values[:, pushed] = new_values
+        stacks[:, pushed * length + top[pushed]] = new_values
+    out = torch.empty_like(g)
+    for u in range(length - 1, -1, -1):
+        s_q, g_q, t_q = top_values
+        value = _envelope_value(torch.full_like(g_q, u), s_q, g_q, spacing, metric)
+        out[u] = torch.where(top >= 0, value, torch.full_like(value, float("inf")))
+        _pop((top >= 0) & (t_q == u))
+    return out.t().reshape(x.shape).movedim(-1, dim)
+
+
+def distance_transform(
+    img: torch.Tensor,
+    metric: str = "euclidean",
+    sampling: Optional[Union[float, Sequence[float]]] = None,
+    spatial_dims: Optional[int] = None,
+    dtype: torch.dtype = torch.float32,
+) -> torch.Tensor:
+    """
+    Exact distance transform in pure PyTorch: the distance of every nonzero element of `img` to the nearest
+    zero element, computed on the device of `img` for the last `spatial_dims` dims, batched over the leading
+    dims (for example B and C). It gives the same result as ``scipy.ndimage.distance_transform_edt`` (and
+    ``distance_transform_cdt`` for the chessboard and taxicab metrics) when there is a zero element.
+
+    The transform is separable: the distance along the first dim is computed with cumulative scans, and
+    every following dim takes the lower envelope of the distances of its line, with the linear-time
+    algorithm of Meijster et al. vectorized over all the lines, so the cost is ``O(N)`` for `N` elements.
+
+    Args:
+        img: the image, its nonzero elements are the foreground.
+        metric: [``"euclidean"``, ``"chessboard"``, ``"taxicab"``] the distance metric.
+        sampling: spacing of the elements along every spatial dim (or the same for all the dims) for the
+            ``"euclidean"`` metric. if None, the spacing is 1.
+        spatial_dims: number of spatial dims, the last dims of `img`. if None, all the dims are spatial.
+        dtype: floating point type of the output.
+
+    Returns:
+        the distances of every element, with the shape of `img`. The elements without zero element in their
+        spatial image are inf.
+
+    Raises:
+        ValueError: When ``metric`` is not one of ["euclidean", "chessboard", "taxicab"].
+        ValueError: When ``sampling`` is specified for the ``"chessboard"`` or ``"taxicab"`` metrics.
+    """
+    if metric not in ("euclidean", "chessboard", "taxicab"):
+        raise ValueError(f"distance_metric {metric} is not implemented.")
+    if sampling is not None and metric != "euclidean":
+        raise ValueError(f"sampling is only supported by the euclidean distance, got {metric}.")
+    spatial_dims = img.ndim if spatial_dims is None else spatial_dims
+    first_dim = img.ndim - spatial_dims
+    spacing = ensure_tuple_rep(1.0 if sampling is None else sampling, spatial_dims)
+    distances = _nearest_zero_distance_1d(img != 0, first_dim, spacing[0]).to(dtype)
+    if metric == "euclidean":
+        distances = distances * distances
+    for i in range(1, spatial_dims):
+        distances = _lower_envelope_1d(distances, first_dim + i, spacing[i], metric)
+    return torch.sqrt(distances) if metric == "euclidean" else distances
+
+
 def get_extreme_points(
     img: np.ndarray, rand_state: np.random.RandomState = np.random, background: int = 0, pert: float = 0.0
 ) -> List[Tuple[int, ...]]:
@@ -303,6 +303,7 @@ _torch_to_np_dtype = {
     torch.complex128: np.complex128,
 }
 _np_to_torch_dtype = {value: key for key, value in _torch_to_np_dtype.items()}
+_np_to_torch_dtype[np.bool_] = torch.bool
 
 
 def dtype_torch_to_numpy(dtype):
@@ -311,8 +312,10 @@ def dtype_torch_to_numpy(dtype):
 
 
 def dtype_numpy_to_torch(dtype):
-    """Convert a numpy dtype to its torch equivalent."""
-    return _np_to_torch_dtype[dtype]
+    """Convert a numpy dtype to its torch equivalent, a torch dtype is returned unchanged."""
+    if isinstance(dtype, torch.dtype):
+        return dtype
+    return _np_to_torch_dtype[np.dtype(dtype).type]
 
 
 def copy_to_device(
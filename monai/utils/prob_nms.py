@@ -14,6 +14,12 @@ class ProbNMS:
     If multiple coordinates have the same highest probability, only one of them will be
     selected.
 
+    Instead of searching the maximum of the whole map for every selection, the values above the
+    threshold are sorted once (the ties in the row-major order, same as ``argmax``), and the
+    candidates are visited in this order, skipping the ones already removed by the boxes of the
+    previous selections. So the cost scales with the number of candidates rather than with the
+    number of selections times the size of the map, and the outputs are the same as the iterative search.
+
     Args:
         spatial_dims: number of spatial dimensions of the input probabilities map.
             Defaults to 2.
@@ -75,26 +81,39 @@ class ProbNMS:
                 prob_map = torch.as_tensor(prob_map, dtype=torch.float)
             self.filter.to(prob_map)
             prob_map = self.filter(prob_map)
-        else:
-            if not isinstance(prob_map, torch.Tensor):
-                prob_map = prob_map.copy()
 
         if isinstance(prob_map, torch.Tensor):
             prob_map = prob_map.detach().cpu().numpy()
 
         prob_map_shape = prob_map.shape
 
-        outputs = []
-        while np.max(prob_map) > self.prob_threshold:
-            max_idx = np.unravel_index(prob_map.argmax(), prob_map_shape)
+        outputs: List = []
+        if not np.max(prob_map) > self.prob_threshold:
+            return outputs
+        candidates = np.flatnonzero(prob_map > self.prob_threshold)
+        # descending probabilities, the stable sort keeps the ties in the order of `argmax`
+        candidates = candidates[np.argsort(-prob_map.flat[candidates].astype(np.float64), kind="stable")]
+        remaining = np.ones(prob_map_shape, dtype=bool)
+        remaining_flat = remaining.reshape(-1)
+        chunk_size = 1024
+        pos = 0
+        while pos < len(candidates):
+            # skip the removed candidates chunk by chunk
+            found = np.flatnonzero(remaining_flat[candidates[pos : pos + chunk_size]])
+            if len(found) == 0:
+                pos += chunk_size
+                continue
+            pos += found[0]
+            max_idx = np.unravel_index(candidates[pos], prob_map_shape)
+            pos += 1
             prob_max = prob_map[max_idx]
             max_idx_arr = np.asarray(max_idx)
             outputs.append([prob_max] + list(max_idx_arr))
 
             idx_min_range = (max_idx_arr - self.box_lower_bd).clip(0, None)
             idx_max_range = (max_idx_arr + self.box_upper_bd).clip(None, prob_map_shape)
-            # for each dimension, set values during index ranges to 0
+            # for each dimension, remove the candidates during index ranges
             slices = tuple(slice(idx_min_range[i], idx_max_range[i]) for i in range(self.spatial_dims))
-            prob_map[slices] = 0
+            remaining[slices] = False
 
         return outputs
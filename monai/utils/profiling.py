@@ -9,12 +9,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
 import time
-from functools import wraps
+from collections import Counter
+from contextlib import contextmanager
+from functools import partial, wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import torch
 
-__all__ = ["torch_profiler_full", "torch_profiler_time_cpu_gpu", "torch_profiler_time_end_to_end", "PerfContext"]
+__all__ = [
+    "torch_profiler_full",
+    "torch_profiler_time_cpu_gpu",
+    "torch_profiler_time_end_to_end",
+    "PerfContext",
+    "ConversionCounter",
+    "TransformProfiler",
+]
 
 
 def torch_profiler_full(func):
@@ -108,3 +126,407 @@ class PerfContext:
     def __exit__(self, exc_type, exc_value, exc_traceback):
         self.total_time += time.perf_counter() - self.start_time
         self.start_time = None
+
+
+class ConversionCounter:
+    """
+    Context manager counting the conversions between numpy arrays and torch tensors within context blocks,
+    for example to check that a pipeline of transforms runs without copying the data back and forth::
+
+        with ConversionCounter() as counter:
+            output = transforms(data)
+        print(counter.to_numpy, counter.to_tensor, counter.summary())
+
+    The conversions of tensors to numpy arrays (``Tensor.numpy``, ``np.asarray(tensor)``) and of numpy arrays to
+    tensors (``torch.as_tensor``, ``torch.from_numpy``, ``torch.tensor``) are counted by temporarily wrapping these
+    functions, they are attributed to the innermost object whose ``__call__`` is running, other than a `Compose`.
+    Only the conversions of the calling process are counted, the `DataLoader` must use ``num_workers=0``.
+    This is a debugging tool, the wrapping slows down the conversions.
+
+    Args:
+        min_size: only the arrays with at least `min_size` elements are counted, so that the conversions of
+            small parameters such as affine matrices are ignored. Defaults to 64.
+
+    """
+
+    _patched = (
+        (torch.Tensor, "numpy", "to_numpy"),
+        (torch.Tensor, "__array__", "to_numpy"),
+        (torch, "as_tensor", "to_tensor"),
+        (torch, "from_numpy", "to_tensor"),
+        (torch, "tensor", "to_tensor"),
+    )
+
+    def __init__(self, min_size: int = 64):
+        self.min_size = min_size
+        self.counts: Counter = Counter()
+        self._originals: Dict = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def to_numpy(self) -> int:
+        """Total number of tensors converted to numpy arrays."""
+        return sum(v for (direction, _), v in self.counts.items() if direction == "to_numpy")
+
+    @property
+    def to_tensor(self) -> int:
+        """Total number of numpy arrays converted to tensors."""
+        return sum(v for (direction, _), v in self.counts.items() if direction == "to_tensor")
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """
+        The numbers of conversions, grouped by the name of the callable class in which they happen,
+        e.g. ``{"Spacing": {"to_numpy": 1, "to_tensor": 1}}``.
+
+        """
+        out: Dict[str, Dict[str, int]] = {}
+        for (direction, name), v in self.counts.items():
+            out.setdefault(name, {"to_numpy": 0, "to_tensor": 0})[direction] += v
+        return out
+
+    def reset(self) -> None:
+        self.counts.clear()
+
+    @staticmethod
+    def _caller_name() -> str:
+        frame: Optional[object] = sys._getframe(2)
+        while frame is not None:
+            caller = frame.f_locals.get("self")  # type: ignore
+            if frame.f_code.co_name == "__call__" and type(caller).__name__ != "Compose":  # type: ignore
+                return type(caller).__name__
+            frame = frame.f_back  # type: ignore
+        return "<none>"
+
+    def _wrap(self, func, direction: str):
+        counter = self
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(counter._local, "busy", False):
+                return func(*args, **kwargs)
+            data = args[0] if args else None
+            if direction == "to_tensor" and not isinstance(data, np.ndarray):
+                return func(*args, **kwargs)
+            if data is None or np.prod(data.shape) < counter.min_size:
+                return func(*args, **kwargs)
+            counter._local.busy = True
+            try:
+                name = counter._caller_name()
+                with counter._lock:
+                    counter.counts[(direction, name)] += 1
+                return func(*args, **kwargs)
+            finally:
+                counter._local.busy = False
+
+        return wrapper
+
+    def __enter__(self):
+        for owner, name, direction in self._patched:
+            self._originals[(owner, name)] = getattr(owner, name)
+            setattr(owner, name, self._wrap(getattr(owner, name), direction))
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        for (owner, name), func in self._originals.items():
+            setattr(owner, name, func)
+        self._originals = {}
+
+
+_profiling_state = threading.local()
+
+
+def _transform_name(transform: Callable) -> str:
+    """
+    The name of `transform` in the profiling records, e.g. ``"Spacingd"``, ``"Spacingd.inverse"``.
+
+    """
+    if isinstance(transform, partial):
+        return _transform_name(transform.func)
+    if inspect.ismethod(transform):
+        owner = type(transform.__self__).__name__
+        return owner if transform.__name__ == "__call__" else f"{owner}.{transform.__name__}"
+    return getattr(transform, "__qualname__", type(transform).__name__)
+
+
+def _iter_arrays(data: Any):
+    """
+    Yield the ``(key, array)`` pairs of the numpy arrays and torch tensors in `data`, at most one level deep.
+
+    """
+    if isinstance(data, (np.ndarray, torch.Tensor)):
+        yield "", data
+    elif isinstance(data, dict):
+        for k, v in data.items():
+            if isinstance(v, (np.ndarray, torch.Tensor)):
+                yield str(k), v
+    elif isinstance(data, (list, tuple)):
+        for i, v in enumerate(data):
+            for k, arr in _iter_arrays(v) if isinstance(v, dict) else [("", v)]:
+                if isinstance(arr, (np.ndarray, torch.Tensor)):
+                    yield f"{i}{'.' + k if k else ''}", arr
+
+
+def _buffer(arr) -> Tuple[int, int]:
+    """
+    The address range of the memory buffer holding `arr`, including the memory of the arrays it is a view of.
+
+    """
+    if isinstance(arr, torch.Tensor):
+        storage = arr.untyped_storage() if hasattr(arr, "untyped_storage") else arr.storage()
+        start = storage.data_ptr()
+        return start, start + storage.nbytes()
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return np.byte_bounds(arr)
+
+
+def _nbytes(arr) -> int:
+    return arr.numel() * arr.element_size() if isinstance(arr, torch.Tensor) else arr.nbytes
+
+
+def _describe_shapes(data: Any) -> str:
+    items = [f"{k}: {tuple(v.shape)}" if k else str(tuple(v.shape)) for k, v in _iter_arrays(data)]
+    return ", ".join(items)
+
+
+def _allocated_bytes(data_in: Any, data_out: Any) -> int:
+    """
+    The number of bytes of the arrays in `data_out` which don't share memory with the arrays in `data_in`.
+
+    """
+    buffers = [_buffer(v) for _, v in _iter_arrays(data_in) if _nbytes(v) > 0]
+    total = 0
+    for _, v in _iter_arrays(data_out):
+        if _nbytes(v) == 0:
+            continue
+        start, end = _buffer(v)
+        if not any(start < b_end and b_start < end for b_start, b_end in buffers):
+            total += _nbytes(v)
+    return total
+
+
+class TransformProfiler:
+    """
+    Profiler of the transforms applied by :py:class:`monai.transforms.Compose` and
+    :py:func:`monai.transforms.apply_transform`. When it's passed to the ``profiler`` argument of a `Compose`,
+    every call of the `Compose` records, for each transform (including the nested `Compose` and their
+    transforms), the wall time, the input and output shapes and the bytes of the output arrays newly allocated
+    by the transform::
+
+        profiler = TransformProfiler()
+        transforms = Compose([LoadImaged(keys), Spacingd(keys, pixdim), RandAffined(keys)], profiler=profiler)
+        loader = DataLoader(CacheDataset(data, transforms), num_workers=4)
+        for batch in loader:
+            ...
+        print(profiler.table())
+        profiler.export_chrome_trace("trace.json")  # to be loaded in chrome://tracing or https://ui.perfetto.dev
+
+    The records of `PersistentDataset`, `CacheDataset` and their subclasses are tagged by the stage of the
+    transform: ``"pre"`` for the cached deterministic transforms and ``"post"`` for the transforms run at every
+    iteration. The records of the other processes, such as the `DataLoader` workers, are appended to files in
+    `output_dir` and are merged by :py:attr:`records`; the records of the process which created the profiler
+    are kept in memory. This is a debugging tool, recording the shapes and bytes of every call has an overhead.
+
+    Args:
+        output_dir: the directory of the records of the other processes. Defaults to a temporary directory
+            removed by :py:meth:`reset` and at the garbage collection of the profiler.
+        record_shapes: whether to record the shapes of the input and output arrays.
+        record_memory: whether to record the bytes of the output arrays which are not views of the input arrays.
+
+    """
+
+    def __init__(self, output_dir: Optional[str] = None, record_shapes: bool = True, record_memory: bool = True):
+        self._own_dir = output_dir is None
+        self.output_dir = tempfile.mkdtemp(prefix="monai_profile_") if output_dir is None else str(output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.record_shapes = record_shapes
+        self.record_memory = record_memory
+        self._owner_pid = os.getpid()
+        self._records: List[Dict] = []
+        self._file = None
+        self._file_pid = -1
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"], state["_file_pid"], state["_lock"] = None, -1, None
+        state["_records"] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._own_dir = False  # the copies in the other processes don't own the directory
+
+    def __del__(self):
+        if getattr(self, "_own_dir", False) and os.getpid() == self._owner_pid:
+            shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    @staticmethod
+    def active() -> Optional["TransformProfiler"]:
+        """The profiler recording the transforms of the current thread, None if the profiling is not active."""
+        return getattr(_profiling_state, "profiler", None)
+
+    @contextmanager
+    def activate(self, stage: Optional[str] = None):
+        """
+        Record the transforms applied by `apply_transform` in the current thread within the context block,
+        tagged by `stage` if specified. If another profiler is already active, it's kept.
+
+        """
+        previous = self.active()
+        if previous is None:
+            _profiling_state.profiler, _profiling_state.stack, _profiling_state.stage = self, [], ""
+        old_stage = _profiling_state.stage
+        if stage is not None:
+            _profiling_state.stage = stage
+        try:
+            yield self
+        finally:
+            _profiling_state.stage = old_stage
+            if previous is None:
+                _profiling_state.profiler = None
+
+    def call(self, transform: Callable, data: Any, name: Optional[str] = None):
+        """
+        Apply `transform` to `data`, recording the call.
+
+        """
+        stack = _profiling_state.stack
+        name = _transform_name(transform) if name is None else name
+        frame = [name, 0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            out = transform(data)
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][1] += duration
+        record = {
+            "name": name,
+            "path": "/".join([f[0] for f in stack] + [name]),
+            "stage": _profiling_state.stage,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "start": start,
+            "time": duration,
+            "self_time": duration - frame[1],
+        }
+        if self.record_shapes:
+            record["input_shapes"] = _describe_shapes(data)
+            record["output_shapes"] = _describe_shapes(out)
+        if self.record_memory:
+            record["allocated_bytes"] = _allocated_bytes(data, out)
+        self._add(record)
+        return out
+
+    def _add(self, record: Dict) -> None:
+        if os.getpid() == self._owner_pid:
+            self._records.append(record)
+            return
+        with self._lock:
+            if self._file_pid != os.getpid():
+                path = os.path.join(self.output_dir, f"records_{os.getpid()}.jsonl")
+                self._file, self._file_pid = open(path, "a"), os.getpid()
+            self._file.write(json.dumps(record) + "\n")  # type: ignore
+            self._file.flush()  # type: ignore
+
+    @property
+    def records(self) -> List[Dict]:
+        """All the records, of the current process and of the other processes, sorted by start time."""
+        records = list(self._records)
+        for filename in sorted(os.listdir(self.output_dir)):
+            if not filename.startswith("records_") or not filename.endswith(".jsonl"):
+                continue
+            with open(os.path.join(self.output_dir, filename)) as f:
+                records += [json.loads(line) for line in f if line.endswith("\n")]
+        return sorted(records, key=lambda r: r["start"])
+
+    def reset(self) -> None:
+        """Remove all the records."""
+        self._records = []
+        for filename in os.listdir(self.output_dir):
+            if filename.startswith("records_") and filename.endswith(".jsonl"):
+                os.remove(os.path.join(self.output_dir, filename))
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The statistics of the records grouped by transform path and stage, e.g.
+        ``{"pre:Compose/Spacingd": {"count": 10, "total": 1.2, "mean": 0.12, "max": 0.2, "self": 1.2, ...}}``,
+        sorted by decreasing self time. The times are in seconds.
+
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        for r in self.records:
+            key = f"{r['stage']}:{r['path']}" if r["stage"] else r["path"]
+            s = stats.setdefault(key, {"count": 0, "total": 0.0, "max": 0.0, "self": 0.0, "allocated_bytes": 0})
+            s["count"] += 1
+            s["total"] += r["time"]
+            s["self"] += r["self_time"]
+            s["max"] = max(s["max"], r["time"])
+            s["allocated_bytes"] += r.get("allocated_bytes", 0)
+            for k in ("input_shapes", "output_shapes"):
+                if k in r:
+                    s[k] = r[k]
+        for s in stats.values():
+            s["mean"] = s["total"] / s["count"]
+        return dict(sorted(stats.items(), key=lambda x: -x[1]["self"]))
+
+    def table(self, max_rows: Optional[int] = None) -> str:
+        """
+        The summary formatted as a table, the transforms with the highest self time first.
+
+        Args:
+            max_rows: the maximum number of transforms in the table, default to all the transforms.
+
+        """
+        header = ("transform", "count", "total (ms)", "mean (ms)", "max (ms)", "self (ms)", "self %", "alloc (MB)")
+        stats = list(self.summary().items())[:max_rows]
+        total_self = sum(s["self"] for _, s in self.summary().items()) or 1.0
+        rows = [
+            (
+                key,
+                str(s["count"]),
+                f"{s['total'] * 1e3:.2f}",
+                f"{s['mean'] * 1e3:.3f}",
+                f"{s['max'] * 1e3:.3f}",
+                f"{s['self'] * 1e3:.2f}",
+                f"{100.0 * s['self'] / total_self:.1f}",
+                f"{s['allocated_bytes'] / 2 ** 20:.2f}",
+            )
+            for key, s in stats
+        ]
+        widths = [max(len(row[i]) for row in rows + [header]) for i in range(len(header))]
+        lines = [
+            "  ".join(c.ljust(w) if i == 0 else c.rjust(w) for i, (c, w) in enumerate(zip(row, widths)))
+            for row in [header] + rows
+        ]
+        lines.insert(1, "-" * len(lines[0]))
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path: str) -> None:
+        """
+        Write the records to `path` in the Chrome trace event format,
+        one row per process and thread, the nested transforms are stacked.
+
+        """
+        events = []
+        for r in self.records:
+            args = {k: r[k] for k in ("input_shapes", "output_shapes", "allocated_bytes") if k in r}
+            events.append(
+                {
+                    "name": r["name"],
+                    "cat": r["stage"] or "transform",
+                    "ph": "X",
+                    "ts": r["start"] * 1e6,
+                    "dur": r["time"] * 1e6,
+                    "pid": r["pid"],
+                    "tid": r["tid"],
+                    "args": args,
+                }
+            )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,82 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch
+
+from monai.transforms import (
+    AdjustContrast,
+    BatchRandAdjustContrast,
+    BatchRandGaussianNoise,
+    BatchRandScaleIntensity,
+    Compose,
+    ScaleIntensity,
+)
+
+
+def _get_batch(shape=(6, 2, 8, 7)):
+    return torch.as_tensor(np.random.RandomState(0).rand(*shape).astype(np.float32))
+
+
+class TestBatchRandIntensity(unittest.TestCase):
+    def test_gaussian_noise(self):
+        img = _get_batch((6, 2, 64, 64))
+        xform = BatchRandGaussianNoise(prob=0.5, mean=1.0, std=0.5).set_random_state(0)
+        result = xform(img)
+        for i in range(img.shape[0]):
+            noise = (result[i] - img[i]).numpy()
+            if not xform._do_transform[i]:
+                np.testing.assert_allclose(noise, 0.0)
+                continue
+            self.assertAlmostEqual(noise.mean(), 1.0, delta=0.05)
+            self.assertAlmostEqual(noise.std(), xform.sample_std[i], delta=0.05)
+        # the noise is reproducible and reused when not randomized
+        np.testing.assert_allclose(xform(img, randomize=False), result)
+        np.testing.assert_allclose(xform.set_random_state(0)(img), result)
+
+    def test_scale_intensity(self):
+        img = _get_batch()
+        xform = BatchRandScaleIntensity(factors=0.5, prob=0.5).set_random_state(1)
+        result = xform(img)
+        for i in range(img.shape[0]):
+            factor = xform.factor[i] if xform._do_transform[i] else 0.0
+            expected = ScaleIntensity(minv=None, maxv=None, factor=factor)(img[i].numpy())
+            np.testing.assert_allclose(result[i].numpy(), expected, rtol=1e-6)
+
+    def test_adjust_contrast(self):
+        img = _get_batch()
+        xform = BatchRandAdjustContrast(prob=0.5, gamma=(0.5, 2.0)).set_random_state(2)
+        result = xform(img)
+        for i in range(img.shape[0]):
+            if not xform._do_transform[i]:
+                np.testing.assert_allclose(result[i].numpy(), img[i].numpy())
+                continue
+            expected = AdjustContrast(xform.gamma_value[i])(img[i].numpy())
+            np.testing.assert_allclose(result[i].numpy(), expected, rtol=1e-5, atol=1e-6)
+
+    def test_compose_seed(self):
+        img = _get_batch().long()
+        chain = Compose(
+            [
+                BatchRandScaleIntensity(factors=0.5, prob=0.5),
+                BatchRandAdjustContrast(prob=0.5),
+                BatchRandGaussianNoise(prob=0.5),
+            ]
+        )
+        expected = chain.set_random_state(3)(img)
+        self.assertEqual(expected.dtype, torch.float32)
+        np.testing.assert_allclose(chain.set_random_state(3)(img), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
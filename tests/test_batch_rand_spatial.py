@@ -0,0 +1,123 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.transforms import (
+    Affine,
+    BatchRandAffine,
+    BatchRandFlip,
+    BatchRandRotate,
+    BatchRandZoom,
+    Compose,
+    Flip,
+    Rotate,
+)
+
+TEST_CASES_AFFINE = [
+    [(4, 2, 12, 10), {"rotate_range": 0.5, "shear_range": (0.1, 0.2), "padding_mode": "zeros"}],
+    [(3, 1, 12, 10, 8), {"rotate_range": (0.3, (0.1, 0.2), 0.4), "translate_range": (2, 1, 3)}],
+    [(5, 1, 9, 11), {"scale_range": (0.2, 0.1), "spatial_size": (10, 12), "padding_mode": "border"}],
+]
+
+TEST_CASES_ROTATE = [
+    [(4, 2, 12, 10), {"range_x": 0.5}],
+    [(3, 1, 12, 10, 8), {"range_x": 0.3, "range_y": (0.1, 0.2), "range_z": 0.4, "padding_mode": "zeros"}],
+]
+
+
+def _get_batch(shape):
+    return torch.as_tensor(np.random.RandomState(0).rand(*shape).astype(np.float32))
+
+
+class TestBatchRandSpatial(unittest.TestCase):
+    @parameterized.expand(TEST_CASES_AFFINE)
+    def test_affine(self, shape, kwargs):
+        img = _get_batch(shape)
+        xform = BatchRandAffine(prob=0.7, **kwargs).set_random_state(0)
+        result = xform(img)
+        spatial_size = kwargs.get("spatial_size", shape[2:])
+        self.assertTupleEqual(tuple(result.shape), shape[:2] + tuple(spatial_size))
+        for i in range(shape[0]):
+            params = {}
+            if xform._do_transform[i]:
+                params = {
+                    "rotate_params": xform.rotate_params[i].tolist() or None,
+                    "shear_params": xform.shear_params[i].tolist() or None,
+                    "translate_params": xform.translate_params[i].tolist() or None,
+                    "scale_params": xform.scale_params[i].tolist() or None,
+                }
+            affine = Affine(
+                spatial_size=spatial_size,
+                mode=kwargs.get("mode", "bilinear"),
+                padding_mode=kwargs.get("padding_mode", "reflection"),
+                **params,
+            )
+            np.testing.assert_allclose(result[i].numpy(), affine(img[i].numpy())[0], atol=1e-4)
+
+    @parameterized.expand(TEST_CASES_ROTATE)
+    def test_rotate(self, shape, kwargs):
+        img = _get_batch(shape)
+        xform = BatchRandRotate(prob=0.7, **kwargs).set_random_state(1)
+        result = xform(img)
+        self.assertTupleEqual(tuple(result.shape), shape)
+        for i in range(shape[0]):
+            if not xform._do_transform[i]:
+                np.testing.assert_allclose(result[i].numpy(), img[i].numpy(), atol=1e-5)
+                continue
+            angle = xform.angles[i, 0] if len(shape) == 4 else xform.angles[i]
+            rotate = Rotate(angle, padding_mode=kwargs.get("padding_mode", "border"), dtype=np.float32)
+            np.testing.assert_allclose(result[i].numpy(), rotate(img[i].numpy()), atol=1e-4)
+
+    def test_zoom(self):
+        img = _get_batch((6, 1, 11, 9, 7))
+        xform = BatchRandZoom(prob=1.0, min_zoom=(0.8, 1.2), max_zoom=(1.0, 1.5), padding_mode="zeros")
+        result = xform.set_random_state(2)(img)
+        self.assertTupleEqual(tuple(result.shape), tuple(img.shape))
+        # the center is a fixed point, the first two dims share the same factor
+        np.testing.assert_allclose(result[:, :, 5, 4, 3], img[:, :, 5, 4, 3], atol=1e-5)
+        np.testing.assert_allclose(xform.zoom.shape, (6, 2))
+        # no zoom
+        xform = BatchRandZoom(prob=1.0, min_zoom=1.0, max_zoom=1.0)
+        np.testing.assert_allclose(xform(img), img, atol=1e-5)
+
+    def test_flip(self):
+        img = _get_batch((8, 2, 5, 6))
+        xform = BatchRandFlip(prob=0.5, spatial_axis=1).set_random_state(3)
+        result = xform(img)
+        for i in range(img.shape[0]):
+            expected = Flip(spatial_axis=1)(img[i].numpy()) if xform._do_transform[i] else img[i].numpy()
+            np.testing.assert_allclose(result[i].numpy(), expected)
+        self.assertTrue(0 < xform._do_transform.sum() < img.shape[0])
+
+    def test_seed_and_labels(self):
+        img = _get_batch((4, 1, 16, 16))
+        label = (img > 0.5).float()
+        chain = Compose(
+            [BatchRandAffine(prob=1.0, rotate_range=0.5, mode="nearest"), BatchRandFlip(prob=0.5, spatial_axis=0)]
+        )
+        expected = chain.set_random_state(4)(img)
+        np.testing.assert_allclose(chain.set_random_state(4)(img), expected)
+        # the same transforms are applied to the labels
+        out_label = label
+        for t in chain.transforms:
+            out_label = t(out_label, randomize=False)
+        np.testing.assert_allclose(out_label, (expected > 0.5).float())
+        with self.assertRaises(ValueError):
+            chain.transforms[0](label[:2], randomize=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import nibabel as nib
+import numpy as np
+
+from monai.data import BucketBatchSampler, DataLoader, pad_list_data_collate
+
+
+def _sizes(num_items):
+    rs = np.random.RandomState(0)
+    return [tuple(rs.randint(10, 100, size=3)) for _ in range(num_items)]
+
+
+class TestBucketBatchSampler(unittest.TestCase):
+    def test_batches(self):
+        sizes = _sizes(23)
+        sampler = BucketBatchSampler(sizes, batch_size=4, num_buckets=3)
+        batches = list(sampler)
+        self.assertEqual(len(batches), len(sampler))
+        self.assertEqual(sorted(i for b in batches for i in b), list(range(23)))
+        self.assertTrue(all(len(b) <= 4 for b in batches))
+
+        sampler.set_epoch(1)
+        self.assertNotEqual(list(sampler), batches)
+        sampler.set_epoch(0)
+        self.assertEqual(list(sampler), batches)
+
+        sampler = BucketBatchSampler(sizes, batch_size=4, num_buckets=3, drop_last=True)
+        self.assertTrue(all(len(b) == 4 for b in sampler))
+        self.assertEqual(len(sampler), 5)
+
+    def test_padding_waste(self):
+        sizes = _sizes(64)
+        random_batches = BucketBatchSampler(sizes, batch_size=4, num_buckets=1).get_padding_stats()
+        bucket_batches = BucketBatchSampler(sizes, batch_size=4, num_buckets=8).get_padding_stats()
+        self.assertEqual(random_batches["data_voxels"], bucket_batches["data_voxels"])
+        self.assertLess(bucket_batches["waste_ratio"], random_batches["waste_ratio"])
+        self.assertLess(bucket_batches["padded_voxels"], random_batches["padded_voxels"])
+
+    def test_anisotropic(self):
+        # the same number of voxels, but the padding to collate 100x10 and 10x100 items is 100x100
+        sizes = [(100, 10), (10, 100)] * 8 + [(50, 20)] * 4
+        sampler = BucketBatchSampler(sizes, batch_size=4, num_buckets=5)
+        for batch in sampler:
+            self.assertEqual(len({sizes[i] for i in batch}), 1)
+        self.assertEqual(sampler.get_padding_stats()["waste_ratio"], 0.0)
+
+    def test_distributed(self):
+        sizes = _sizes(22)
+        samplers = [BucketBatchSampler(sizes, batch_size=4, num_buckets=2, num_replicas=3, rank=r) for r in range(3)]
+        batches = [list(s) for s in samplers]
+        self.assertEqual([len(b) for b in batches], [2, 2, 2])
+        self.assertEqual(sorted({i for b in batches for batch in b for i in batch}), list(range(22)))
+        with self.assertRaises(ValueError):
+            BucketBatchSampler(sizes, batch_size=4, num_replicas=3, rank=3)
+
+    def test_loader(self):
+        data = [{"image": np.ones((1, s, s)) * s} for s in (2, 5, 6, 6, 2, 5)]
+        sampler = BucketBatchSampler([d["image"].shape[1:] for d in data], batch_size=2, num_buckets=3)
+        for batch in DataLoader(data, batch_sampler=sampler, collate_fn=pad_list_data_collate):
+            values = batch["image"].amax(dim=(1, 2, 3))
+            self.assertEqual(values[0], values[1])
+
+    def test_read_sizes(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filenames = []
+            for i, shape in enumerate([(4, 5, 6), (7, 8, 9)]):
+                filenames.append(os.path.join(tempdir, f"test_image{i}.nii.gz"))
+                nib.save(nib.Nifti1Image(np.zeros(shape), np.eye(4)), filenames[-1])
+            self.assertEqual(BucketBatchSampler.read_spatial_sizes(filenames), [(4, 5, 6), (7, 8, 9)])
+
+
+if __name__ == "__main__":
+    unittest.main()
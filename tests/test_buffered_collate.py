@@ -0,0 +1,104 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+from copy import deepcopy
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.data import BufferedCollate, DataLoader, Dataset, decollate_batch, pad_list_data_collate
+from monai.transforms import PadListDataCollate
+from tests.utils import skip_if_no_cuda
+
+TEST_CASES = [
+    ["symmetric"],
+    ["end"],
+]
+
+
+def _make_data(num_items):
+    rs = np.random.RandomState(0)
+    return [
+        {
+            "image": rs.rand(1, 10 - 2 * i, 8 + 2 * i).astype(np.float32),
+            "label": torch.as_tensor(rs.randint(0, 2, size=(1, 10 - 2 * i, 8 + 2 * i))),
+            "name": f"item_{i}",
+        }
+        for i in range(num_items)
+    ]
+
+
+class TestBufferedCollate(unittest.TestCase):
+    @parameterized.expand(TEST_CASES)
+    def test_same_as_pad_collate(self, method):
+        data = _make_data(3)
+        expected = pad_list_data_collate(deepcopy(data), method=method)
+        result = BufferedCollate(method=method)(deepcopy(data))
+        self.assertEqual(result["name"], expected["name"])
+        for key in ("image", "label"):
+            self.assertEqual(result[key].dtype, expected[key].dtype)
+            torch.testing.assert_allclose(result[key], expected[key])
+
+        # the padding can be inverted
+        if method != "symmetric":
+            return
+        for item, orig in zip(decollate_batch(result), data):
+            inverted = PadListDataCollate.inverse(item)
+            np.testing.assert_allclose(inverted["image"], orig["image"])
+
+    def test_reuse(self):
+        collate = BufferedCollate(num_buffers=2)
+        data = _make_data(4)
+        for _ in range(5):
+            for i in range(3):
+                batch = collate(deepcopy([data[i], data[i + 1]]))
+                np.testing.assert_allclose(batch["image"][0, :, : 10 - 2 * i, 1 : 9 + 2 * i], data[i]["image"])
+                del batch
+        # 2 sets of buffers (image and label), the first ones are resized once
+        self.assertLessEqual(collate.num_allocations, 6)
+
+        # the batches still referenced are not overwritten
+        kept = [collate(deepcopy([data[0], data[1]])) for _ in range(3)]
+        for batch in kept:
+            np.testing.assert_allclose(batch["label"][1, :, 1:9, :], data[1]["label"])
+        self.assertEqual(len({b["image"].data_ptr() for b in kept}), 3)
+
+    def test_loader(self):
+        collate = BufferedCollate()
+        data = [(np.ones((1, 4, 4)) * i, i) for i in range(5)]
+        num_workers = 0 if sys.platform == "win32" else 2
+        for loader in (
+            DataLoader(Dataset(data), batch_size=2, collate_fn=collate, num_workers=n) for n in (0, num_workers)
+        ):
+            results = [(b[0].clone(), b[1]) for b in loader]
+            torch.testing.assert_allclose(results[2][0], torch.ones(1, 1, 4, 4, dtype=torch.float64) * 4)
+            torch.testing.assert_allclose(results[1][1], torch.tensor([2, 3]))
+
+    @skip_if_no_cuda
+    def test_non_blocking_copies(self):
+        collate = BufferedCollate(num_buffers=2, pin_memory=True)
+        data = [(np.full((1, 512, 512), i, dtype=np.float32),) for i in range(8)]
+        results = []
+        for i in range(0, len(data), 2):
+            batch = collate(data[i : i + 2])
+            self.assertTrue(batch[0].is_pinned())
+            # the copies may still be queued when the batch is released
+            results.append(batch[0].to("cuda", non_blocking=True) * 1)
+            del batch
+        for i, result in enumerate(results):
+            self.assertListEqual(result[:, 0, 0, 0].tolist(), [2 * i, 2 * i + 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
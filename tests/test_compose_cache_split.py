@@ -0,0 +1,149 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import torch
+
+from monai.data import CacheDataset, PersistentDataset
+from monai.transforms import (
+    AddChanneld,
+    CastToTyped,
+    Compose,
+    CopyItemsd,
+    Flipd,
+    Lambdad,
+    MapTransform,
+    NormalizeIntensityd,
+    RandFlipd,
+    RandGaussianNoised,
+    RandSpatialCropd,
+    ScaleIntensityd,
+    ToTensord,
+)
+
+
+def _transforms(hoist):
+    return Compose(
+        [
+            AddChanneld(["img", "seg"]),
+            RandFlipd(["img", "seg"], prob=0.5, spatial_axis=0),
+            ScaleIntensityd("img"),
+            ToTensord(["img", "seg"]),
+            RandGaussianNoised("img", prob=0.5),
+            CastToTyped("seg", dtype=torch.int64),
+            CopyItemsd("seg", times=1, names="seg_copy"),
+            NormalizeIntensityd("img"),
+            Flipd("seg", spatial_axis=1),
+            RandSpatialCropd(["img", "seg"], roi_size=(6, 6), random_size=False),
+            lambda x: x,
+        ],
+        hoist_deterministic=hoist,
+    ).set_random_state(0)
+
+
+class TestComposeCacheSplit(unittest.TestCase):
+    def test_default_split(self):
+        transforms = _transforms(hoist=False)
+        cached, not_cached = transforms.cache_split()
+        self.assertListEqual(cached, list(transforms.transforms[:1]))
+        self.assertListEqual(not_cached, list(transforms.transforms[1:]))
+
+    def test_hoist(self):
+        transforms = _transforms(hoist=True)
+        cached, not_cached = transforms.cache_split()
+        names = [type(t).__name__ for t in cached]
+        # ScaleIntensityd, ToTensord and CastToTyped commute with the flip, and the last one doesn't read
+        # the noisy image. CopyItemsd reads the flipped items.
+        self.assertListEqual(names, ["AddChanneld", "ScaleIntensityd", "ToTensord", "CastToTyped"])
+        names = [type(t).__name__ for t in not_cached]
+        self.assertListEqual(
+            names[:-1],
+            ["RandFlipd", "RandGaussianNoised", "CopyItemsd", "NormalizeIntensityd", "Flipd", "RandSpatialCropd"],
+        )
+        report = transforms.cache_report()
+        self.assertIn("  3 ToTensord (hoisted before RandFlipd)", report)
+        self.assertIn("  5 CastToTyped (hoisted before RandFlipd)", report)
+        self.assertIn("  6 CopyItemsd (doesn't commute with RandFlipd)", report)
+        self.assertIn("  7 NormalizeIntensityd (doesn't commute with RandGaussianNoised)", report)
+        self.assertIn("  8 Flipd (doesn't commute with RandFlipd)", report)
+        self.assertIn("(not a Transform)", report)
+
+    def test_unknown_keys(self):
+        class AddLabeld(MapTransform):
+            def __call__(self, data):
+                d = dict(data)
+                for key in self.key_iterator(d):
+                    d[key] = d[key] + d["seg"]
+                return d
+
+        # the items read by the transforms are unknown, `AddLabeld` reads "seg", which is written by the random flip
+        for transform in (Lambdad("img", lambda x: x), AddLabeld("img")):
+            self.assertIsNone(transform.read_keys())
+            self.assertIsNone(transform.write_keys())
+            transforms = Compose([RandFlipd("seg", prob=0.5), transform], hoist_deterministic=True)
+            cached, not_cached = transforms.cache_split()
+            self.assertListEqual(cached, [])
+            self.assertListEqual(not_cached, list(transforms.transforms))
+
+    def test_voxelwise_normalize(self):
+        img = np.arange(16, dtype=np.float32).reshape(1, 4, 4)
+        subtrahend = np.arange(16, dtype=np.float32)[::-1].reshape(1, 4, 4) * 2
+        for normalize, hoisted in (
+            (NormalizeIntensityd("img", subtrahend=subtrahend, divisor=np.ones_like(img)), False),
+            (NormalizeIntensityd("img", subtrahend=[1.0], divisor=[2.0], channel_wise=True), True),
+            (NormalizeIntensityd("img", subtrahend=1.0, divisor=2.0), True),
+        ):
+            self.assertEqual(normalize.order_invariant(), hoisted)
+            transforms = Compose([RandFlipd("img", prob=1.0, spatial_axis=1), normalize], hoist_deterministic=True)
+            self.assertListEqual(transforms.cache_split()[0], [normalize] if hoisted else [])
+            expected = transforms({"img": img})["img"]
+            np.testing.assert_allclose(CacheDataset([{"img": img}], transforms, progress=False)[0]["img"], expected)
+
+    def test_split_once(self):
+        data = [{"img": np.ones((8, 8), dtype=np.float32), "seg": np.ones((8, 8))} for _ in range(3)]
+        transforms = _transforms(hoist=True)
+        with mock.patch.object(Compose, "_cache_plan", wraps=transforms._cache_plan) as plan:
+            dataset = CacheDataset(data, transforms, progress=False)
+            for _ in range(2):
+                for i in range(len(dataset)):
+                    dataset[i]
+            self.assertEqual(plan.call_count, 1)
+            transforms.hoist_deterministic = False
+            self.assertListEqual(transforms.cache_split()[0], list(transforms.transforms[:1]))
+            self.assertEqual(plan.call_count, 2)
+
+    def test_datasets(self):
+        rng = np.random.RandomState(0)
+        data = [{"img": rng.rand(8, 8).astype(np.float32), "seg": (rng.rand(8, 8) > 0.5)} for _ in range(4)]
+        transforms = _transforms(hoist=False).set_random_state(1)
+        expected = [transforms(d) for d in data]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for dataset in (
+                CacheDataset(data, _transforms(hoist=True).set_random_state(1), progress=False),
+                PersistentDataset(data, _transforms(hoist=True).set_random_state(1), cache_dir=cache_dir),
+            ):
+                for i, d in enumerate(expected):
+                    result = dataset[i]
+                    np.testing.assert_allclose(result["img"], d["img"], atol=1e-6)
+                    np.testing.assert_allclose(result["seg"], d["seg"])
+                    self.assertEqual(result["seg"].dtype, torch.int64)
+                    np.testing.assert_allclose(result["seg_copy"], d["seg_copy"])
+        cached = CacheDataset(data, _transforms(hoist=True), progress=False)._cache[0]
+        self.assertIsInstance(cached["img"], torch.Tensor)
+        self.assertAlmostEqual(float(cached["img"].max()), 1.0, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.transforms import (
+    Affined,
+    Compose,
+    Lambdad,
+    Orientationd,
+    PendingResample,
+    RandAffined,
+    RandRotated,
+    RandZoomd,
+    Rotated,
+    Spacingd,
+    Zoomd,
+)
+from monai.utils.enums import InverseKeys
+
+KEYS = ["img", "seg"]
+
+# single transforms, the lazy resampling is the same as the eager one
+TESTS = [
+    [Spacingd(KEYS, pixdim=(0.7, 0.9, 1.3), mode=("bilinear", "nearest"))],
+    [Orientationd(KEYS, axcodes="LPS")],
+    [Rotated(KEYS, angle=(0.3, 0.1, 0.2), keep_size=False, mode=("bilinear", "nearest"))],
+    [RandRotated(KEYS, range_x=0.3, range_y=0.2, prob=1.0, mode=("bilinear", "nearest"))],
+    [Zoomd(KEYS, zoom=1.3, mode="trilinear")],
+    [Zoomd(KEYS, zoom=0.7, mode="trilinear", align_corners=(True, None), keep_size=False)],
+    [Affined(KEYS, rotate_params=(0.2, 0.1, 0.3), translate_params=(2, 1, 0), spatial_size=(18, 20, 22))],
+    [RandAffined(KEYS, prob=1.0, rotate_range=0.3, translate_range=3, spatial_size=(22, 22, 18))],
+]
+
+
+def _get_data():
+    rng = np.random.RandomState(0)
+    affine = np.diag([1.5, 1.2, 2.0, 1.0])
+    return {
+        "img": rng.rand(1, 20, 24, 16).astype(np.float32),
+        "seg": (rng.rand(1, 20, 24, 16) > 0.5).astype(np.float32),
+        "img_meta_dict": {"affine": affine.copy()},
+        "seg_meta_dict": {"affine": affine.copy()},
+    }
+
+
+def _get_chain():
+    return [
+        Spacingd(KEYS, pixdim=(1.0, 1.0, 1.0), mode=("bilinear", "nearest")),
+        Orientationd(KEYS, axcodes="LPS"),
+        RandRotated(KEYS, range_x=0.3, prob=1.0, mode=("bilinear", "nearest")),
+        RandZoomd(KEYS, prob=1.0, min_zoom=0.8, max_zoom=1.2, mode=("trilinear", "nearest")),
+        RandAffined(KEYS, prob=1.0, rotate_range=0.2, scale_range=0.1, mode=("bilinear", "nearest")),
+    ]
+
+
+class TestComposeLazy(unittest.TestCase):
+    @parameterized.expand(TESTS)
+    def test_single(self, transform):
+        expected = Compose([transform]).set_random_state(3)(_get_data())
+        result = Compose([transform], lazy=True).set_random_state(3)(_get_data())
+        for key in KEYS:
+            self.assertEqual(type(result[key]), type(expected[key]))
+            np.testing.assert_allclose(np.asarray(result[key]), np.asarray(expected[key]), atol=1e-4)
+            np.testing.assert_allclose(
+                result[key + InverseKeys.KEY_SUFFIX][-1][InverseKeys.ORIG_SIZE],
+                expected[key + InverseKeys.KEY_SUFFIX][-1][InverseKeys.ORIG_SIZE],
+            )
+
+    def test_chain(self):
+        eager = Compose(_get_chain()).set_random_state(1)
+        lazy = Compose(_get_chain(), lazy=True).set_random_state(1)
+        expected, result = eager(_get_data()), lazy(_get_data())
+        np.testing.assert_allclose(result["img_meta_dict"]["affine"], expected["img_meta_dict"]["affine"])
+        for key in KEYS:
+            self.assertTupleEqual(result[key].shape, expected[key].shape)
+            self.assertEqual(len(result[key + InverseKeys.KEY_SUFFIX]), 5)
+        # labels are not blurred by the intermediate interpolations
+        np.testing.assert_allclose(np.unique(np.asarray(result["seg"])), [0.0, 1.0])
+        self.assertLess(np.abs(np.asarray(result["img"]) - np.asarray(expected["img"])).mean(), 0.1)
+
+        inverted = lazy.inverse(result)
+        for key in KEYS:
+            self.assertTupleEqual(inverted[key].shape, (1, 20, 24, 16))
+            self.assertEqual(len(inverted[key + InverseKeys.KEY_SUFFIX]), 0)
+
+    def test_non_lazy_transform(self):
+        shapes = []
+        chain = _get_chain()
+        chain.insert(2, Lambdad("img", lambda x: shapes.append(x.shape) or x))
+        result = Compose(chain, lazy=True).set_random_state(1)(_get_data())
+        # the pending resampling is applied before the non lazy transform
+        self.assertEqual(shapes, [result["img"].shape])
+
+    def test_pending_resample(self):
+        data = {"img": torch.arange(12.0).reshape(1, 3, 4)}
+        pending = PendingResample()
+        flip = np.array([[-1.0, 0.0, 2.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        pending.push("img", flip, (3, 4))
+        pending.push("img", flip, (3, 4))
+        self.assertTupleEqual(pending.spatial_shape(data, "img"), (3, 4))
+        out = pending.apply(data)
+        self.assertEqual(len(pending), 0)
+        np.testing.assert_allclose(out["img"], data["img"].numpy())
+        pending.push("img", flip, (3, 4), as_tensor_output=True)
+        out = pending.apply(data)
+        np.testing.assert_allclose(out["img"].numpy(), torch.flip(data["img"], dims=(1,)).numpy())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@ import torch
 from parameterized import parameterized
 
 from monai.metrics import ConfusionMatrixMetric, get_confusion_matrix
+from monai.networks import one_hot
 
 # input data
 data: Dict[Any, Any] = {
@@ -261,6 +262,18 @@ class TestConfusionMatrix(unittest.TestCase):
         result = metric(**vals)
         np.testing.assert_allclose(result, expected_value, atol=1e-4, rtol=1e-4)
 
+    def test_label_indices(self):
+        generator = torch.Generator().manual_seed(0)
+        y_pred = torch.randint(0, 3, (4, 1, 6, 7), generator=generator)
+        y = torch.randint(0, 3, (4, 1, 6, 7), generator=generator)
+        for include_background in (True, False):
+            expected = get_confusion_matrix(one_hot(y_pred, 3), one_hot(y, 3), include_background)
+            result = get_confusion_matrix(y_pred, y, include_background, num_classes=3)
+            np.testing.assert_allclose(result.numpy(), expected.numpy())
+        metric = ConfusionMatrixMetric(metric_name="f1", compute_sample=True, num_classes=3)
+        expected = ConfusionMatrixMetric(metric_name="f1", compute_sample=True)(one_hot(y_pred, 3), one_hot(y, 3))
+        np.testing.assert_allclose(metric(y_pred, y)[0], expected[0], rtol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
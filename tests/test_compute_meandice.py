@@ -16,6 +16,7 @@ import torch
 from parameterized import parameterized
 
 from monai.metrics import DiceMetric, compute_meandice
+from monai.networks import one_hot
 
 # keep background
 TEST_CASE_1 = [  # y (1, 1, 2, 2), y_pred (1, 1, 2, 2), expected out (1, 1)
@@ -198,6 +199,19 @@ class TestComputeMeanDice(unittest.TestCase):
         result, _ = dice_metric(**input_data)
         np.testing.assert_allclose(result.cpu().numpy(), expected_value, atol=1e-4)
 
+    @parameterized.expand([[True], [False]])
+    def test_label_indices(self, include_background):
+        generator = torch.Generator().manual_seed(0)
+        y_pred = torch.randint(0, 4, (3, 1, 8, 9), generator=generator)
+        y = torch.randint(0, 3, (3, 1, 8, 9), generator=generator)  # no ground truth of the class 3, NaN dice
+        expected = compute_meandice(one_hot(y_pred, 4), one_hot(y, 4), include_background)
+        result = compute_meandice(y_pred, y, include_background, num_classes=4)
+        np.testing.assert_allclose(result.numpy(), expected.numpy(), rtol=1e-6)
+        result, _ = DiceMetric(include_background, reduction="none", num_classes=4)(y_pred, y)
+        np.testing.assert_allclose(result.numpy(), expected.numpy(), rtol=1e-6)
+        with self.assertRaises(ValueError):
+            compute_meandice(y_pred, y, num_classes=3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,7 +15,7 @@ import numpy as np
 import torch
 from parameterized import parameterized
 
-from monai.metrics import compute_roc_auc
+from monai.metrics import compute_roc_auc, compute_roc_auc_from_histogram, compute_roc_auc_histogram
 from monai.transforms import Activations, AsDiscrete
 
 TEST_CASE_1 = [
@@ -90,6 +90,29 @@ class TestComputeROCAUC(unittest.TestCase):
         result = compute_roc_auc(y_pred=y_pred, y=y, average=average)
         np.testing.assert_allclose(expected_value, result, rtol=1e-5)
 
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_5, TEST_CASE_6, TEST_CASE_7])
+    def test_histogram(self, y_pred, y, softmax, to_onehot, average, expected_value):
+        y_pred = Activations(softmax=softmax)(y_pred)
+        y = AsDiscrete(to_onehot=to_onehot, n_classes=2)(y)
+        # the distinct values fall in distinct bins
+        histogram = compute_roc_auc_histogram(y_pred, y, num_bins=10000, value_range=(0.0, 10.0))
+        result = compute_roc_auc_from_histogram(histogram, average=average)
+        np.testing.assert_allclose(expected_value, result, rtol=1e-5)
+
+    def test_ties(self):
+        state = np.random.RandomState(0)
+        y_pred = torch.as_tensor(state.randint(0, 10, (200, 3)) / 10.0)
+        y = torch.as_tensor(state.randint(0, 2, (200, 3)))
+        # the Mann-Whitney U statistic counting the tied pairs as 1/2
+        expected = []
+        for pred, label in zip(y_pred.T.numpy(), y.T.numpy()):
+            diff = pred[label == 1][:, None] - pred[label == 0][None]
+            expected.append(np.mean((diff > 0) + 0.5 * (diff == 0)))
+        np.testing.assert_allclose(compute_roc_auc(y_pred, y, average="none"), expected, rtol=1e-10)
+        histogram = compute_roc_auc_histogram(y_pred[:100], y[:100], num_bins=10)
+        histogram += compute_roc_auc_histogram(y_pred[100:], y[100:], num_bins=10)
+        np.testing.assert_allclose(compute_roc_auc_from_histogram(histogram, average="none"), expected, rtol=1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
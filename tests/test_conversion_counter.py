@@ -0,0 +1,100 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch
+
+from monai.transforms import (
+    BorderPad,
+    CenterSpatialCrop,
+    Compose,
+    Flip,
+    GaussianSmooth,
+    NormalizeIntensity,
+    RandGaussianNoise,
+    RandRotate,
+    RandZoom,
+    Rotate90,
+    ScaleIntensity,
+    ScaleIntensityRange,
+    Spacing,
+    SpatialPad,
+    ThresholdIntensity,
+)
+from monai.transforms.utils import pad_nd
+from monai.utils import ConversionCounter
+
+DEVICE = "cuda:0" if torch.cuda.is_available() else "cpu"
+
+
+def _pipeline():
+    return Compose(
+        [
+            ScaleIntensity(),
+            NormalizeIntensity(),
+            ThresholdIntensity(threshold=0.5, above=False, cval=0.5),
+            RandGaussianNoise(prob=1.0),
+            GaussianSmooth(sigma=1.0),
+            SpatialPad(spatial_size=(20, 20, 12), mode="reflect"),
+            BorderPad(spatial_border=1),
+            CenterSpatialCrop(roi_size=(16, 16, 10)),
+            Flip(spatial_axis=0),
+            Rotate90(k=1, spatial_axes=(0, 1)),
+            RandRotate(range_x=0.3, prob=1.0),
+            RandZoom(prob=1.0, min_zoom=0.8, max_zoom=1.2, padding_mode="edge"),
+            ScaleIntensityRange(a_min=-1.0, a_max=1.0, b_min=0.0, b_max=1.0, clip=True),
+        ]
+    ).set_random_state(0)
+
+
+class TestConversionCounter(unittest.TestCase):
+    def test_tensor_pipeline(self):
+        img = torch.rand(1, 18, 16, 10, device=DEVICE)
+        with ConversionCounter() as counter:
+            out = _pipeline()(img)
+            out, _, _ = Spacing(pixdim=(1.0, 1.0, 0.8))(out, affine=np.eye(4))
+        self.assertIsInstance(out, torch.Tensor)
+        self.assertEqual(out.dtype, torch.float32)
+        self.assertEqual(out.device, img.device)
+        # only the noise drawn from the numpy random state is uploaded
+        self.assertEqual(counter.to_numpy, 0, counter.summary())
+        self.assertDictEqual(counter.summary(), {"RandGaussianNoise": {"to_numpy": 0, "to_tensor": 1}})
+
+    def test_numpy_pipeline(self):
+        img = np.random.RandomState(0).rand(1, 18, 16, 10).astype(np.float32)
+        with ConversionCounter() as counter:
+            out = _pipeline()(img)
+        self.assertIsInstance(out, np.ndarray)
+        self.assertGreater(counter.to_numpy, 0)
+        self.assertGreater(counter.to_tensor, 0)
+        self.assertIn("GaussianSmooth", counter.summary())
+        # the same results on both paths
+        expected = _pipeline()(torch.as_tensor(img)).numpy()
+        np.testing.assert_allclose(out, expected, atol=1e-4)
+        # the functions are restored
+        counter.reset()
+        torch.as_tensor(img)
+        self.assertEqual(counter.to_tensor, 0)
+
+    def test_pad_nd(self):
+        img = np.arange(24).reshape(1, 4, 6)
+        for mode in ("constant", "edge", "reflect", "wrap", "symmetric"):
+            expected = np.pad(img, [(0, 0), (2, 1), (3, 0)], mode=mode)
+            out = pad_nd(torch.as_tensor(img), [(0, 0), (2, 1), (3, 0)], mode=mode)
+            self.assertIsInstance(out, torch.Tensor)
+            self.assertEqual(out.dtype, torch.int64)
+            np.testing.assert_allclose(out.numpy(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
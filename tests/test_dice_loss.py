@@ -16,6 +16,7 @@ import torch
 from parameterized import parameterized
 
 from monai.losses import DiceLoss
+from monai.networks import one_hot
 from tests.utils import SkipIfBeforePyTorchVersion, test_script_save
 
 TEST_CASES = [
@@ -196,6 +197,22 @@ class TestDiceLoss(unittest.TestCase):
             loss = DiceLoss(to_onehot_y=True)
             loss.forward(chn_input, chn_target)
 
+    @parameterized.expand(
+        [[{}], [{"include_background": False, "squared_pred": True}], [{"batch": True, "jaccard": True}]]
+    )
+    def test_label_indices(self, input_param):
+        generator = torch.Generator().manual_seed(0)
+        input = torch.rand(2, 3, 5, 6, generator=generator, requires_grad=True)
+        target = torch.randint(0, 3, (2, 1, 5, 6), generator=generator)
+        loss = DiceLoss(to_onehot_y=True, softmax=True, reduction="none", **input_param)
+        result = loss(input, target)
+        (grad,) = torch.autograd.grad(result.sum(), input)
+        loss = DiceLoss(softmax=True, reduction="none", **input_param)
+        expected = loss(input, one_hot(target, 3))
+        (expected_grad,) = torch.autograd.grad(expected.sum(), input)
+        np.testing.assert_allclose(result.detach().numpy(), expected.detach().numpy(), rtol=1e-5)
+        np.testing.assert_allclose(grad.numpy(), expected_grad.numpy(), rtol=1e-4, atol=1e-7)
+
     @SkipIfBeforePyTorchVersion((1, 7, 0))
     def test_script(self):
         loss = DiceLoss()
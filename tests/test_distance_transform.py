@@ -0,0 +1,79 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.transforms import distance_transform
+from monai.utils import optional_import
+
+ndimage, has_scipy = optional_import("scipy.ndimage")
+
+TEST_CASES = [
+    [(17, 23), "euclidean", None],
+    [(9, 11, 13), "euclidean", None],
+    [(9, 11, 13), "euclidean", (0.5, 2.0, 1.5)],
+    [(7, 1, 12), "euclidean", 3.0],
+    [(17, 23), "chessboard", None],
+    [(9, 11, 13), "chessboard", None],
+    [(17, 23), "taxicab", None],
+    [(9, 11, 13), "taxicab", None],
+]
+
+
+def _scipy_distance(img, metric, sampling):
+    if metric == "euclidean":
+        return ndimage.distance_transform_edt(img, sampling=sampling)
+    return ndimage.distance_transform_cdt(img, metric=metric)
+
+
+@unittest.skipUnless(has_scipy, "Requires scipy")
+class TestDistanceTransform(unittest.TestCase):
+    @parameterized.expand(TEST_CASES)
+    def test_scipy_parity(self, shape, metric, sampling):
+        img = np.random.RandomState(0).rand(*shape) > 0.1
+        result = distance_transform(torch.as_tensor(img), metric, sampling, dtype=torch.float64)
+        np.testing.assert_allclose(result.numpy(), _scipy_distance(img, metric, sampling), atol=1e-10)
+
+    def test_anisotropic_ties(self):
+        # the positions where the elements of the envelope start to be the nearest are rounded at the ties
+        rng = np.random.RandomState(2)
+        for _ in range(20):
+            img = rng.rand(*rng.randint(2, 12, size=3)) > rng.choice([0.3, 0.7, 0.97])
+            img[0, 0, 0] = False
+            sampling = tuple(rng.uniform(0.3, 3.0, size=3))
+            result = distance_transform(torch.as_tensor(img), sampling=sampling, dtype=torch.float64)
+            expected = ndimage.distance_transform_edt(img, sampling=sampling)
+            np.testing.assert_allclose(result.numpy(), expected, atol=1e-10)
+
+    def test_batch(self):
+        img = np.random.RandomState(1).rand(3, 2, 10, 14) > 0.05
+        img[0, 1] = True  # no zero element
+        result = distance_transform(torch.as_tensor(img), spatial_dims=2)
+        self.assertEqual(result.dtype, torch.float32)
+        self.assertTrue(torch.all(torch.isinf(result[0, 1])))
+        for b, c in [(0, 0), (1, 1), (2, 0)]:
+            expected = ndimage.distance_transform_edt(img[b, c])
+            np.testing.assert_allclose(result[b, c].numpy(), expected, rtol=1e-6)
+
+    def test_exceptions(self):
+        img = torch.ones(5, 5)
+        with self.assertRaises(ValueError):
+            distance_transform(img, metric="cosine")
+        with self.assertRaises(ValueError):
+            distance_transform(img, metric="taxicab", sampling=2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
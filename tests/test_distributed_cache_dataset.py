@@ -0,0 +1,93 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch.distributed as dist
+
+from monai.data import DataLoader, DistributedCacheDataset, PartitionSampler
+from monai.transforms import Compose, Lambda, RandLambdad
+from tests.utils import DistCall, DistTestCase
+
+
+class _CountingLambda(Lambda):
+    def __init__(self):
+        super().__init__(func=lambda x: {"value": x * 10})
+        self.num_calls = 0
+
+    def __call__(self, img):
+        self.num_calls += 1
+        return super().__call__(img)
+
+
+class TestDistributedCacheDataset(unittest.TestCase):
+    def test_partitions(self):
+        data = list(range(11))
+        datasets = []
+        for rank in range(3):
+            load = _CountingLambda()
+            transform = Compose([load, RandLambdad(keys="value", func=lambda x: x + 1)])
+            datasets.append(DistributedCacheDataset(data, transform, num_replicas=3, rank=rank, progress=False))
+            # only the partition of the current rank is cached
+            self.assertEqual(load.num_calls, 4)
+            self.assertEqual(len(datasets[-1]), 4)
+            self.assertEqual([d["value"] for d in datasets[-1]], [i * 10 + 1 for i in datasets[-1].partition])
+        self.assertEqual(sorted({i for d in datasets for i in d.partition}), data)
+
+    def test_rebalance(self):
+        data = list(range(40))
+        datasets = [
+            DistributedCacheDataset(
+                data,
+                Lambda(func=lambda x: x * 10),
+                num_replicas=4,
+                rank=rank,
+                rebalance_interval=2,
+                rebalance_rate=0.5,
+                cache_rate=0.6,
+                progress=False,
+            )
+            for rank in range(4)
+        ]
+        initial = [d.partition for d in datasets]
+        for epoch in range(5):
+            for ds in datasets:
+                PartitionSampler(ds).set_epoch(epoch)
+            partitions = [d.partition for d in datasets]
+            self.assertEqual(sorted(i for p in partitions for i in p), data)
+            for ds in datasets:
+                self.assertEqual(list(ds), [i * 10 for i in ds.partition])
+                self.assertEqual(ds._cache, [i * 10 for i in ds.partition[: ds.cache_num]])
+        changed = [len(set(p) - set(i)) for p, i in zip(partitions, initial)]
+        self.assertTrue(all(0 < c < 10 for c in changed))
+
+    def test_sampler(self):
+        dataset = DistributedCacheDataset(list(range(10)), Lambda(func=lambda x: x), num_replicas=2, rank=1)
+        sampler = PartitionSampler(dataset, seed=1)
+        first = list(sampler)
+        self.assertEqual(sorted(first), list(range(5)))
+        sampler.set_epoch(1)
+        self.assertNotEqual(list(sampler), first)
+        batches = list(DataLoader(dataset, batch_size=5, sampler=sampler))
+        np.testing.assert_equal(sorted(batches[0].tolist()), sorted(dataset.partition))
+
+
+class DistributedCacheDatasetTest(DistTestCase):
+    @DistCall(nnodes=1, nproc_per_node=2)
+    def test_ranks(self):
+        dataset = DistributedCacheDataset(list(range(5)), Lambda(func=lambda x: x), shuffle=False, progress=False)
+        self.assertEqual(dataset.rank, dist.get_rank())
+        self.assertEqual(list(dataset), [[0, 2, 4], [1, 3, 0]][dist.get_rank()])
+
+
+if __name__ == "__main__":
+    unittest.main()
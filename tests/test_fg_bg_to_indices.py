@@ -9,12 +9,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 import unittest
 
 import numpy as np
 from parameterized import parameterized
 
 from monai.transforms import FgBgToIndices
+from monai.transforms.utils import RunLengthIndices
 
 TEST_CASE_1 = [
     {"image_threshold": 0.0, "output_shape": None},
@@ -64,6 +66,30 @@ class TestFgBgToIndices(unittest.TestCase):
         np.testing.assert_allclose(fg_indices, expected_fg)
         np.testing.assert_allclose(bg_indices, expected_bg)
 
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3, TEST_CASE_4])
+    def test_compact(self, input_data, label, image, expected_fg, expected_bg):
+        fg_indices, bg_indices = FgBgToIndices(input_data["image_threshold"], compact=True)(label, image)
+        self.assertIsInstance(fg_indices, RunLengthIndices)
+        np.testing.assert_array_equal(fg_indices, expected_fg)
+        np.testing.assert_array_equal(bg_indices, expected_bg)
+        self.assertEqual(len(fg_indices), len(expected_fg))
+        np.testing.assert_array_equal(fg_indices[[0, -1]], expected_fg[[0, -1]])
+        self.assertEqual(bg_indices[-1], expected_bg[-1])
+        with self.assertRaises(IndexError):
+            fg_indices[len(expected_fg)]
+        with self.assertRaises(ValueError):
+            FgBgToIndices(compact=True, output_shape=[3, 3])
+
+    def test_compact_size(self):
+        mask = np.zeros((64, 64, 64), dtype=bool)
+        mask[10:40, 20:50, 5:60] = True
+        indices = RunLengthIndices.from_mask(mask)
+        np.testing.assert_array_equal(indices, np.nonzero(mask.ravel())[0])
+        self.assertLess(indices.nbytes * 50, np.nonzero(mask.ravel())[0].nbytes)
+        restored = pickle.loads(pickle.dumps(indices))
+        np.testing.assert_array_equal(restored, indices)
+        self.assertEqual(len(RunLengthIndices.from_mask(np.zeros(5))), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
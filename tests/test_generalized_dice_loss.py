@@ -16,6 +16,7 @@ import torch
 from parameterized import parameterized
 
 from monai.losses import GeneralizedDiceLoss
+from monai.networks import one_hot
 from tests.utils import SkipIfBeforePyTorchVersion, test_script_save
 
 TEST_CASES = [
@@ -179,6 +180,17 @@ class TestGeneralizedDiceLoss(unittest.TestCase):
             loss = GeneralizedDiceLoss(to_onehot_y=True)
             loss.forward(chn_input, chn_target)
 
+    def test_label_indices(self):
+        generator = torch.Generator().manual_seed(0)
+        input = torch.rand(2, 3, 5, 6, generator=generator)
+        target = torch.randint(0, 3, (2, 1, 5, 6), generator=generator)
+        for batch in (True, False):
+            loss = GeneralizedDiceLoss(to_onehot_y=True, softmax=True, include_background=False, batch=batch)
+            expected = GeneralizedDiceLoss(softmax=True, include_background=False, batch=batch)(
+                input, one_hot(target, 3)
+            )
+            np.testing.assert_allclose(loss(input, target).numpy(), expected.numpy(), rtol=1e-5)
+
     @SkipIfBeforePyTorchVersion((1, 7, 0))
     def test_script(self):
         loss = GeneralizedDiceLoss()
@@ -0,0 +1,69 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import PatchIter, get_patch_grid, get_patch_grid_coords, iter_patch, iter_patch_views
+
+TEST_CASES = []
+for mode, pad_opts in [
+    ("wrap", {}),
+    ("edge", {}),
+    ("reflect", {}),
+    ("symmetric", {}),
+    ("constant", {}),
+    ("constant", {"constant_values": 2}),
+    ("mean", {}),
+]:
+    TEST_CASES.append([(1, 7, 5), (None, 3, 2), (0, 0, 0), mode, pad_opts])
+    TEST_CASES.append([(2, 4, 9, 3), (None, 3, 4, 2), (0, -1, 2, 1), mode, pad_opts])
+    TEST_CASES.append([(1, 1, 6), (None, 1, 4), (0, 0, -3), mode, pad_opts])
+
+
+class TestGetPatchGrid(unittest.TestCase):
+    @parameterized.expand(TEST_CASES)
+    def test_same_as_iter_patch(self, shape, patch_size, start_pos, mode, pad_opts):
+        img = np.random.RandomState(0).rand(*shape)
+        expected = [(p.copy(), c) for p, c in iter_patch(img, patch_size, start_pos, False, mode, **pad_opts)]
+
+        patches, coords = get_patch_grid(img, patch_size, start_pos, mode, **pad_opts)
+        np.testing.assert_allclose(patches, np.stack([p for p, _ in expected]))
+        np.testing.assert_equal(coords, np.stack([c for _, c in expected]))
+        np.testing.assert_equal(get_patch_grid_coords(shape, patch_size, start_pos), coords)
+
+        views = list(iter_patch_views(img, patch_size, start_pos, mode, **pad_opts))
+        self.assertEqual(len(views), len(expected))
+        for (patch, coord), (expected_patch, expected_coord) in zip(views, expected):
+            np.testing.assert_allclose(patch, expected_patch)
+            np.testing.assert_equal(coord, expected_coord)
+
+    def test_views(self):
+        img = np.arange(32, dtype=float).reshape(1, 4, 8)
+        patches = list(PatchIter(patch_size=(2, 3), mode="constant", virtual_pad=True)(img))
+        self.assertEqual(len(patches), 6)
+        self.assertTrue(np.shares_memory(patches[0][0], img))
+        self.assertFalse(np.shares_memory(patches[-1][0], img))  # crossing the border
+        np.testing.assert_allclose(patches[-1][0], [[[22.0, 23.0, 0.0], [30.0, 31.0, 0.0]]])
+
+    def test_batches(self):
+        img = np.arange(32, dtype=float).reshape(1, 4, 8)
+        batches = list(PatchIter(patch_size=(2, 3), batch_size=4)(img))
+        self.assertEqual([b[0].shape for b in batches], [(4, 1, 2, 3), (2, 1, 2, 3)])
+        self.assertEqual([b[1].shape for b in batches], [(4, 3, 2), (2, 3, 2)])
+        with self.assertRaises(ValueError):
+            PatchIter(patch_size=(2, 3), batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
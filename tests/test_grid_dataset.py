@@ -78,6 +78,121 @@ class TestGridPatchDataset(unittest.TestCase):
                 rtol=1e-5,
             )
 
+    def test_shard_patches(self):
+        test_dataset = ["vwxyz", "helloworld", "worldfoobar"]
+        n_workers = 0 if sys.platform == "win32" else 2
+        output = []
+        for rank in range(2):
+            ds = GridPatchDataset(
+                dataset=test_dataset,
+                patch_iter=identity_generator,
+                with_coordinates=False,
+                shard_patches=True,
+                num_replicas=2,
+                rank=rank,
+                num_patches=[len(i) for i in test_dataset],
+            )
+            rank_output = []
+            for item in DataLoader(ds, batch_size=3, num_workers=n_workers):
+                rank_output.extend(item)
+            # the ranks yield the same number of patches, padded with the first ones
+            self.assertEqual(len(rank_output), 14 if n_workers else 13)
+            output.extend(rank_output)
+        expected = "".join(test_dataset) + ("vw" if n_workers else "")
+        self.assertEqual(sorted(output), sorted(expected))
+        with self.assertRaises(ValueError):
+            GridPatchDataset(dataset=test_dataset, patch_iter=identity_generator, num_replicas=2, rank=2)
+        with self.assertRaises(ValueError):
+            GridPatchDataset(test_dataset, identity_generator, shard_patches=True, num_patches=[5, 10])
+        with self.assertRaises(ValueError):
+            GridPatchDataset(test_dataset, identity_generator, shard_patches=True)
+
+    def test_shard_segments(self):
+        class CountingDataset(list):
+            num_reads = 0
+
+            def __getitem__(self, index):
+                self.num_reads += 1
+                return super().__getitem__(index)
+
+        test_dataset = ["abc", "", "defgh", "ij"]
+        outputs, num_reads = [], []
+        for rank in range(3):
+            counting = CountingDataset(test_dataset)
+            ds = GridPatchDataset(
+                counting, identity_generator, shard_patches=True, num_replicas=3, rank=rank, num_patches=[3, 0, 5, 2]
+            )
+            outputs.append("".join(i[0] for i in ds))
+            num_reads.append(counting.num_reads)
+        self.assertListEqual(outputs, ["abcd", "efgh", "ijab"])
+        # only the images of the patches of the rank are read
+        self.assertListEqual(num_reads, [2, 1, 2])
+        outputs = []
+        for rank in range(3):
+            ds = GridPatchDataset(
+                test_dataset,
+                identity_generator,
+                with_coordinates=False,
+                shard_patches=True,
+                num_replicas=3,
+                rank=rank,
+                num_patches=[3, 0, 5, 2],
+                drop_last=True,
+            )
+            outputs.append("".join(ds))
+        self.assertListEqual(outputs, ["abc", "def", "ghi"])
+
+    def test_shard_patch_iter(self):
+        images = [np.arange(36, dtype=float).reshape(1, 6, 6), np.arange(20, dtype=float).reshape(1, 4, 5)]
+        for kwargs in ({}, {"virtual_pad": True}, {"mode": "constant"}, {"mode": "mean"}, {"batch_size": 2}):
+            patch_iter = PatchIter(patch_size=(2, 4), **kwargs)
+            num_patches = [patch_iter.num_patches(i.shape) for i in images]
+            expected = [item for i in images for item in patch_iter(i)]
+            self.assertEqual(sum(num_patches), len(expected))
+            # the ranges of the grid are extracted directly
+            for start, stop in ((0, 1), (1, 3), (2, None), (len(expected), None)):
+                for item, exp in zip(patch_iter(images[0], start, stop), expected[start : stop or num_patches[0]]):
+                    np.testing.assert_allclose(item[0], exp[0])
+                    np.testing.assert_allclose(item[1], exp[1])
+            results = []
+            for rank in range(3):
+                ds = GridPatchDataset(
+                    images, patch_iter, shard_patches=True, num_replicas=3, rank=rank, num_patches=num_patches
+                )
+                results.extend(ds)
+            for item, exp in zip(results, expected + expected):
+                np.testing.assert_allclose(item[0], exp[0])
+                np.testing.assert_allclose(item[1], exp[1])
+            self.assertEqual(len(results), -(-len(expected) // 3) * 3)
+
+    def test_interleave_shuffle(self):
+        test_dataset = ["abc", "defgh"]
+        ds = GridPatchDataset(dataset=test_dataset, patch_iter=identity_generator, num_interleaved=2)
+        self.assertEqual([i[0] for i in ds], list("adbecfgh"))
+        self.assertEqual([i[1] for i in ds], [0, 0, 1, 1, 2, 2, 3, 4])
+
+        ds = GridPatchDataset(
+            dataset=test_dataset, patch_iter=identity_generator, with_coordinates=False, shuffle_buffer_size=4
+        )
+        first, second = list(ds), list(ds)
+        self.assertEqual(sorted(first), list("abcdefgh"))
+        self.assertEqual(sorted(second), list("abcdefgh"))
+        self.assertNotEqual(first, list("abcdefgh"))
+
+    def test_cache_images(self):
+        class CountingDataset(list):
+            num_reads = 0
+
+            def __getitem__(self, index):
+                self.num_reads += 1
+                return super().__getitem__(index)
+
+        test_dataset = CountingDataset(["vwxyz", "helloworld"])
+        ds = GridPatchDataset(dataset=test_dataset, patch_iter=identity_generator, cache_images=True)
+        for _ in range(3):
+            self.assertEqual(len(list(ds)), 15)
+        self.assertEqual(test_dataset.num_reads, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
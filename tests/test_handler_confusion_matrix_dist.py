@@ -24,11 +24,15 @@ from tests.utils import DistCall, DistTestCase
 class DistributedConfusionMatrix(DistTestCase):
     @DistCall(nnodes=1, nproc_per_node=2)
     def test_compute(self):
-        self._compute()
+        self._compute(save_details=True)
 
-    def _compute(self):
+    @DistCall(nnodes=1, nproc_per_node=2)
+    def test_compute_statistics(self):
+        self._compute(save_details=False)
+
+    def _compute(self, save_details):
         device = f"cuda:{dist.get_rank()}" if torch.cuda.is_available() else "cpu"
-        metric = ConfusionMatrix(include_background=True, metric_name="tpr")
+        metric = ConfusionMatrix(include_background=True, metric_name="tpr", save_details=save_details)
 
         def _val_func(engine, batch):
             pass
@@ -47,6 +47,26 @@ class TestHandlerMeanDice(unittest.TestCase):
         self.assertAlmostEqual(avg_dice, expected_avg, places=4)
         self.assertTupleEqual(tuple(engine.state.metric_details["mean_dice"].shape), details_shape)
 
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_statistics(self, input_params, _expected_avg, _details_shape):
+        dice_metric = MeanDice(save_details=False, **input_params)
+        details_metric = MeanDice(**input_params)
+        engine = Engine(lambda engine, batch: None)
+        details_metric.attach(engine=engine, name="mean_dice")
+        generator = torch.Generator().manual_seed(0)
+        for _ in range(3):
+            y_pred = (torch.rand(4, 3, 5, 5, generator=generator) > 0.5).float()
+            y = (torch.rand(4, 3, 5, 5, generator=generator) > 0.7).float()
+            y[0] = 0  # no ground truth, NaN dice
+            dice_metric.update([y_pred, y])
+            details_metric.update([y_pred, y])
+            # the running value is available during the epoch
+            self.assertAlmostEqual(dice_metric.compute(), details_metric.compute(), places=6)
+        self.assertEqual(len(dice_metric._scores), 0)
+        self.assertTupleEqual(tuple(dice_metric._statistics_sum.shape), (2,))
+        dice_metric.reset()
+        self.assertIsNone(dice_metric._statistics_sum)
+
     @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
     def test_shape_mismatch(self, input_params, _expected_avg, _details_shape):
         dice_metric = MeanDice(**input_params)
@@ -39,6 +39,19 @@ class TestHandlerROCAUC(unittest.TestCase):
         auc = auc_metric.compute()
         np.testing.assert_allclose(0.75, auc)
 
+    def test_histogram(self):
+        auc_metric = ROCAUC(average="none", num_bins=100)
+        exact_metric = ROCAUC(average="none")
+        state = np.random.RandomState(0)
+        for _ in range(3):
+            y_pred = torch.as_tensor(state.rand(8, 2))
+            y = torch.as_tensor(state.randint(0, 2, (8, 2)))
+            auc_metric.update([y_pred, y])
+            exact_metric.update([y_pred, y])
+        np.testing.assert_allclose(auc_metric.compute(), exact_metric.compute(), atol=0.02)
+        auc_metric.reset()
+        self.assertIsNone(auc_metric._histogram)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -24,7 +24,13 @@ from tests.utils import DistCall, DistTestCase
 class DistributedROCAUC(DistTestCase):
     @DistCall(nnodes=1, nproc_per_node=2, node_rank=0)
     def test_compute(self):
-        auc_metric = ROCAUC()
+        self._compute(ROCAUC())
+
+    @DistCall(nnodes=1, nproc_per_node=2, node_rank=0)
+    def test_compute_histogram(self):
+        self._compute(ROCAUC(num_bins=10000))
+
+    def _compute(self, auc_metric):
         act = Activations(softmax=True)
         to_onehot = AsDiscrete(to_onehot=True, n_classes=2)
 
@@ -12,6 +12,7 @@
 import random
 import sys
 import unittest
+from copy import deepcopy
 from functools import partial
 from typing import TYPE_CHECKING, List, Tuple
 from unittest.case import skipUnless
@@ -528,6 +529,43 @@ class TestInverse(unittest.TestCase):
                 fwd_bck = t.inverse(fwd_bck)
                 self.check_inverse(name, data.keys(), forwards[-i - 2], fwd_bck, forwards[-1], acceptable_diff)
 
+    def assert_same(self, a, b):
+        if isinstance(a, dict):
+            self.assertEqual(set(a.keys()), set(b.keys()))
+            for key in a:
+                self.assert_same(a[key], b[key])
+        elif isinstance(a, (list, tuple)):
+            self.assertEqual(len(a), len(b))
+            for i, j in zip(a, b):
+                self.assert_same(i, j)
+        elif isinstance(a, (np.ndarray, torch.Tensor)):
+            np.testing.assert_array_equal(a, b)
+        else:
+            self.assertEqual(a, b)
+
+    def test_inverse_not_modify_input(self):
+        transforms = Compose(
+            [
+                Spacingd(KEYS, [1.2, 0.8, 1.0], diagonal=False),
+                Orientationd(KEYS, "LPS"),
+                SpatialPadd(KEYS, [110, 110, 110]),
+                CenterSpatialCropd(KEYS, [80, 90, 100]),
+                RandSpatialCropd(KEYS, [60, 70, 80], random_size=False),
+                CropForegroundd(KEYS, source_key="label", margin=2),
+                ResizeWithPadOrCropd(KEYS, [64, 64, 64]),
+                RandFlipd(KEYS, prob=1.0, spatial_axis=1),
+            ]
+        ).set_random_state(0)
+        fwd = transforms(self.all_data["3D"])
+        expected = deepcopy(fwd)
+        fwd_bck = transforms.inverse(fwd)
+        self.assert_same(fwd, expected)
+        self.assertEqual(fwd_bck["image"].shape, self.all_data["3D"]["image"].shape)
+        for key in KEYS:
+            self.assertEqual(len(fwd_bck[key + InverseKeys.KEY_SUFFIX]), 0)
+            self.assertEqual(len(fwd[key + InverseKeys.KEY_SUFFIX]), 8)
+            self.assertIsNot(fwd_bck[f"{key}_meta_dict"], fwd[f"{key}_meta_dict"])
+
     # skip this test if multiprocessing uses 'spawn', as the check is only basic anyway
     @skipUnless(torch.multiprocessing.get_start_method(allow_none=False) == "spawn", "requires spawn")
     def test_fail(self):
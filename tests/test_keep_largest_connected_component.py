@@ -11,10 +11,11 @@
 
 import unittest
 
+import numpy as np
 import torch
 from parameterized import parameterized
 
-from monai.transforms import KeepLargestConnectedComponent
+from monai.transforms import KeepLargestConnectedComponent, get_largest_connected_component_mask
 
 grid_1 = torch.tensor([[[[0, 0, 1, 0, 0], [0, 2, 1, 1, 1], [1, 2, 1, 0, 0], [1, 2, 0, 1, 0], [2, 2, 0, 0, 2]]]])
 grid_2 = torch.tensor([[[[0, 0, 0, 0, 1], [0, 0, 1, 1, 1], [1, 0, 1, 1, 2], [1, 0, 1, 2, 2], [0, 0, 0, 0, 1]]]])
@@ -465,6 +466,24 @@ class TestKeepLargestConnectedComponent(unittest.TestCase):
             else:
                 _ = converter(tensor.clone())
 
+    @parameterized.expand([[(3, 1, 9, 11), 1], [(2, 1, 7, 8, 6), None], [(4, 5, 10, 9), 2]])
+    def test_single_labeling(self, shape, connectivity):
+        # compare with the largest connected component of every label computed one by one
+        rs = np.random.RandomState(0)
+        labels = torch.as_tensor(rs.randint(0, 4, size=(shape[0], 1) + shape[2:]))
+        img = labels if shape[1] == 1 else torch.cat([labels == i for i in range(shape[1])], dim=1).float()
+        applied_labels = [1, 2, 3]
+        expected = img.clone()
+        for i in applied_labels:
+            item = expected[:, 0] if shape[1] == 1 else expected[:, i]
+            foreground = (item == i).type(torch.uint8) if shape[1] == 1 else item.type(torch.uint8)
+            item[foreground != get_largest_connected_component_mask(foreground, connectivity)] = 0
+        for num_workers in (1, 2):
+            converter = KeepLargestConnectedComponent(
+                applied_labels, connectivity=connectivity, num_workers=num_workers
+            )
+            torch.testing.assert_allclose(converter(img.clone()), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import os
+import tempfile
 import unittest
-from unittest import skipUnless
+from unittest import mock, skipUnless
 
 import numpy as np
 from numpy.testing import assert_array_equal
@@ -228,7 +229,23 @@ class TestMaskedInferenceWSIDataset(unittest.TestCase):
         dataset = MaskedInferenceWSIDataset(**input_parameters)
         self.compare_samples_expected(dataset, expected)
 
-    def compare_samples_expected(self, dataset, expected):
+    @parameterized.expand([[MASK4, 1, 4], [MASK4, 2, 1], [MASK2, 3, 1]])
+    @skipUnless(has_cim, "Requires CuCIM")
+    @skip_if_quick
+    def test_read_blocks_cucim(self, mask, block_size, num_blocks):
+        data = [{"image": FILE_PATH, "mask": mask}]
+        dataset = MaskedInferenceWSIDataset(data, patch_size=2, image_reader_name="cuCIM")
+        expected = [dataset[i][0] for i in range(len(dataset))]
+        block_dataset = MaskedInferenceWSIDataset(
+            data, patch_size=2, image_reader_name="cuCIM", block_size=block_size, num_workers=2
+        )
+        samples = [sample for i in range(len(block_dataset)) for sample in block_dataset[i]]
+        self.assertEqual(len(block_dataset), num_blocks)
+        self.compare_samples_expected(samples, expected, batched=False)
+
+    def compare_samples_expected(self, dataset, expected, batched=True):
+        if not batched:
+            dataset = [[sample] for sample in dataset]
         for i in range(len(dataset)):
             self.assertTupleEqual(dataset[i][0]["image"].shape, expected[i]["image"].shape)
             self.assertIsNone(assert_array_equal(dataset[i][0]["image"], expected[i]["image"]))
@@ -236,5 +253,53 @@ class TestMaskedInferenceWSIDataset(unittest.TestCase):
             self.assertListEqual(dataset[i][0]["mask_location"], expected[i]["mask_location"])
 
 
+class _Reader:
+    """A `WSIReader` reading the regions of a random RGB image of 64 x 48 pixels, padded with zeros."""
+
+    def __init__(self, reader_lib):
+        self.pixels = np.random.RandomState(0).randint(0, 256, size=(3, 64, 48), dtype=np.uint8)
+        self.num_reads = 0
+
+    def read(self, path):
+        # channel last, as the image objects of cuCIM
+        return self.pixels.transpose(1, 2, 0)
+
+    def get_data(self, img, location, size):
+        self.num_reads += 1
+        region = np.zeros((3,) + tuple(size), dtype=np.uint8)
+        (x, y), (w, h) = location, size
+        pixels = img[max(x, 0) : x + w, max(y, 0) : y + h].transpose(2, 0, 1)
+        region[:, max(-x, 0) : max(-x, 0) + pixels.shape[1], max(-y, 0) : max(-y, 0) + pixels.shape[2]] = pixels
+        return region, {}
+
+
+class TestMaskedInferenceWSIDatasetBlocks(unittest.TestCase):
+    @parameterized.expand([[1, 1, 9], [2, 3, 6], [(4, 2), 2, 5], [16, 4, 1]])
+    def test_read_blocks(self, block_size, num_workers, num_blocks):
+        # a mask at level 2 (16 x 12 pixels), saved transposed as the tissue masks
+        mask = np.zeros((16, 12))
+        mask[[0, 1, 1, 5, 6, 8, 9, 15, 15], [0, 0, 1, 4, 4, 7, 11, 10, 11]] = 1
+        with tempfile.TemporaryDirectory() as tempdir, mock.patch("monai.apps.pathology.datasets.WSIReader", _Reader):
+            mask_path = os.path.join(tempdir, "mask.npy")
+            np.save(mask_path, mask.T)
+            data = [{"image": "image.tiff", "mask": mask_path}]
+            dataset = MaskedInferenceWSIDataset(data, patch_size=(6, 5))
+            expected = {tuple(p["mask_location"]): p["image"] for i in range(len(dataset)) for p in dataset[i]}
+            self.assertEqual(len(expected), 9)
+            block_dataset = MaskedInferenceWSIDataset(
+                data, patch_size=(6, 5), block_size=block_size, num_workers=num_workers
+            )
+            self.assertEqual(len(block_dataset), num_blocks)
+            block_dataset.image_reader.num_reads = 0
+            samples = [sample for i in range(len(block_dataset)) for sample in block_dataset[i]]
+        # a single region is read for every block, in bands read by the threads
+        self.assertLessEqual(block_dataset.image_reader.num_reads, num_blocks * num_workers)
+        self.assertEqual(len(samples), len(expected))
+        for sample in samples:
+            self.assertEqual(sample["name"], "image")
+            self.assertTupleEqual(sample["image"].shape, (3, 6, 5))
+            assert_array_equal(sample["image"], expected[tuple(sample["mask_location"])])
+
+
 if __name__ == "__main__":
     unittest.main()
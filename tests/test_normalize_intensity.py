@@ -12,6 +12,7 @@
 import unittest
 
 import numpy as np
+import torch
 from parameterized import parameterized
 
 from monai.transforms import NormalizeIntensity
@@ -74,6 +75,14 @@ class TestNormalizeIntensity(NumpyImageTestCase2D):
         expected = np.array([[0.0, -1.0, 0.0, 1.0], [0.0, -1.0, 0.0, 1.0]])
         np.testing.assert_allclose(expected, normalizer(input_data))
 
+    def test_tensor_not_modified(self):
+        normalizer = NormalizeIntensity(nonzero=True, channel_wise=True)
+        input_data = torch.tensor([[0.0, 3.0, 0.0, 4.0], [0.0, 4.0, 0.0, 5.0]])
+        original = input_data.clone()
+        expected = np.array([[0.0, -1.0, 0.0, 1.0], [0.0, -1.0, 0.0, 1.0]])
+        np.testing.assert_allclose(expected, normalizer(input_data).numpy())
+        torch.testing.assert_allclose(input_data, original)
+
     def test_value_errors(self):
         input_data = np.array([[0.0, 3.0, 0.0, 4.0], [0.0, 4.0, 0.0, 5.0]])
         normalizer = NormalizeIntensity(nonzero=True, channel_wise=True, subtrahend=[1])
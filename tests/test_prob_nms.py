@@ -80,6 +80,20 @@ TEST_CASES_3D = [
 ]
 
 
+def _iterative_nms(probs_map, prob_threshold, box_size):
+    # reference: select the maximum of the whole map and zero its box, until no value is above the threshold
+    probs_map = probs_map.copy()
+    box_size = np.asarray(box_size)
+    outputs = []
+    while np.max(probs_map) > prob_threshold:
+        max_idx = np.asarray(np.unravel_index(probs_map.argmax(), probs_map.shape))
+        outputs.append([probs_map[tuple(max_idx)]] + list(max_idx))
+        lower = (max_idx - box_size // 2).clip(0, None)
+        upper = max_idx + box_size - box_size // 2
+        probs_map[tuple(slice(i, j) for i, j in zip(lower, upper))] = 0
+    return outputs
+
+
 class TestProbNMS(unittest.TestCase):
     @parameterized.expand(
         [
@@ -98,6 +112,17 @@ class TestProbNMS(unittest.TestCase):
         output = nms(probs_map)
         np.testing.assert_allclose(output, expected)
 
+    @parameterized.expand([[(60, 70), (5, 8)], [(20, 25, 30), (3, 6, 4)]])
+    def test_iterative_nms(self, shape, box_size):
+        state = np.random.RandomState(0)
+        for prob_threshold in (0.0, 0.5):
+            # quantized values for many ties
+            probs_map = state.randint(0, 20, shape).astype(np.float32) / 20
+            nms = ProbNMS(spatial_dims=len(shape), prob_threshold=prob_threshold, box_size=box_size)
+            output = nms(probs_map)
+            self.assertListEqual(output, _iterative_nms(probs_map, prob_threshold, box_size))
+            self.assertGreater(len(output), 10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -154,6 +154,19 @@ class TestRandAffined(unittest.TestCase):
             else:
                 np.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-4)
 
+    def test_grouped_keys(self):
+        rng = np.random.RandomState(0)
+        keys = ("t1", "t2", "t1c", "seg")
+        data = {key: rng.rand(1, 8, 10).astype(np.float32) for key in keys}
+        data["t1c"] = torch.as_tensor(data["t1c"])
+        modes = ("bilinear", "bilinear", "bilinear", "nearest")
+        params = {"prob": 1.0, "rotate_range": 0.5, "scale_range": 0.2, "padding_mode": "zeros"}
+        res = RandAffined(keys=keys, mode=modes, **params).set_random_state(123)(data)
+        for key, mode in zip(keys, modes):
+            expected = RandAffined(keys=key, mode=mode, **params).set_random_state(123)(data)[key]
+            np.testing.assert_allclose(res[key].cpu().numpy(), expected.cpu().numpy(), rtol=1e-6)
+            self.assertTupleEqual(tuple(res[key].shape), (1, 8, 10))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,7 +14,7 @@ import unittest
 import numpy as np
 from parameterized import parameterized
 
-from monai.transforms import RandCropByPosNegLabel
+from monai.transforms import FgBgToIndices, RandCropByPosNegLabel
 
 TEST_CASE_0 = [
     {
@@ -73,6 +73,24 @@ class TestRandCropByPosNegLabel(unittest.TestCase):
         self.assertIsInstance(result, expected_type)
         self.assertTupleEqual(result[0].shape, expected_shape)
 
+    def test_compact_indices(self):
+        img = np.random.RandomState(0).rand(1, 12, 10, 8)
+        label = (img > 0.7).astype(np.float32)
+        fg_indices, bg_indices = FgBgToIndices()(label)
+        fg_compact, bg_compact = FgBgToIndices(compact=True)(label)
+        cropper = RandCropByPosNegLabel(spatial_size=(4, 4, 4), pos=1, neg=2, num_samples=6)
+        # the same crop centers are sampled from the explicit and compact indices, or from the label
+        expected = cropper.set_random_state(1)(img, label, fg_indices=fg_indices, bg_indices=bg_indices)
+        compact = cropper.set_random_state(1)(img, label, fg_indices=fg_compact, bg_indices=bg_compact)
+        computed = cropper.set_random_state(1)(img, label)
+        for e, c, r in zip(expected, compact, computed):
+            np.testing.assert_allclose(c, e)
+            np.testing.assert_allclose(r, e)
+        # gather all the samples at once
+        cropper = RandCropByPosNegLabel(spatial_size=(4, 4, 4), pos=1, neg=2, num_samples=6, stack=True)
+        stacked = cropper.set_random_state(1)(img, label)
+        np.testing.assert_allclose(stacked, np.stack(expected))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -80,6 +80,22 @@ class TestRand3DElastic(unittest.TestCase):
         else:
             np.testing.assert_allclose(result, expected_val, rtol=1e-4, atol=1e-4)
 
+    def test_control_spacing(self):
+        full = Rand3DElastic(sigma_range=(4.0, 4.0), magnitude_range=(1.0, 1.0), prob=1.0)
+        coarse = Rand3DElastic(sigma_range=(4.0, 4.0), magnitude_range=(1.0, 1.0), prob=1.0, control_spacing=(8, 8, 4))
+        img = np.ones((1, 33, 33, 25), dtype=np.float32)
+        std_full, std_coarse = [], []
+        for seed in range(5):
+            full.set_random_state(seed)
+            coarse.set_random_state(seed)
+            self.assertTupleEqual(coarse(img).shape, img.shape)
+            self.assertTupleEqual(coarse.rand_offset.shape, (3, 5, 5, 7))
+            std_coarse.append(coarse.compute_offset(img.shape[1:]).std().item())
+            full(img)
+            std_full.append(full.compute_offset(img.shape[1:]).std().item())
+        # the magnitude of the coarse displacement field matches the full resolution one
+        np.testing.assert_allclose(np.mean(std_coarse), np.mean(std_full), rtol=0.2)
+
 
 if __name__ == "__main__":
     unittest.main()
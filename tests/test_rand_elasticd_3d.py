@@ -121,6 +121,23 @@ class TestRand3DElasticd(unittest.TestCase):
             else:
                 np.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-4)
 
+    def test_control_spacing(self):
+        g = Rand3DElasticd(
+            keys=("img", "seg"),
+            sigma_range=(3.0, 5.0),
+            magnitude_range=(2.0, 3.0),
+            prob=1.0,
+            spatial_size=(20, 24, 16),
+            control_spacing=4,
+        )
+        g.set_random_state(123)
+        img = np.random.RandomState(0).rand(1, 24, 24, 24).astype(np.float32)
+        res = g({"img": img, "seg": img.copy()})
+        self.assertTupleEqual(g.rand_3d_elastic.rand_offset.shape, (3, 6, 7, 5))
+        for key in ("img", "seg"):
+            self.assertTupleEqual(res[key].shape, (1, 20, 24, 16))
+        np.testing.assert_allclose(res["img"], res["seg"])
+
 
 if __name__ == "__main__":
     unittest.main()
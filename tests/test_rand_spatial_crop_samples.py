@@ -12,6 +12,7 @@
 import unittest
 
 import numpy as np
+import torch
 from parameterized import parameterized
 
 from monai.transforms import RandSpatialCropSamples
@@ -79,6 +80,18 @@ class TestRandSpatialCropSamples(unittest.TestCase):
             self.assertTupleEqual(item.shape, expected)
         np.testing.assert_allclose(result[-1], expected_last_item)
 
+    def test_stack(self):
+        img = torch.as_tensor(np.random.RandomState(0).rand(2, 10, 9, 8))
+        for random_center in (True, False):
+            expected = RandSpatialCropSamples([4, 3, 5], 6, random_center, False).set_random_state(1)(img)
+            xform = RandSpatialCropSamples([4, 3, 5], 6, random_center, False, stack=True).set_random_state(1)
+            result = xform(img)
+            self.assertTupleEqual(tuple(result.shape), (6, 2, 4, 3, 5))
+            np.testing.assert_allclose(result, torch.stack(expected))
+            np.testing.assert_allclose(xform.set_random_state(1)(img.numpy()), result)
+        with self.assertRaises(ValueError):
+            RandSpatialCropSamples([4, 3, 5], 6, stack=True)
+
 
 if __name__ == "__main__":
     unittest.main()
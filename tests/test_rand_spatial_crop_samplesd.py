@@ -73,6 +73,16 @@ class TestRandSpatialCropSamplesd(unittest.TestCase):
         np.testing.assert_allclose(item["img"], expected_last["img"])
         np.testing.assert_allclose(item["seg"], expected_last["seg"])
 
+    def test_shared_data(self):
+        data = {"img": np.random.rand(1, 8, 8), "meta": {"name": "img"}, "img_transforms": [{"class": "Flip"}]}
+        result = RandSpatialCropSamplesd(keys="img", roi_size=[4, 4], num_samples=3, random_size=False)(data)
+        for item in result:
+            self.assertIs(item["meta"], data["meta"])
+            self.assertEqual(len(item["img_transforms"]), 2)
+            self.assertEqual(item["img_transforms"][-1]["class"], "RandSpatialCropd")
+        # the input data is not modified
+        self.assertEqual(len(data["img_transforms"]), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,8 +12,10 @@
 import unittest
 
 import numpy as np
+import torch
 
 from monai.transforms.intensity.array import ScaleIntensityRangePercentiles
+from monai.transforms.utils import compute_percentiles
 from tests.utils import NumpyImageTestCase2D
 
 
@@ -55,6 +57,41 @@ class TestScaleIntensityRangePercentiles(NumpyImageTestCase2D):
         self.assertRaises(AssertionError, ScaleIntensityRangePercentiles, lower=30, upper=-20, b_min=0, b_max=255)
         self.assertRaises(AssertionError, ScaleIntensityRangePercentiles, lower=30, upper=900, b_min=0, b_max=255)
 
+    def test_compute_percentiles(self):
+        q = [0, 0.5, 10, 33.3, 50, 99.5, 100]
+        rng = np.random.RandomState(0)
+        # signed integers whose range overflows their dtype, e.g. CT images padded with -32768
+        ct = (rng.rand(1, 40, 30) * 3000 - 1000).astype(np.int16)
+        ct[:, :5] = -32768
+        signed = (
+            (rng.rand(1, 40, 30) * 3000 - 1000).astype(np.int16),
+            ct,
+            np.array([-100, 0, 50, 100], dtype=np.int8),
+        )
+        for img in (self.imt, rng.randn(2, 31, 17)) + signed:
+            expected = np.percentile(img, q)
+            np.testing.assert_array_equal(compute_percentiles(img, q), expected)
+            np.testing.assert_array_equal(compute_percentiles(torch.as_tensor(img), q), expected)
+            # the histogram is exact for integers, otherwise the error is less than a bin
+            tol = 0 if np.issubdtype(img.dtype, np.integer) else (img.max() - img.min()) / 256
+            np.testing.assert_allclose(compute_percentiles(img, q, "histogram", 256), expected, rtol=0, atol=tol)
+            result = compute_percentiles(torch.as_tensor(img), q, "histogram", 256)
+            np.testing.assert_allclose(result, expected, rtol=0, atol=tol)
+        np.testing.assert_allclose(compute_percentiles(np.ones(5), [1, 99], "histogram"), [1, 1])
+        with self.assertRaises(ValueError):
+            compute_percentiles(self.imt, 101)
+        with self.assertRaises(ValueError):
+            compute_percentiles(self.imt, 10, method="sort")
+
+    def test_methods_and_precomputed(self):
+        img = self.imt
+        expected = ScaleIntensityRangePercentiles(lower=1, upper=99, b_min=0, b_max=1, clip=True)(img)
+        scaler = ScaleIntensityRangePercentiles(lower=1, upper=99, b_min=0, b_max=1, clip=True, method="histogram")
+        np.testing.assert_allclose(scaler(img), expected, atol=1e-2)
+        result = scaler(torch.as_tensor(img), percentiles=np.percentile(img, [1, 99]))
+        self.assertIsInstance(result, torch.Tensor)
+        np.testing.assert_allclose(result.numpy(), expected, rtol=1e-5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -57,6 +57,26 @@ class TestScaleIntensityRangePercentilesd(NumpyImageTestCase2D):
 
         self.assertTrue(np.allclose(expected_img, scaler(data)["img"]))
 
+    def test_precomputed(self):
+        img = self.imt
+        lower, upper = 10, 99
+        scaler = ScaleIntensityRangePercentilesd("img", lower, upper, b_min=0, b_max=1, percentiles_key="percentiles")
+        expected = scaler({"img": img})["img"]
+        a_min, a_max = np.percentile(img, [lower, upper])
+        # from the meta data
+        meta = {"percentiles": {lower: a_min, upper: a_max}}
+        result = scaler({"img": img, "img_meta_dict": meta})["img"]
+        np.testing.assert_allclose(result, expected)
+        result = scaler({"img": img, "img_meta_dict": {"percentiles": {10: 0.0, 99: 2.0}}})["img"]
+        np.testing.assert_allclose(result, img / 2.0, rtol=1e-6)
+        # from the data dictionary, with string percentiles as in a json index
+        result = scaler({"img": img, "img_percentiles": {"10": 0.0, "99.0": 4.0}})["img"]
+        np.testing.assert_allclose(result, img / 4.0, rtol=1e-6)
+        # missing percentiles are computed
+        result = scaler({"img": img, "img_percentiles": {"50": 0.0}})["img"]
+        np.testing.assert_allclose(result, expected)
+        self.assertIn("img_percentiles", scaler.read_keys())
+
     def test_invalid_instantiation(self):
         self.assertRaises(
             AssertionError, ScaleIntensityRangePercentilesd, keys=["img"], lower=-1, upper=99, b_min=0, b_max=255
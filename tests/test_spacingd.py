@@ -10,8 +10,10 @@
 # limitations under the License.
 
 import unittest
+from copy import deepcopy
 
 import numpy as np
+import torch
 
 from monai.transforms import Spacingd
 
@@ -79,6 +81,38 @@ class TestSpacingDCase(unittest.TestCase):
         np.testing.assert_allclose(res["image"].shape, (2, 1, 46))
         np.testing.assert_allclose(res["image_meta_dict"]["affine"], np.diag((1, 0.2, 1, 1)))
 
+    def test_grouped_keys(self):
+        rng = np.random.RandomState(0)
+        keys = ("t1", "t2", "flair", "seg")
+        data = {key: rng.rand(1, 8, 10, 6) for key in keys}
+        data.update({f"{key}_meta_dict": {"affine": np.diag((1.0, 1.5, 2.0, 1.0))} for key in keys})
+        # "t1", "t2" are resampled together, "flair" has a different affine, "seg" a different mode
+        data["flair_meta_dict"]["affine"] = np.diag((2.0, 1.5, 1.0, 1.0))
+        modes = ("bilinear", "bilinear", "bilinear", "nearest")
+        res = Spacingd(keys=keys, pixdim=(1.2, 1.2, 1.2), mode=modes)(deepcopy(data))
+        for key, mode in zip(keys, modes):
+            expected = Spacingd(keys=key, pixdim=(1.2, 1.2, 1.2), mode=mode)(deepcopy(data))
+            np.testing.assert_allclose(res[key], expected[key])
+            np.testing.assert_allclose(res[f"{key}_meta_dict"]["affine"], expected[f"{key}_meta_dict"]["affine"])
+            self.assertEqual(res[f"{key}_transforms"][0]["orig_size"], (8, 10, 6))
+        self.assertIsNot(res["t1_meta_dict"]["affine"], res["t2_meta_dict"]["affine"])
+
+    def test_tensor(self):
+        device = "cuda:0" if torch.cuda.is_available() else "cpu"
+        img = np.random.RandomState(0).rand(2, 8, 10, 6)
+        data = {"image": img, "image_meta_dict": {"affine": np.diag((1.0, 1.5, 2.0, 1.0))}}
+        spacing = Spacingd(keys="image", pixdim=(1.2, 1.2, 1.2))
+        expected = spacing(deepcopy(data))
+        data["image"] = torch.as_tensor(img, device=device)
+        res = spacing(data)
+        self.assertIsInstance(res["image"], torch.Tensor)
+        self.assertEqual(res["image"].device, torch.device(device))
+        np.testing.assert_allclose(res["image"].cpu().numpy(), expected["image"], rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(res["image_meta_dict"]["affine"], expected["image_meta_dict"]["affine"])
+        inverted = spacing.inverse(res)
+        self.assertIsInstance(inverted["image"], torch.Tensor)
+        self.assertEqual(inverted["image"].shape, img.shape)
+
 
 if __name__ == "__main__":
     unittest.main()
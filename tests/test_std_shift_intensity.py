@@ -12,6 +12,7 @@
 import unittest
 
 import numpy as np
+import torch
 
 from monai.transforms import ShiftIntensity, StdShiftIntensity
 from tests.utils import NumpyImageTestCase2D
@@ -61,6 +62,17 @@ class TestStdShiftIntensity(NumpyImageTestCase2D):
             result = std_shifter(image)
             np.testing.assert_equal(result.dtype, trans_dtype)
 
+    def test_tensor_not_modified(self):
+        image = torch.tensor([[0.0, 1.0, 2.0, 3.0], [1.0, 1.0, 3.0, 3.0]])
+        original = image.clone()
+        for nonzero in [True, False]:
+            for channel_wise in [True, False]:
+                std_shifter = StdShiftIntensity(factor=1.0, nonzero=nonzero, channel_wise=channel_wise)
+                result = std_shifter(image)
+                expected = std_shifter(image.numpy())
+                torch.testing.assert_allclose(image, original)
+                np.testing.assert_allclose(result.numpy(), expected, rtol=1e-5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,7 +16,19 @@ import numpy as np
 import torch
 from parameterized import parameterized
 
-from monai.metrics import SurfaceDistanceMetric
+from monai.metrics import (
+    SurfaceDistanceMetric,
+    compute_average_surface_distance,
+    compute_hausdorff_distance,
+    compute_surface_distance_metrics,
+)
+from monai.metrics.utils import (
+    _get_surface_distances_torch,
+    get_mask_edges,
+    get_surface_distance,
+    get_surface_distances_batch,
+)
+from tests.utils import skip_if_no_cuda
 
 
 def create_spherical_seg_3d(
@@ -153,6 +165,77 @@ class TestAllSurfaceMetrics(unittest.TestCase):
         np.testing.assert_allclose(0, result, rtol=1e-7)
         np.testing.assert_allclose(0, not_nans, rtol=1e-7)
 
+    def test_shared_distances(self):
+        seg_1 = create_spherical_seg_3d(radius=10, centre=(20, 20, 20), im_shape=(40, 40, 40))
+        seg_2 = create_spherical_seg_3d(radius=8, centre=(18, 21, 20), im_shape=(40, 40, 40))
+        empty = np.zeros_like(seg_1)
+        y_pred = torch.as_tensor(np.stack([[empty, seg_1, seg_2], [empty, seg_2, empty]]))
+        y = torch.as_tensor(np.stack([[empty, seg_2, seg_2], [empty, seg_1, seg_1]]))
+        results = compute_surface_distance_metrics(y_pred, y, percentile=90, num_workers=2)
+        np.testing.assert_allclose(results["hausdorff_distance"], compute_hausdorff_distance(y_pred, y, num_workers=1))
+        np.testing.assert_allclose(
+            results["percentile_hausdorff_distance"], compute_hausdorff_distance(y_pred, y, percentile=90)
+        )
+        np.testing.assert_allclose(
+            results["average_surface_distance"], compute_average_surface_distance(y_pred, y, symmetric=True)
+        )
+        # isotropic spacing scales the distances
+        scaled = compute_surface_distance_metrics(y_pred, y, percentile=90, spacing=2.5)
+        for key, value in results.items():
+            np.testing.assert_allclose(scaled[key], value * 2.5, rtol=1e-6)
+        anisotropic = compute_average_surface_distance(y_pred, y, spacing=(1.0, 1.0, 3.0))
+        self.assertTrue(torch.all(anisotropic[:, 0] > compute_average_surface_distance(y_pred, y)[:, 0]))
+        with self.assertRaises(ValueError):
+            compute_average_surface_distance(y_pred, y, distance_metric="taxicab", spacing=2.0)
+
+    def test_tensor_distances(self):
+        seg_1 = create_spherical_seg_3d(radius=6, centre=(10, 10, 10), im_shape=(20, 20, 20)).astype(bool)
+        seg_2 = create_spherical_seg_3d(radius=5, centre=(9, 11, 10), im_shape=(20, 20, 20)).astype(bool)
+        edges = get_mask_edges(seg_1, seg_2)
+        edges_t = get_mask_edges(torch.as_tensor(seg_1), torch.as_tensor(seg_2), always_return_as_numpy=False)
+        for edge, edge_t in zip(edges, edges_t):
+            self.assertIsInstance(edge_t, torch.Tensor)
+            np.testing.assert_array_equal(edge_t.numpy(), edge)
+        for metric, spacing in [("euclidean", None), ("euclidean", (1.0, 0.5, 2.0)), ("taxicab", None)]:
+            expected = get_surface_distance(edges[0], edges[1], metric, spacing)
+            # the tensors on CPU use scipy
+            result = get_surface_distance(edges_t[0], edges_t[1], metric, spacing)
+            self.assertIsInstance(result, np.ndarray)
+            np.testing.assert_allclose(result, expected)
+
+    def test_batch_distances(self):
+        seg_1 = create_spherical_seg_3d(radius=6, centre=(10, 10, 10), im_shape=(20, 20, 20)).astype(bool)
+        seg_2 = create_spherical_seg_3d(radius=5, centre=(9, 11, 10), im_shape=(20, 20, 20)).astype(bool)
+        # a flat mask, an empty prediction and an empty ground truth
+        flat = np.zeros_like(seg_1)
+        flat[5:15, 5:15, 10] = True
+        empty = np.zeros_like(seg_1)
+        y_pred = np.stack([np.stack([seg_1, flat, empty]), np.stack([seg_2, seg_1, seg_1])])
+        y = np.stack([np.stack([seg_2, seg_1, seg_2]), np.stack([flat, flat, empty])])
+        for metric, spacing in [("euclidean", None), ("euclidean", (1.0, 0.5, 2.0)), ("chessboard", None)]:
+            expected = get_surface_distances_batch(y_pred, y, metric, spacing)
+            result = _get_surface_distances_torch(torch.as_tensor(y_pred), torch.as_tensor(y), metric, spacing, True)
+            for expected_b, result_b in zip(expected, result):
+                for expected_bc, result_bc in zip(expected_b, result_b):
+                    for e, r in zip(expected_bc, result_bc):
+                        np.testing.assert_allclose(r, e, rtol=1e-6)
+
+    @skip_if_no_cuda
+    def test_cuda_distances(self):
+        seg_1 = create_spherical_seg_3d(radius=6, centre=(10, 10, 10), im_shape=(20, 20, 20)).astype(bool)
+        seg_2 = create_spherical_seg_3d(radius=5, centre=(9, 11, 10), im_shape=(20, 20, 20)).astype(bool)
+        edges = get_mask_edges(seg_1, seg_2)
+        edges_t = [torch.as_tensor(edge, device="cuda") for edge in edges]
+        result = get_surface_distance(edges_t[0], edges_t[1])
+        self.assertEqual(result.device.type, "cuda")
+        np.testing.assert_allclose(result.cpu().numpy(), get_surface_distance(edges[0], edges[1]), rtol=1e-6)
+        self.assertTrue(torch.all(torch.isinf(get_surface_distance(edges_t[0], torch.zeros_like(edges_t[1])))))
+        y_pred, y = torch.as_tensor(seg_1[None, None]), torch.as_tensor(seg_2[None, None])
+        expected = get_surface_distances_batch(y_pred, y)[0][0]
+        result = get_surface_distances_batch(y_pred.cuda(), y.cuda())[0][0]
+        for e, r in zip(expected, result):
+            np.testing.assert_allclose(r, e, rtol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+from monai.data import CacheDataset, DataLoader
+from monai.transforms import (
+    AddChanneld,
+    Compose,
+    Flip,
+    RandFlipd,
+    RandGaussianNoised,
+    ScaleIntensity,
+    ScaleIntensityd,
+    SpatialCropd,
+)
+from monai.utils import TransformProfiler
+
+
+class TestTransformProfiler(unittest.TestCase):
+    def test_nested_compose(self):
+        profiler = TransformProfiler()
+        img = np.random.rand(1, 16, 16).astype(np.float32)
+        inner = Compose([Flip(spatial_axis=0), ScaleIntensity()])
+        transforms = Compose([ScaleIntensity(), inner, lambda x: x], profiler=profiler)
+        for _ in range(3):
+            transforms(img)
+        records = profiler.records
+        self.assertEqual(len(records), 3 * 6)
+        paths = {r["path"] for r in records}
+        self.assertSetEqual(
+            paths,
+            {
+                "Compose",
+                "Compose/ScaleIntensity",
+                "Compose/Compose",
+                "Compose/Compose/Flip",
+                "Compose/Compose/ScaleIntensity",
+                "Compose/TestTransformProfiler.test_nested_compose.<locals>.<lambda>",
+            },
+        )
+        for r in records:
+            self.assertLessEqual(r["self_time"], r["time"])
+            self.assertEqual(r["input_shapes"], "(1, 16, 16)")
+        summary = profiler.summary()
+        self.assertEqual(summary["Compose/Compose/Flip"]["count"], 3)
+        # the scaled image is a new array, the identity doesn't allocate
+        self.assertEqual(summary["Compose/ScaleIntensity"]["allocated_bytes"], 3 * img.nbytes)
+        lambda_path = "Compose/TestTransformProfiler.test_nested_compose.<locals>.<lambda>"
+        self.assertEqual(summary[lambda_path]["allocated_bytes"], 0)
+        self.assertEqual(summary["Compose"]["count"], 3)
+        table = profiler.table()
+        self.assertIn("Compose/Compose/Flip", table)
+        self.assertEqual(len(profiler.table(max_rows=2).splitlines()), 4)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, "trace.json")
+            profiler.export_chrome_trace(filename)
+            with open(filename) as f:
+                trace = json.load(f)
+        self.assertEqual(len(trace["traceEvents"]), len(records))
+        self.assertEqual(trace["traceEvents"][0]["ph"], "X")
+
+        profiler.reset()
+        self.assertEqual(len(profiler.records), 0)
+        # not recorded without profiler
+        Compose([ScaleIntensity(), inner])(img)
+        self.assertEqual(len(profiler.records), 0)
+
+    def test_inverse(self):
+        profiler = TransformProfiler(record_shapes=False, record_memory=False)
+        data = {"img": np.random.rand(1, 10, 10).astype(np.float32)}
+        transforms = Compose([SpatialCropd("img", roi_center=(5, 5), roi_size=(4, 4))], profiler=profiler)
+        transforms.inverse(transforms(data))
+        stages = {(r["stage"], r["path"]) for r in profiler.records}
+        self.assertSetEqual(
+            stages, {("", "Compose"), ("", "Compose/SpatialCropd"), ("inverse", "SpatialCropd.inverse")}
+        )
+        self.assertNotIn("input_shapes", profiler.records[0])
+
+    @unittest.skipIf(sys.platform == "win32", "requires fork")
+    def test_cache_dataset_workers(self):
+        profiler = TransformProfiler()
+        data = [{"img": np.random.rand(8, 8).astype(np.float32)} for _ in range(6)]
+        transforms = Compose(
+            [
+                AddChanneld("img"),
+                ScaleIntensityd("img"),
+                RandFlipd("img", prob=0.5),
+                RandGaussianNoised("img", prob=0.5),
+            ],
+            profiler=profiler,
+        )
+        dataset = CacheDataset(data, transforms, progress=False)
+        for _ in DataLoader(dataset, batch_size=2, num_workers=2):
+            pass
+        summary = profiler.summary()
+        self.assertEqual(summary["pre:ScaleIntensityd"]["count"], 6)
+        self.assertEqual(summary["post:RandFlipd"]["count"], 6)
+        self.assertEqual(summary["post:RandGaussianNoised"]["count"], 6)
+        self.assertEqual(summary["pre:AddChanneld"]["input_shapes"], "img: (8, 8)")
+        pids = {r["pid"] for r in profiler.records if r["stage"] == "post"}
+        self.assertNotIn(os.getpid(), pids)
+        self.assertGreaterEqual(len(pids), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright 2020 - 2021 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import WSIReader, WSITileCache
+
+TEST_CASES = [
+    [{"location": (10, 20), "size": (40, 30)}],
+    [{"location": (0, 0), "size": (16, 16)}],
+    [{"location": (50, 70), "size": (50, 30), "grid_shape": (2, 3), "patch_size": 8}],
+    [{"location": (60, 90), "size": (20, 20), "dtype": np.float32}],
+]
+
+
+class _Region:
+    def __init__(self, array):
+        self.array = array
+        self.channel_names = ["R", "G", "B", "A"]
+
+    def __array__(self, dtype=None):
+        return self.array if dtype is None else self.array.astype(dtype)
+
+
+class _Image:
+    """A cuCIM-like image with 16 x 16 tiles, padded with zeros outside of its bounds."""
+
+    def __init__(self, path="image.tiff"):
+        self.path = path
+        self.pixels = np.random.RandomState(0).randint(0, 256, size=(100, 120, 4), dtype=np.uint8)
+        self.shape = self.pixels.shape
+        self.resolutions = {"level_tile_sizes": ((16, 16),)}
+        self.num_reads = 0
+
+    def read_region(self, location, size, level=0):
+        self.num_reads += 1
+        (x, y), (w, h) = location, size
+        region = np.zeros((h, w, 4), dtype=np.uint8)
+        pixels = self.pixels[max(y, 0) : y + h, max(x, 0) : x + w]
+        region[max(-y, 0) : max(-y, 0) + pixels.shape[0], max(-x, 0) : max(-x, 0) + pixels.shape[1]] = pixels
+        return _Region(region)
+
+
+class TestWSITileCache(unittest.TestCase):
+    @parameterized.expand(TEST_CASES)
+    def test_cached_regions(self, kwargs):
+        img = _Image()
+        expected = WSIReader("cuCIM").get_data(img, **kwargs)[0]
+        cache = WSITileCache()
+        reader = WSIReader("cuCIM", tile_cache=cache)
+        for _ in range(2):
+            result = reader.get_data(img, **kwargs)[0]
+            self.assertEqual(result.dtype, expected.dtype)
+            np.testing.assert_array_equal(result, expected)
+        self.assertEqual(cache.misses, len(cache))
+        self.assertEqual(cache.hits, cache.misses)
+        self.assertAlmostEqual(cache.hit_rate, 0.5)
+
+    def test_shared(self):
+        self.assertIs(WSITileCache.shared(), WSITileCache.shared())
+        self.assertIs(WSIReader("cuCIM", tile_cache=True).tile_cache, WSITileCache.shared())
+        self.assertIsNone(WSIReader("cuCIM", tile_cache=False).tile_cache)
+        # the tiles of the same file are shared across the image objects
+        cache = WSITileCache()
+        img_1, img_2 = _Image(), _Image()
+        WSIReader("cuCIM", tile_cache=cache).get_data(img_1, location=(0, 0), size=(32, 32))
+        WSIReader("cuCIM", tile_cache=cache, tile_size=16).get_data(img_2, location=(8, 8), size=(16, 16))
+        self.assertEqual((img_1.num_reads, img_2.num_reads), (4, 0))
+
+    def test_lru(self):
+        tile = np.zeros((4, 4, 3), dtype=np.uint8)
+        cache = WSITileCache(max_bytes=3 * tile.nbytes)
+        for key in range(3):
+            cache.put(key, tile)
+        self.assertIsNotNone(cache.get(0))
+        cache.put(3, tile)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.nbytes, 3 * tile.nbytes)
+        self.assertIsNone(cache.get(1))
+        self.assertIsNotNone(cache.get(0))
+        # larger than the budget
+        cache.put(4, np.zeros((8, 8, 3), dtype=np.uint8))
+        self.assertIsNone(cache.get(4))
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes, cache.hit_rate), (0, 0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()